@@ -0,0 +1 @@
+"""Performance benchmarks for the Local Weather Forecast integration."""
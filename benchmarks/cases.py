@@ -0,0 +1,295 @@
+"""Benchmark cases for the forecast pipeline.
+
+Every case builds its inputs once (setup is not timed) and returns a callable
+that runs the measured operation.  The callable must be repeatable: running it
+twice does the same amount of work.
+
+Home Assistant is mocked with the same helpers the unit tests use
+(``tests/conftest.py``), so no running Home Assistant instance is needed.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import math
+import random
+from typing import Any
+from unittest.mock import Mock, patch
+
+from custom_components.local_weather_forecast.combined_model import (
+    generate_enhanced_hourly_forecast,
+)
+from custom_components.local_weather_forecast import sensor as sensor_module
+from custom_components.local_weather_forecast.const import (
+    FORECAST_MODEL_ENHANCED,
+    FORECAST_MODEL_NEGRETTI,
+    PRESSURE_CHANGE_MINUTES,
+)
+from custom_components.local_weather_forecast.forecast_calculator import (
+    DailyForecastGenerator,
+    HourlyForecastGenerator,
+    PressureModel,
+    TemperatureModel,
+    ZambrettiForecaster,
+)
+from custom_components.local_weather_forecast.sensor import (
+    LocalForecastPressureChangeSensor,
+)
+from custom_components.local_weather_forecast.weather import (
+    LocalWeatherForecastWeather,
+)
+from tests.conftest import MockConfigEntry, MockState, MockStates
+
+# Location used by all cases (Košice, same as the test suite)
+LATITUDE = 48.72
+LONGITUDE = 21.25
+ELEVATION = 314.0
+
+# Number of readings in the pressure ingest stream
+INGEST_READINGS = 100_000
+# Spacing of the stream readings (1 Hz barometer); smaller streams are spread
+# wider so every stream spans at least twice the pressure change window
+INGEST_INTERVAL_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """One benchmark.
+
+    Attributes:
+        name: Unique case name (key in the baseline file)
+        description: What is measured
+        setup: Builds the inputs for the given scale (1.0 = full size) and
+            returns the measured callable
+        items: Operations performed by one call at full size (ops/sec is
+            reported per item, e.g. per reading for the ingest stream)
+    """
+
+    name: str
+    description: str
+    setup: Callable[[float], Callable[[], Any]]
+    items: int = 1
+
+    def items_for_scale(self, scale: float) -> int:
+        """Return the number of items one call performs at the given scale."""
+        if self.items == 1:
+            return 1
+        return max(1, int(self.items * scale))
+
+
+def create_hass() -> Mock:
+    """Create a Home Assistant mock with realistic sensor states."""
+    states = MockStates()
+    states.async_set("sensor.bench_pressure", "978.6", {"unit_of_measurement": "hPa"})
+    states.async_set("sensor.bench_temperature", "14.2", {"unit_of_measurement": "°C"})
+    states.async_set("sensor.bench_humidity", "78", {"unit_of_measurement": "%"})
+    states.async_set("sensor.bench_wind_speed", "3.4", {"unit_of_measurement": "m/s"})
+    states.async_set("sensor.bench_wind_direction", "225", {"unit_of_measurement": "°"})
+    states.async_set("sensor.local_forecast_pressure", "1012.4", {"unit_of_measurement": "hPa"})
+    states.async_set("sensor.local_forecast_pressurechange", "-1.8")
+    states.async_set("sensor.local_forecast_temperaturechange", "0.4")
+    states.async_set("sun.sun", "above_horizon")
+    states.async_set(
+        "sensor.local_forecast",
+        "Fairly fine, possibly showers",
+        {
+            "forecast_short_term": ["Fair", "Normal"],
+            "forecast_zambretti": ["Fairly fine, possibly showers", 11, "K"],
+            "forecast_neg_zam": ["Showery bright intervals", 13, "M"],
+            "forecast_pressure_trend": ["Falling", 2],
+        },
+    )
+
+    hass = Mock()
+    hass.states = states
+    hass.data = {}
+    hass.config.latitude = LATITUDE
+    hass.config.longitude = LONGITUDE
+    hass.config.elevation = ELEVATION
+    hass.config.language = "en"
+    return hass
+
+
+def create_config_entry() -> MockConfigEntry:
+    """Create a config entry using the benchmark sensors."""
+    return MockConfigEntry(
+        data={
+            "pressure_sensor": "sensor.bench_pressure",
+            "temperature_sensor": "sensor.bench_temperature",
+            "humidity_sensor": "sensor.bench_humidity",
+            "wind_speed_sensor": "sensor.bench_wind_speed",
+            "wind_direction_sensor": "sensor.bench_wind_direction",
+            "elevation": ELEVATION,
+            "pressure_type": "absolute",
+        },
+    )
+
+
+def _create_hourly_generator(forecast_model: str) -> HourlyForecastGenerator:
+    """Create an hourly generator the way the weather entity does."""
+    hass = create_hass()
+    return HourlyForecastGenerator(
+        hass,
+        PressureModel(1012.4, -1.8),
+        TemperatureModel(
+            14.2,
+            0.4,
+            cloud_cover=40.0,
+            humidity=78.0,
+            hass=hass,
+            latitude=LATITUDE,
+            longitude=LONGITUDE,
+        ),
+        ZambrettiForecaster(hass=hass, latitude=LATITUDE),
+        wind_direction=225,
+        wind_speed=3.4,
+        latitude=LATITUDE,
+        elevation=ELEVATION,
+        forecast_model=forecast_model,
+        longitude=LONGITUDE,
+    )
+
+
+def setup_hourly_legacy(scale: float) -> Callable[[], Any]:
+    """Hourly forecast, classic Zambretti/Negretti path."""
+    generator = _create_hourly_generator(FORECAST_MODEL_NEGRETTI)
+    return lambda: generator.generate(hours_count=24, interval_hours=1)
+
+
+def setup_hourly_orchestration(scale: float) -> Callable[[], Any]:
+    """Hourly forecast, enhanced orchestration path."""
+    generator = _create_hourly_generator(FORECAST_MODEL_ENHANCED)
+    return lambda: generator.generate(hours_count=24, interval_hours=1)
+
+
+def setup_daily(scale: float) -> Callable[[], Any]:
+    """Daily forecast aggregated from the enhanced hourly forecast."""
+    generator = DailyForecastGenerator(_create_hourly_generator(FORECAST_MODEL_ENHANCED))
+    return lambda: generator.generate(days=3)
+
+
+def setup_enhanced_hourly(scale: float) -> Callable[[], Any]:
+    """Combined model orchestration without the generator wrapper."""
+    weather_data = {
+        "start_time": datetime.now(timezone.utc),
+        "temperature": 14.2,
+        "pressure": 1012.4,
+        "pressure_change": -1.8,
+        "humidity": 78.0,
+        "dewpoint": 10.4,
+        "condition": "partlycloudy",
+        "zambretti_result": ["Fairly fine, possibly showers", 11],
+        "negretti_result": ["Showery bright intervals", 13],
+        "temperature_trend": 0.4,
+        "latitude": LATITUDE,
+        "longitude": LONGITUDE,
+        "cloud_cover": 40.0,
+    }
+    return lambda: generate_enhanced_hourly_forecast(weather_data, hours=24, lang_index=1)
+
+
+def _create_weather_entity() -> LocalWeatherForecastWeather:
+    """Create a weather entity attached to the mocked hass."""
+    entity = LocalWeatherForecastWeather(create_config_entry())
+    entity.hass = create_hass()
+    return entity
+
+
+def setup_weather_condition(scale: float) -> Callable[[], Any]:
+    """Weather entity current condition."""
+    entity = _create_weather_entity()
+    return lambda: entity.condition
+
+
+def setup_weather_attributes(scale: float) -> Callable[[], Any]:
+    """Weather entity state attributes."""
+    entity = _create_weather_entity()
+    return lambda: entity.extra_state_attributes
+
+
+class _StreamClock(datetime):
+    """datetime whose now() returns the timestamps of the ingest stream."""
+
+    stream: Iterator[datetime] = iter(())
+
+    @classmethod
+    def now(cls, tz=None) -> datetime:  # type: ignore[override]
+        return next(cls.stream)
+
+
+def setup_pressure_ingest(scale: float) -> Callable[[], Any]:
+    """Pressure change sensor ingesting a stream of readings.
+
+    Each call feeds the whole stream into a fresh sensor, so repeated calls
+    start from the same (empty) history.  Readings get synthetic timestamps
+    spanning more than the 3 h window, so the sensor evicts old readings
+    like in steady-state operation.
+    """
+    rng = random.Random(1013)
+    count = max(2, int(INGEST_READINGS * scale))
+    interval = max(INGEST_INTERVAL_SECONDS, 2 * PRESSURE_CHANGE_MINUTES * 60 / count)
+    start = datetime(2025, 1, 1)
+    timestamps = [start + timedelta(seconds=i * interval) for i in range(count)]
+    events = [
+        Mock(data={"new_state": MockState(
+            "sensor.bench_pressure",
+            str(round(978.0 + 6.0 * math.sin(i / 2000.0) + rng.gauss(0.0, 0.05), 2)),
+            {"unit_of_measurement": "hPa"},
+        )})
+        for i in range(count)
+    ]
+    hass = create_hass()
+    entry = create_config_entry()
+
+    def ingest() -> float:
+        sensor = LocalForecastPressureChangeSensor(hass, entry)
+        sensor.async_write_ha_state = lambda: None
+        handle = sensor._handle_pressure_update
+        _StreamClock.stream = iter(timestamps)
+        with patch.object(sensor_module, "datetime", _StreamClock):
+            for event in events:
+                handle(event)
+        return sensor.native_value
+
+    return ingest
+
+
+CASES: list[BenchmarkCase] = [
+    BenchmarkCase(
+        "hourly_legacy",
+        "HourlyForecastGenerator.generate, 24 h, Negretti-Zambra (legacy path)",
+        setup_hourly_legacy,
+    ),
+    BenchmarkCase(
+        "hourly_orchestration",
+        "HourlyForecastGenerator.generate, 24 h, Enhanced (orchestration path)",
+        setup_hourly_orchestration,
+    ),
+    BenchmarkCase(
+        "daily",
+        "DailyForecastGenerator.generate, 3 days",
+        setup_daily,
+    ),
+    BenchmarkCase(
+        "enhanced_hourly",
+        "generate_enhanced_hourly_forecast, 24 h",
+        setup_enhanced_hourly,
+    ),
+    BenchmarkCase(
+        "weather_condition",
+        "LocalWeatherForecastWeather.condition",
+        setup_weather_condition,
+    ),
+    BenchmarkCase(
+        "weather_attributes",
+        "LocalWeatherForecastWeather.extra_state_attributes",
+        setup_weather_attributes,
+    ),
+    BenchmarkCase(
+        "pressure_ingest",
+        f"Pressure change sensor, stream of {INGEST_READINGS} readings (ops = readings)",
+        setup_pressure_ingest,
+        items=INGEST_READINGS,
+    ),
+]
@@ -0,0 +1,262 @@
+"""Run the benchmark suite and compare with the stored baseline.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.run                    # run all, compare with baseline
+    python -m benchmarks.run -k hourly          # only cases containing "hourly"
+    python -m benchmarks.run --update-baseline  # store results as new baseline
+
+Every case reports throughput (ops/sec, best of several rounds with the
+garbage collector disabled, like ``timeit``) and memory (peak and retained
+allocations of one call, measured separately with ``tracemalloc``).
+
+Exit code is 1 if any case is slower or allocates more than the baseline
+beyond the tolerance.
+"""
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+import gc
+import json
+import logging
+from pathlib import Path
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+from .cases import CASES, BenchmarkCase
+
+BASELINE_FILE = Path(__file__).with_name("baseline.json")
+
+# Default allowed regression (fraction of the baseline value)
+DEFAULT_TOLERANCE = 0.30
+
+# Allocation differences below this are noise (KiB)
+MEMORY_SLACK_KIB = 16.0
+
+
+@dataclass
+class BenchmarkResult:
+    """Measured values of one case."""
+
+    ops_per_sec: float
+    peak_kib: float
+    retained_kib: float
+    rounds: int
+    loops: int
+
+
+def _time_loops(func: Callable[[], Any], loops: int) -> float:
+    """Return seconds needed to call func loops times (GC disabled)."""
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        return time.perf_counter() - start
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def _measure_memory(func: Callable[[], Any]) -> tuple[float, float]:
+    """Return (peak, retained) KiB allocated by one call of func.
+
+    Retained memory includes the returned value (e.g. the forecast list).
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = func()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return (peak - before) / 1024.0, (after - before) / 1024.0
+
+
+def run_case(
+    case: BenchmarkCase,
+    *,
+    scale: float = 1.0,
+    rounds: int = 5,
+    min_time: float = 0.2,
+) -> BenchmarkResult:
+    """Run one benchmark case.
+
+    Args:
+        case: Case to run
+        scale: Input size factor (1.0 = full size, smaller for smoke tests)
+        rounds: Number of timed rounds, the best one is reported
+        min_time: Minimum duration of one round in seconds
+
+    Returns:
+        BenchmarkResult of the case
+    """
+    func = case.setup(scale)
+    items = case.items_for_scale(scale)
+
+    # Warm up (imports, lru caches) and calibrate loops per round
+    elapsed = _time_loops(func, 1)
+    loops = 1
+    while elapsed < min_time and loops < 1_000_000:
+        loops *= 10 if elapsed < min_time / 10 else 2
+        elapsed = _time_loops(func, loops)
+
+    best = elapsed
+    for _ in range(rounds - 1):
+        best = min(best, _time_loops(func, loops))
+
+    peak_kib, retained_kib = _measure_memory(func)
+    return BenchmarkResult(
+        ops_per_sec=loops * items / best if best > 0 else float("inf"),
+        peak_kib=peak_kib,
+        retained_kib=retained_kib,
+        rounds=rounds,
+        loops=loops,
+    )
+
+
+def compare(
+    results: dict[str, BenchmarkResult],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[str]:
+    """Compare results with baseline values.
+
+    Args:
+        results: Measured results by case name
+        baseline: Baseline values by case name (cases missing here are skipped)
+        tolerance: Allowed regression as a fraction of the baseline
+
+    Returns:
+        List of regression messages (empty if none)
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+
+        min_ops = reference["ops_per_sec"] * (1.0 - tolerance)
+        if result.ops_per_sec < min_ops:
+            regressions.append(
+                f"{name}: {result.ops_per_sec:,.0f} ops/s is below "
+                f"baseline {reference['ops_per_sec']:,.0f} ops/s (-{tolerance:.0%} allowed)"
+            )
+
+        max_peak = reference["peak_kib"] * (1.0 + tolerance) + MEMORY_SLACK_KIB
+        if result.peak_kib > max_peak:
+            regressions.append(
+                f"{name}: peak allocation {result.peak_kib:,.1f} KiB is above "
+                f"baseline {reference['peak_kib']:,.1f} KiB (+{tolerance:.0%} allowed)"
+            )
+    return regressions
+
+
+def load_baseline(path: Path = BASELINE_FILE) -> dict[str, Any]:
+    """Load a baseline file (empty dict if it does not exist)."""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def environment() -> dict[str, str]:
+    """Describe the machine results were measured on."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def save_results(path: Path, results: dict[str, BenchmarkResult]) -> None:
+    """Write results (and the environment) as JSON."""
+    data = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment(),
+        "results": {
+            name: {
+                "ops_per_sec": round(result.ops_per_sec, 1),
+                "peak_kib": round(result.peak_kib, 1),
+                "retained_kib": round(result.retained_kib, 1),
+            }
+            for name, result in results.items()
+        },
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def _select(cases: Iterable[BenchmarkCase], keyword: str | None) -> list[BenchmarkCase]:
+    return [case for case in cases if not keyword or keyword in case.name]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark suite from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="keyword", help="only run cases whose name contains this")
+    parser.add_argument("--rounds", type=int, default=5, help="timed rounds per case")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds per round")
+    parser.add_argument(
+        "--tolerance", type=float, default=DEFAULT_TOLERANCE,
+        help="allowed regression as fraction of baseline (default %(default)s)",
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="baseline JSON file")
+    parser.add_argument("--output", type=Path, help="also write results to this JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="store results as baseline")
+    args = parser.parse_args(argv)
+
+    # Debug logging of the integration would dominate the measurements
+    logging.getLogger("custom_components.local_weather_forecast").setLevel(logging.WARNING)
+
+    baseline_data = load_baseline(args.baseline)
+    baseline = baseline_data.get("results", {})
+    if baseline_data and baseline_data.get("environment") != environment():
+        print(
+            f"Note: baseline was measured on {baseline_data.get('environment')}, "
+            f"this is {environment()}; ops/sec comparison may not be meaningful."
+        )
+
+    results: dict[str, BenchmarkResult] = {}
+    print(f"{'case':<22} {'ops/sec':>14} {'vs base':>8} {'peak KiB':>10} {'kept KiB':>10}")
+    for case in _select(CASES, args.keyword):
+        result = run_case(case, rounds=args.rounds, min_time=args.min_time)
+        results[case.name] = result
+        reference = baseline.get(case.name)
+        ratio = f"{result.ops_per_sec / reference['ops_per_sec']:.2f}x" if reference else "-"
+        print(
+            f"{case.name:<22} {result.ops_per_sec:>14,.1f} {ratio:>8} "
+            f"{result.peak_kib:>10,.1f} {result.retained_kib:>10,.1f}"
+        )
+
+    if args.output:
+        save_results(args.output, results)
+
+    if args.update_baseline:
+        merged = {
+            name: BenchmarkResult(**values, rounds=0, loops=0)
+            for name, values in baseline.items()
+            if name not in results
+        }
+        merged.update(results)
+        save_results(args.baseline, merged)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
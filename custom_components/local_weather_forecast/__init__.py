@@ -4,11 +4,22 @@ from __future__ import annotations
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    ENTITY_MAIN,
+    ENTITY_NEG_ZAM_DETAIL,
+    ENTITY_PRESSURE,
+    ENTITY_PRESSURE_CHANGE,
+    ENTITY_TEMPERATURE,
+    ENTITY_TEMPERATURE_CHANGE,
+    ENTITY_ZAMBRETTI_DETAIL,
+)
+from .coordinator import LocalForecastCoordinator, async_unique_id_prefix
+from .history_store import async_remove_histories
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,31 +31,42 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.debug("Setting up Local Weather Forecast integration")
 
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = entry.data
+    coordinator = LocalForecastCoordinator(hass, entry)
+    # First station keeps the legacy unique IDs, further stations are prefixed
+    coordinator.unique_id_prefix = async_unique_id_prefix(hass, entry)
+    hass.data[DOMAIN][entry.entry_id] = coordinator
 
     # Migrate entities to new unique IDs (remove entry_id prefix)
-    await async_migrate_entities(hass, entry)
+    await async_migrate_entities(hass, entry, coordinator)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    # The forecast language follows the system language unless set explicitly
+    entry.async_on_unload(
+        hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, coordinator.async_invalidate_language)
+    )
+    entry.async_on_unload(coordinator.last_known_good.async_stop)
 
     return True
 
 
-async def async_migrate_entities(hass: HomeAssistant, entry: ConfigEntry) -> None:
+async def async_migrate_entities(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: LocalForecastCoordinator
+) -> None:
     """Migrate entities from old unique_id format to new format."""
     entity_registry = er.async_get(hass)
 
-    # Mapping of old unique_id (with entry_id prefix) to new unique_id (without prefix)
+    # Mapping of old unique_id (with entry_id prefix) to the current unique_id
+    # (legacy YAML ID for the first station, entry-prefixed for further stations)
     migrations = {
-        f"{entry.entry_id}_main": "local_forecast",
-        f"{entry.entry_id}_pressure": "local_forecast_pressure",
-        f"{entry.entry_id}_temperature": "local_forecast_temperature",
-        f"{entry.entry_id}_pressure_change": "local_forecast_pressurechange",
-        f"{entry.entry_id}_temperature_change": "local_forecast_temperaturechange",
-        f"{entry.entry_id}_zambretti_detail": "local_forecast_zambretti_detail",
-        f"{entry.entry_id}_neg_zam_detail": "local_forecast_neg_zam_detail",
+        f"{entry.entry_id}_main": coordinator.unique_id(ENTITY_MAIN),
+        f"{entry.entry_id}_pressure": coordinator.unique_id(ENTITY_PRESSURE),
+        f"{entry.entry_id}_temperature": coordinator.unique_id(ENTITY_TEMPERATURE),
+        f"{entry.entry_id}_pressure_change": coordinator.unique_id(ENTITY_PRESSURE_CHANGE),
+        f"{entry.entry_id}_temperature_change": coordinator.unique_id(ENTITY_TEMPERATURE_CHANGE),
+        f"{entry.entry_id}_zambretti_detail": coordinator.unique_id(ENTITY_ZAMBRETTI_DETAIL),
+        f"{entry.entry_id}_neg_zam_detail": coordinator.unique_id(ENTITY_NEG_ZAM_DETAIL),
     }
 
     for old_unique_id, new_unique_id in migrations.items():
@@ -83,14 +105,22 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove stored change sensor history when the config entry is deleted."""
+    await async_remove_histories(hass, entry.entry_id)
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry when options change."""
     # Only reload if sensor configuration or critical settings changed
     # This prevents infinite reload loop when only options like enable_weather_entity change
 
     # Get old and new data
-    old_data = hass.data[DOMAIN].get(entry.entry_id, {})
+    coordinator = hass.data[DOMAIN].get(entry.entry_id)
+    old_data = coordinator.config_data if coordinator else {}
     new_data = entry.data
+    if coordinator:
+        coordinator.async_invalidate_language()
 
     # Check if sensor configuration changed (these require platform reload)
     sensor_keys = [
@@ -113,7 +143,7 @@ async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
             break
 
     # Check if critical settings changed
-    critical_keys = ["elevation", "pressure_type", "hemisphere", "forecast_model", "language", "enable_weather_entity"]
+    critical_keys = ["elevation", "pressure_type", "hemisphere", "forecast_model", "language", "enable_weather_entity", "stage_timing"]
     critical_changed = False
     for key in critical_keys:
         if old_data.get(key) != new_data.get(key):
@@ -129,5 +159,6 @@ async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     else:
         # Just update the data in memory without reload
         _LOGGER.debug("Configuration unchanged, skipping reload")
-        hass.data[DOMAIN][entry.entry_id] = new_data
+        if coordinator:
+            coordinator.config_data = dict(new_data)
 
@@ -0,0 +1,99 @@
+"""Helpers for the batch (vectorized) forecast APIs.
+
+The ``*_batch`` functions of the forecast algorithms accept scalars,
+sequences or NumPy arrays for every observation input.  Scalars are
+broadcast to the length of the other inputs.
+
+NumPy is optional: when it is installed, inputs are processed with array
+operations and results are returned as ``numpy.ndarray``.  Without NumPy
+(or with ``use_numpy=False``) a pure Python loop over the memoized scalar
+core is used, and results are returned as ``array("i")`` for forecast
+numbers and ``list[str]`` for letters.
+"""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from itertools import repeat
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on environment
+    np = None  # type: ignore[assignment]
+
+HAS_NUMPY = np is not None
+
+# Batch results: (forecast numbers, letter codes)
+BatchResult = tuple[Any, Any]
+
+
+def numpy_enabled(use_numpy: bool = True) -> bool:
+    """Return True if the NumPy implementation should be used."""
+    return use_numpy and HAS_NUMPY
+
+
+def broadcast(*values: Any) -> tuple[int, list[Sequence[Any]]]:
+    """Broadcast scalars and sequences to a common length (pure Python).
+
+    Args:
+        values: Scalars or sequences (sequences must have equal length)
+
+    Returns:
+        (length, list of sequences) - scalars are repeated
+
+    Raises:
+        ValueError: If sequences have different lengths
+    """
+    lengths = {len(value) for value in values if _is_sequence(value)}
+    if len(lengths) > 1:
+        raise ValueError(f"Batch inputs have different lengths: {sorted(lengths)}")
+    length = lengths.pop() if lengths else 1
+    return length, [value if _is_sequence(value) else repeat(value, length) for value in values]
+
+
+def broadcast_arrays(*values: Any) -> list[Any]:
+    """Broadcast scalars, sequences and arrays to 1-d float arrays (NumPy)."""
+    arrays = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in values))
+    return [np.atleast_1d(value) for value in arrays]
+
+
+def wind_factors(wind_direction: float, wind_speed: float) -> tuple[int, int]:
+    """Return (wind_fak, wind_speed_fak) like the main sensor's wind data.
+
+    Args:
+        wind_direction: Wind direction in degrees
+        wind_speed: Wind speed in m/s
+
+    Returns:
+        wind_fak (0 = north, 1 = east/west, 2 = south) and wind_speed_fak
+        (1 if wind speed >= 1 m/s, else 0)
+    """
+    wind_speed_fak = 1 if wind_speed >= 1 else 0
+    if 135 <= wind_direction <= 225:
+        wind_fak = 2
+    elif wind_direction >= 315 or wind_direction <= 45:
+        wind_fak = 0
+    else:
+        wind_fak = 1
+    return wind_fak, wind_speed_fak
+
+
+def wind_factors_array(wind_direction: Any, wind_speed: Any) -> tuple[Any, Any]:
+    """Vectorized wind_factors() for NumPy arrays."""
+    wind_speed_fak = (wind_speed >= 1).astype(int)
+    wind_fak = np.where(
+        (wind_direction >= 135) & (wind_direction <= 225),
+        2,
+        np.where((wind_direction >= 315) | (wind_direction <= 45), 0, 1),
+    )
+    return wind_fak, wind_speed_fak
+
+
+def to_result(numbers: list[int], letters: list[str]) -> BatchResult:
+    """Pack pure Python results."""
+    return array("i", numbers), letters
+
+
+def _is_sequence(value: Any) -> bool:
+    return not isinstance(value, (str, bytes)) and hasattr(value, "__len__")
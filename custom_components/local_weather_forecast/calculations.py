@@ -3,8 +3,9 @@ from __future__ import annotations
 
 import logging
 import math
-from typing import Optional
+from typing import Any, Optional
 
+from .batch import broadcast, broadcast_arrays, np, numpy_enabled
 from .const import (
     COMFORT_VERY_COLD,
     COMFORT_COLD,
@@ -26,6 +27,21 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+# Magnus formula constants of the dew point
+_DEWPOINT_A = 17.27
+_DEWPOINT_B = 237.7
+
+# Magnus formula constants of the saturation vapor pressure (future humidity)
+_VAPOR_A = 17.67
+_VAPOR_B = 243.5
+
+
+def _dewpoint(temperature: float, humidity: float) -> float:
+    """Dew point in °C (Magnus formula), unrounded; humidity must be 0-100 %."""
+    alpha = ((_DEWPOINT_A * temperature) / (_DEWPOINT_B + temperature)) + math.log(humidity / 100.0)
+    return (_DEWPOINT_B * alpha) / (_DEWPOINT_A - alpha)
+
+
 def calculate_dewpoint(temperature: float, humidity: float) -> Optional[float]:
     """
     Calculate dew point temperature using Magnus formula.
@@ -42,15 +58,7 @@ def calculate_dewpoint(temperature: float, humidity: float) -> Optional[float]:
         return None
 
     try:
-        # Magnus formula constants
-        a = 17.27
-        b = 237.7
-
-        # Calculate alpha
-        alpha = ((a * temperature) / (b + temperature)) + math.log(humidity / 100.0)
-
-        # Calculate dew point
-        dewpoint = (b * alpha) / (a - alpha)
+        dewpoint = _dewpoint(temperature, humidity)
 
         _LOGGER.debug(f"Dewpoint: T={temperature:.1f}°C, RH={humidity:.1f}% → Dewpoint={dewpoint:.1f}°C")
 
@@ -152,6 +160,42 @@ def get_precipitation_type_from_wet_bulb(
             return 'mixed'  # True transition conditions
 
 
+def _future_humidity(
+    current_temperature: float,
+    current_humidity: float,
+    future_temperature: float,
+    pressure_change: float,
+) -> float:
+    """Future relative humidity in %, unrounded (see calculate_future_humidity)."""
+    # Step 1: Calculate current saturation vapor pressure (Magnus formula)
+    # es = 6.112 × exp((17.67 × T) / (T + 243.5))
+    es_current = 6.112 * math.exp((_VAPOR_A * current_temperature) / (_VAPOR_B + current_temperature))
+
+    # Step 2: Calculate actual vapor pressure (from current RH)
+    # e = RH × es / 100
+    e_actual = (current_humidity / 100.0) * es_current
+
+    # Step 3: Calculate future saturation vapor pressure
+    es_future = 6.112 * math.exp((_VAPOR_A * future_temperature) / (_VAPOR_B + future_temperature))
+
+    # Step 4: Calculate future relative humidity (assuming constant absolute humidity)
+    # RH_future = (e_actual / es_future) × 100
+    future_humidity = (e_actual / es_future) * 100.0
+
+    # Clamp to valid range [1, 100]
+    future_humidity = max(1.0, min(100.0, future_humidity))
+
+    # Adiabatic correction for pressure changes (optional, small effect)
+    if abs(pressure_change) > PRESSURE_TREND_RISING:
+        # Rising pressure (compression) → slight moisture reduction
+        # Falling pressure (expansion) → slight moisture increase
+        # Rule of thumb: ±1% RH per ±10 hPa change
+        adiabatic_adjustment = -pressure_change * 0.1  # hPa → % RH
+        future_humidity = max(1.0, min(100.0, future_humidity + adiabatic_adjustment))
+
+    return future_humidity
+
+
 def calculate_future_humidity(
     current_temperature: float,
     current_humidity: float,
@@ -189,34 +233,9 @@ def calculate_future_humidity(
         return None
     
     try:
-        # Step 1: Calculate current saturation vapor pressure (Magnus formula)
-        # es = 6.112 × exp((17.67 × T) / (T + 243.5))
-        a = 17.67
-        b = 243.5
-        
-        es_current = 6.112 * math.exp((a * current_temperature) / (b + current_temperature))
-        
-        # Step 2: Calculate actual vapor pressure (from current RH)
-        # e = RH × es / 100
-        e_actual = (current_humidity / 100.0) * es_current
-        
-        # Step 3: Calculate future saturation vapor pressure
-        es_future = 6.112 * math.exp((a * future_temperature) / (b + future_temperature))
-        
-        # Step 4: Calculate future relative humidity (assuming constant absolute humidity)
-        # RH_future = (e_actual / es_future) × 100
-        future_humidity = (e_actual / es_future) * 100.0
-        
-        # Clamp to valid range [1, 100]
-        future_humidity = max(1.0, min(100.0, future_humidity))
-        
-        # Adiabatic correction for pressure changes (optional, small effect)
-        if abs(pressure_change) > PRESSURE_TREND_RISING:
-            # Rising pressure (compression) → slight moisture reduction
-            # Falling pressure (expansion) → slight moisture increase
-            # Rule of thumb: ±1% RH per ±10 hPa change
-            adiabatic_adjustment = -pressure_change * 0.1  # hPa → % RH
-            future_humidity = max(1.0, min(100.0, future_humidity + adiabatic_adjustment))
+        future_humidity = _future_humidity(
+            current_temperature, current_humidity, future_temperature, pressure_change
+        )
         
         _LOGGER.debug(
             f"FutureRH: T={current_temperature:.1f}°C → {future_temperature:.1f}°C, "
@@ -429,6 +448,26 @@ def calculate_wind_chill(temperature: float, wind_speed: float) -> Optional[floa
         return None
 
 
+def _humidity_effect(temperature: float, humidity: float) -> float:
+    """Humidity contribution to the apparent temperature in °C."""
+    # Calculate water vapor pressure (e) in hPa
+    e = (humidity / 100) * 6.105 * math.exp((17.27 * temperature) / (237.7 + temperature))
+    # Humidity contribution (calibrated to Netatmo)
+    return 0.18 * e - 0.9
+
+
+def _wind_effect(wind_speed: float) -> float:
+    """Wind contribution to the apparent temperature in °C (wind speed in km/h)."""
+    ws_ms = wind_speed / 3.6  # Convert km/h to m/s
+    # Wind chill contribution (calibrated to Netatmo)
+    return -0.15 * ws_ms
+
+
+def _solar_effect(solar_radiation: float) -> float:
+    """Solar contribution to the apparent temperature in °C."""
+    return solar_radiation / 200.0  # Scale factor
+
+
 def calculate_apparent_temperature(
     temperature: float,
     humidity: Optional[float] = None,
@@ -460,18 +499,13 @@ def calculate_apparent_temperature(
 
         # 1. HUMIDITY EFFECT (vapor pressure makes it feel warmer/colder)
         if humidity is not None:
-            # Calculate water vapor pressure (e) in hPa
-            e = (humidity / 100) * 6.105 * math.exp((17.27 * temperature) / (237.7 + temperature))
-            # Humidity contribution (calibrated to Netatmo)
-            humidity_effect = 0.18 * e - 0.9
+            humidity_effect = _humidity_effect(temperature, humidity)
             apparent_temp += humidity_effect
             components.append(f"humidity_effect={humidity_effect:+.1f}°C")
 
         # 2. WIND CHILL EFFECT (wind makes it feel colder)
         if wind_speed is not None and wind_speed > 0:
-            ws_ms = wind_speed / 3.6  # Convert km/h to m/s
-            # Wind chill contribution (calibrated to Netatmo)
-            wind_effect = -0.15 * ws_ms
+            wind_effect = _wind_effect(wind_speed)
             apparent_temp += wind_effect
             components.append(f"wind_effect={wind_effect:+.1f}°C")
 
@@ -480,7 +514,7 @@ def calculate_apparent_temperature(
             # Solar warming effect (stronger when sun is high)
             # Typical range: 0-1000 W/m²
             # At 800 W/m² (full sun), adds ~4°C
-            solar_factor = solar_radiation / 200.0  # Scale factor
+            solar_factor = _solar_effect(solar_radiation)
             components.append(f"solar_effect={solar_factor:+.1f}°C")
             apparent_temp += solar_factor
 
@@ -494,6 +528,183 @@ def calculate_apparent_temperature(
         return temperature
 
 
+def _rounded_or_none(values: Any, valid: Any) -> list[Optional[float]]:
+    """Round array values to 0.1 like the scalar functions (None where invalid)."""
+    # Python's round() on the floats, np.round() rounds differently at .x5
+    return [
+        round(value, 1) if is_valid else None
+        for value, is_valid in zip(values.tolist(), valid.tolist())
+    ]
+
+
+def calculate_future_humidity_batch(
+    current_temperature: float,
+    current_humidity: float,
+    future_temperature: Any,
+    pressure_change: Any = 0.0,
+    *,
+    use_numpy: bool = True,
+) -> list[Optional[float]]:
+    """Calculate future relative humidity for a whole forecast horizon.
+
+    Future temperatures and pressure changes can be scalars, sequences or
+    NumPy arrays; scalars are broadcast.  Results match
+    calculate_future_humidity() element-wise.
+
+    Args:
+        current_temperature: Current air temperature in °C
+        current_humidity: Current relative humidity in %
+        future_temperature: Predicted future temperatures in °C
+        pressure_change: Pressure changes in hPa
+        use_numpy: Use NumPy if installed
+
+    Returns:
+        Predicted relative humidity in % per hour (None where the calculation fails)
+    """
+    if current_humidity <= 0 or current_humidity > 100:
+        _LOGGER.debug("FutureRH: Invalid current humidity=%s%%", current_humidity)
+        length, _ = broadcast(future_temperature, pressure_change)
+        return [None] * length
+
+    if numpy_enabled(use_numpy):
+        future_temperature, pressure_change = broadcast_arrays(future_temperature, pressure_change)
+        with np.errstate(all="ignore"):
+            es_current = 6.112 * math.exp(
+                (_VAPOR_A * current_temperature) / (_VAPOR_B + current_temperature)
+            )
+            e_actual = (current_humidity / 100.0) * es_current
+            es_future = 6.112 * np.exp(
+                (_VAPOR_A * future_temperature) / (_VAPOR_B + future_temperature)
+            )
+            future_humidity = np.clip((e_actual / es_future) * 100.0, 1.0, 100.0)
+            adjust = np.abs(pressure_change) > PRESSURE_TREND_RISING
+            future_humidity = np.where(
+                adjust,
+                np.clip(future_humidity + -pressure_change * 0.1, 1.0, 100.0),
+                future_humidity,
+            )
+        return _rounded_or_none(future_humidity, np.isfinite(es_future) & (es_future != 0))
+
+    _, inputs = broadcast(future_temperature, pressure_change)
+    results: list[Optional[float]] = []
+    for temperature, change in zip(*inputs):
+        try:
+            results.append(round(
+                _future_humidity(current_temperature, current_humidity, temperature, change), 1
+            ))
+        except (ValueError, ZeroDivisionError):
+            results.append(None)
+    return results
+
+
+def calculate_dewpoint_batch(
+    temperature: Any,
+    humidity: Any,
+    *,
+    use_numpy: bool = True,
+) -> list[Optional[float]]:
+    """Calculate dew points for a whole forecast horizon.
+
+    Inputs can be scalars, sequences or NumPy arrays; scalars are broadcast.
+    Results match calculate_dewpoint() element-wise.
+
+    Args:
+        temperature: Temperatures in °C
+        humidity: Relative humidities in %
+        use_numpy: Use NumPy if installed
+
+    Returns:
+        Dew points in °C (None where humidity is invalid or the calculation fails)
+    """
+    if numpy_enabled(use_numpy):
+        temperature, humidity = broadcast_arrays(temperature, humidity)
+        valid = (humidity > 0) & (humidity <= 100)
+        with np.errstate(all="ignore"):
+            alpha = (
+                (_DEWPOINT_A * temperature) / (_DEWPOINT_B + temperature)
+                + np.log(np.where(valid, humidity, 100.0) / 100.0)
+            )
+            dewpoint = (_DEWPOINT_B * alpha) / (_DEWPOINT_A - alpha)
+        return _rounded_or_none(dewpoint, valid & np.isfinite(dewpoint))
+
+    _, inputs = broadcast(temperature, humidity)
+    results: list[Optional[float]] = []
+    for temp, rh in zip(*inputs):
+        if rh <= 0 or rh > 100:
+            results.append(None)
+            continue
+        try:
+            results.append(round(_dewpoint(temp, rh), 1))
+        except (ValueError, ZeroDivisionError):
+            results.append(None)
+    return results
+
+
+def calculate_apparent_temperature_batch(
+    temperature: Any,
+    humidity: Any = None,
+    wind_speed: Any = None,
+    solar_radiation: Any = None,
+    *,
+    use_numpy: bool = True,
+) -> list[float]:
+    """Calculate apparent temperatures (feels like) for a whole forecast horizon.
+
+    Inputs can be scalars, sequences or NumPy arrays; scalars are broadcast.
+    Like in calculate_apparent_temperature(), an optional input that is None
+    is ignored.  Results match calculate_apparent_temperature() element-wise.
+
+    Args:
+        temperature: Temperatures in °C
+        humidity: Relative humidities in % (optional)
+        wind_speed: Wind speeds in km/h (optional)
+        solar_radiation: Solar radiation in W/m² (optional)
+        use_numpy: Use NumPy if installed
+
+    Returns:
+        Apparent temperatures in °C
+    """
+    if numpy_enabled(use_numpy):
+        optional = [value for value in (humidity, wind_speed, solar_radiation) if value is not None]
+        temperature, *optional = broadcast_arrays(temperature, *optional)
+        inputs = iter(optional)
+        apparent = temperature
+        with np.errstate(all="ignore"):
+            if humidity is not None:
+                e = (next(inputs) / 100) * 6.105 * np.exp((17.27 * temperature) / (237.7 + temperature))
+                apparent = apparent + (0.18 * e - 0.9)
+            if wind_speed is not None:
+                speed = next(inputs)
+                apparent = np.where(speed > 0, apparent + -0.15 * (speed / 3.6), apparent)
+            if solar_radiation is not None:
+                radiation = next(inputs)
+                apparent = np.where(radiation > 0, apparent + radiation / 200.0, apparent)
+        # Failed calculations return the temperature itself
+        valid = np.isfinite(apparent)
+        return [
+            round(value, 1) if is_valid else fallback
+            for value, is_valid, fallback in zip(
+                apparent.tolist(), valid.tolist(), temperature.tolist()
+            )
+        ]
+
+    _, inputs = broadcast(temperature, humidity, wind_speed, solar_radiation)
+    results: list[float] = []
+    for temp, rh, speed, radiation in zip(*inputs):
+        try:
+            apparent = temp
+            if rh is not None:
+                apparent += _humidity_effect(temp, rh)
+            if speed is not None and speed > 0:
+                apparent += _wind_effect(speed)
+            if radiation is not None and radiation > 0:
+                apparent += _solar_effect(radiation)
+            results.append(round(apparent, 1))
+        except (ValueError, ZeroDivisionError, OverflowError):
+            results.append(temp)
+    return results
+
+
 def get_comfort_level(apparent_temperature: float) -> str:
     """
     Get comfort level based on apparent temperature.
@@ -20,6 +20,8 @@ import logging
 import math
 from datetime import datetime, timedelta, timezone
 
+from .solar_ephemeris import sun_angle_factor
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -94,7 +96,10 @@ def calculate_combined_forecast_with_time(
                 forecast_number = min(forecast_number, 5)
                 capped = True
                 _LOGGER.debug(
-                    f"🛡️ Sanity check L1: cloud={cloud_cover}%%, humidity={humidity}%% → capped to {forecast_number}"
+                    "🛡️ Sanity check L1: cloud=%s%%%%, humidity=%s%%%% → capped to %s",
+                    cloud_cover,
+                    humidity,
+                    forecast_number
                 )
         elif humidity is not None:
             # Level 2: Humidity-only — very dry air = rain physically impossible
@@ -102,14 +107,24 @@ def calculate_combined_forecast_with_time(
                 forecast_number = min(forecast_number, 5)
                 capped = True
                 _LOGGER.debug(
-                    f"🛡️ Sanity check L2: humidity={humidity}%% → capped to {forecast_number}"
+                    "🛡️ Sanity check L2: humidity=%s%%%% → capped to %s",
+                    humidity,
+                    forecast_number
                 )
         # Level 3: No sensors — skip, rely on threshold fixes
     
     _LOGGER.debug(
-        f"🎯 {source}: P={current_pressure:.1f} hPa, ΔP={pressure_change:+.1f} hPa → "
-        f"{reason} → Z:{zambretti_weight:.0%}/N:{negretti_weight:.0%} → "
-        f"{decision} → forecast_code={forecast_number}"
+        "🎯 %s: P=%.1f hPa, ΔP=%+.1f hPa → "
+        "%s → Z:%.0f%%/N:%.0f%% → "
+        "%s → forecast_code=%s",
+        source,
+        current_pressure,
+        pressure_change,
+        reason,
+        zambretti_weight * 100,
+        negretti_weight * 100,
+        decision,
+        forecast_number
     )
     
     return (
@@ -373,11 +388,11 @@ def calculate_combined_rain_probability(
     # ✅ FIXED: Handle None values for letter codes
     # If letter is None or invalid, use default 'M' (middle forecast, 50% probability)
     if zambretti_letter is None or not isinstance(zambretti_letter, str) or len(zambretti_letter) == 0:
-        _LOGGER.debug(f"Invalid zambretti_letter={zambretti_letter}, using default 'M'")
+        _LOGGER.debug("Invalid zambretti_letter=%s, using default 'M'", zambretti_letter)
         zambretti_letter = 'M'
     
     if negretti_letter is None or not isinstance(negretti_letter, str) or len(negretti_letter) == 0:
-        _LOGGER.debug(f"Invalid negretti_letter={negretti_letter}, using default 'M'")
+        _LOGGER.debug("Invalid negretti_letter=%s, using default 'M'", negretti_letter)
         negretti_letter = 'M'
     
     # Import rain probability mapping
@@ -404,10 +419,17 @@ def calculate_combined_rain_probability(
         )
 
         _LOGGER.debug(
-            f"Combined rain probability: "
-            f"Z:{zambretti_letter}({zambretti_rain}%) × {zambretti_weight:.0%} + "
-            f"N:{negretti_letter}({negretti_rain}%) × {negretti_weight:.0%} = "
-            f"{combined_rain:.0f}%"
+            "Combined rain probability: "
+            "Z:%s(%s%%) × %.0f%% + "
+            "N:%s(%s%%) × %.0f%% = "
+            "%.0f%%",
+            zambretti_letter,
+            zambretti_rain,
+            zambretti_weight * 100,
+            negretti_letter,
+            negretti_rain,
+            negretti_weight * 100,
+            combined_rain
         )
 
         return combined_rain
@@ -478,8 +500,12 @@ def generate_enhanced_hourly_forecast(
             confidence = forecast_result[3]
             
             _LOGGER.debug(
-                f"🎯 Hour {hour}: PERSISTENCE → {forecast_text} "
-                f"(code={forecast_code}, confidence={confidence:.0%})"
+                "🎯 Hour %s: PERSISTENCE → %s "
+                "(code=%s, confidence=%.0f%%)",
+                hour,
+                forecast_text,
+                forecast_code,
+                confidence * 100
             )
         
         elif hour <= 3:
@@ -511,8 +537,12 @@ def generate_enhanced_hourly_forecast(
             confidence = forecast_result[3]
             
             _LOGGER.debug(
-                f"🎯 Hour {hour}: WMO SIMPLE → {forecast_text} "
-                f"(code={forecast_code}, confidence={confidence:.0%})"
+                "🎯 Hour %s: WMO SIMPLE → %s "
+                "(code=%s, confidence=%.0f%%)",
+                hour,
+                forecast_text,
+                forecast_code,
+                confidence * 100
             )
         
         elif hour <= 6:
@@ -578,8 +608,13 @@ def generate_enhanced_hourly_forecast(
             confidence = wmo_result[3] * wmo_weight + (0.85 if consensus else 0.78) * td_weight
             
             _LOGGER.debug(
-                f"🎯 Hour {hour}: BLEND → {forecast_text} "
-                f"(WMO:{wmo_weight:.0%}, TD:{td_weight:.0%}, confidence={confidence:.0%})"
+                "🎯 Hour %s: BLEND → %s "
+                "(WMO:%.0f%%, TD:%.0f%%, confidence=%.0f%%)",
+                hour,
+                forecast_text,
+                wmo_weight * 100,
+                td_weight * 100,
+                confidence * 100
             )
         
         else:
@@ -613,9 +648,14 @@ def generate_enhanced_hourly_forecast(
             confidence = 0.85 if consensus else 0.78
             
             _LOGGER.debug(
-                f"🎯 Hour {hour}: TIME DECAY → {forecast_text} "
-                f"(Z:{zambretti_weight:.0%}/N:{negretti_weight:.0%}, "
-                f"confidence={confidence:.0%})"
+                "🎯 Hour %s: TIME DECAY → %s "
+                "(Z:%.0f%%/N:%.0f%%, "
+                "confidence=%.0f%%)",
+                hour,
+                forecast_text,
+                zambretti_weight * 100,
+                negretti_weight * 100,
+                confidence * 100
             )
         
         # ═══════════════════════════════════════
@@ -877,11 +917,22 @@ def calculate_weather_aware_temperature(
     # ═══════════════════════════════════════
     # 3. WEATHER CONDITION ADJUSTMENTS
     # ═══════════════════════════════════════
+    # Sun angle at the forecast hour from the cached solar ephemeris
+    try:
+        future_time = current_time.replace(
+            hour=int(current_hour) % 24, minute=0, second=0, microsecond=0
+        ) + timedelta(hours=hour)
+        future_sun_factor = sun_angle_factor(future_time, latitude, longitude)
+    except (TypeError, ValueError):
+        # Mock or invalid location - use fixed-hours approximation
+        future_sun_factor = None
+
     weather_adjustment = _get_weather_temperature_adjustment(
         forecast_code=forecast_code,
         future_hour=future_hour_of_day,
         solar_radiation=solar_radiation,
-        cloud_cover=cloud_cover
+        cloud_cover=cloud_cover,
+        sun_factor=future_sun_factor,
     )
     
     # ═══════════════════════════════════════
@@ -893,7 +944,7 @@ def calculate_weather_aware_temperature(
     if elevation is not None and elevation > 0:
         # Compared to sea level (0m)
         elevation_correction = -0.0065 * elevation
-        _LOGGER.debug(f"Elevation correction: {elevation_correction:+.2f}°C for {elevation}m")
+        _LOGGER.debug("Elevation correction: %+.2f°C for %sm", elevation_correction, elevation)
     
     # ═══════════════════════════════════════
     # 5. HUMIDITY/DEWPOINT EFFECT
@@ -925,8 +976,12 @@ def calculate_weather_aware_temperature(
                         0.3965 * base_temp * (wind_kmh ** 0.16)
             wind_effect = wind_chill - base_temp
             _LOGGER.debug(
-                f"Wind chill: {wind_chill:.1f}°C (base: {base_temp:.1f}°C, "
-                f"wind: {wind_speed:.1f}m/s, effect: {wind_effect:+.1f}°C)"
+                "Wind chill: %.1f°C (base: %.1f°C, "
+                "wind: %.1fm/s, effect: %+.1f°C)",
+                wind_chill,
+                base_temp,
+                wind_speed,
+                wind_effect
             )
         
         # Heat index for hot+humid conditions (T > 27°C, humidity > 40%)
@@ -940,8 +995,12 @@ def calculate_weather_aware_temperature(
                  0.00072546 * T * RH * RH - 0.000003582 * T * T * RH * RH
             wind_effect = HI - base_temp
             _LOGGER.debug(
-                f"Heat index: {HI:.1f}°C (base: {base_temp:.1f}°C, "
-                f"humidity: {humidity:.0f}%, effect: {wind_effect:+.1f}°C)"
+                "Heat index: %.1f°C (base: %.1f°C, "
+                "humidity: %.0f%%, effect: %+.1f°C)",
+                HI,
+                base_temp,
+                humidity,
+                wind_effect
             )
     
     # ═══════════════════════════════════════
@@ -954,10 +1013,20 @@ def calculate_weather_aware_temperature(
     predicted = max(-40.0, min(50.0, predicted))
     
     _LOGGER.debug(
-        f"🌡️ Temperature h{hour}: {predicted:.1f}°C "
-        f"(base={current_temp:.1f}, fcst_trend={trend_change:+.1f} [bias={forecast_bias:+.3f}°C/h], "
-        f"diurnal={diurnal_change:+.1f}, weather={weather_adjustment:+.1f}, "
-        f"elev={elevation_correction:+.1f}, humid={humidity_effect:+.1f}, wind={wind_effect:+.1f})"
+        "🌡️ Temperature h%s: %.1f°C "
+        "(base=%.1f, fcst_trend=%+.1f [bias=%+.3f°C/h], "
+        "diurnal=%+.1f, weather=%+.1f, "
+        "elev=%+.1f, humid=%+.1f, wind=%+.1f)",
+        hour,
+        predicted,
+        current_temp,
+        trend_change,
+        forecast_bias,
+        diurnal_change,
+        weather_adjustment,
+        elevation_correction,
+        humidity_effect,
+        wind_effect
     )
     
     return round(predicted, 1)
@@ -989,7 +1058,8 @@ def _get_weather_temperature_adjustment(
     forecast_code: int,
     future_hour: int,
     solar_radiation: float | None,
-    cloud_cover: float | None
+    cloud_cover: float | None,
+    sun_factor: float | None = None,
 ) -> float:
     """Calculate temperature adjustment based on weather condition.
     
@@ -998,6 +1068,8 @@ def _get_weather_temperature_adjustment(
         future_hour: Hour of day (0-23)
         solar_radiation: Solar radiation W/m² (optional)
         cloud_cover: Cloud cover % (optional)
+        sun_factor: Sun angle factor 0.0-1.0 from the solar ephemeris
+            (optional, defaults to fixed-hours approximation)
         
     Returns:
         Temperature adjustment in °C
@@ -1037,7 +1109,8 @@ def _get_weather_temperature_adjustment(
             max_warming = (solar_rad_value / 400.0) * 2.0
             
             # Sun angle factor (stronger at midday)
-            sun_factor = _get_sun_angle_factor(future_hour)
+            if sun_factor is None:
+                sun_factor = _get_sun_angle_factor(future_hour)
             adjustment = max_warming * sun_factor
         else:
             # Fallback: typical sunny day warming
@@ -16,23 +16,31 @@ from .const import (
     CONF_ELEVATION,
     CONF_ENABLE_WEATHER_ENTITY,
     CONF_FORECAST_MODEL,
+    CONF_FORECAST_TRACE,
+    CONF_STAGE_TIMING,
     CONF_HEMISPHERE,
     CONF_HUMIDITY_SENSOR,
     CONF_LANGUAGE,
     CONF_PRESSURE_SENSOR,
     CONF_PRESSURE_TYPE,
     CONF_RAIN_RATE_SENSOR,
+    CONF_SENSOR_UPDATE_INTERVAL,
     CONF_SOLAR_RADIATION_SENSOR,
     CONF_TEMPERATURE_SENSOR,
     CONF_WIND_DIRECTION_SENSOR,
     CONF_WIND_GUST_SENSOR,
     CONF_WIND_SPEED_SENSOR,
+    CONF_WEATHER_UPDATE_DEBOUNCE,
     DEFAULT_ELEVATION,
     DEFAULT_ENABLE_WEATHER_ENTITY,
     DEFAULT_FORECAST_MODEL,
+    DEFAULT_FORECAST_TRACE,
+    DEFAULT_STAGE_TIMING,
     DEFAULT_HEMISPHERE,
     DEFAULT_LANGUAGE,
     DEFAULT_PRESSURE_TYPE,
+    DEFAULT_SENSOR_UPDATE_INTERVAL,
+    DEFAULT_WEATHER_UPDATE_DEBOUNCE,
     DOMAIN,
     FORECAST_MODEL_ENHANCED,
     FORECAST_MODEL_NEGRETTI,
@@ -42,6 +50,9 @@ from .const import (
     LANGUAGES,
     PRESSURE_TYPE_ABSOLUTE,
     PRESSURE_TYPE_RELATIVE,
+    SENSOR_UPDATE_INTERVAL_MAX,
+    WEATHER_UPDATE_DEBOUNCE_MAX,
+    WEATHER_UPDATE_DEBOUNCE_MIN,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -740,6 +751,42 @@ class LocalWeatherForecastOptionsFlow(config_entries.OptionsFlow):
                     CONF_ENABLE_WEATHER_ENTITY,
                     default=current_config.get(CONF_ENABLE_WEATHER_ENTITY, DEFAULT_ENABLE_WEATHER_ENTITY),
                 ): selector.BooleanSelector(),
+                vol.Optional(
+                    CONF_SENSOR_UPDATE_INTERVAL,
+                    default=current_config.get(
+                        CONF_SENSOR_UPDATE_INTERVAL, DEFAULT_SENSOR_UPDATE_INTERVAL
+                    ),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=SENSOR_UPDATE_INTERVAL_MAX,
+                        step=5,
+                        unit_of_measurement="s",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Optional(
+                    CONF_WEATHER_UPDATE_DEBOUNCE,
+                    default=current_config.get(
+                        CONF_WEATHER_UPDATE_DEBOUNCE, DEFAULT_WEATHER_UPDATE_DEBOUNCE
+                    ),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=WEATHER_UPDATE_DEBOUNCE_MIN,
+                        max=WEATHER_UPDATE_DEBOUNCE_MAX,
+                        step=0.25,
+                        unit_of_measurement="s",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Optional(
+                    CONF_FORECAST_TRACE,
+                    default=current_config.get(CONF_FORECAST_TRACE, DEFAULT_FORECAST_TRACE),
+                ): selector.BooleanSelector(),
+                vol.Optional(
+                    CONF_STAGE_TIMING,
+                    default=current_config.get(CONF_STAGE_TIMING, DEFAULT_STAGE_TIMING),
+                ): selector.BooleanSelector(),
             }
         )
 
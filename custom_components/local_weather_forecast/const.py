@@ -28,6 +28,10 @@ CONF_ENABLE_WEATHER_ENTITY: Final = "enable_weather_entity"
 CONF_ENABLE_EXTENDED_SENSORS: Final = "enable_extended_sensors"
 CONF_FORECAST_INTERVAL: Final = "forecast_interval"
 CONF_FORECAST_MODEL: Final = "forecast_model"  # v3.1.4+ - Which forecast model to use
+CONF_FORECAST_TRACE: Final = "forecast_trace"  # Keep structured per-hour trace of forecast calculations
+CONF_STAGE_TIMING: Final = "stage_timing"  # Measure calculation stages (diagnostics + timing sensor)
+CONF_WEATHER_UPDATE_DEBOUNCE: Final = "weather_update_debounce"  # Seconds to coalesce weather entity writes
+CONF_SENSOR_UPDATE_INTERVAL: Final = "sensor_update_interval"  # Minimum seconds between sensor recalculations
 
 # Hemisphere options (v3.1.4+)
 HEMISPHERE_NORTH: Final = "north"  # Northern hemisphere (latitude >= 0)
@@ -42,6 +46,21 @@ FORECAST_MODEL_ZAMBRETTI: Final = "zambretti"  # Original Zambretti algorithm
 FORECAST_MODEL_NEGRETTI: Final = "negretti"    # Negretti & Zambra slide rule algorithm
 FORECAST_MODEL_ENHANCED: Final = "enhanced"    # Dynamic weighting: adapts based on pressure change rate (best accuracy)
 
+# Entity keys - unique ID of each entity of the first station (the entities of
+# further stations get the config entry ID as prefix, see coordinator.py)
+ENTITY_MAIN: Final = "local_forecast"
+ENTITY_PRESSURE: Final = "local_forecast_pressure"
+ENTITY_TEMPERATURE: Final = "local_forecast_temperature"
+ENTITY_PRESSURE_CHANGE: Final = "local_forecast_pressurechange"
+ENTITY_TEMPERATURE_CHANGE: Final = "local_forecast_temperaturechange"
+ENTITY_ZAMBRETTI_DETAIL: Final = "local_forecast_zambretti_detail"
+ENTITY_NEG_ZAM_DETAIL: Final = "local_forecast_neg_zam_detail"
+ENTITY_ENHANCED: Final = "local_forecast_enhanced"
+ENTITY_RAIN_PROBABILITY: Final = "local_forecast_rain_probability"
+ENTITY_STAGE_TIMING: Final = "local_forecast_stage_timing"  # Only with the stage_timing option
+ENTITY_WEATHER: Final = "weather"  # Unique ID is always f"{entry_id}_weather"
+DEFAULT_WEATHER_ENTITY_ID: Final = "weather.local_weather_forecast_weather"
+
 # Defaults
 DEFAULT_ELEVATION: Final = 0
 DEFAULT_LATITUDE: Final = 50.0  # Europe middle latitude
@@ -52,6 +71,10 @@ DEFAULT_ENABLE_EXTENDED_SENSORS: Final = False
 DEFAULT_FORECAST_INTERVAL: Final = 3  # hours
 DEFAULT_FORECAST_MODEL: Final = FORECAST_MODEL_ENHANCED  # v3.1.4+ - Default to enhanced (best accuracy)
 DEFAULT_HEMISPHERE: Final = HEMISPHERE_NORTH  # v3.1.4+ - Default to northern hemisphere
+DEFAULT_FORECAST_TRACE: Final = False
+DEFAULT_STAGE_TIMING: Final = False
+DEFAULT_WEATHER_UPDATE_DEBOUNCE: Final = 1.0  # seconds
+DEFAULT_SENSOR_UPDATE_INTERVAL: Final = 30  # seconds
 
 # Languages (available in UI configuration)
 LANGUAGES: Final = {
@@ -87,6 +110,34 @@ TEMPERATURE_CHANGE_MINUTES: Final = 60  # 1 hour
 PRESSURE_MIN_RECORDS: Final = 36  # Minimum records to keep (even if older than 180 min)
 TEMPERATURE_MIN_RECORDS: Final = 12  # Minimum records to keep (even if older than 60 min)
 
+# Change sensor history persistence (helpers.storage, not state attributes)
+# History is saved to .storage/local_weather_forecast.<entry_id>_<name>_history
+# so the recorder only stores summary attributes for the change sensors.
+CHANGE_HISTORY_STORAGE_VERSION: Final = 1
+CHANGE_HISTORY_SAVE_DELAY: Final = 60  # seconds - coalesce writes from high-frequency sensors
+# Saved readings are downsampled to at most one per CHANGE_HISTORY_SAMPLE_SECONDS,
+# so a full window of a 1 Hz barometer (10800 readings in 3h) is kept as 1080
+# readings and the tendency is correct right after a restart.
+CHANGE_HISTORY_SAMPLE_SECONDS: Final = 10
+# Saved readings per history: the whole window at the sample interval plus the
+# minimum records kept beyond it (pressure: 1116, temperature: 372)
+PRESSURE_HISTORY_MAX_RECORDS: Final = (
+    PRESSURE_CHANGE_MINUTES * 60 // CHANGE_HISTORY_SAMPLE_SECONDS + PRESSURE_MIN_RECORDS
+)
+TEMPERATURE_HISTORY_MAX_RECORDS: Final = (
+    TEMPERATURE_CHANGE_MINUTES * 60 // CHANGE_HISTORY_SAMPLE_SECONDS + TEMPERATURE_MIN_RECORDS
+)
+
+# Fallback for unavailable source sensors (see last_known_good.py)
+# The last valid value seen in live state events is used first; only a sensor
+# without one is looked up in the recorder, once per outage.
+HISTORY_FALLBACK_HOURS: Final = 24  # How far back the recorder is searched
+HISTORY_FALLBACK_MAX_STATES: Final = 20  # Newest state changes read per query (bounded scan)
+HISTORY_FALLBACK_NEGATIVE_TTL: Final = 600  # seconds - no new query after a query found nothing
+
+# Startup readiness barrier (see readiness.py)
+STARTUP_READY_TIMEOUT: Final = 30  # seconds - shared by all startup waits of an entry
+
 # Pressure thresholds
 PRESSURE_TREND_RISING: Final = 1.6
 PRESSURE_TREND_FALLING: Final = -1.6
@@ -207,6 +258,22 @@ ZAMBRETTI_TO_CONDITION: Final = {
 # Forecast intervals (hours)
 FORECAST_INTERVALS: Final = [1, 3, 6, 12, 24]
 
+# Weather entity forecast cache (async_forecast_hourly / async_forecast_daily)
+# Results are reused while quantized inputs and the current hour are unchanged.
+FORECAST_CACHE_SIZE: Final = 8  # LRU entries (hourly + daily per model/language)
+FORECAST_CACHE_TTL: Final = 300  # seconds - upper bound on result age
+FORECAST_REFRESH_DELAY: Final = 30  # seconds - coalesce sensor changes before pushing forecasts
+DETAIL_REFRESH_MINUTES: Final = 10  # Detail sensor times/icons refresh on every 10th minute of the clock
+WEATHER_UPDATE_DEBOUNCE_MIN: Final = 0.25  # seconds - shortest configurable write coalescing window
+WEATHER_UPDATE_DEBOUNCE_MAX: Final = 5.0  # seconds - longest configurable write coalescing window
+SENSOR_UPDATE_INTERVAL_MAX: Final = 300  # seconds - longest configurable sensor update interval
+# Run forecast models outside the event loop.  Code-level switch only (no
+# option): False generates in the event loop, e.g. for profiling.
+FORECAST_GENERATE_IN_EXECUTOR: Final = True
+FORECAST_TRACE_MAX_RECORDS: Final = 200  # Records per forecast trace (72h hourly + daily)
+STAGE_TIMING_WINDOW: Final = 256  # Most recent durations per stage used for p50/p95/max
+STAGE_TIMING_SENSOR_INTERVAL: Final = 60  # seconds - timing sensor refresh
+
 # Comfort levels
 COMFORT_VERY_COLD: Final = "very_cold"
 COMFORT_COLD: Final = "cold"
@@ -0,0 +1,398 @@
+"""Per-entry forecast coordinator for Local Weather Forecast integration.
+
+The main sensor computes p0, trends and the Zambretti / Negretti-Zambra
+results once per tick.  Instead of publishing them only through state
+attributes (which every dependent entity then re-reads from the state
+machine and re-parses), the values are stored in a typed snapshot owned by
+a coordinator in ``hass.data[DOMAIN][entry_id]`` and pushed directly to
+subscribed entities.
+
+State attributes are still written for dashboards and templates - the
+coordinator only removes the internal round-trip through the event bus.
+
+The coordinator also owns the entity IDs of its station.  The first station
+keeps the unique IDs of the original YAML package (``local_forecast``, ...)
+so existing dashboards and automations keep working; every further station
+prefixes them with its config entry ID.  Entities register their resolved
+entity ID here, so an entity of one station never reads another station's
+sensors.
+
+The last known good values of the source sensors (fallback while a sensor is
+unavailable, see last_known_good.py) are shared by all entities of the entry,
+and so is the startup readiness barrier (see readiness.py).
+
+With the stage_timing option the coordinator also owns the per-stage timing
+histograms (see debug_trace.StageTimings) reported by diagnostics.py and the
+stage timing sensor.
+
+Scheduled refreshes of the detail sensors (forecast times and day/night
+icons) run from one wall-clock aligned timer per entry.  The inputs shared by
+both sensors are read once per tick and passed to every subscriber.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields, replace
+from datetime import datetime
+import logging
+from typing import Any, Callable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_track_utc_time_change
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_STAGE_TIMING,
+    DEFAULT_STAGE_TIMING,
+    DEFAULT_WEATHER_ENTITY_ID,
+    DETAIL_REFRESH_MINUTES,
+    DOMAIN,
+    ENTITY_MAIN,
+    ENTITY_PRESSURE_CHANGE,
+    ENTITY_WEATHER,
+)
+from .debug_trace import StageTimings
+from .last_known_good import LastKnownGoodCache
+from .readiness import ReadinessBarrier
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ForecastSnapshot:
+    """Immutable snapshot of inputs and derived values for one config entry.
+
+    Field shapes match the attributes the entities already publish, so a
+    subscriber can use a snapshot value wherever it previously parsed the
+    corresponding state attribute.
+    """
+
+    # Main sensor
+    p0: float | None = None                      # Sea level pressure (hPa)
+    temperature: float | None = None             # Current temperature (°C)
+    wind_data: list | None = None                # [wind_fak, dir, dir_text, speed_fak]
+    zambretti: list | None = None                # [text, number, letter]
+    negretti: list | None = None                 # [text, number, letter]
+    pressure_trend: list | None = None           # [text, index]
+    lang_index: int | None = None
+
+    # Change sensors
+    pressure_change: float | None = None         # hPa / 3h
+    pressure_change_updated: datetime | None = None
+    temperature_change: float | None = None      # °C / h
+
+    # Detail sensors (same dict as their extra_state_attributes)
+    zambretti_detail: dict[str, Any] = field(default_factory=dict)
+    negretti_detail: dict[str, Any] = field(default_factory=dict)
+
+    # Enhanced and precipitation sensors
+    enhanced: dict[str, Any] = field(default_factory=dict)
+    rain_probability: int | None = None
+    rain_probability_attributes: dict[str, Any] = field(default_factory=dict)
+
+
+SNAPSHOT_FIELDS: frozenset[str] = frozenset(f.name for f in fields(ForecastSnapshot))
+
+
+@dataclass(frozen=True)
+class DetailRefresh:
+    """Inputs of a scheduled detail sensor refresh, read once per tick."""
+
+    now: datetime
+    is_night: bool                               # sun.sun below horizon
+    pressure_change_updated: datetime | None     # Forecast reference time
+
+
+@callback
+def async_build_detail_refresh(
+    hass: HomeAssistant, pressure_change_updated: datetime | None
+) -> DetailRefresh:
+    """Read the shared inputs of a detail sensor refresh."""
+    sun_state = hass.states.get("sun.sun")
+    return DetailRefresh(
+        now=dt_util.now(),
+        is_night=bool(sun_state and sun_state.state == "below_horizon"),
+        pressure_change_updated=pressure_change_updated,
+    )
+
+
+@callback
+def async_track_detail_refresh_time(
+    hass: HomeAssistant, action: Callable[[datetime], None]
+) -> CALLBACK_TYPE:
+    """Call action on every DETAIL_REFRESH_MINUTES boundary of the clock."""
+    return async_track_utc_time_change(
+        hass, action, minute=f"/{DETAIL_REFRESH_MINUTES}", second=0
+    )
+
+
+class LocalForecastCoordinator:
+    """Hold the forecast snapshot of one config entry and notify subscribers."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the coordinator."""
+        self.hass = hass
+        self.entry = entry
+        # Copy of entry.data used by async_reload_entry to detect changes
+        self.config_data: dict[str, Any] = dict(entry.data)
+        self.data = ForecastSnapshot()
+        self.last_update: datetime | None = None
+        self._listeners: dict[int, tuple[Callable[[frozenset[str]], None], frozenset[str] | None]] = {}
+        self._next_listener_id = 0
+        # "" for the first station (legacy unique IDs), f"{entry_id}_" otherwise
+        self.unique_id_prefix = ""
+        # Unique ID -> entity ID of the entities of this entry
+        self._entity_ids: dict[str, str] = {}
+        self._detail_refresh_listeners: dict[int, Callable[[DetailRefresh], None]] = {}
+        self._detail_refresh_unsub: CALLBACK_TYPE | None = None
+        # Resolved forecast language (see language.get_language_index)
+        self.language_index: int | None = None
+        # None unless the stage_timing option is enabled
+        self.stage_timings: StageTimings | None = (
+            StageTimings()
+            if entry.options.get(CONF_STAGE_TIMING, entry.data.get(CONF_STAGE_TIMING, DEFAULT_STAGE_TIMING))
+            else None
+        )
+        self.last_known_good = LastKnownGoodCache(hass, self.stage_timings)
+        # Latest forecast traces of the weather entity (forecast_trace option)
+        self.forecast_traces: dict[str, dict[str, Any]] = {}
+        # Entity ID -> throttling counters of a sensor (diagnostics)
+        self._update_counters: dict[str, Callable[[], dict[str, int]]] = {}
+        self.readiness = ReadinessBarrier(hass, f"Coordinator {entry.entry_id}")
+
+    def unique_id(self, key: str, domain: str = Platform.SENSOR) -> str:
+        """Return the unique ID of an entity of this entry.
+
+        Args:
+            key: Entity key (ENTITY_* constant)
+            domain: Entity platform
+
+        Returns:
+            Unique ID; the weather entity always uses f"{entry_id}_weather"
+        """
+        if domain == Platform.WEATHER:
+            return f"{self.entry.entry_id}_{key}"
+        return f"{self.unique_id_prefix}{key}"
+
+    @callback
+    def async_register_entity(self, unique_id: str | None, entity_id: str | None) -> None:
+        """Remember the entity ID of an entity of this entry once it is added."""
+        if unique_id and entity_id:
+            self._entity_ids[unique_id] = entity_id
+
+    @callback
+    def async_register_update_counters(
+        self, entity_id: str, get_counters: Callable[[], dict[str, int]]
+    ) -> CALLBACK_TYPE:
+        """Report the update throttling counters of a sensor in diagnostics.
+
+        Args:
+            entity_id: Entity ID of the sensor
+            get_counters: Returns the current counters
+
+        Returns:
+            Callable that removes the sensor again
+        """
+        self._update_counters[entity_id] = get_counters
+
+        @callback
+        def remove() -> None:
+            self._update_counters.pop(entity_id, None)
+
+        return remove
+
+    def update_counters(self) -> dict[str, dict[str, int]]:
+        """Return the update throttling counters of the sensors by entity ID."""
+        return {entity_id: get() for entity_id, get in self._update_counters.items()}
+
+    @callback
+    def entity_id(self, key: str, domain: str = Platform.SENSOR) -> str | None:
+        """Return the entity ID of an entity of this entry.
+
+        Entities register themselves when added; entities not added yet are
+        looked up in the entity registry.  If the entity is not registered
+        at all, the first station falls back to the legacy entity ID and
+        further stations return None (never the first station's entity).
+
+        Args:
+            key: Entity key (ENTITY_* constant)
+            domain: Entity platform
+
+        Returns:
+            Entity ID, or None if the entity does not exist (yet)
+        """
+        unique_id = self.unique_id(key, domain)
+        entity_id = self._entity_ids.get(unique_id)
+        if entity_id is not None:
+            return entity_id
+
+        entity_id = er.async_get(self.hass).async_get_entity_id(domain, DOMAIN, unique_id)
+        if entity_id is not None:
+            self._entity_ids[unique_id] = entity_id
+            return entity_id
+
+        if self.unique_id_prefix:
+            return None
+        if domain == Platform.WEATHER:
+            return DEFAULT_WEATHER_ENTITY_ID if key == ENTITY_WEATHER else None
+        return f"{domain}.{key}"
+
+    @callback
+    def async_invalidate_language(self, _event: Event | None = None) -> None:
+        """Resolve the language again on next use (options or core config changed)."""
+        self.language_index = None
+
+    @callback
+    def async_add_listener(
+        self,
+        update_callback: Callable[[frozenset[str]], None],
+        watched_fields: set[str] | frozenset[str] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Subscribe to snapshot changes.
+
+        Args:
+            update_callback: Called with the set of changed field names
+            watched_fields: Only notify when one of these fields changed (None = all)
+
+        Returns:
+            Callable that removes the listener
+        """
+        listener_id = self._next_listener_id
+        self._next_listener_id += 1
+        watched = frozenset(watched_fields) if watched_fields is not None else None
+        self._listeners[listener_id] = (update_callback, watched)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.pop(listener_id, None)
+
+        return remove_listener
+
+    @callback
+    def async_add_detail_refresh_listener(
+        self, refresh_callback: Callable[[DetailRefresh], None]
+    ) -> CALLBACK_TYPE:
+        """Subscribe to the scheduled detail sensor refresh.
+
+        The timer runs only while there are subscribers; one tick reads the
+        shared inputs once and passes them to every subscriber.
+
+        Args:
+            refresh_callback: Called with the DetailRefresh of each tick
+
+        Returns:
+            Callable that removes the listener
+        """
+        listener_id = self._next_listener_id
+        self._next_listener_id += 1
+        self._detail_refresh_listeners[listener_id] = refresh_callback
+        if self._detail_refresh_unsub is None:
+            self._detail_refresh_unsub = async_track_detail_refresh_time(
+                self.hass, self._async_refresh_details
+            )
+
+        @callback
+        def remove_listener() -> None:
+            self._detail_refresh_listeners.pop(listener_id, None)
+            if not self._detail_refresh_listeners and self._detail_refresh_unsub is not None:
+                self._detail_refresh_unsub()
+                self._detail_refresh_unsub = None
+
+        return remove_listener
+
+    @callback
+    def _async_refresh_details(self, _now: datetime | None = None) -> None:
+        """Read the shared refresh inputs once and pass them to the detail sensors."""
+        pressure_change_updated = self.data.pressure_change_updated
+        if pressure_change_updated is None:
+            entity_id = self.entity_id(ENTITY_PRESSURE_CHANGE)
+            state = self.hass.states.get(entity_id) if entity_id else None
+            if state is not None:
+                pressure_change_updated = state.last_updated
+
+        refresh = async_build_detail_refresh(self.hass, pressure_change_updated)
+        for refresh_callback in list(self._detail_refresh_listeners.values()):
+            refresh_callback(refresh)
+
+    @callback
+    def async_set_updated_data(self, **changes: Any) -> frozenset[str]:
+        """Merge changed values into the snapshot and notify subscribers.
+
+        Values equal to the current snapshot are ignored, so re-publishing an
+        unchanged result does not wake any subscriber.
+
+        Returns:
+            Names of the fields that actually changed
+        """
+        unknown = set(changes) - SNAPSHOT_FIELDS
+        if unknown:
+            raise ValueError(f"Unknown snapshot fields: {sorted(unknown)}")
+
+        changed = {
+            name: value
+            for name, value in changes.items()
+            if getattr(self.data, name) != value
+        }
+        if not changed:
+            return frozenset()
+
+        self.data = replace(self.data, **changed)
+        self.last_update = dt_util.utcnow()
+        changed_fields = frozenset(changed)
+
+        _LOGGER.debug(
+            "Coordinator %s: updated %s", self.entry.entry_id, ", ".join(sorted(changed_fields))
+        )
+
+        for update_callback, watched in list(self._listeners.values()):
+            if watched is None or watched & changed_fields:
+                update_callback(changed_fields)
+
+        return changed_fields
+
+
+def async_get_coordinator(
+    hass: HomeAssistant | None, entry: ConfigEntry
+) -> LocalForecastCoordinator | None:
+    """Return the coordinator of a config entry, or None if not set up."""
+    hass_data = getattr(hass, "data", None)
+    if not isinstance(hass_data, dict):
+        return None
+    coordinator = hass_data.get(DOMAIN, {}).get(entry.entry_id)
+    if isinstance(coordinator, LocalForecastCoordinator):
+        return coordinator
+    return None
+
+
+@callback
+def async_unique_id_prefix(hass: HomeAssistant, entry: ConfigEntry) -> str:
+    """Return the unique ID prefix of the entities of a config entry.
+
+    The entry owning the legacy unique IDs keeps them (prefix ""); so does the
+    first entry set up on a clean install.  Every other entry gets its entry
+    ID as prefix, so several stations never share an entity.
+
+    Args:
+        hass: Home Assistant instance
+        entry: Config entry being set up
+
+    Returns:
+        "" or f"{entry.entry_id}_"
+    """
+    entity_registry = er.async_get(hass)
+    main_entity_id = entity_registry.async_get_entity_id(Platform.SENSOR, DOMAIN, ENTITY_MAIN)
+    if main_entity_id is not None:
+        registry_entry = entity_registry.async_get(main_entity_id)
+        if registry_entry is not None and registry_entry.config_entry_id == entry.entry_id:
+            return ""
+        return f"{entry.entry_id}_"
+
+    legacy_taken = any(
+        isinstance(coordinator, LocalForecastCoordinator)
+        and coordinator.entry.entry_id != entry.entry_id
+        and not coordinator.unique_id_prefix
+        for coordinator in hass.data.get(DOMAIN, {}).values()
+    )
+    return f"{entry.entry_id}_" if legacy_taken else ""
@@ -0,0 +1,180 @@
+"""Debug logging helpers and optional structured forecast traces.
+
+Hot paths log with %-style arguments (``_LOGGER.debug("p=%.1f", p)``), so
+messages are only formatted when debug logging is enabled.  Use
+``debug_enabled()`` to skip work that only exists to build a log message.
+
+``ForecastTrace`` collects one structured record per forecast hour (inputs,
+model letters, chosen code, resulting condition).  Tracing is off by default
+and can be turned on per config entry with the ``forecast_trace`` option; the
+last trace per forecast type is kept on the weather entity for diagnostics.
+
+``StageTimings`` keeps the most recent durations and the call count of the
+calculation stages (main sensor update, change sensor handlers, weather
+condition / attributes, forecast generation, recorder fallback).  It only
+exists when the ``stage_timing`` option is on; instrumented code looks it up
+on its owner and does no timing at all while it is None, so the disabled
+cost is one attribute lookup per call.
+"""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime, timezone
+import functools
+import inspect
+import logging
+import math
+import threading
+import time
+from typing import Any
+
+from .const import FORECAST_TRACE_MAX_RECORDS, STAGE_TIMING_WINDOW
+
+# Stage names (keys of StageTimings.as_dict)
+STAGE_MAIN_UPDATE = "main_update"
+STAGE_PRESSURE_CHANGE = "pressure_change"
+STAGE_TEMPERATURE_CHANGE = "temperature_change"
+STAGE_WEATHER_CONDITION = "weather_condition"
+STAGE_WEATHER_ATTRIBUTES = "weather_attributes"
+STAGE_HOURLY_FORECAST = "hourly_forecast"
+STAGE_DAILY_FORECAST = "daily_forecast"
+STAGE_HISTORY_FALLBACK = "history_fallback"
+
+
+def debug_enabled(logger: logging.Logger) -> bool:
+    """Return True if debug messages of this logger are emitted."""
+    return logger.isEnabledFor(logging.DEBUG)
+
+
+class ForecastTrace:
+    """Structured record of one forecast calculation."""
+
+    def __init__(self, kind: str, max_records: int = FORECAST_TRACE_MAX_RECORDS) -> None:
+        """Initialize the trace.
+
+        Args:
+            kind: Forecast type ("hourly" or "daily")
+            max_records: Maximum number of records kept
+        """
+        self.kind = kind
+        self.max_records = max_records
+        self.created = datetime.now(timezone.utc)
+        self.records: list[dict[str, Any]] = []
+        self.dropped = 0
+
+    def record(self, **values: Any) -> None:
+        """Add one record (e.g. one forecast hour)."""
+        if len(self.records) >= self.max_records:
+            self.dropped += 1
+            return
+        self.records.append(values)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the trace as a JSON serializable dict."""
+        return {
+            "kind": self.kind,
+            "created": self.created.isoformat(),
+            "records": self.records,
+            "dropped": self.dropped,
+        }
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+class StageTimings:
+    """Rolling durations and call counts of the calculation stages."""
+
+    def __init__(self, window: int = STAGE_TIMING_WINDOW) -> None:
+        """Initialize empty statistics.
+
+        Args:
+            window: Number of most recent durations kept per stage
+        """
+        self.window = window
+        self._durations: dict[str, deque[float]] = {}
+        self._calls: dict[str, int] = {}
+        # Forecasts are generated in the executor
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Add the duration of one call of a stage."""
+        with self._lock:
+            durations = self._durations.get(stage)
+            if durations is None:
+                durations = self._durations[stage] = deque(maxlen=self.window)
+            durations.append(seconds)
+            self._calls[stage] = self._calls.get(stage, 0) + 1
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return call count and p50/p95/max (ms, over the window) per stage."""
+        with self._lock:
+            snapshot = {stage: sorted(durations) for stage, durations in self._durations.items()}
+            calls = dict(self._calls)
+        return {
+            stage: {
+                "calls": calls[stage],
+                "p50_ms": round(_percentile(ordered, 0.50) * 1000, 3),
+                "p95_ms": round(_percentile(ordered, 0.95) * 1000, 3),
+                "max_ms": round(ordered[-1] * 1000, 3),
+            }
+            for stage, ordered in sorted(snapshot.items())
+        }
+
+
+def timed_call(timings: StageTimings | None, stage: str, func: Callable[[], Any]) -> Callable[[], Any]:
+    """Return func recording its duration as a stage (func itself without timings)."""
+    if timings is None:
+        return func
+
+    @functools.wraps(func)
+    def wrapper() -> Any:
+        start = time.perf_counter()
+        try:
+            return func()
+        finally:
+            timings.record(stage, time.perf_counter() - start)
+
+    return wrapper
+
+
+def timed_stage(stage: str) -> Callable[[Callable], Callable]:
+    """Decorate a method to record its duration in ``self.stage_timings``.
+
+    Works for plain and coroutine methods; while ``self.stage_timings`` is
+    None the method is called directly.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+                timings = self.stage_timings
+                if timings is None:
+                    return await func(self, *args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return await func(self, *args, **kwargs)
+                finally:
+                    timings.record(stage, time.perf_counter() - start)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            timings = self.stage_timings
+            if timings is None:
+                return func(self, *args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                timings.record(stage, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,58 @@
+"""Diagnostics support for Local Weather Forecast.
+
+Reports the configuration of the entry, the current forecast snapshot of
+the coordinator, startup and recorder fallback statistics, the update
+throttling counters of the sensors and - with the stage_timing option - the
+rolling per-stage timings (see debug_trace.StageTimings).  Forecast traces
+are included when the forecast_trace option is enabled.
+"""
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_LATITUDE
+from .coordinator import async_get_coordinator
+
+TO_REDACT = {CONF_LATITUDE, "longitude"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Args:
+        hass: Home Assistant instance
+        entry: Config entry of the station
+
+    Returns:
+        JSON serializable diagnostics
+    """
+    diagnostics: dict[str, Any] = {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+    }
+
+    coordinator = async_get_coordinator(hass, entry)
+    if coordinator is None:
+        diagnostics["coordinator"] = None
+        return diagnostics
+
+    timings = coordinator.stage_timings
+    diagnostics["coordinator"] = {
+        "last_update": coordinator.last_update,
+        "snapshot": asdict(coordinator.data),
+        "startup_duration": coordinator.readiness.startup_duration,
+        "history_fallback_queries": coordinator.last_known_good.queries,
+        "update_counters": coordinator.update_counters(),
+    }
+    diagnostics["stage_timings"] = timings.as_dict() if timings is not None else None
+    diagnostics["forecast_traces"] = dict(coordinator.forecast_traces)
+    return diagnostics
@@ -0,0 +1,123 @@
+"""LRU/TTL cache for weather entity forecast results.
+
+Dashboards with several weather cards request the hourly and daily forecast
+repeatedly, and every request used to rebuild all models and recompute up to
+72 hourly steps.  Results are cached under a key built from quantized inputs,
+so sensor noise below the quantization step does not cause a recalculation.
+Sensor state changes therefore do not clear the cache - a changed input
+produces a new key.  Entries expire after a TTL and can be invalidated
+explicitly.
+
+Every invalidation starts a new cache generation.  A calculation started
+before the invalidation stores its result with its own generation, and the
+cache drops it instead of serving a stale forecast.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+import logging
+import time
+from typing import Any
+
+from .const import FORECAST_CACHE_SIZE, FORECAST_CACHE_TTL
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def quantize(value: float | None, step: float) -> float | None:
+    """Round value to a multiple of step (None stays None).
+
+    Example: quantize(1013.26, 0.1) -> 1013.3
+    """
+    if value is None:
+        return None
+    return round(round(value / step) * step, 6)
+
+
+def forecast_signature(forecasts: list[dict[str, Any]] | None) -> tuple | None:
+    """Return a comparable summary of what subscribers would see.
+
+    The forecast datetimes are derived from the current time and change on
+    every calculation, so only their hour is compared; all other values are
+    compared as-is.
+    """
+    if forecasts is None:
+        return None
+    return tuple(
+        (
+            str(forecast.get("datetime", ""))[:13],
+            tuple(sorted((key, value) for key, value in forecast.items() if key != "datetime")),
+        )
+        for forecast in forecasts
+    )
+
+
+class ForecastCache:
+    """Small LRU cache with per-entry TTL and hit/miss counters."""
+
+    def __init__(
+        self, max_size: int = FORECAST_CACHE_SIZE, ttl: float = FORECAST_CACHE_TTL
+    ) -> None:
+        """Initialize the cache."""
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.generation = 0  # Bumped by invalidate()
+        self._entries: OrderedDict[Hashable, tuple[float, list[dict[str, Any]]]] = OrderedDict()
+
+    def get(self, key: Hashable) -> list[dict[str, Any]] | None:
+        """Return a copy of the cached forecasts, or None on miss/expiry."""
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            _LOGGER.debug("Forecast cache: hit (%d hits / %d misses)", self.hits, self.misses)
+            # Copy so callers can't modify cached entries
+            return [dict(forecast) for forecast in entry[1]]
+
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        _LOGGER.debug("Forecast cache: miss (%d hits / %d misses)", self.hits, self.misses)
+        return None
+
+    def put(
+        self, key: Hashable, forecasts: list[dict[str, Any]], generation: int | None = None
+    ) -> None:
+        """Store forecasts, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            forecasts: Forecasts to store
+            generation: Cache generation the forecasts were calculated in;
+                results of an older generation are not stored
+        """
+        if generation is not None and generation != self.generation:
+            _LOGGER.debug("Forecast cache: dropped result of generation %s", generation)
+            return
+        self._entries[key] = (time.monotonic(), [dict(forecast) for forecast in forecasts])
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop all cached forecasts and results still being calculated."""
+        self.generation += 1
+        if self._entries:
+            self._entries.clear()
+            self.invalidations += 1
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return counters for diagnostics."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hits / total, 3) if total else None,
+        }
@@ -10,20 +10,29 @@ This module implements sophisticated meteorological forecasting models:
 
 from __future__ import annotations
 
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import logging
 import math
 from typing import TypedDict
 
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, State
 
 from .const import (
+    CONF_HEMISPHERE,
+    DEFAULT_HEMISPHERE,
+    DOMAIN,
     FORECAST_MODEL_ZAMBRETTI,
     FORECAST_MODEL_NEGRETTI,
     FORECAST_MODEL_ENHANCED,
     PRESSURE_TREND_FALLING,
     PRESSURE_TREND_RISING,
 )
+from .debug_trace import ForecastTrace, debug_enabled
+from .solar_ephemeris import is_night_for_hass, is_night_from_sun, sun_angle_factor
 from .zambretti import calculate_zambretti_forecast
 from .forecast_mapping import map_forecast_to_condition, ZAMBRETTI_LETTER_TO_CODE
 
@@ -52,6 +61,55 @@ class Forecast(TypedDict, total=False):
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class ForecastEnvironment:
+    """Home Assistant inputs of the forecast models as plain values.
+
+    The weather entity resolves them on the event loop and passes them to
+    models built without hass, so forecasts generated in the executor never
+    read the state machine or the coordinator.
+    """
+
+    latitude: float | None  # Home Assistant location (night checks, sun angle)
+    longitude: float | None
+    elevation: float | None
+    sun_state: State | None  # sun.sun
+    lang_index: int
+    hemisphere: str
+
+    @classmethod
+    def from_hass(
+        cls, hass: HomeAssistant, config_entry: ConfigEntry | None = None
+    ) -> ForecastEnvironment:
+        """Resolve the inputs (call on the event loop).
+
+        Args:
+            hass: Home Assistant instance
+            config_entry: Config entry of the station (language and hemisphere)
+
+        Returns:
+            Snapshot of the inputs
+        """
+        from .language import get_language_index
+
+        return cls(
+            latitude=hass.config.latitude,
+            longitude=hass.config.longitude,
+            elevation=hass.config.elevation,
+            sun_state=hass.states.get("sun.sun"),
+            lang_index=get_language_index(hass, config_entry),
+            hemisphere=(
+                config_entry.data.get(CONF_HEMISPHERE, DEFAULT_HEMISPHERE)
+                if config_entry is not None
+                else DEFAULT_HEMISPHERE
+            ),
+        )
+
+    def is_night(self, check_time: datetime) -> bool:
+        """Check if it's night at check_time (see is_night_for_hass)."""
+        return is_night_from_sun(self.sun_state, check_time, self.latitude, self.longitude)
+
+
 class PressureModel:
     """Model atmospheric pressure trends with exponential smoothing.
 
@@ -93,11 +151,47 @@ class PressureModel:
         self.change_3h = pressure_change_3h
         self.change_per_hour = self.change_rate_1h
 
+    def _predict_value(self, hours_ahead: int) -> tuple[float, float]:
+        """Return (predicted pressure, unclamped total change) without logging.
+
+        The damped rate sum Σ(rate * damping^i, i=0..h-1) is a geometric
+        series, so it is evaluated in closed form instead of a loop.
+        """
+        if hours_ahead == 0:
+            return self.current_pressure, 0.0
+
+        damping = self.damping_factor
+        if damping == 1.0:
+            total_change = self.change_rate_1h * hours_ahead
+        else:
+            total_change = self.change_rate_1h * (1.0 - damping ** hours_ahead) / (1.0 - damping)
+
+        # Apply realistic limits to prevent unrealistic forecasts
+        # Maximum change: ±20 hPa over 24 hours (scales proportionally)
+        max_change = 20.0 * (hours_ahead / 24.0)  # Scale linearly with time
+        total_change = max(-max_change, min(max_change, total_change))
+
+        # Clamp to realistic atmospheric pressure range (910-1085 hPa)
+        # Matches Negretti-Zambra global range for consistency
+        predicted = max(910.0, min(1085.0, self.current_pressure + total_change))
+        return predicted, total_change
+
+    def _classify_trend(self, future_pressure: float) -> str:
+        """Return 'rising', 'falling' or 'steady' for a predicted pressure."""
+        change = future_pressure - self.current_pressure
+
+        if change > PRESSURE_TREND_RISING:
+            return "rising"
+        elif change < PRESSURE_TREND_FALLING:
+            return "falling"
+        else:
+            return "steady"
+
     def predict(self, hours_ahead: int) -> float:
         """Predict pressure N hours ahead.
 
         Uses exponential smoothing with damping to simulate natural pressure evolution.
-        Formula: P(t+h) = P(t) + Σ(rate * damping^i)
+        Formula: P(t+h) = P(t) + rate * (1 - damping^h) / (1 - damping)
 
         Args:
             hours_ahead: Hours into the future
@@ -105,38 +199,49 @@ class PressureModel:
         Returns:
             Predicted pressure in hPa
         """
-        if hours_ahead == 0:
-            return self.current_pressure
-
-        # Apply exponentially damped change rate
-        total_change = 0.0
-        current_rate = self.change_rate_1h
+        result, total_change = self._predict_value(hours_ahead)
 
-        for hour in range(hours_ahead):
-            total_change += current_rate
-            # Dampen the rate for next hour
-            current_rate *= self.damping_factor
+        if hours_ahead:
+            _LOGGER.debug(
+                "PressureModel: %sh → %.1f hPa "
+                "(current=%.1f, change=%+.1f, rate=%+.1f/3h)",
+                hours_ahead,
+                result,
+                self.current_pressure,
+                total_change,
+                self.change_rate_3h
+            )
 
-        # Apply realistic limits to prevent unrealistic forecasts
-        # Maximum change: ±20 hPa over 24 hours (scales proportionally)
-        max_change = 20.0 * (hours_ahead / 24.0)  # Scale linearly with time
-        total_change = max(-max_change, min(max_change, total_change))
+        return result
 
-        predicted = self.current_pressure + total_change
+    def predict_many(
+        self, hours: Sequence[int], as_array: bool = False
+    ) -> tuple[list[float] | array, list[str]]:
+        """Predict pressure and trend for a whole forecast horizon in one pass.
 
-        # Constrain to realistic absolute pressure range (910-1085 hPa)
-        # Matches Negretti-Zambra global range for consistency
-        predicted = max(910.0, min(1085.0, predicted))
+        Args:
+            hours: Hours into the future (e.g. range(0, 25))
+            as_array: Return pressures as array('d') instead of a list
 
-        # Clamp to realistic atmospheric pressure range (910-1085 hPa)
-        result = max(910.0, min(1085.0, predicted))
+        Returns:
+            (predicted pressures in hPa, trend strings), one entry per hour
+        """
+        pressures = [self._predict_value(hours_ahead)[0] for hours_ahead in hours]
+        trends = [self._classify_trend(pressure) for pressure in pressures]
 
-        _LOGGER.debug(
-            f"PressureModel: {hours_ahead}h → {result:.1f} hPa "
-            f"(current={self.current_pressure:.1f}, change={total_change:+.1f}, rate={self.change_rate_3h:+.1f}/3h)"
-        )
+        if pressures and debug_enabled(_LOGGER):
+            _LOGGER.debug(
+                "PressureModel: %s hours → %.1f..%.1f hPa "
+                "(rate=%+.1f/3h)",
+                len(pressures),
+                pressures[0],
+                pressures[-1],
+                self.change_rate_3h
+            )
 
-        return result
+        if as_array:
+            return array("d", pressures), trends
+        return pressures, trends
 
     def get_trend(self, hours_ahead: int) -> str:
         """Get pressure trend description.
@@ -147,15 +252,7 @@ class PressureModel:
         Returns:
             Trend string: 'rising', 'falling', or 'steady'
         """
-        future_pressure = self.predict(hours_ahead)
-        change = future_pressure - self.current_pressure
-
-        if change > PRESSURE_TREND_RISING:
-            return "rising"
-        elif change < PRESSURE_TREND_FALLING:
-            return "falling"
-        else:
-            return "steady"
+        return self._classify_trend(self._predict_value(hours_ahead)[0])
 
 
 class TemperatureModel:
@@ -185,7 +282,8 @@ class TemperatureModel:
         latitude: float | None = None,
         longitude: float | None = None,
         hemisphere: str = "north",
-        elevation: float | None = None
+        elevation: float | None = None,
+        environment: ForecastEnvironment | None = None,
     ):
         """Initialize temperature model.
 
@@ -203,6 +301,8 @@ class TemperatureModel:
             longitude: Station longitude (-180 to +180, None = use HA config)
             hemisphere: "north" or "south"
             elevation: Station elevation in meters (None = use HA config or 0)
+            environment: Home Assistant inputs resolved on the event loop (used
+                instead of hass)
         """
         self.current_temp = current_temp
         self.change_rate_1h = change_rate_1h
@@ -213,11 +313,15 @@ class TemperatureModel:
         self.wind_speed = wind_speed
         self.hemisphere = hemisphere
         self.hass = hass
+        self.environment = environment
 
         # Get location coordinates
         if latitude is not None and longitude is not None:
             self.latitude = latitude
             self.longitude = longitude
+        elif environment is not None:
+            self.latitude = environment.latitude
+            self.longitude = environment.longitude
         elif hass is not None:
             self.latitude = hass.config.latitude
             self.longitude = hass.config.longitude
@@ -226,13 +330,20 @@ class TemperatureModel:
             self.latitude = 48.72
             self.longitude = 21.25
             _LOGGER.debug(
-                f"TempModel: No location specified, using fallback: "
-                f"{self.latitude}°N, {self.longitude}°E"
+                "TempModel: No location specified, using fallback: "
+                "%s°N, %s°E",
+                self.latitude,
+                self.longitude
             )
         
         # Get elevation (affects diurnal amplitude)
         if elevation is not None:
             self.elevation = float(elevation)
+        elif environment is not None:
+            try:
+                self.elevation = float(environment.elevation)
+            except (TypeError, ValueError):
+                self.elevation = 0.0
         elif hass is not None and hasattr(hass.config, 'elevation'):
             try:
                 self.elevation = float(hass.config.elevation)
@@ -253,9 +364,15 @@ class TemperatureModel:
             current_month = datetime.now(timezone.utc).month
             self.diurnal_amplitude = self._get_seasonal_amplitude(current_month)
             _LOGGER.debug(
-                f"TempModel: Auto-calculated seasonal amplitude: {self.diurnal_amplitude}°C "
-                f"(lat={self.latitude:.1f}°, elev={self.elevation:.0f}m, "
-                f"continent={self.continentality:.2f}, month={current_month}, hemisphere={hemisphere})"
+                "TempModel: Auto-calculated seasonal amplitude: %s°C "
+                "(lat=%.1f°, elev=%.0fm, "
+                "continent=%.2f, month=%s, hemisphere=%s)",
+                self.diurnal_amplitude,
+                self.latitude,
+                self.elevation,
+                self.continentality,
+                current_month,
+                hemisphere
             )
         else:
             self.diurnal_amplitude = diurnal_amplitude
@@ -264,7 +381,7 @@ class TemperatureModel:
         # This is critical for radiative cooling calculations at night
         if cloud_cover is not None:
             self.cloud_cover = cloud_cover
-            _LOGGER.debug(f"Cloud cover from sensor: {self.cloud_cover:.0f}%")
+            _LOGGER.debug("Cloud cover from sensor: %.0f%%", self.cloud_cover)
         elif humidity is not None:
             # Empirical relationship: high humidity correlates with clouds
             # Based on typical RH-cloud relationships:
@@ -281,8 +398,10 @@ class TemperatureModel:
             else:
                 self.cloud_cover = 80 + (humidity - 85) * 1.33  # 80-100%
             _LOGGER.debug(
-                f"Cloud cover estimated from humidity: {self.cloud_cover:.0f}% "
-                f"(RH={humidity:.1f}%)"
+                "Cloud cover estimated from humidity: %.0f%% "
+                "(RH=%.1f%%)",
+                self.cloud_cover,
+                humidity
             )
         else:
             # No cloud/humidity data: assume moderate conditions (50% clouds)
@@ -342,8 +461,12 @@ class TemperatureModel:
         # Get actual sunrise/sunset times to calculate proper diurnal cycle
         diurnal_change = 0.0
         
-        if self.hass is not None:
-            sun_entity = self.hass.states.get("sun.sun")
+        if self.environment is not None or self.hass is not None:
+            sun_entity = (
+                self.environment.sun_state
+                if self.environment is not None
+                else self.hass.states.get("sun.sun")
+            )
             if sun_entity:
                 try:
                     from homeassistant.util import dt as dt_util
@@ -441,8 +564,10 @@ class TemperatureModel:
                                         cloud_factor = 1.0 - (self.cloud_cover / 100.0) * 0.7
                                         radiative_cooling_rate *= cloud_factor
                                         _LOGGER.debug(
-                                            f"Radiative cooling - cloud_cover={self.cloud_cover:.0f}%, "
-                                            f"cloud_factor={cloud_factor:.2f}"
+                                            "Radiative cooling - cloud_cover=%.0f%%, "
+                                            "cloud_factor=%.2f",
+                                            self.cloud_cover,
+                                            cloud_factor
                                         )
                                     
                                     # High humidity reduces cooling (water vapor absorbs IR)
@@ -451,8 +576,10 @@ class TemperatureModel:
                                         humidity_factor = 1.0 - (self.humidity - 80) / 20.0 * 0.3
                                         radiative_cooling_rate *= humidity_factor
                                         _LOGGER.debug(
-                                            f"Radiative cooling - humidity={self.humidity:.0f}%, "
-                                            f"humidity_factor={humidity_factor:.2f}"
+                                            "Radiative cooling - humidity=%.0f%%, "
+                                            "humidity_factor=%.2f",
+                                            self.humidity,
+                                            humidity_factor
                                         )
                                     
                                     # Wind mixing prevents temperature inversion and reduces surface cooling
@@ -479,8 +606,10 @@ class TemperatureModel:
                                         
                                         radiative_cooling_rate *= wind_factor
                                         _LOGGER.debug(
-                                            f"Radiative cooling - wind_speed={self.wind_speed:.1f}m/s, "
-                                            f"wind_factor={wind_factor:.2f}"
+                                            "Radiative cooling - wind_speed=%.1fm/s, "
+                                            "wind_factor=%.2f",
+                                            self.wind_speed,
+                                            wind_factor
                                         )
                                     
                                     # === COOLING CURVE ===
@@ -554,19 +683,30 @@ class TemperatureModel:
                             diurnal_change = future_diurnal - current_diurnal
                             
                             _LOGGER.debug(
-                                f"Sun-based diurnal: current_hour={self.current_hour}, future_hour={future_hour}, "
-                                f"sunrise={sunrise_hour:.1f}, sunset={sunset_hour:.1f}, "
-                                f"temp_min={temp_min_hour:.1f}, temp_max={temp_max_hour:.1f}, "
-                                f"daylight={daylight_duration:.1f}h, daylight_factor={daylight_factor:.2f}, "
-                                f"current_offset={current_diurnal:+.1f}°C, future_offset={future_diurnal:+.1f}°C, "
-                                f"change={diurnal_change:+.1f}°C"
+                                "Sun-based diurnal: current_hour=%s, future_hour=%s, "
+                                "sunrise=%.1f, sunset=%.1f, "
+                                "temp_min=%.1f, temp_max=%.1f, "
+                                "daylight=%.1fh, daylight_factor=%.2f, "
+                                "current_offset=%+.1f°C, future_offset=%+.1f°C, "
+                                "change=%+.1f°C",
+                                self.current_hour,
+                                future_hour,
+                                sunrise_hour,
+                                sunset_hour,
+                                temp_min_hour,
+                                temp_max_hour,
+                                daylight_duration,
+                                daylight_factor,
+                                current_diurnal,
+                                future_diurnal,
+                                diurnal_change
                             )
                         else:
                             _LOGGER.debug("Could not parse sunrise/sunset times, using fallback")
                     else:
                         _LOGGER.debug("Sunrise/sunset times not available, using fallback")
                 except Exception as err:
-                    _LOGGER.debug(f"Error calculating sun-based diurnal: {err}, using fallback")
+                    _LOGGER.debug("Error calculating sun-based diurnal: %s, using fallback", err)
             else:
                 _LOGGER.debug("sun.sun entity not available, using fallback")
         
@@ -609,9 +749,12 @@ class TemperatureModel:
             solar_change = future_solar_warming - current_solar_warming
 
             _LOGGER.debug(
-                f"Solar temp adjustment: {solar_change:.1f}°C "
-                f"(radiation={effective_solar:.0f}W/m², "
-                f"sun_factor={future_sun_factor:.2f})"
+                "Solar temp adjustment: %.1f°C "
+                "(radiation=%.0fW/m², "
+                "sun_factor=%.2f)",
+                solar_change,
+                effective_solar,
+                future_sun_factor
             )
 
         # Combine all components: damped trend + diurnal cycle + solar warming
@@ -652,8 +795,12 @@ class TemperatureModel:
             predicted = self.current_temp + damped_change
             
             _LOGGER.debug(
-                f"Thermal inertia: tau={thermal_tau:.1f}h, response={thermal_response:.2f}, "
-                f"ideal_change={total_change:+.1f}°C, damped_change={damped_change:+.1f}°C"
+                "Thermal inertia: tau=%.1fh, response=%.2f, "
+                "ideal_change=%+.1f°C, damped_change=%+.1f°C",
+                thermal_tau,
+                thermal_response,
+                total_change,
+                damped_change
             )
         else:
             predicted = predicted_ideal
@@ -673,9 +820,15 @@ class TemperatureModel:
         result = max(-40.0, min(50.0, predicted))
 
         _LOGGER.debug(
-            f"TempModel: {hours_ahead}h → {result:.1f}°C "
-            f"(current={self.current_temp:.1f}, trend={trend_change:+.1f}, "
-            f"diurnal={diurnal_change:+.1f}, solar={solar_change:+.1f})"
+            "TempModel: %sh → %.1f°C "
+            "(current=%.1f, trend=%+.1f, "
+            "diurnal=%+.1f, solar=%+.1f)",
+            hours_ahead,
+            result,
+            self.current_temp,
+            trend_change,
+            diurnal_change,
+            solar_change
         )
 
         return result
@@ -742,9 +895,14 @@ class TemperatureModel:
             seasonal_amp = (base_summer + base_winter) / 2.0
         
         _LOGGER.debug(
-            f"Seasonal amplitude: lat={abs_lat:.1f}°, month={month}, "
-            f"base_winter={base_winter}°C, base_summer={base_summer}°C, "
-            f"result={seasonal_amp:.1f}°C"
+            "Seasonal amplitude: lat=%.1f°, month=%s, "
+            "base_winter=%s°C, base_summer=%s°C, "
+            "result=%.1f°C",
+            abs_lat,
+            month,
+            base_winter,
+            base_summer,
+            seasonal_amp
         )
         
         # Apply continentality factor
@@ -763,8 +921,11 @@ class TemperatureModel:
         seasonal_amp *= elevation_factor
         
         _LOGGER.debug(
-            f"Final amplitude after adjustments: {seasonal_amp:.1f}°C "
-            f"(continent_factor={continentality_factor:.2f}, elev_factor={elevation_factor:.2f})"
+            "Final amplitude after adjustments: %.1f°C "
+            "(continent_factor=%.2f, elev_factor=%.2f)",
+            seasonal_amp,
+            continentality_factor,
+            elevation_factor
         )
         
         return seasonal_amp
@@ -826,8 +987,11 @@ class TemperatureModel:
                 max_continentality = max(max_continentality, local_continentality)
         
         _LOGGER.debug(
-            f"Estimated continentality: {max_continentality:.2f} "
-            f"(lat={latitude:.1f}°, lon={longitude:.1f}°)"
+            "Estimated continentality: %.2f "
+            "(lat=%.1f°, lon=%.1f°)",
+            max_continentality,
+            latitude,
+            longitude
         )
         
         return max_continentality
@@ -835,76 +999,27 @@ class TemperatureModel:
     def _get_sun_angle_factor(self, hour: int) -> float:
         """Calculate sun angle factor (0-1) for given hour.
 
-        Uses real sun.sun entity if available for accurate sunrise/sunset times,
-        otherwise falls back to simple sine curve simulation.
+        Uses the cached solar ephemeris for the model location (sunrise/sunset
+        of the target day) when hass (or its environment) is available,
+        otherwise falls back to a simple sine curve simulation.
 
         Args:
-            hour: Hour of day (0-23)
+            hour: Hour of day (0-23, UTC like current_hour)
 
         Returns:
             Sun angle factor (0.0 = night, 1.0 = solar noon)
         """
-        # Try to use real sun entity if hass available
-        if self.hass is not None:
-            sun_entity = self.hass.states.get("sun.sun")
-
-            if sun_entity:
-                try:
-                    from homeassistant.util import dt as dt_util
-
-                    # Get sunrise and sunset times
-                    next_rising_str = sun_entity.attributes.get("next_rising")
-                    next_setting_str = sun_entity.attributes.get("next_setting")
-
-                    if next_rising_str and next_setting_str:
-                        next_rising = dt_util.parse_datetime(next_rising_str)
-                        next_setting = dt_util.parse_datetime(next_setting_str)
-
-                        if next_rising and next_setting:
-                            # Calculate for the target hour
-                            now = datetime.now(timezone.utc)
-                            target_time = now.replace(hour=hour, minute=0, second=0, microsecond=0)
-
-                            # If target hour is in the past today, move to tomorrow
-                            if target_time < now:
-                                target_time = target_time + timedelta(days=1)
-
-                            # Ensure timezone awareness
-                            if target_time.tzinfo is None:
-                                target_time = target_time.replace(tzinfo=timezone.utc)
-                            if next_rising.tzinfo is None:
-                                next_rising = next_rising.replace(tzinfo=timezone.utc)
-                            if next_setting.tzinfo is None:
-                                next_setting = next_setting.replace(tzinfo=timezone.utc)
-
-                            # If time is before sunrise or after sunset, sun factor = 0
-                            sunrise_hour = next_rising.hour + next_rising.minute / 60.0
-                            sunset_hour = next_setting.hour + next_setting.minute / 60.0
-
-                            if hour < sunrise_hour or hour >= sunset_hour:
-                                return 0.0
-
-                            # Calculate solar noon (midpoint between sunrise and sunset)
-                            solar_noon = (sunrise_hour + sunset_hour) / 2.0
-                            daylight_duration = sunset_hour - sunrise_hour
-
-                            # Sun angle factor: sine curve from sunrise to sunset, peaking at solar noon
-                            # Map hour to 0-π phase (0 at sunrise, π at sunset)
-                            time_from_sunrise = hour - sunrise_hour
-                            phase = (time_from_sunrise / daylight_duration) * math.pi
-
-                            sun_factor = math.sin(phase)
-
-                            _LOGGER.debug(
-                                f"Sun factor for hour {hour}: {sun_factor:.2f} "
-                                f"(sunrise={sunrise_hour:.1f}, sunset={sunset_hour:.1f}, "
-                                f"solar_noon={solar_noon:.1f})"
-                            )
-
-                            return max(0.0, min(1.0, sun_factor))
+        if self.environment is not None or self.hass is not None:
+            try:
+                # Next occurrence of the target hour
+                now = datetime.now(timezone.utc)
+                target_time = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+                if target_time < now:
+                    target_time = target_time + timedelta(days=1)
 
-                except (ValueError, AttributeError) as err:
-                    _LOGGER.debug(f"Could not use sun entity, falling back to simulation: {err}")
+                return sun_angle_factor(target_time, self.latitude, self.longitude)
+            except (TypeError, ValueError) as err:
+                _LOGGER.debug("Could not use solar ephemeris, falling back to simulation: %s", err)
 
         # Fallback: Simple sine curve simulation
         # Night time (no solar warming)
@@ -950,7 +1065,9 @@ class ZambrettiForecaster:
         self,
         hass: HomeAssistant | None = None,
         latitude: float = 50.0,
-        solar_radiation: float | None = None
+        solar_radiation: float | None = None,
+        config_entry: ConfigEntry | None = None,
+        environment: ForecastEnvironment | None = None,
     ):
         """Initialize Zambretti forecaster.
 
@@ -958,10 +1075,22 @@ class ZambrettiForecaster:
             hass: Home Assistant instance for sun entity access
             latitude: Location latitude for seasonal adjustment
             solar_radiation: Current solar radiation in W/m² for cloud cover correction
+            config_entry: Config entry of the station (language setting)
+            environment: Home Assistant inputs resolved on the event loop (used
+                instead of hass)
         """
         self.hass = hass
         self.latitude = latitude
         self.solar_radiation = solar_radiation
+        self.config_entry = config_entry
+        self.environment = environment
+
+    def _lang_index(self) -> int:
+        """Return the forecast language index."""
+        if self.environment is not None:
+            return self.environment.lang_index
+        from .language import get_language_index
+        return get_language_index(self.hass, self.config_entry)
 
     def forecast_hour(
         self,
@@ -1012,12 +1141,11 @@ class ZambrettiForecaster:
         wind_data = [wind_fak, wind_direction, dir_text, speed_fak]
 
         # Run Zambretti algorithm
-        from .language import get_language_index
         result = calculate_zambretti_forecast(
             p0=pressure,
             pressure_change=pressure_change,
             wind_data=wind_data,
-            lang_index=get_language_index(self.hass)
+            lang_index=self._lang_index()
         )
 
         # Result is [forecast_text, forecast_number, letter_code]
@@ -1048,8 +1176,11 @@ class ZambrettiForecaster:
         )
 
         _LOGGER.debug(
-            f"Zambretti condition mapping: letter={letter_code} → "
-            f"base={condition}, time={forecast_time.hour:02d}:00"
+            "Zambretti condition mapping: letter=%s → "
+            "base=%s, time=%02d:00",
+            letter_code,
+            condition,
+            forecast_time.hour
         )
 
         # UV INDEX CLOUD COVER CORRECTION (daytime only)
@@ -1063,7 +1194,7 @@ class ZambrettiForecaster:
         # Clear sky at solar noon: ~800-1000 W/m² (varies by season)
         if is_daytime and self.solar_radiation is not None:
             # Use solar radiation if UV index not available
-            sun_factor = self._get_sun_angle_factor_for_condition(hour)
+            sun_factor = self._get_sun_angle_factor_for_condition(hour, forecast_time)
 
             # Expected clear-sky solar radiation with location-aware maximum
             month = forecast_time.month
@@ -1091,9 +1222,14 @@ class ZambrettiForecaster:
             expected_clear_sky_solar = max_solar_location * sun_factor
 
             _LOGGER.debug(
-                f"Location-aware solar calculation: lat={self.latitude:.2f}°, "
-                f"month={month}, max_for_location={max_solar_location:.0f} W/m², "
-                f"sun_factor={sun_factor:.3f}, expected={expected_clear_sky_solar:.0f} W/m²"
+                "Location-aware solar calculation: lat=%.2f°, "
+                "month=%s, max_for_location=%.0f W/m², "
+                "sun_factor=%.3f, expected=%.0f W/m²",
+                self.latitude,
+                month,
+                max_solar_location,
+                sun_factor,
+                expected_clear_sky_solar
             )
 
             if expected_clear_sky_solar > 100:
@@ -1101,43 +1237,65 @@ class ZambrettiForecaster:
                 cloud_cover_percent = max(0.0, min(100.0, (1.0 - solar_ratio) * 100))
 
                 _LOGGER.debug(
-                    f"Solar cloud correction: radiation={self.solar_radiation:.0f}W/m², "
-                    f"expected={expected_clear_sky_solar:.0f}W/m², "
-                    f"clouds={cloud_cover_percent:.0f}%"
+                    "Solar cloud correction: radiation=%.0fW/m², "
+                    "expected=%.0fW/m², "
+                    "clouds=%.0f%%",
+                    self.solar_radiation,
+                    expected_clear_sky_solar,
+                    cloud_cover_percent
                 )
 
                 # Apply same corrections as UV
                 if condition in ("sunny", "clear-night") and cloud_cover_percent > 70:
-                    _LOGGER.debug(f"Solar correction: {condition} → cloudy")
+                    _LOGGER.debug("Solar correction: %s → cloudy", condition)
                     condition = "cloudy"
                 elif condition in ("sunny", "clear-night") and cloud_cover_percent > 40:
-                    _LOGGER.debug(f"Solar correction: {condition} → partlycloudy")
+                    _LOGGER.debug("Solar correction: %s → partlycloudy", condition)
                     condition = "partlycloudy"
                 elif condition == "cloudy" and cloud_cover_percent < 30:
-                    _LOGGER.debug(f"Solar correction: cloudy → partlycloudy")
+                    _LOGGER.debug("Solar correction: cloudy → partlycloudy")
                     condition = "partlycloudy"
                 elif condition == "cloudy" and cloud_cover_percent < 10:
-                    _LOGGER.debug(f"Solar correction: cloudy → sunny")
+                    _LOGGER.debug("Solar correction: cloudy → sunny")
                     condition = "sunny"
 
         # Convert sunny to clear-night during night hours
         if condition == "sunny" and self._is_night(forecast_time):
-            _LOGGER.debug(f"Night time detected, converting sunny → clear-night")
+            _LOGGER.debug("Night time detected, converting sunny → clear-night")
             return "clear-night"
 
         return condition
 
-    def _get_sun_angle_factor_for_condition(self, hour: int) -> float:
+    def _get_sun_angle_factor_for_condition(
+        self, hour: int, forecast_time: datetime | None = None
+    ) -> float:
         """Calculate sun angle factor for condition correction.
 
-        Simplified version for cloud cover correction.
+        Uses the cached solar ephemeris for the Home Assistant location when
+        available, otherwise a simplified fixed-hours curve.
 
         Args:
             hour: Hour of day (0-23)
+            forecast_time: Forecast datetime (optional, enables ephemeris)
 
         Returns:
             Sun angle factor (0.0 = night, 1.0 = solar noon)
         """
+        if forecast_time is not None and self.environment is not None:
+            try:
+                return sun_angle_factor(
+                    forecast_time, self.environment.latitude, self.environment.longitude
+                )
+            except (TypeError, ValueError, AttributeError) as err:
+                _LOGGER.debug("Could not use solar ephemeris for condition: %s", err)
+        elif forecast_time is not None and self.hass is not None:
+            try:
+                return sun_angle_factor(
+                    forecast_time, self.hass.config.latitude, self.hass.config.longitude
+                )
+            except (TypeError, ValueError, AttributeError) as err:
+                _LOGGER.debug("Could not use solar ephemeris for condition: %s", err)
+
         # Night time
         if hour >= 18 or hour < 6:
             return 0.0
@@ -1164,64 +1322,9 @@ class ZambrettiForecaster:
         if check_time.hour >= 11 and check_time.hour <= 13:
             return False
 
-        if self.hass is None:
-            # Fallback to simple time check if hass not available
-            return check_time.hour >= 19 or check_time.hour < 7
-
-        # Get sun entity
-        sun_entity = self.hass.states.get("sun.sun")
-
-        if not sun_entity:
-            # Fallback to simple time check if sun entity not available
-            return check_time.hour >= 19 or check_time.hour < 7
-
-        # For current time (within 1 minute), just check state
-        now = datetime.now(timezone.utc)
-
-        # Make check_time timezone aware first if needed
-        if check_time.tzinfo is None:
-            check_time = check_time.replace(tzinfo=timezone.utc)
-
-        time_diff = abs((check_time - now).total_seconds())
-
-        if time_diff < 60:
-            return sun_entity.state == "below_horizon"
-
-        # For future times, calculate sunrise/sunset for the specific forecast date
-        try:
-            from homeassistant.helpers.sun import get_astral_event_date
-            from homeassistant.const import SUN_EVENT_SUNRISE, SUN_EVENT_SUNSET
-
-            # Get sunrise/sunset for the specific forecast date
-            forecast_date = check_time.date()
-
-            sunrise = get_astral_event_date(self.hass, SUN_EVENT_SUNRISE, forecast_date)
-            sunset = get_astral_event_date(self.hass, SUN_EVENT_SUNSET, forecast_date)
-
-            if sunrise and sunset:
-                # Make check_time timezone-aware if it isn't already
-                if check_time.tzinfo is None:
-                    check_time = check_time.replace(tzinfo=timezone.utc)
-
-                # Check if time is before sunrise or after sunset
-                is_night = check_time < sunrise or check_time > sunset
-
-                _LOGGER.debug(
-                    f"Future time check: "
-                    f"check={check_time.strftime('%Y-%m-%d %H:%M')}, "
-                    f"sunset={sunset.strftime('%Y-%m-%d %H:%M')}, "
-                    f"sunrise={sunrise.strftime('%Y-%m-%d %H:%M')} → "
-                    f"is_night={is_night}"
-                )
-
-                return is_night
-
-        except (ImportError, ValueError, AttributeError) as err:
-            _LOGGER.debug(f"Could not calculate sun times, using fallback: {err}")
-
-        # Fallback: Night is between 19:00 and 07:00
-        hour = check_time.hour
-        return hour >= 19 or hour < 7
+        if self.environment is not None:
+            return self.environment.is_night(check_time)
+        return is_night_for_hass(self.hass, check_time)
 
 
 
@@ -1318,8 +1421,13 @@ class RainProbabilityCalculator:
         result = max(0, min(100, base_prob))
 
         _LOGGER.debug(
-            f"RainProb: code={forecast_code} → {result}% "
-            f"(P={future_pressure:.1f}hPa, ΔP={pressure_change:+.1f}, base={RainProbabilityCalculator.CODE_RAIN_PROB.get(forecast_code, 50)}%)"
+            "RainProb: code=%s → %s%% "
+            "(P=%.1fhPa, ΔP=%+.1f, base=%s%%)",
+            forecast_code,
+            result,
+            future_pressure,
+            pressure_change,
+            RainProbabilityCalculator.CODE_RAIN_PROB.get(forecast_code, 50)
         )
 
         return result
@@ -1380,7 +1488,10 @@ class HourlyForecastGenerator:
         forecast_model: str = FORECAST_MODEL_ENHANCED,
         elevation: float = 0.0,
         current_condition: str | None = None,
-        longitude: float = 21.25
+        longitude: float = 21.25,
+        trace: ForecastTrace | None = None,
+        config_entry: ConfigEntry | None = None,
+        environment: ForecastEnvironment | None = None,
     ):
         """Initialize hourly forecast generator.
 
@@ -1397,6 +1508,10 @@ class HourlyForecastGenerator:
             elevation: Elevation in meters above sea level
             current_condition: Current weather condition from weather entity (e.g., 'snowy', 'rainy', 'cloudy')
             longitude: Location longitude (for diurnal temperature model)
+            trace: Structured trace collecting one record per forecast hour (optional)
+            config_entry: Config entry of the station (language and hemisphere settings)
+            environment: Home Assistant inputs resolved on the event loop (used
+                instead of hass and config_entry)
         """
         self.hass = hass
         self.pressure_model = pressure_model
@@ -1410,6 +1525,23 @@ class HourlyForecastGenerator:
         self.elevation = elevation
         self.current_condition = current_condition
         self.longitude = longitude
+        self.trace = trace
+        self.config_entry = config_entry
+        self.environment = environment
+
+    def _lang_index(self) -> int:
+        """Return the forecast language index."""
+        if self.environment is not None:
+            return self.environment.lang_index
+        from .language import get_language_index
+        return get_language_index(self.hass, self.config_entry)
+
+    def _ha_longitude(self) -> float:
+        """Return the Home Assistant longitude (21.25 if unknown)."""
+        if self.environment is not None:
+            longitude = self.environment.longitude
+            return longitude if longitude is not None else 21.25
+        return getattr(self.hass.config, 'longitude', 21.25) if self.hass and self.hass.config else 21.25
 
     def generate(
         self,
@@ -1439,23 +1571,15 @@ class HourlyForecastGenerator:
         now = datetime.now(timezone.utc)
         rain_calc = RainProbabilityCalculator()
 
-        for hour_offset in range(0, hours_count + 1, interval_hours):
-            future_time = now + timedelta(hours=hour_offset)
+        # Predict atmospheric conditions for the whole horizon at once
+        hour_offsets = range(0, hours_count + 1, interval_hours)
+        predicted_pressures, predicted_trends = self.pressure_model.predict_many(hour_offsets)
 
-            # Predict atmospheric conditions
-            future_pressure = self.pressure_model.predict(hour_offset)
-            pressure_trend = self.pressure_model.get_trend(hour_offset)
-            
-            # ═══════════════════════════════════════════════════════════════
-            # v3.1.12: Use weather-aware temperature model for ALL models
-            # ═══════════════════════════════════════════════════════════════
-            # Calculate pressure change for forecast code determination
-            pressure_change = future_pressure - self.pressure_model.current_pressure
+        for hour_offset, future_pressure, pressure_trend in zip(
+            hour_offsets, predicted_pressures, predicted_trends
+        ):
+            future_time = now + timedelta(hours=hour_offset)
 
-            # Predict atmospheric conditions
-            future_pressure = self.pressure_model.predict(hour_offset)
-            pressure_trend = self.pressure_model.get_trend(hour_offset)
-            
             # ═══════════════════════════════════════════════════════════════
             # v3.1.12: Use weather-aware temperature model for ALL models
             # ═══════════════════════════════════════════════════════════════
@@ -1479,15 +1603,15 @@ class HourlyForecastGenerator:
             if self.forecast_model in (FORECAST_MODEL_NEGRETTI, FORECAST_MODEL_ENHANCED):
                 try:
                     from .negretti_zambra import calculate_negretti_zambra_forecast
-                    from .language import get_language_index
-                    from .const import CONF_HEMISPHERE, DEFAULT_HEMISPHERE
 
-                    lang_index = get_language_index(self.hass)
+                    lang_index = self._lang_index()
 
                     # Get hemisphere from config
                     hemisphere = DEFAULT_HEMISPHERE
-                    if hasattr(self, 'config_entry') and hasattr(self, 'config_entry') and getattr(self, 'config_entry', None):
-                        hemisphere = getattr(self, 'config_entry').data.get(CONF_HEMISPHERE, DEFAULT_HEMISPHERE)
+                    if self.environment is not None:
+                        hemisphere = self.environment.hemisphere
+                    elif self.config_entry is not None:
+                        hemisphere = self.config_entry.data.get(CONF_HEMISPHERE, DEFAULT_HEMISPHERE)
 
                     negretti_result = calculate_negretti_zambra_forecast(
                         future_pressure,
@@ -1499,7 +1623,7 @@ class HourlyForecastGenerator:
                     )
                     negretti_text, negretti_num, negretti_letter = negretti_result
                 except Exception as e:
-                    _LOGGER.debug(f"Negretti-Zambra calculation failed: {e}, using Zambretti")
+                    _LOGGER.debug("Negretti-Zambra calculation failed: %s, using Zambretti", e)
                     negretti_letter = zambretti_letter
                     negretti_num = zambretti_num
 
@@ -1507,20 +1631,19 @@ class HourlyForecastGenerator:
             if self.forecast_model == FORECAST_MODEL_ZAMBRETTI:
                 forecast_letter = zambretti_letter
                 forecast_num = zambretti_num
-                _LOGGER.debug(f"Using Zambretti forecast: {zambretti_letter}")
+                _LOGGER.debug("Using Zambretti forecast: %s", zambretti_letter)
             elif self.forecast_model == FORECAST_MODEL_NEGRETTI and negretti_letter:
                 forecast_letter = negretti_letter
                 forecast_num = negretti_num
-                _LOGGER.debug(f"Using Negretti-Zambra forecast: {negretti_letter}")
+                _LOGGER.debug("Using Negretti-Zambra forecast: %s", negretti_letter)
             else:  # FORECAST_MODEL_ENHANCED - use combined_model.py
                 if hour_offset == 0:
                     # ═══════════════════════════════════════
                     # NEW v3.1.12: Use Persistence for hour 0
                     # ═══════════════════════════════════════
                     from .persistence import calculate_persistence_forecast, get_current_condition_code
-                    from .language import get_language_index
                     
-                    lang_index = get_language_index(self.hass)
+                    lang_index = self._lang_index()
                     
                     # Get current dewpoint (estimate if not available)
                     current_dewpoint = self.temperature_model.current_temp - 5.0  # Rough estimate
@@ -1560,8 +1683,10 @@ class HourlyForecastGenerator:
                         forecast_letter = "A"  # Fallback
                     
                     _LOGGER.debug(
-                        f"🔒 Hour 0: PERSISTENCE → code={forecast_num}, "
-                        f"letter={forecast_letter}, confidence=98%"
+                        "🔒 Hour 0: PERSISTENCE → code=%s, "
+                        "letter=%s, confidence=98%%",
+                        forecast_num,
+                        forecast_letter
                     )
                     
                 elif negretti_letter:
@@ -1612,7 +1737,7 @@ class HourlyForecastGenerator:
                     # Fallback to Zambretti if Negretti unavailable
                     forecast_letter = zambretti_letter
                     forecast_num = zambretti_num
-                    _LOGGER.debug(f"Combined forecast (Zambretti fallback): {zambretti_letter}")
+                    _LOGGER.debug("Combined forecast (Zambretti fallback): %s", zambretti_letter)
 
             # ═══════════════════════════════════════════════════════════════
             # v3.1.12: Calculate temperature using weather-aware model
@@ -1627,15 +1752,19 @@ class HourlyForecastGenerator:
                 forecast_code=forecast_num if forecast_num is not None else 13,  # Use selected forecast code
                 current_hour=now.hour,
                 latitude=self.latitude,
-                longitude=getattr(self.hass.config, 'longitude', 21.25) if self.hass and self.hass.config else 21.25,
+                longitude=self._ha_longitude(),
                 humidity=getattr(self.temperature_model, 'humidity', None),
                 cloud_cover=getattr(self.temperature_model, 'cloud_cover', None),
                 solar_radiation=self.zambretti.solar_radiation if hasattr(self.zambretti, 'solar_radiation') else None,
             )
             
             _LOGGER.debug(
-                f"🌡️ {self.forecast_model} h{hour_offset}: {future_temp:.1f}°C "
-                f"(code={forecast_num}, weather-aware)"
+                "🌡️ %s h%s: %.1f°C "
+                "(code=%s, weather-aware)",
+                self.forecast_model,
+                hour_offset,
+                future_temp,
+                forecast_num
             )
 
             # Determine if it's daytime using sun entity (if available)
@@ -1664,9 +1793,15 @@ class HourlyForecastGenerator:
             )
 
             _LOGGER.debug(
-                f"Final condition for {future_time.strftime('%H:%M')}: "
-                f"model={self.forecast_model}, letter={forecast_letter}, "
-                f"code={forecast_num}, is_current={is_current_state} → {condition}"
+                "Final condition for %s: "
+                "model=%s, letter=%s, "
+                "code=%s, is_current=%s → %s",
+                future_time.strftime('%H:%M'),
+                self.forecast_model,
+                forecast_letter,
+                forecast_num,
+                is_current_state,
+                condition
             )
 
             # ═══════════════════════════════════════════════════════════════
@@ -1698,9 +1833,15 @@ class HourlyForecastGenerator:
                     
                     if predicted_humidity is not None:
                         _LOGGER.debug(
-                            f"💧 Forecast h{hour_offset}: RH prediction "
-                            f"{current_humidity:.1f}% → {predicted_humidity:.1f}% "
-                            f"(T: {current_temp:.1f}°C → {future_temp:.1f}°C, ΔP={pressure_change:+.1f}hPa)"
+                            "💧 Forecast h%s: RH prediction "
+                            "%.1f%% → %.1f%% "
+                            "(T: %.1f°C → %.1f°C, ΔP=%+.1fhPa)",
+                            hour_offset,
+                            current_humidity,
+                            predicted_humidity,
+                            current_temp,
+                            future_temp,
+                            pressure_change
                         )
 
             # Calculate rain probability from selected model (Zambretti/Negretti/Enhanced)
@@ -1767,11 +1908,27 @@ class HourlyForecastGenerator:
                 "native_apparent_temp": round(apparent_temp, 1) if apparent_temp is not None else None,
             }
 
+            if self.trace is not None:
+                self.trace.record(
+                    hour=hour_offset,
+                    pressure=round(future_pressure, 1),
+                    trend=pressure_trend,
+                    zambretti=zambretti_letter,
+                    negretti=negretti_letter,
+                    code=forecast_num,
+                    temperature=round(future_temp, 1),
+                    is_night=is_night,
+                    condition=condition,
+                    rain_probability=rain_prob,
+                )
+
             forecasts.append(forecast)
 
         _LOGGER.debug(
-            f"Generated {len(forecasts)} hourly forecasts "
-            f"(interval: {interval_hours}h)"
+            "Generated %s hourly forecasts "
+            "(interval: %sh)",
+            len(forecasts),
+            interval_hours
         )
 
         return forecasts
@@ -1785,69 +1942,9 @@ class HourlyForecastGenerator:
         Returns:
             True if sun is below horizon
         """
-        if self.hass is None:
-            # Fallback to simple time check if hass not available
-            return check_time.hour >= 19 or check_time.hour < 7
-
-        # Get sun entity
-        sun_entity = self.hass.states.get("sun.sun")
-
-        if not sun_entity:
-            # Fallback to simple time check if sun entity not available
-            _LOGGER.debug(f"Sun entity not available, using fallback time check for hour={check_time.hour}")
-            return check_time.hour >= 19 or check_time.hour < 7
-
-        # For current time (within 1 minute), just check state
-        now = datetime.now(timezone.utc)
-
-        # Make check_time timezone aware first if needed
-        if check_time.tzinfo is None:
-            check_time = check_time.replace(tzinfo=timezone.utc)
-
-        time_diff = abs((check_time - now).total_seconds())
-
-        if time_diff < 60:
-            is_night = sun_entity.state == "below_horizon"
-            _LOGGER.debug(f"Current time check: is_night={is_night} (sun.sun state={sun_entity.state})")
-            return is_night
-
-        # For future times, calculate sunrise/sunset for the specific forecast date
-        try:
-            from homeassistant.helpers.sun import get_astral_event_date
-            from homeassistant.const import SUN_EVENT_SUNRISE, SUN_EVENT_SUNSET
-
-            # Get sunrise/sunset for the specific forecast date
-            forecast_date = check_time.date()
-
-            sunrise = get_astral_event_date(self.hass, SUN_EVENT_SUNRISE, forecast_date)
-            sunset = get_astral_event_date(self.hass, SUN_EVENT_SUNSET, forecast_date)
-
-            if sunrise and sunset:
-                # Make check_time timezone-aware if it isn't already
-                if check_time.tzinfo is None:
-                    check_time = check_time.replace(tzinfo=timezone.utc)
-
-                # Check if time is before sunrise or after sunset
-                is_night = check_time < sunrise or check_time > sunset
-
-                _LOGGER.debug(
-                    f"Future time check: "
-                    f"check={check_time.strftime('%Y-%m-%d %H:%M')}, "
-                    f"sunset={sunset.strftime('%Y-%m-%d %H:%M')}, "
-                    f"sunrise={sunrise.strftime('%Y-%m-%d %H:%M')} → "
-                    f"is_night={is_night}"
-                )
-
-                return is_night
-
-        except (ImportError, ValueError, AttributeError) as err:
-            _LOGGER.debug(f"Could not calculate sun times, using fallback: {err}")
-
-        # Fallback: Night is between 19:00 and 07:00
-        hour = check_time.hour
-        is_night = hour >= 19 or hour < 7
-        _LOGGER.debug(f"Fallback time check: hour={hour} → is_night={is_night}")
-        return is_night
+        if self.environment is not None:
+            return self.environment.is_night(check_time)
+        return is_night_for_hass(self.hass, check_time)
 
     def _generate_with_orchestration(self, hours_count: int) -> list[Forecast]:
         """Generate forecast using ENHANCED orchestration (v3.1.12).
@@ -1865,21 +1962,26 @@ class HourlyForecastGenerator:
             List of Forecast objects
         """
         from .combined_model import generate_enhanced_hourly_forecast
-        from .language import get_language_index
-        from .const import CONF_HEMISPHERE, DEFAULT_HEMISPHERE
         
         # Get language index
-        lang_index = get_language_index(self.hass)
+        lang_index = self._lang_index()
         
-        # Get hemisphere from config
+        # Get hemisphere from the config of this station (callers without an
+        # entry fall back to the first configured entry)
         hemisphere = DEFAULT_HEMISPHERE
-        try:
-            config_entries = self.hass.config_entries.async_entries("local_weather_forecast")
-            if config_entries:
-                hemisphere = config_entries[0].data.get(CONF_HEMISPHERE, DEFAULT_HEMISPHERE)
-        except (AttributeError, TypeError, IndexError):
-            # In tests, config_entries might be a Mock or unavailable
-            pass
+        if self.environment is not None:
+            hemisphere = self.environment.hemisphere
+        else:
+            config_entry = self.config_entry
+            if config_entry is None:
+                try:
+                    config_entries = self.hass.config_entries.async_entries(DOMAIN)
+                    config_entry = config_entries[0] if config_entries else None
+                except (AttributeError, TypeError, IndexError):
+                    # In tests, config_entries might be a Mock or unavailable
+                    pass
+            if config_entry is not None:
+                hemisphere = config_entry.data.get(CONF_HEMISPHERE, DEFAULT_HEMISPHERE)
         
         # Get Zambretti and Negretti forecasts for the orchestration
         zambretti_result = self.zambretti.forecast_hour(
@@ -1909,7 +2011,7 @@ class HourlyForecastGenerator:
             )
             negretti_result = [negretti_data[0], negretti_data[1]]
         except Exception as e:
-            _LOGGER.debug(f"Could not get Negretti forecast: {e}")
+            _LOGGER.debug("Could not get Negretti forecast: %s", e)
         
         # Prepare weather data dict
         weather_data = {
@@ -1924,25 +2026,71 @@ class HourlyForecastGenerator:
             "negretti_result": negretti_result,
             "temperature_trend": self.temperature_model.change_rate_1h,  # Use change_rate_1h
             "latitude": self.latitude,  # NEW: For sun-based temperature model
-            "longitude": getattr(self.hass.config, 'longitude', 21.25) if self.hass and self.hass.config else 21.25,  # NEW
+            "longitude": self._ha_longitude(),  # NEW
             "solar_radiation": self.zambretti.solar_radiation if hasattr(self.zambretti, 'solar_radiation') else None,  # NEW
             "cloud_cover": getattr(self.temperature_model, 'cloud_cover', None),
         }
         
         # Generate forecasts using enhanced orchestration
         # Note: generate_enhanced_hourly_forecast uses range(hours + 1), so pass hours_count - 1
-        _LOGGER.debug(f"🎯 Calling generate_enhanced_hourly_forecast with {hours_count} hours")
+        _LOGGER.debug("🎯 Calling generate_enhanced_hourly_forecast with %s hours", hours_count)
         hourly_forecasts = generate_enhanced_hourly_forecast(
             weather_data=weather_data,
             hours=hours_count - 1,  # Function generates hours 0 to hours (inclusive)
             lang_index=lang_index
         )
         
+        # ═══════════════════════════════════════════════════════════════
+        # HUMIDITY PREDICTION FOR DERIVED PARAMETERS
+        # Future humidity, dew point and apparent temperature for the whole
+        # horizon at once. NO condition adjustments - trust the orchestrated models!
+        # ═══════════════════════════════════════════════════════════════
+        from .calculations import (
+            calculate_apparent_temperature_batch,
+            calculate_dewpoint_batch,
+            calculate_future_humidity_batch,
+        )
+
+        future_temps = [forecast_data["temperature"] for forecast_data in hourly_forecasts]
+        current_humidity = getattr(self.temperature_model, 'humidity', None)
+        current_temp = self.temperature_model.current_temp
+        predicted_humidities: list[float | None] = [None] * len(hourly_forecasts)
+        humidities: list[float | None] = [None] * len(hourly_forecasts)
+        dewpoints: list[float | None] = [None] * len(hourly_forecasts)
+        apparent_temps: list[float | None] = [None] * len(hourly_forecasts)
+
+        if (
+            current_humidity is not None
+            and 0 <= current_humidity <= 100
+            and current_temp is not None
+            and hourly_forecasts
+        ):
+            pressure_changes = [
+                forecast_data["pressure"] - self.pressure_model.current_pressure
+                for forecast_data in hourly_forecasts
+            ]
+            # Calculate future humidity based on temperature change (Clausius-Clapeyron)
+            predicted_humidities = calculate_future_humidity_batch(
+                current_temp, current_humidity, future_temps, pressure_changes
+            )
+            # Use predicted humidity if available, otherwise fall back to current
+            humidities = [
+                predicted if predicted is not None else current_humidity
+                for predicted in predicted_humidities
+            ]
+            # Dew point and apparent temperature (feels-like) from predicted conditions
+            dewpoints = calculate_dewpoint_batch(future_temps, humidities)
+            # Estimate future wind speed (currently use current, could be improved)
+            future_wind_speed = self.wind_speed  # TODO: Add wind speed prediction
+            apparent_temps = calculate_apparent_temperature_batch(
+                future_temps, humidities, future_wind_speed
+            )
+
         # Convert to Home Assistant Forecast format
         forecasts = []
         rain_calc = RainProbabilityCalculator()
         
-        for forecast_data in hourly_forecasts:
+        for index, forecast_data in enumerate(hourly_forecasts):
             future_time = forecast_data["datetime"]
             condition_code = forecast_data["condition_code"]
             temperature = forecast_data["temperature"]
@@ -1976,39 +2124,21 @@ class HourlyForecastGenerator:
                 is_current_state=is_current_state
             )
             
-            # ═══════════════════════════════════════════════════════════════
-            # HUMIDITY PREDICTION FOR DERIVED PARAMETERS
-            # Calculate future humidity for dewpoint and apparent temperature
-            # NO condition adjustments - trust the orchestrated models!
-            # ═══════════════════════════════════════════════════════════════
-            humidity = None
+            humidity = humidities[index]
             hour_offset = (future_time - datetime.now(timezone.utc)).total_seconds() / 3600
-            
-            if hasattr(self.temperature_model, 'humidity') and self.temperature_model.humidity is not None:
-                current_humidity = self.temperature_model.humidity
-                current_temp = self.temperature_model.current_temp
-                
-                if 0 <= current_humidity <= 100 and current_temp is not None:
-                    # Calculate future humidity based on temperature change (Clausius-Clapeyron)
-                    from .calculations import calculate_future_humidity
-                    
-                    pressure_change = pressure - self.pressure_model.current_pressure
-                    predicted_humidity = calculate_future_humidity(
-                        current_temperature=current_temp,
-                        current_humidity=current_humidity,
-                        future_temperature=temperature,
-                        pressure_change=pressure_change
-                    )
-                    
-                    # Use predicted humidity if available, otherwise fall back to current
-                    humidity = predicted_humidity if predicted_humidity is not None else current_humidity
-                    
-                    if predicted_humidity is not None:
-                        _LOGGER.debug(
-                            f"💧 Enhanced h{hour_offset:.0f}: RH prediction "
-                            f"{current_humidity:.1f}% → {predicted_humidity:.1f}% "
-                            f"(T: {current_temp:.1f}°C → {temperature:.1f}°C, ΔP={pressure_change:+.1f}hPa)"
-                        )
+
+            if predicted_humidities[index] is not None:
+                _LOGGER.debug(
+                    "💧 Enhanced h%.0f: RH prediction "
+                    "%.1f%% → %.1f%% "
+                    "(T: %.1f°C → %.1f°C, ΔP=%+.1fhPa)",
+                    hour_offset,
+                    current_humidity,
+                    predicted_humidities[index],
+                    current_temp,
+                    temperature,
+                    pressure_changes[index]
+                )
             
             # Calculate rain probability
             rain_prob = rain_calc.calculate(
@@ -2032,27 +2162,16 @@ class HourlyForecastGenerator:
             
             # Log for transparency
             _LOGGER.debug(
-                f"Enhanced h{hour_offset:.0f}: condition={condition}, rain_prob={rain_prob}% "
-                f"(code={condition_code})"
+                "Enhanced h%.0f: condition=%s, rain_prob=%s%% "
+                "(code=%s)",
+                hour_offset,
+                condition,
+                rain_prob,
+                condition_code
             )
             
-            # Calculate dew point from predicted temperature and humidity
-            dewpoint_temp = None
-            if humidity is not None and 0 < humidity <= 100:
-                from .calculations import calculate_dewpoint
-                dewpoint_temp = calculate_dewpoint(temperature, humidity)
-
-            # Calculate apparent temperature (feels-like) from predicted conditions
-            apparent_temp = None
-            if humidity is not None:
-                from .calculations import calculate_apparent_temperature
-                # Estimate future wind speed (currently use current, could be improved)
-                future_wind_speed = self.wind_speed  # TODO: Add wind speed prediction
-                apparent_temp = calculate_apparent_temperature(
-                    temperature,
-                    humidity,
-                    future_wind_speed
-                )
+            dewpoint_temp = dewpoints[index]
+            apparent_temp = apparent_temps[index]
             
             forecast: Forecast = {
                 "datetime": future_time.isoformat(),
@@ -2072,12 +2191,25 @@ class HourlyForecastGenerator:
                 "apparent_temperature": round(apparent_temp, 1) if apparent_temp is not None else None,
                 "native_apparent_temp": round(apparent_temp, 1) if apparent_temp is not None else None,
             }
+
+            if self.trace is not None:
+                self.trace.record(
+                    hour=round(hour_offset),
+                    pressure=round(pressure, 1) if pressure else None,
+                    letter=forecast_letter,
+                    code=condition_code,
+                    temperature=round(temperature, 1),
+                    is_night=is_night,
+                    condition=condition,
+                    rain_probability=rain_prob,
+                )
             
             forecasts.append(forecast)
         
         _LOGGER.debug(
-            f"🎯 Generated {len(forecasts)} forecasts via enhanced orchestration "
-            f"(Persistence → WMO Simple → TIME DECAY)"
+            "🎯 Generated %s forecasts via enhanced orchestration "
+            "(Persistence → WMO Simple → TIME DECAY)",
+            len(forecasts)
         )
         
         return forecasts
@@ -2177,9 +2309,15 @@ class DailyForecastGenerator:
         estimated_max = round(base_mean + amplitude / 2, 1)
 
         _LOGGER.debug(
-            f"📊 Daily extremes estimate: min={estimated_min:.1f}°C, max={estimated_max:.1f}°C "
-            f"(current={current_temp:.1f}°C at hour={current_hour:.1f}, "
-            f"diurnal_pos={current_pos:.2f}, amplitude={amplitude:.1f}°C)"
+            "📊 Daily extremes estimate: min=%.1f°C, max=%.1f°C "
+            "(current=%.1f°C at hour=%.1f, "
+            "diurnal_pos=%.2f, amplitude=%.1f°C)",
+            estimated_min,
+            estimated_max,
+            current_temp,
+            current_hour,
+            current_pos,
+            amplitude
         )
 
         return estimated_min, estimated_max
@@ -2245,15 +2383,19 @@ class DailyForecastGenerator:
 
                 if estimated_min < daily_temp_min:
                     _LOGGER.debug(
-                        f"📊 Today temp_low adjusted: {daily_temp_min}°C → {estimated_min}°C "
-                        f"(diurnal model estimate)"
+                        "📊 Today temp_low adjusted: %s°C → %s°C "
+                        "(diurnal model estimate)",
+                        daily_temp_min,
+                        estimated_min
                     )
                     daily_temp_min = estimated_min
 
                 if estimated_max > daily_temp_max:
                     _LOGGER.debug(
-                        f"📊 Today temp_high adjusted: {daily_temp_max}°C → {estimated_max}°C "
-                        f"(diurnal model estimate)"
+                        "📊 Today temp_high adjusted: %s°C → %s°C "
+                        "(diurnal model estimate)",
+                        daily_temp_max,
+                        estimated_max
                     )
                     daily_temp_max = estimated_max
 
@@ -2299,8 +2441,11 @@ class DailyForecastGenerator:
                     # Use the most severe precipitation condition
                     daily_condition = max(has_precipitation, key=lambda c: CONDITION_PRIORITY.get(c, 0))
                     _LOGGER.debug(
-                        f"Daily condition (precipitation priority): {daily_condition} "
-                        f"(found {len(has_precipitation)} precip hours out of {len(daytime_hours)} daytime)"
+                        "Daily condition (precipitation priority): %s "
+                        "(found %s precip hours out of %s daytime)",
+                        daily_condition,
+                        len(has_precipitation),
+                        len(daytime_hours)
                     )
                 else:
                     # ✅ STEP 2: Check for WORSENING TREND
@@ -2336,9 +2481,14 @@ class DailyForecastGenerator:
                             daily_condition = afternoon_worst
                             trend_adjusted = True
                             _LOGGER.debug(
-                                f"Daily condition (worsening trend): {daily_condition} "
-                                f"(morning={morning_worst}[{morning_priority}] → "
-                                f"afternoon={afternoon_worst}[{afternoon_priority}])"
+                                "Daily condition (worsening trend): %s "
+                                "(morning=%s[%s] → "
+                                "afternoon=%s[%s])",
+                                daily_condition,
+                                morning_worst,
+                                morning_priority,
+                                afternoon_worst,
+                                afternoon_priority
                             )
                     
                     if not trend_adjusted:
@@ -2372,8 +2522,11 @@ class DailyForecastGenerator:
                             # No tie - use the most frequent (weighted)
                             daily_condition = tied_conditions[0]
                             _LOGGER.debug(
-                                f"Daily condition (weighted vote): {daily_condition} "
-                                f"(weight={max_count} out of {len(weighted_conditions)} weighted)"
+                                "Daily condition (weighted vote): %s "
+                                "(weight=%s out of %s weighted)",
+                                daily_condition,
+                                max_count,
+                                len(weighted_conditions)
                             )
                         else:
                             # Tie detected - select the worst (highest priority)
@@ -2382,9 +2535,13 @@ class DailyForecastGenerator:
                                 key=lambda c: CONDITION_PRIORITY.get(c, 0)
                             )
                             _LOGGER.debug(
-                                f"Daily condition (tie-break): {daily_condition} "
-                                f"(tied with {tied_conditions} at weight={max_count}, "
-                                f"selected worst with priority={CONDITION_PRIORITY.get(daily_condition, 0)})"
+                                "Daily condition (tie-break): %s "
+                                "(tied with %s at weight=%s, "
+                                "selected worst with priority=%s)",
+                                daily_condition,
+                                tied_conditions,
+                                max_count,
+                                CONDITION_PRIORITY.get(daily_condition, 0)
                             )
             else:
                 daily_condition = day_hours[len(day_hours) // 2].get("condition", "cloudy")
@@ -2408,9 +2565,12 @@ class DailyForecastGenerator:
                 # Use maximum daytime probability (most conservative, best for planning)
                 daily_rain_prob = max(daytime_rain_probs)
                 _LOGGER.debug(
-                    f"Daily rain probability: max={daily_rain_prob}% "
-                    f"(from {len(daytime_rain_probs)} daytime hours, "
-                    f"avg={sum(daytime_rain_probs)/len(daytime_rain_probs):.0f}%)"
+                    "Daily rain probability: max=%s%% "
+                    "(from %s daytime hours, "
+                    "avg=%.0f%%)",
+                    daily_rain_prob,
+                    len(daytime_rain_probs),
+                    sum(daytime_rain_probs) / len(daytime_rain_probs)
                 )
             else:
                 # Fallback: use all day hours
@@ -2427,9 +2587,14 @@ class DailyForecastGenerator:
             daily_avg_temp = (daily_temp_max + daily_temp_min) / 2.0
             if daily_avg_temp <= 2.0 and daily_condition in ("rainy", "pouring"):
                 _LOGGER.debug(
-                    f"Daily forecast snow conversion: {daily_condition} → snowy "
-                    f"(avg_temp={daily_avg_temp:.1f}°C ≤ 2°C, high={daily_temp_max:.1f}, low={daily_temp_min:.1f}, "
-                    f"day={day_time.strftime('%Y-%m-%d')})"
+                    "Daily forecast snow conversion: %s → snowy "
+                    "(avg_temp=%.1f°C ≤ 2°C, high=%.1f, low=%.1f, "
+                    "day=%s)",
+                    daily_condition,
+                    daily_avg_temp,
+                    daily_temp_max,
+                    daily_temp_min,
+                    day_time.strftime('%Y-%m-%d')
                 )
                 daily_condition = "snowy"
 
@@ -2450,8 +2615,10 @@ class DailyForecastGenerator:
             daily_forecasts.append(forecast)
 
         _LOGGER.debug(
-            f"Aggregated {len(daily_forecasts)} daily forecasts "
-            f"from {len(hourly_forecasts)} hourly points"
+            "Aggregated %s daily forecasts "
+            "from %s hourly points",
+            len(daily_forecasts),
+            len(hourly_forecasts)
         )
 
         return daily_forecasts
@@ -30,9 +30,13 @@ BENEFITS:
 """
 from __future__ import annotations
 
+import functools
 import logging
+import re
 from typing import Callable
 
+from .forecast_data import FORECAST_TEXTS
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -223,15 +227,21 @@ def forecast_code_to_condition(
         if condition in ("rainy", "pouring", "lightning-rainy"):
             if 2.0 < temperature <= 4.0:
                 condition = "snowy-rainy"
-                _LOGGER.debug(f"Snow conversion: rainy → snowy-rainy (T={temperature:.1f}°C)")
+                _LOGGER.debug("Snow conversion: rainy → snowy-rainy (T=%.1f°C)", temperature)
             elif temperature <= 2.0:
                 condition = "snowy"
-                _LOGGER.debug(f"Snow conversion: rainy → snowy (T={temperature:.1f}°C)")
+                _LOGGER.debug("Snow conversion: rainy → snowy (T=%.1f°C)", temperature)
 
     _LOGGER.debug(
-        f"Code→Condition: code={code} → {condition} "
-        f"(night={is_night}, temp={temperature if temperature is not None else 'N/A'}°C, "
-        f"current={is_current_state}, rain_sensor={has_rain_sensor})"
+        "Code→Condition: code=%s → %s "
+        "(night=%s, temp=%s°C, "
+        "current=%s, rain_sensor=%s)",
+        code,
+        condition,
+        is_night,
+        temperature if temperature is not None else 'N/A',
+        is_current_state,
+        has_rain_sensor
     )
 
     return condition
@@ -240,6 +250,162 @@ def forecast_code_to_condition(
 # ==============================================================================
 # TEXT TO INTERNAL CODE MAPPING (MULTILINGUAL)
 # ==============================================================================
+# Keywords are matched as substrings of the lowercased text.  Known forecast
+# texts (FORECAST_TEXTS, all languages) are classified once at import; other
+# texts are scanned once by a single compiled pattern and memoized.
+
+STORM_KEYWORDS = (
+    "storm", "thunder", "gale", "tempest",  # English
+    "stürmisch", "sturm",  # German
+    "θυελλώδης", "καταιγίδα", "τυφώνας",  # Greek
+    "tempestoso", "tempesta", "uragano",  # Italian
+    "búrlivé", "búrka", "orkán"  # Slovak
+)
+HEAVY_RAIN_KEYWORDS = (
+    "heavy rain", "pouring", "frequent", "much rain", "torrential",  # English
+    "häufiger", "viel regen",  # German
+    "συχνή βροχή", "πολλές βροχές",  # Greek
+    "piogge frequenti", "molta pioggia",  # Italian
+    "častý", "veľa dažďom"  # Slovak
+)
+CLOUDY_KEYWORDS = (
+    "cloudy", "overcast",  # English
+    "wolkig", "bewölkt",  # German
+    "νεφελώδης", "συννεφιασμένος",  # Greek
+    "nuvoloso", "coperto",  # Italian
+    "oblačn", "zamrač"  # Slovak (matches zamračené, zamračený, zamračená)
+)
+PARTLY_KEYWORDS = (
+    "partly", "fairly",  # English
+    "heiter bis", "bis wolkig",  # German
+    "αίθριος έως",  # Greek
+    "abbastanza",  # Italian
+    "polo", "miestami"  # Slovak
+)
+POSSIBLY_KEYWORDS = (
+    "possibly", "possible", "may", "might",  # English
+    "möglich", "evtl",  # German
+    "πιθανή", "πιθανώς",  # Greek
+    "possibili", "possibile",  # Italian
+    "možné", "možno"  # Slovak
+)
+RAIN_KEYWORDS = (
+    "rain", "shower",  # English
+    "regen", "schauer", "regnerisch",  # German
+    "βροχή", "βροχερό", "βροχόπτωση",  # Greek
+    "pioggia", "piogge", "rovesci", "piovoso",  # Italian
+    "dážď", "prší", "zrážk", "prehán", "dážd", "daždiv"  # Slovak
+)
+UNSETTLED_KEYWORDS = (
+    "unsettled", "changeable", "variable",  # English
+    "unbeständig", "wechselhaft",  # German
+    "ασταθής", "μεταβλητός", "άστατ",  # Greek
+    "instabile", "variabile",  # Italian
+    "nestále", "premenlivý", "premenlivé"  # Slovak
+)
+FINE_KEYWORDS = (
+    "settled", "stable", "fine", "fair",  # English
+    "beständig", "schön", "schönwetter",  # German
+    "σταθερός", "καλός καιρός", "ωραίος",  # Greek
+    "bello", "stabile", "bel tempo",  # Italian
+    "stabilne", "pekné", "jasn", "slnečn"  # Slovak
+)
+# Possibly keywords count as future problems too
+FUTURE_PROBLEM_KEYWORDS = (
+    "later", "becoming", "worse",  # English
+    "später", "wird", "verschlechterung",  # German
+    "αργό��ερα", "επιδείνωση",  # Greek
+    "più tardi", "diventa", "peggiora",  # Italian
+    "neskôr", "stáva sa", "zhoršenie"  # Slovak
+)
+
+_KEYWORD_GROUPS: dict[str, tuple[str, ...]] = {
+    "storm": STORM_KEYWORDS,
+    "heavy_rain": HEAVY_RAIN_KEYWORDS,
+    "cloudy": CLOUDY_KEYWORDS,
+    "partly": PARTLY_KEYWORDS,
+    "possibly": POSSIBLY_KEYWORDS,
+    "rain": RAIN_KEYWORDS,
+    "unsettled": UNSETTLED_KEYWORDS,
+    "fine": FINE_KEYWORDS,
+    "future_problem": FUTURE_PROBLEM_KEYWORDS,
+}
+
+# Keyword -> every group containing it, or containing a shorter keyword that
+# is its prefix (the pattern reports only the longest keyword per position)
+_KEYWORD_TO_GROUPS: dict[str, frozenset[str]] = {
+    keyword: frozenset(
+        group
+        for group, group_keywords in _KEYWORD_GROUPS.items()
+        for other in group_keywords
+        if keyword.startswith(other)
+    )
+    for keywords in _KEYWORD_GROUPS.values()
+    for keyword in keywords
+}
+
+# Zero-width lookahead finds keywords at every position, so overlapping
+# keywords of different groups are all seen in one pass
+_KEYWORD_PATTERN = re.compile(
+    "(?=("
+    + "|".join(re.escape(keyword) for keyword in sorted(_KEYWORD_TO_GROUPS, key=len, reverse=True))
+    + "))"
+)
+
+# Text class of fine weather with caveats: code 0 if forecast_num is 0, else 3
+_FINE_WITH_CAVEATS = -1
+
+
+def _classify_text(text_lower: str) -> int | None:
+    """Classify a lowercased forecast text by its keywords.
+
+    Args:
+        text_lower: Lowercased forecast text
+
+    Returns:
+        Internal code, _FINE_WITH_CAVEATS, or None if no keyword matched
+    """
+    groups: set[str] = set()
+    for match in _KEYWORD_PATTERN.finditer(text_lower):
+        groups |= _KEYWORD_TO_GROUPS[match.group(1)]
+
+    # PRIORITY 1: Storm keywords (code 25)
+    if "storm" in groups:
+        return 25
+    # PRIORITY 2: Heavy/frequent rain keywords (22)
+    if "heavy_rain" in groups:
+        return 22
+    # PRIORITY 3: Cloudy keywords (BEFORE rain check!)
+    # This fixes "Zamračené" (Slovak cloudy) detection
+    if "cloudy" in groups:
+        return 3 if "partly" in groups else 13
+    # PRIORITY 4: Rain keywords (but NOT "possibly") (15)
+    if "rain" in groups and "possibly" not in groups:
+        return 15
+    # PRIORITY 5: Unsettled/changeable (WITHOUT rain) (3)
+    if "unsettled" in groups:
+        return 3
+    # PRIORITY 6: Fair/fine weather (0-5), checking for future problems
+    if "fine" in groups:
+        if "future_problem" in groups or "possibly" in groups:
+            return _FINE_WITH_CAVEATS
+        return 0
+    return None
+
+
+# Every known forecast text (all languages) classified once
+_KNOWN_TEXT_CLASSES: dict[str, int | None] = {
+    text.lower(): _classify_text(text.lower())
+    for texts in FORECAST_TEXTS
+    for text in texts
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _classify_unknown_text(text_lower: str) -> int | None:
+    """Classify a text that is not a known forecast text (memoized)."""
+    return _classify_text(text_lower)
+
 
 def forecast_text_to_code(
     forecast_text: str,
@@ -259,140 +425,36 @@ def forecast_text_to_code(
     Returns:
         Internal forecast code (0-25)
     """
-    text_lower = forecast_text.lower()
-
     # PRIORITY 0: Forecast number in heavy rain zone (20-24) overrides text
     # This ensures forecast_num=21 → code 21 → pouring
     if forecast_num is not None and 20 <= forecast_num <= 24:
         _LOGGER.debug(
-            f"Text→Code[{source}]: num={forecast_num} in heavy rain zone, "
-            f"using directly (ignoring text)"
+            "Text→Code[%s]: num=%s in heavy rain zone, "
+            "using directly (ignoring text)",
+            source,
+            forecast_num
         )
         return forecast_num
 
-    # PRIORITY 1: Storm keywords (code 25)
-    storm_keywords = [
-        "storm", "thunder", "gale", "tempest",  # English
-        "stürmisch", "sturm",  # German
-        "θυελλώδης", "καταιγίδα", "τυφώνας",  # Greek
-        "tempestoso", "tempesta", "uragano",  # Italian
-        "búrlivé", "búrka", "orkán"  # Slovak
-    ]
-    if any(word in text_lower for word in storm_keywords):
-        _LOGGER.debug(f"Text→Code[{source}]: storm → 25")
-        return 25
-
-    # PRIORITY 2: Heavy/frequent rain keywords (22)
-    heavy_rain_keywords = [
-        "heavy rain", "pouring", "frequent", "much rain", "torrential",  # English
-        "häufiger", "viel regen",  # German
-        "συχνή βροχή", "πολλές βροχές",  # Greek
-        "piogge frequenti", "molta pioggia",  # Italian
-        "častý", "veľa dažďom"  # Slovak
-    ]
-    if any(word in text_lower for word in heavy_rain_keywords):
-        _LOGGER.debug(f"Text→Code[{source}]: heavy rain → 22")
-        return 22
-
-    # PRIORITY 3: Cloudy keywords (BEFORE rain check!)
-    # This fixes "Zamračené" (Slovak cloudy) detection
-    cloudy_keywords = [
-        "cloudy", "overcast",  # English
-        "wolkig", "bewölkt",  # German
-        "νεφελώδης", "συννεφιασμένος",  # Greek
-        "nuvoloso", "coperto",  # Italian
-        "oblačn", "zamrač"  # Slovak (matches zamračené, zamračený, zamračená)
-    ]
-    partly_keywords = [
-        "partly", "fairly",  # English
-        "heiter bis", "bis wolkig",  # German
-        "αίθριος έως",  # Greek
-        "abbastanza",  # Italian
-        "polo", "miestami"  # Slovak
-    ]
-
-    has_cloudy = any(word in text_lower for word in cloudy_keywords)
-    has_partly = any(word in text_lower for word in partly_keywords)
-
-    if has_cloudy:
-        if has_partly:
-            _LOGGER.debug(f"Text→Code[{source}]: partly cloudy → 3")
-            return 3
-        else:
-            _LOGGER.debug(f"Text→Code[{source}]: cloudy → 13")
-            return 13
-
-    # PRIORITY 4: Rain keywords (but NOT "possibly") (15)
-    possibly_keywords = [
-        "possibly", "possible", "may", "might",  # English
-        "möglich", "evtl",  # German
-        "πιθανή", "πιθανώς",  # Greek
-        "possibili", "possibile",  # Italian
-        "možné", "možno"  # Slovak
-    ]
-    rain_keywords = [
-        "rain", "shower",  # English
-        "regen", "schauer", "regnerisch",  # German
-        "βροχή", "βροχερό", "βροχόπτωση",  # Greek
-        "pioggia", "piogge", "rovesci", "piovoso",  # Italian
-        "dážď", "prší", "zrážk", "prehán", "dážd", "daždiv"  # Slovak
-    ]
-
-    has_possibly = any(word in text_lower for word in possibly_keywords)
-    has_rain = any(word in text_lower for word in rain_keywords)
-
-    if has_rain and not has_possibly:
-        _LOGGER.debug(f"Text→Code[{source}]: rain → 15")
-        return 15
-
-    # PRIORITY 5: Unsettled/changeable (WITHOUT rain) (3)
-    unsettled_keywords = [
-        "unsettled", "changeable", "variable",  # English
-        "unbeständig", "wechselhaft",  # German
-        "ασταθής", "μεταβλητός", "άστατ",  # Greek
-        "instabile", "variabile",  # Italian
-        "nestále", "premenlivý", "premenlivé"  # Slovak
-    ]
-    if any(word in text_lower for word in unsettled_keywords):
-        _LOGGER.debug(f"Text→Code[{source}]: unsettled → 3 (partlycloudy)")
-        return 3
-
-    # PRIORITY 6: Fair/fine weather (0-5)
-    fine_keywords = [
-        "settled", "stable", "fine", "fair",  # English
-        "beständig", "schön", "schönwetter",  # German
-        "σταθερός", "καλός καιρός", "ωραίος",  # Greek
-        "bello", "stabile", "bel tempo",  # Italian
-        "stabilne", "pekné", "jasn", "slnečn"  # Slovak
-    ]
-    if any(word in text_lower for word in fine_keywords):
-        # Check for future problems
-        future_problem_keywords = [
-            "later", "becoming", "worse",  # English
-            "später", "wird", "verschlechterung",  # German
-            "αργό��ερα", "επιδείνωση",  # Greek
-            "più tardi", "diventa", "peggiora",  # Italian
-            "neskôr", "stáva sa", "zhoršenie"  # Slovak
-        ] + possibly_keywords
-
-        has_future_problems = any(word in text_lower for word in future_problem_keywords)
-
-        if not has_future_problems or (forecast_num is not None and forecast_num == 0):
-            _LOGGER.debug(f"Text→Code[{source}]: settled fine → 0")
-            return 0
-        else:
-            _LOGGER.debug(f"Text→Code[{source}]: fine with caveats → 3")
-            return 3
-
-    # FALLBACK: Use forecast_num if provided
-    if forecast_num is not None:
+    text_lower = forecast_text.lower()
+    try:
+        text_class = _KNOWN_TEXT_CLASSES[text_lower]
+    except KeyError:
+        text_class = _classify_unknown_text(text_lower)
+
+    if text_class == _FINE_WITH_CAVEATS:
+        code = 0 if forecast_num == 0 else 3
+    elif text_class is not None:
+        code = text_class
+    elif forecast_num is not None:
+        # FALLBACK: Use forecast_num if provided
         code = max(0, min(25, forecast_num))
-        _LOGGER.debug(f"Text→Code[{source}]: fallback to num={forecast_num} → {code}")
-        return code
+    else:
+        # ULTIMATE FALLBACK: Partlycloudy (code 3)
+        code = 3
 
-    # ULTIMATE FALLBACK: Partlycloudy (code 3)
-    _LOGGER.debug(f"Text→Code[{source}]: ultimate fallback → 3")
-    return 3
+    _LOGGER.debug("Text→Code[%s]: '%s' (num=%s) → %s", source, forecast_text, forecast_num, code)
+    return code
 
 
 # ==============================================================================
@@ -438,17 +500,17 @@ def map_forecast_to_condition(
     if forecast_num is not None:
         # Direct number has priority (works for both Zambretti and Negretti)
         code = max(0, min(25, forecast_num))
-        _LOGGER.debug(f"Unified[{source}]: num={forecast_num} → code={code}")
+        _LOGGER.debug("Unified[%s]: num=%s → code=%s", source, forecast_num, code)
     elif forecast_letter:
         # Letter mapping (only for Zambretti-style letters)
         code = ZAMBRETTI_LETTER_TO_CODE.get(forecast_letter.upper(), 3)
-        _LOGGER.debug(f"Unified[{source}]: letter={forecast_letter} → code={code}")
+        _LOGGER.debug("Unified[%s]: letter=%s → code=%s", source, forecast_letter, code)
     elif forecast_text:
         # Text analysis
         code = forecast_text_to_code(forecast_text, None, source)
     else:
         # No input - fallback
-        _LOGGER.debug(f"Unified[{source}]: No input, using default code=3")
+        _LOGGER.debug("Unified[%s]: No input, using default code=3", source)
         code = 3
 
     # Step 2: Determine night status
@@ -458,8 +520,14 @@ def map_forecast_to_condition(
     condition = forecast_code_to_condition(code, is_night, temperature, is_current_state, has_rain_sensor)
 
     _LOGGER.debug(
-        f"🎯 UNIFIED[{source}]: text='{forecast_text}', num={forecast_num}, "
-        f"letter={forecast_letter} → code={code} → {condition}"
+        "🎯 UNIFIED[%s]: text='%s', num=%s, "
+        "letter=%s → code=%s → %s",
+        source,
+        forecast_text,
+        forecast_num,
+        forecast_letter,
+        code,
+        condition
     )
 
     return condition
@@ -499,18 +567,15 @@ def get_forecast_text(
         >>> get_forecast_text(forecast_num=25, lang_index=1)
         "Stormy, much rain"
     """
-    # Import here to avoid circular dependency
-    from .forecast_data import FORECAST_TEXTS
-
     # Determine forecast code
     if forecast_letter:
         # Convert letter to code
         code = ZAMBRETTI_LETTER_TO_CODE.get(forecast_letter.upper(), 0)
-        _LOGGER.debug(f"get_forecast_text: letter={forecast_letter} → code={code}")
+        _LOGGER.debug("get_forecast_text: letter=%s → code=%s", forecast_letter, code)
     elif forecast_num is not None:
         # Use number directly
         code = max(0, min(25, forecast_num))
-        _LOGGER.debug(f"get_forecast_text: num={forecast_num} → code={code}")
+        _LOGGER.debug("get_forecast_text: num=%s → code=%s", forecast_num, code)
     else:
         # No input - default
         _LOGGER.debug("get_forecast_text: No input, using default code=0")
@@ -519,7 +584,7 @@ def get_forecast_text(
     # Get text from FORECAST_TEXTS
     try:
         text = FORECAST_TEXTS[code][lang_index]
-        _LOGGER.debug(f"get_forecast_text: code={code}, lang={lang_index} → '{text}'")
+        _LOGGER.debug("get_forecast_text: code=%s, lang=%s → '%s'", code, lang_index, text)
         return text
     except (IndexError, KeyError) as e:
         _LOGGER.error(
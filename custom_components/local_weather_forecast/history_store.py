@@ -0,0 +1,185 @@
+"""Persistent storage for pressure/temperature change sensor history.
+
+The change sensors used to publish their whole reading history as a state
+attribute so it survived restarts.  The recorder then stored every reading
+again with every state row.  History is now kept in a ``Store`` file in a
+compact columnar layout and written on a debounce:
+
+    {"t0": 1700000000.0, "dt": [0, 300, 600], "v": [1013.2, 1013.1, 1012.9]}
+
+``t0`` is the POSIX timestamp of the oldest reading, ``dt`` the offsets in
+whole seconds and ``v`` the values.  Readings are downsampled by time (at
+most one per CHANGE_HISTORY_SAMPLE_SECONDS) before the newest ``max_records``
+are kept, so high-frequency sensors still restore their whole window.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+from typing import Any, Callable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    CHANGE_HISTORY_SAMPLE_SECONDS,
+    CHANGE_HISTORY_SAVE_DELAY,
+    CHANGE_HISTORY_STORAGE_VERSION,
+    DOMAIN,
+    PRESSURE_HISTORY_MAX_RECORDS,
+    TEMPERATURE_HISTORY_MAX_RECORDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Names of the stored histories (one file per name and config entry)
+PRESSURE_CHANGE_HISTORY: str = "pressure_change"
+TEMPERATURE_CHANGE_HISTORY: str = "temperature_change"
+HISTORY_NAMES: tuple[str, ...] = (PRESSURE_CHANGE_HISTORY, TEMPERATURE_CHANGE_HISTORY)
+HISTORY_MAX_RECORDS: dict[str, int] = {
+    PRESSURE_CHANGE_HISTORY: PRESSURE_HISTORY_MAX_RECORDS,
+    TEMPERATURE_CHANGE_HISTORY: TEMPERATURE_HISTORY_MAX_RECORDS,
+}
+
+
+def downsample_history(
+    history: list[tuple[datetime, float]], sample_seconds: float
+) -> list[tuple[datetime, float]]:
+    """Keep at most one reading per sample_seconds.
+
+    Walks from the newest reading back, so the newest reading is always kept
+    and every kept reading is at least sample_seconds older than the next.
+
+    Args:
+        history: Readings ordered oldest first
+        sample_seconds: Minimum spacing of kept readings
+
+    Returns:
+        Downsampled readings, oldest first
+    """
+    if sample_seconds <= 0 or len(history) < 2:
+        return list(history)
+
+    kept = [history[-1]]
+    last_time = history[-1][0]
+    for index in range(len(history) - 2, -1, -1):
+        reading = history[index]
+        if (last_time - reading[0]).total_seconds() >= sample_seconds:
+            kept.append(reading)
+            last_time = reading[0]
+    kept.reverse()
+    return kept
+
+
+def encode_history(
+    history: list[tuple[datetime, float]],
+    max_records: int = PRESSURE_HISTORY_MAX_RECORDS,
+    sample_seconds: float = CHANGE_HISTORY_SAMPLE_SECONDS,
+) -> dict[str, Any]:
+    """Encode (timestamp, value) pairs into the columnar storage layout.
+
+    Args:
+        history: Readings ordered oldest first
+        max_records: Keep only this many newest readings (after downsampling)
+        sample_seconds: Keep at most one reading per this many seconds
+
+    Returns:
+        Dict with t0, dt and v keys (empty lists if there is no history)
+    """
+    history = downsample_history(history, sample_seconds)[-max_records:]
+    if not history:
+        return {"t0": None, "dt": [], "v": []}
+
+    t0 = history[0][0].timestamp()
+    return {
+        "t0": t0,
+        "dt": [round(ts.timestamp() - t0) for ts, _ in history],
+        "v": [round(value, 3) for _, value in history],
+    }
+
+
+def decode_history(data: dict[str, Any] | None) -> list[tuple[datetime, float]]:
+    """Decode the columnar storage layout into (timestamp, value) pairs.
+
+    Malformed data returns an empty history instead of raising.
+    """
+    if not data or data.get("t0") is None:
+        return []
+
+    try:
+        t0 = float(data["t0"])
+        return [
+            (datetime.fromtimestamp(t0 + offset), float(value))
+            for offset, value in zip(data["dt"], data["v"])
+        ]
+    except (KeyError, TypeError, ValueError) as err:
+        _LOGGER.debug("History store: Ignoring malformed history data: %s", err)
+        return []
+
+
+class ChangeHistoryStore:
+    """Debounced Store wrapper holding the history of one change sensor."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        name: str,
+        max_records: int | None = None,
+    ) -> None:
+        """Initialize the history store (max_records defaults to the size for name)."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, CHANGE_HISTORY_STORAGE_VERSION, get_storage_key(entry_id, name)
+        )
+        self._max_records = (
+            max_records
+            if max_records is not None
+            else HISTORY_MAX_RECORDS.get(name, PRESSURE_HISTORY_MAX_RECORDS)
+        )
+
+    async def async_load(self) -> list[tuple[datetime, float]]:
+        """Load the stored history (oldest first)."""
+        return decode_history(await self._store.async_load())
+
+    @callback
+    def async_schedule_save(
+        self, get_history: Callable[[], list[tuple[datetime, float]]]
+    ) -> None:
+        """Schedule a debounced save.
+
+        The history is read when the write happens, so repeated calls within
+        the save delay result in a single write of the latest readings.  A
+        pending write is flushed when Home Assistant stops.
+        """
+        self._store.async_delay_save(
+            lambda: encode_history(get_history(), self._max_records),
+            CHANGE_HISTORY_SAVE_DELAY,
+        )
+
+    async def async_flush(
+        self, get_history: Callable[[], list[tuple[datetime, float]]]
+    ) -> None:
+        """Write the history now and drop a pending debounced save.
+
+        Called when the sensor is removed: a sensor updating more often than
+        the save delay keeps pushing the debounced write back, so without a
+        flush a reload would restore stale readings.  Once this returns no
+        delayed write is left that could recreate the file after the entry's
+        histories were deleted.
+        """
+        await self._store.async_save(encode_history(get_history(), self._max_records))
+
+    async def async_remove(self) -> None:
+        """Delete the stored history."""
+        await self._store.async_remove()
+
+
+def get_storage_key(entry_id: str, name: str) -> str:
+    """Return the storage key of a history for a config entry."""
+    return f"{DOMAIN}.{entry_id}_{name}_history"
+
+
+async def async_remove_histories(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete all stored histories of a config entry."""
+    for name in HISTORY_NAMES:
+        await ChangeHistoryStore(hass, entry_id, name).async_remove()
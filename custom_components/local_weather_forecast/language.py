@@ -5,8 +5,11 @@ import logging
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
 
+from .const import CONF_LANGUAGE, DOMAIN
+from .coordinator import async_get_coordinator
 from .forecast_data import (
     WIND_TYPES,
     VISIBILITY_ESTIMATES,
@@ -32,16 +35,16 @@ LANGUAGE_MAP = {
 DEFAULT_LANGUAGE_INDEX = 1  # English
 
 
-def get_language_index(hass: HomeAssistant) -> int:
+def get_language_index(hass: HomeAssistant, config_entry: ConfigEntry | None = None) -> int:
     """Get language array index for forecast text generation.
 
-    Priority:
-    1. Explicit language set in integration options/data (config_entry)
-    2. Home Assistant system language (hass.config.language)
-    3. English fallback
+    The index is resolved once per config entry and kept by its coordinator
+    until the options or the core configuration change.
 
     Args:
         hass: Home Assistant instance
+        config_entry: Config entry of the station; callers without one get
+            the language of the first entry
 
     Returns:
         Language index (0-4) for forecast_data arrays
@@ -50,12 +53,42 @@ def get_language_index(hass: HomeAssistant) -> int:
     if not hass or not hass.config:
         return DEFAULT_LANGUAGE_INDEX
 
+    entry = config_entry
+    if entry is None:
+        try:
+            entries = hass.config_entries.async_entries(DOMAIN)
+            entry = entries[0] if entries else None
+        except (AttributeError, TypeError):
+            entry = None
+
+    coordinator = async_get_coordinator(hass, entry) if entry is not None else None
+    if coordinator is not None and coordinator.language_index is not None:
+        return coordinator.language_index
+
+    lang_index = _resolve_language_index(hass, entry)
+    if coordinator is not None:
+        coordinator.language_index = lang_index
+    return lang_index
+
+
+def _resolve_language_index(hass: HomeAssistant, entry: ConfigEntry | None) -> int:
+    """Resolve the language array index of a config entry.
+
+    Priority:
+    1. Explicit language set in integration options/data (config_entry)
+    2. Home Assistant system language (hass.config.language)
+    3. English fallback
+
+    Args:
+        hass: Home Assistant instance
+        entry: Config entry of the station, or None
+
+    Returns:
+        Language index (0-4) for forecast_data arrays
+    """
     # 1. Check integration config_entry for explicit language setting
     try:
-        from .const import CONF_LANGUAGE
-        entries = hass.config_entries.async_entries("local_weather_forecast")
-        if entries:
-            entry = entries[0]
+        if entry is not None:
             configured_lang = entry.options.get(CONF_LANGUAGE) or entry.data.get(CONF_LANGUAGE)
             if configured_lang and configured_lang in LANGUAGE_MAP:
                 lang_index = LANGUAGE_MAP[configured_lang]
@@ -79,138 +112,156 @@ def get_language_index(hass: HomeAssistant) -> int:
     return lang_index
 
 
-def get_wind_type(hass: HomeAssistant, beaufort_number: int) -> str:
+def get_wind_type(
+    hass: HomeAssistant, beaufort_number: int, config_entry: ConfigEntry | None = None
+) -> str:
     """Get wind type description in user's language.
 
     Args:
         hass: Home Assistant instance
         beaufort_number: Beaufort scale number (0-12)
+        config_entry: Config entry of the station (for its language setting)
 
     Returns:
         Wind type description in user's language
     """
-    lang_index = get_language_index(hass)
+    lang_index = get_language_index(hass, config_entry)
 
     if 0 <= beaufort_number < len(WIND_TYPES):
         result = WIND_TYPES[beaufort_number][lang_index]
-        _LOGGER.debug(f"Wind type for Beaufort {beaufort_number}: {result}")
+        _LOGGER.debug("Wind type for Beaufort %s: %s", beaufort_number, result)
         return result
 
     # Fallback
     result = "Unknown" if lang_index == 1 else WIND_TYPES[0][lang_index]
-    _LOGGER.debug(f"Wind type fallback for invalid Beaufort {beaufort_number}: {result}")
+    _LOGGER.debug("Wind type fallback for invalid Beaufort %s: %s", beaufort_number, result)
     return result
 
 
-def get_visibility_estimate(hass: HomeAssistant, fog_risk: str) -> str:
+def get_visibility_estimate(
+    hass: HomeAssistant, fog_risk: str, config_entry: ConfigEntry | None = None
+) -> str:
     """Get visibility estimate text in user's language.
 
     Args:
         hass: Home Assistant instance
         fog_risk: Fog risk level (high, medium, low, none)
+        config_entry: Config entry of the station (for its language setting)
 
     Returns:
         Visibility estimate in user's language
     """
-    lang_index = get_language_index(hass)
+    lang_index = get_language_index(hass, config_entry)
 
     if fog_risk in VISIBILITY_ESTIMATES:
         result = VISIBILITY_ESTIMATES[fog_risk][lang_index]
-        _LOGGER.debug(f"Visibility estimate for fog_risk '{fog_risk}': {result}")
+        _LOGGER.debug("Visibility estimate for fog_risk '%s': %s", fog_risk, result)
         return result
 
     # Fallback to "none" (very good visibility)
     result = VISIBILITY_ESTIMATES["none"][lang_index]
-    _LOGGER.debug(f"Visibility estimate fallback for invalid fog_risk '{fog_risk}': {result}")
+    _LOGGER.debug("Visibility estimate fallback for invalid fog_risk '%s': %s", fog_risk, result)
     return result
 
 
-def get_comfort_level_text(hass: HomeAssistant, comfort_level: str) -> str:
+def get_comfort_level_text(
+    hass: HomeAssistant, comfort_level: str, config_entry: ConfigEntry | None = None
+) -> str:
     """Get comfort level text in user's language.
 
     Args:
         hass: Home Assistant instance
         comfort_level: Comfort level key (very_cold, cold, cool, comfortable, warm, hot, very_hot)
+        config_entry: Config entry of the station (for its language setting)
 
     Returns:
         Comfort level text in user's language
     """
-    lang_index = get_language_index(hass)
+    lang_index = get_language_index(hass, config_entry)
 
     if comfort_level in COMFORT_LEVELS:
         result = COMFORT_LEVELS[comfort_level][lang_index]
-        _LOGGER.debug(f"Comfort level for '{comfort_level}': {result}")
+        _LOGGER.debug("Comfort level for '%s': %s", comfort_level, result)
         return result
 
     # Fallback to comfortable
     result = COMFORT_LEVELS.get("comfortable", ("Angenehm", "Comfortable", "Άνετο", "Confortevole", "Príjemne"))[lang_index]
-    _LOGGER.debug(f"Comfort level fallback for invalid '{comfort_level}': {result}")
+    _LOGGER.debug("Comfort level fallback for invalid '%s': %s", comfort_level, result)
     return result
 
 
-def get_fog_risk_text(hass: HomeAssistant, fog_risk: str) -> str:
+def get_fog_risk_text(
+    hass: HomeAssistant, fog_risk: str, config_entry: ConfigEntry | None = None
+) -> str:
     """Get fog risk level text in user's language.
 
     Args:
         hass: Home Assistant instance
         fog_risk: Fog risk level (none, low, medium, high, critical)
+        config_entry: Config entry of the station (for its language setting)
 
     Returns:
         Fog risk text in user's language
     """
-    lang_index = get_language_index(hass)
+    lang_index = get_language_index(hass, config_entry)
 
     if fog_risk in FOG_RISK_LEVELS:
         result = FOG_RISK_LEVELS[fog_risk][lang_index]
-        _LOGGER.debug(f"Fog risk text for '{fog_risk}': {result}")
+        _LOGGER.debug("Fog risk text for '%s': %s", fog_risk, result)
         return result
 
     # Fallback to none
     result = FOG_RISK_LEVELS.get("none", ("Kein Nebel", "No fog", "Χωρίς ομίχλη", "Nessuna nebbia", "Žiadna hmla"))[lang_index]
-    _LOGGER.debug(f"Fog risk text fallback for invalid '{fog_risk}': {result}")
+    _LOGGER.debug("Fog risk text fallback for invalid '%s': %s", fog_risk, result)
     return result
 
 
-def get_atmosphere_stability_text(hass: HomeAssistant, stability: str) -> str:
+def get_atmosphere_stability_text(
+    hass: HomeAssistant, stability: str, config_entry: ConfigEntry | None = None
+) -> str:
     """Get atmosphere stability text in user's language.
 
     Args:
         hass: Home Assistant instance
         stability: Stability level (stable, moderate, unstable, very_unstable, unknown)
+        config_entry: Config entry of the station (for its language setting)
 
     Returns:
         Stability text in user's language
     """
-    lang_index = get_language_index(hass)
+    lang_index = get_language_index(hass, config_entry)
 
     if stability in ATMOSPHERE_STABILITY:
         result = ATMOSPHERE_STABILITY[stability][lang_index]
-        _LOGGER.debug(f"Atmosphere stability text for '{stability}': {result}")
+        _LOGGER.debug("Atmosphere stability text for '%s': %s", stability, result)
         return result
 
     # Fallback to unknown
     result = ATMOSPHERE_STABILITY.get("unknown", ("Unbekannt", "Unknown", "Άγνωστο", "Sconosciuto", "Neznáma"))[lang_index]
-    _LOGGER.debug(f"Atmosphere stability text fallback for invalid '{stability}': {result}")
+    _LOGGER.debug("Atmosphere stability text fallback for invalid '%s': %s", stability, result)
     return result
 
 
-def get_adjustment_text(hass: HomeAssistant, adjustment_key: str, value: str) -> str:
+def get_adjustment_text(
+    hass: HomeAssistant, adjustment_key: str, value: str, config_entry: ConfigEntry | None = None
+) -> str:
     """Get adjustment detail text in user's language with unit conversion.
 
     Args:
         hass: Home Assistant instance
         adjustment_key: Adjustment type key (high_humidity, critical_fog_risk, etc.)
         value: Value to insert into template (formatted number as string)
+        config_entry: Config entry of the station (for its language setting)
 
     Returns:
         Adjustment text in user's language with value converted to user's unit system
     """
-    lang_index = get_language_index(hass)
+    lang_index = get_language_index(hass, config_entry)
 
     if adjustment_key not in ADJUSTMENT_TEMPLATES:
         # Fallback to English-style format
         result = f"{adjustment_key}: {value}"
-        _LOGGER.debug(f"Adjustment text fallback for unknown key '{adjustment_key}': {result}")
+        _LOGGER.debug("Adjustment text fallback for unknown key '%s': %s", adjustment_key, result)
         return result
 
     # Parse the numeric value
@@ -220,7 +271,7 @@ def get_adjustment_text(hass: HomeAssistant, adjustment_key: str, value: str) ->
         # If can't parse, use as-is
         template = ADJUSTMENT_TEMPLATES[adjustment_key][lang_index]
         result = template.replace("{value}", value)
-        _LOGGER.debug(f"Adjustment text for '{adjustment_key}' (non-numeric value): {result}")
+        _LOGGER.debug("Adjustment text for '%s' (non-numeric value): %s", adjustment_key, result)
         return result
 
     # Get user's temperature unit preference
@@ -238,37 +289,40 @@ def get_adjustment_text(hass: HomeAssistant, adjustment_key: str, value: str) ->
             formatted_value = f"{converted_value:.1f}°F"
             # Replace °C with °F in template
             template = template.replace("°C", "°F")
-            _LOGGER.debug(f"Adjustment text for '{adjustment_key}': {value}°C → {formatted_value} (converted to Fahrenheit)")
+            _LOGGER.debug("Adjustment text for '%s': %s°C → %s (converted to Fahrenheit)", adjustment_key, value, formatted_value)
         elif user_temp_unit == "K":
             # Kelvin spread same as Celsius spread (same scale)
             formatted_value = f"{numeric_value:.1f} K"
             template = template.replace("°C", "K")
-            _LOGGER.debug(f"Adjustment text for '{adjustment_key}': {value}°C → {formatted_value} (converted to Kelvin)")
+            _LOGGER.debug("Adjustment text for '%s': %s°C → %s (converted to Kelvin)", adjustment_key, value, formatted_value)
         else:
             # Metric system - use original value
             formatted_value = value
-            _LOGGER.debug(f"Adjustment text for '{adjustment_key}': {formatted_value} (metric, no conversion)")
+            _LOGGER.debug("Adjustment text for '%s': %s (metric, no conversion)", adjustment_key, formatted_value)
     else:
         # For humidity and gust_ratio, no conversion needed
         formatted_value = value
         template = ADJUSTMENT_TEMPLATES[adjustment_key][lang_index]
-        _LOGGER.debug(f"Adjustment text for '{adjustment_key}': {formatted_value} (no conversion needed)")
+        _LOGGER.debug("Adjustment text for '%s': %s (no conversion needed)", adjustment_key, formatted_value)
 
     result = template.replace("{value}", formatted_value)
     return result
 
 
-def get_snow_risk_text(hass: HomeAssistant, snow_risk: str) -> str:
+def get_snow_risk_text(
+    hass: HomeAssistant, snow_risk: str, config_entry: ConfigEntry | None = None
+) -> str:
     """Get snow risk level text in user's language.
 
     Args:
         hass: Home Assistant instance
         snow_risk: Snow risk level (none, low, medium, high)
+        config_entry: Config entry of the station (for its language setting)
 
     Returns:
         Snow risk text in user's language
     """
-    lang_index = get_language_index(hass)
+    lang_index = get_language_index(hass, config_entry)
 
     # Snow risk level translations
     # Format: [German, English, Greek, Italian, Slovak]
@@ -281,26 +335,29 @@ def get_snow_risk_text(hass: HomeAssistant, snow_risk: str) -> str:
 
     if snow_risk in SNOW_RISK_LEVELS:
         result = SNOW_RISK_LEVELS[snow_risk][lang_index]
-        _LOGGER.debug(f"Snow risk text for '{snow_risk}': {result}")
+        _LOGGER.debug("Snow risk text for '%s': %s", snow_risk, result)
         return result
 
     # Fallback to none
     result = SNOW_RISK_LEVELS["none"][lang_index]
-    _LOGGER.debug(f"Snow risk text fallback for invalid '{snow_risk}': {result}")
+    _LOGGER.debug("Snow risk text fallback for invalid '%s': %s", snow_risk, result)
     return result
 
 
-def get_frost_risk_text(hass: HomeAssistant, frost_risk: str) -> str:
+def get_frost_risk_text(
+    hass: HomeAssistant, frost_risk: str, config_entry: ConfigEntry | None = None
+) -> str:
     """Get frost/ice risk level text in user's language.
 
     Args:
         hass: Home Assistant instance
         frost_risk: Frost risk level (none, low, medium, high, critical)
+        config_entry: Config entry of the station (for its language setting)
 
     Returns:
         Frost risk text in user's language
     """
-    lang_index = get_language_index(hass)
+    lang_index = get_language_index(hass, config_entry)
 
     # Frost/Ice risk level translations
     # Format: [German, English, Greek, Italian, Slovak]
@@ -314,26 +371,29 @@ def get_frost_risk_text(hass: HomeAssistant, frost_risk: str) -> str:
 
     if frost_risk in FROST_RISK_LEVELS:
         result = FROST_RISK_LEVELS[frost_risk][lang_index]
-        _LOGGER.debug(f"Frost risk text for '{frost_risk}': {result}")
+        _LOGGER.debug("Frost risk text for '%s': %s", frost_risk, result)
         return result
 
     # Fallback to none
     result = FROST_RISK_LEVELS["none"][lang_index]
-    _LOGGER.debug(f"Frost risk text fallback for invalid '{frost_risk}': {result}")
+    _LOGGER.debug("Frost risk text fallback for invalid '%s': %s", frost_risk, result)
     return result
 
 
-def get_convective_risk_text(hass: HomeAssistant, convective_risk: str) -> str:
+def get_convective_risk_text(
+    hass: HomeAssistant, convective_risk: str, config_entry: ConfigEntry | None = None
+) -> str:
     """Get convective storm risk level text in user's language.
 
     Args:
         hass: Home Assistant instance
         convective_risk: Convective risk level (none, low, high)
+        config_entry: Config entry of the station (for its language setting)
 
     Returns:
         Convective risk text in user's language
     """
-    lang_index = get_language_index(hass)
+    lang_index = get_language_index(hass, config_entry)
 
     # Convective risk level translations
     # Format: [German, English, Greek, Italian, Slovak]
@@ -345,10 +405,10 @@ def get_convective_risk_text(hass: HomeAssistant, convective_risk: str) -> str:
 
     if convective_risk in CONVECTIVE_RISK_LEVELS:
         result = CONVECTIVE_RISK_LEVELS[convective_risk][lang_index]
-        _LOGGER.debug(f"Convective risk text for '{convective_risk}': {result}")
+        _LOGGER.debug("Convective risk text for '%s': %s", convective_risk, result)
         return result
 
     # Fallback to none
     result = CONVECTIVE_RISK_LEVELS["none"][lang_index]
-    _LOGGER.debug(f"Convective risk text fallback for invalid '{convective_risk}': {result}")
+    _LOGGER.debug("Convective risk text fallback for invalid '%s': %s", convective_risk, result)
     return result
@@ -0,0 +1,165 @@
+"""Last known good values of source sensors.
+
+When a source sensor becomes unavailable, the entities fall back to the last
+valid value of that sensor.  Reading it from the recorder on every update
+(per sensor and per entity) puts a lot of load on the database while a flaky
+sensor keeps dropping out, so the values are kept in memory instead:
+
+- every valid state of a tracked sensor (live state change events) is
+  remembered, so a sensor that was valid since startup needs no query at all
+  (values older than ``HISTORY_FALLBACK_HOURS`` are not used);
+- a sensor without a remembered value is looked up with one bounded recorder
+  query (newest ``HISTORY_FALLBACK_MAX_STATES`` state changes, only values of
+  the last ``HISTORY_FALLBACK_HOURS`` are used); concurrent lookups of the
+  same sensor share that query;
+- a query that found nothing is remembered for
+  ``HISTORY_FALLBACK_NEGATIVE_TTL`` seconds (negative cache).
+
+An outage therefore costs at most one database query per sensor.  The cache
+of a config entry is owned by its coordinator and shared by all entities.
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import logging
+import time
+
+from homeassistant.components.recorder import get_instance, history
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    HISTORY_FALLBACK_HOURS,
+    HISTORY_FALLBACK_MAX_STATES,
+    HISTORY_FALLBACK_NEGATIVE_TTL,
+)
+from .debug_trace import STAGE_HISTORY_FALLBACK, StageTimings, timed_stage
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _state_value(state: State | None) -> float | None:
+    """Return the numeric value of a state, or None if it is not valid."""
+    if state is None or state.state in ("unknown", "unavailable", None):
+        return None
+    try:
+        return float(str(state.state))
+    except (ValueError, TypeError):
+        return None
+
+
+class LastKnownGoodCache:
+    """Remember the last valid value of source sensors."""
+
+    def __init__(self, hass: HomeAssistant, stage_timings: StageTimings | None = None) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.stage_timings = stage_timings
+        # Entity ID -> (value, last_updated) of the last valid state
+        self._values: dict[str, tuple[float, datetime]] = {}
+        # Entity ID -> time.monotonic() until which no new query is made
+        self._misses: dict[str, float] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._unsubs: dict[str, CALLBACK_TYPE] = {}
+        self.queries = 0  # Recorder queries made (diagnostics)
+
+    @callback
+    def async_track(self, entity_id: str) -> None:
+        """Remember the valid states of a sensor from now on (idempotent)."""
+        if entity_id in self._unsubs:
+            return
+        self._unsubs[entity_id] = async_track_state_change_event(
+            self.hass, [entity_id], self._async_state_changed
+        )
+        self._async_remember(entity_id, self.hass.states.get(entity_id))
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop tracking all sensors."""
+        for unsub in self._unsubs.values():
+            unsub()
+        self._unsubs.clear()
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Remember a valid new state of a tracked sensor."""
+        self._async_remember(event.data["entity_id"], event.data.get("new_state"))
+
+    @callback
+    def _async_remember(self, entity_id: str, state: State | None) -> None:
+        """Store the value of a state if it is valid."""
+        value = _state_value(state)
+        if value is not None:
+            self._values[entity_id] = (value, state.last_updated)
+            self._misses.pop(entity_id, None)
+
+    def _cached(self, entity_id: str) -> float | None:
+        """Return the remembered value if it is within HISTORY_FALLBACK_HOURS."""
+        cached = self._values.get(entity_id)
+        if cached is None:
+            return None
+        value, last_updated = cached
+        if dt_util.utcnow() - last_updated > timedelta(hours=HISTORY_FALLBACK_HOURS):
+            return None
+        return value
+
+    async def async_get(self, entity_id: str) -> float | None:
+        """Return the last known good value of a sensor.
+
+        Args:
+            entity_id: Entity ID of the sensor
+
+        Returns:
+            Last valid value, or None if there is none (or the recorder
+            found none within the negative cache TTL)
+        """
+        self.async_track(entity_id)
+        if entity_id in self._values:
+            # Valid states were seen; the recorder has nothing newer
+            return self._cached(entity_id)
+
+        lock = self._locks.setdefault(entity_id, asyncio.Lock())
+        async with lock:
+            # Another caller may have queried (or a live state arrived) meanwhile
+            if entity_id in self._values:
+                return self._cached(entity_id)
+            expiry = self._misses.get(entity_id)
+            if expiry is not None and time.monotonic() < expiry:
+                return None
+
+            result = await self._async_query(entity_id)
+            if result is None:
+                self._misses[entity_id] = time.monotonic() + HISTORY_FALLBACK_NEGATIVE_TTL
+                return None
+            # A live state that arrived during the query is newer
+            self._values.setdefault(entity_id, result)
+            return self._cached(entity_id)
+
+    @timed_stage(STAGE_HISTORY_FALLBACK)
+    async def _async_query(self, entity_id: str) -> tuple[float, datetime] | None:
+        """Return the newest valid value of a sensor from the recorder."""
+        self.queries += 1
+        try:
+            states = await get_instance(self.hass).async_add_executor_job(
+                history.get_last_state_changes,
+                self.hass,
+                HISTORY_FALLBACK_MAX_STATES,
+                entity_id,
+            )
+        except Exception as e:
+            _LOGGER.error("Error retrieving historical data for %s: %s", entity_id, e)
+            return None
+
+        # Newest first, only values from the last HISTORY_FALLBACK_HOURS
+        oldest = dt_util.utcnow() - timedelta(hours=HISTORY_FALLBACK_HOURS)
+        for state in reversed((states or {}).get(entity_id, [])):
+            if state.last_updated < oldest:
+                break
+            if (value := _state_value(state)) is not None:
+                _LOGGER.debug("Retrieved historical value %s for %s", value, entity_id)
+                return value, state.last_updated
+
+        _LOGGER.debug("No historical data found for %s", entity_id)
+        return None
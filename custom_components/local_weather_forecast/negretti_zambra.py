@@ -4,16 +4,188 @@
 - Uses forecast_mapping.get_forecast_text() for text retrieval
 - Internal codes (0-25) are universal for all models
 - No duplicate text storage needed
+
+Lookup tables and wind adjustments are module-level tuples built once per
+process.  The pure core maps quantized inputs (pressure, trend, wind sector,
+season) to the forecast number by index arithmetic and is memoized; the
+localized text is only looked up for the final result.
 """
+from __future__ import annotations
+
 from datetime import datetime
+from functools import lru_cache
 import logging
-
+import math
+
+from .batch import (
+    BatchResult,
+    broadcast,
+    broadcast_arrays,
+    np,
+    numpy_enabled,
+    to_result,
+    wind_factors,
+    wind_factors_array,
+)
 from .const import PRESSURE_TREND_FALLING, PRESSURE_TREND_RISING
 
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Pressure range expanded to cover global conditions + adjustments
+# Base range: 910-1085 hPa covers 99.9% of global weather including:
+# - Mediterranean hurricanes (Medicanes): 940-960 hPa
+# - Sydney/Australian cyclones: 955-975 hPa
+# - European storms: 920-1070 hPa
+# After wind adjustments (±10.3 hPa) and summer adjustments (±12.3 hPa)
+# Effective range: ~887-1108 hPa (covers extreme global conditions)
+BAR_TOP = 1085
+BAR_BOTTOM = 910
+BAR_RANGE = BAR_TOP - BAR_BOTTOM
+
+# Expanded to 44 indexes for higher precision: 175 / 44 = 3.98 hPa per index
+# (Previously 22 indexes: 175 / 22 = 7.95 hPa per index)
+OPTION_COUNT = 44
+_OPTION_STEP = BAR_RANGE / OPTION_COUNT
+
+# ✅ FIXED v3.1.10: Use original Negretti & Zambra absolute value (7 hPa)
+# Original barometers (1890s) used 950-1050 hPa range, 7% = 7 hPa
+# Our expanded range (910-1085 hPa) made 7% = 12.25 hPa (too aggressive!)
+# Scientific correction: Summer effects are physical constants, not percentage-scaled
+SUMMER_ADJUSTMENT_HPA = 7.0
+
+# Lookup tables per trend (falling, steady, rising), 44 indexes each.
+# Original 22 indexes expanded to 44 (each value doubled) for better granularity.
+# Index 0 = extremely low pressure ... 43 = peak high pressure.
+_FALL_OPT: tuple[int, ...] = (
+    25, 25, 25, 25, 25, 25, 25, 25, 25, 25,  # 0-9: Extremely low to moderate-low (stormy)
+    25, 25, 25, 25, 25, 25, 23, 23, 23, 23,  # 10-19: Moderate to high
+    21, 21, 20, 20, 17, 17, 14, 14, 7, 7,    # 20-29: Very high to peak high
+    3, 3, 1, 1, 1, 1, 1, 1, 0, 0,            # 30-39: Peak high (becoming fine)
+    0, 0, 0, 0,                              # 40-43: Peak high
+)
+_STEADY_OPT: tuple[int, ...] = (
+    25, 25, 25, 25, 25, 25, 25, 25, 25, 25,  # 0-9: Extremely low to moderate-low
+    25, 25, 23, 23, 23, 23, 22, 22, 18, 18,  # 10-19: Moderate to high
+    15, 15, 13, 13, 10, 10, 4, 4, 1, 1,      # 20-29: Very high to peak high
+    1, 1, 0, 0, 0, 0, 0, 0, 0, 0,            # 30-39: Peak high (settled fine)
+    0, 0, 0, 0,                              # 40-43: Peak high
+)
+_RISE_OPT: tuple[int, ...] = (
+    25, 25, 25, 25, 24, 24, 24, 24, 19, 19,  # 0-9: Extremely low to moderate-low
+    16, 16, 12, 12, 11, 11, 9, 9, 8, 8,      # 10-19: Moderate to high
+    6, 6, 5, 5, 2, 2, 1, 1, 1, 1,            # 20-29: Very high to peak high
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0,            # 30-39: Peak high (settled fine)
+    0, 0, 0, 0,                              # 40-43: Peak high
+)
+_OPTIONS_BY_TREND: tuple[tuple[int, ...], ...] = (_FALL_OPT, _STEADY_OPT, _RISE_OPT)
+
+# Northern Hemisphere wind direction adjustment (hPa) per 22.5° sector,
+# sector 0 = N (348.75-11.25°), 1 = NNE, ... 15 = NNW
+_WIND_ADJUSTMENT: tuple[float, ...] = tuple(
+    percent / 100 * BAR_RANGE
+    for percent in (
+        6, 5, 4.6, 2,          # N, NNE, NE, ENE
+        -0.5, -5, -5, -8.5,    # E, ESE, SE, SSE
+        -11.5, -10, -6, -4.5,  # S, SSW, SW, WSW
+        -3, -0.5, 1.5, 3,      # W, WNW, NW, NNW
+    )
+)
+
+# Letter code per forecast index (A = settled fine ... Z = stormy, much rain)
+_NEGRETTI_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+EXCEPTIONAL_TEXT: tuple[str, ...] = (
+    "außergewöhnliches Wetter, ",
+    "Exceptional Weather, ",
+    "εξαιρετικός καιρός, ",
+    "Tempo eccezionale, ",
+    "Výnimočné počasie, ",
+)
+
+if np is not None:
+    _OPTIONS_ARRAY = np.array(_OPTIONS_BY_TREND, dtype=int)
+    _WIND_ADJUSTMENT_ARRAY = np.array(_WIND_ADJUSTMENT, dtype=float)
+    _NEGRETTI_LETTER_ARRAY = np.array(list(_NEGRETTI_LETTERS))
+
+# Pressure resolution of the memoized core (decimal places, hPa)
+_P0_RESOLUTION = 2
+
+
+def _pressure_trend(pressure_change: float) -> int:
+    """Return -1 (falling), 0 (steady) or 1 (rising)."""
+    if pressure_change <= PRESSURE_TREND_FALLING:
+        return -1
+    if pressure_change >= PRESSURE_TREND_RISING:
+        return 1
+    return 0
+
+
+def _wind_sector(direction: float) -> int | None:
+    """Return the 22.5° wind sector (0 = N ... 15 = NNW), None if invalid."""
+    try:
+        sector = math.ceil((direction - 11.25) / 22.5)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return sector if 0 < sector < 16 else 0
+
+
+@lru_cache(maxsize=2048)
+def _negretti_core(
+    p0: float, trend: int, wind_sector: int | None, is_summer: bool
+) -> tuple[int, bool]:
+    """Map quantized inputs to a Negretti & Zambra result (pure, memoized).
+
+    Args:
+        p0: Sea level pressure in hPa (quantized by caller)
+        trend: -1 falling, 0 steady, 1 rising
+        wind_sector: Wind sector for the direction adjustment, None if no
+            adjustment applies (southern hemisphere or calm)
+        is_summer: True for March - October
+
+    Returns:
+        (forecast index 0-25, is_exceptional)
+    """
+    z_hp = p0
+    if wind_sector is not None:
+        z_hp = z_hp + _WIND_ADJUSTMENT[wind_sector]
+
+    # Summer adjustment only for moderate pressure (975-1025 hPa) - same as Zambretti
+    # Very low pressure (<975 hPa) = storm conditions, no adjustment needed
+    # Very high pressure (>1025 hPa) = already optimal, no adjustment needed
+    if is_summer and 975 <= p0 <= 1025:
+        z_hp = z_hp + trend * SUMMER_ADJUSTMENT_HPA
+
+    # Ensure within bounds
+    if z_hp >= BAR_TOP:
+        z_hp = float(BAR_TOP - 1)
+    elif z_hp < BAR_BOTTOM:
+        z_hp = float(BAR_BOTTOM)
+
+    # Values outside the 44 index positions (0-43) indicate exceptional conditions
+    z_option_raw = (z_hp - BAR_BOTTOM) / _OPTION_STEP
+    is_exceptional = not 0.0 <= z_option_raw <= 43.0
+    z_option = int(round(min(max(z_option_raw, 0.0), 43.0)))
+
+    forecast_idx = _OPTIONS_BY_TREND[trend + 1][z_option]
+
+    _LOGGER.debug(
+        "Negretti: p0=%.2f hPa, trend=%s, wind_sector=%s, is_summer=%s → "
+        "z_hp=%.1f hPa, z_option=%s, forecast_idx=%s, is_exceptional=%s",
+        p0,
+        'RISING' if trend == 1 else 'FALLING' if trend == -1 else 'STEADY',
+        wind_sector,
+        is_summer,
+        z_hp,
+        z_option,
+        forecast_idx,
+        is_exceptional
+    )
+
+    return forecast_idx, is_exceptional
+
+
 def calculate_negretti_zambra_forecast(
     p0: float,
     pressure_change: float,
@@ -36,303 +208,141 @@ def calculate_negretti_zambra_forecast(
     Returns:
         [forecast_text, forecast_number, letter_code]
     """
-    _LOGGER.debug(
-        f"Negretti: Input - p0={p0:.1f} hPa, pressure_change={pressure_change:.2f} hPa, "
-        f"wind_data={wind_data}, elevation={elevation}m, hemisphere={hemisphere}"
-    )
-
-    # Configuration - convert hemisphere string to numeric (1=North, 0=South)
-    hemisphere_numeric = 1 if hemisphere == "north" else 0
-    # Pressure range expanded to cover global conditions + adjustments
-    # Base range: 910-1085 hPa covers 99.9% of global weather including:
-    # - Mediterranean hurricanes (Medicanes): 940-960 hPa
-    # - Sydney/Australian cyclones: 955-975 hPa
-    # - European storms: 920-1070 hPa
-    # After wind adjustments (±10.3 hPa) and summer adjustments (±12.3 hPa)
-    # Effective range: ~887-1108 hPa (covers extreme global conditions)
-    bar_top = 1085
-    bar_bottom = 910
-
-    # Lookup tables for different trends - EXPANDED to 44 indexes for higher precision
-    # Original 22 indexes expanded to 44 (each value doubled) for better granularity
-    # This provides 3.98 hPa/index instead of 7.95 hPa/index (2× better precision)
-    rise_opt = [
-        25, 25,  # 0-1: Extremely low pressure rising
-        25, 25,  # 2-3: Very low pressure rising
-        24, 24,  # 4-5: Low pressure rising
-        24, 24,  # 6-7: Low-moderate pressure rising
-        19, 19,  # 8-9: Moderate-low pressure rising
-        16, 16,  # 10-11: Moderate pressure rising
-        12, 12,  # 12-13: Moderate-high pressure rising
-        11, 11,  # 14-15: High-moderate pressure rising
-        9, 9,    # 16-17: High pressure rising
-        8, 8,    # 18-19: High pressure rising
-        6, 6,    # 20-21: Very high pressure rising
-        5, 5,    # 22-23: Very high pressure rising
-        2, 2,    # 24-25: Extremely high pressure rising
-        1, 1,    # 26-27: Extremely high pressure rising
-        1, 1,    # 28-29: Extremely high pressure rising
-        0, 0,    # 30-31: Peak high pressure rising (settled fine)
-        0, 0,    # 32-33: Peak high pressure rising
-        0, 0,    # 34-35: Peak high pressure rising
-        0, 0,    # 36-37: Peak high pressure rising
-        0, 0,    # 38-39: Peak high pressure rising
-        0, 0,    # 40-41: Peak high pressure rising
-        0, 0     # 42-43: Peak high pressure rising
-    ]
-
-    steady_opt = [
-        25, 25,  # 0-1: Extremely low pressure steady
-        25, 25,  # 2-3: Very low pressure steady
-        25, 25,  # 4-5: Low pressure steady
-        25, 25,  # 6-7: Low-moderate pressure steady
-        25, 25,  # 8-9: Moderate-low pressure steady
-        25, 25,  # 10-11: Moderate pressure steady
-        23, 23,  # 12-13: Moderate-high pressure steady
-        23, 23,  # 14-15: High-moderate pressure steady
-        22, 22,  # 16-17: High pressure steady
-        18, 18,  # 18-19: High pressure steady
-        15, 15,  # 20-21: Very high pressure steady
-        13, 13,  # 22-23: Very high pressure steady
-        10, 10,  # 24-25: Extremely high pressure steady
-        4, 4,    # 26-27: Extremely high pressure steady
-        1, 1,    # 28-29: Peak high pressure steady
-        1, 1,    # 30-31: Peak high pressure steady
-        0, 0,    # 32-33: Peak high pressure steady (settled fine)
-        0, 0,    # 34-35: Peak high pressure steady
-        0, 0,    # 36-37: Peak high pressure steady
-        0, 0,    # 38-39: Peak high pressure steady
-        0, 0,    # 40-41: Peak high pressure steady
-        0, 0     # 42-43: Peak high pressure steady
-    ]
-
-    fall_opt = [
-        25, 25,  # 0-1: Extremely low pressure falling (stormy)
-        25, 25,  # 2-3: Very low pressure falling
-        25, 25,  # 4-5: Low pressure falling
-        25, 25,  # 6-7: Low-moderate pressure falling
-        25, 25,  # 8-9: Moderate-low pressure falling
-        25, 25,  # 10-11: Moderate pressure falling
-        25, 25,  # 12-13: Moderate-high pressure falling
-        25, 25,  # 14-15: High-moderate pressure falling
-        23, 23,  # 16-17: High pressure falling
-        23, 23,  # 18-19: High pressure falling
-        21, 21,  # 20-21: Very high pressure falling
-        20, 20,  # 22-23: Very high pressure falling
-        17, 17,  # 24-25: Extremely high pressure falling
-        14, 14,  # 26-27: Extremely high pressure falling
-        7, 7,    # 28-29: Peak high pressure falling
-        3, 3,    # 30-31: Peak high pressure falling
-        1, 1,    # 32-33: Peak high pressure falling
-        1, 1,    # 34-35: Peak high pressure falling
-        1, 1,    # 36-37: Peak high pressure falling
-        0, 0,    # 38-39: Peak high pressure falling (becoming fine)
-        0, 0,    # 40-41: Peak high pressure falling
-        0, 0     # 42-43: Peak high pressure falling
-    ]
-
-    exceptional_text = [
-        "außergewöhnliches Wetter, ",
-        "Exceptional Weather, ",
-        "εξαιρετικός καιρός, ",
-        "Tempo eccezionale, ",
-        "Výnimočné počasie, "
-    ]
-
-    # Calculate constants
-    bar_range = bar_top - bar_bottom
-    # Expanded to 44 indexes for higher precision: 175 / 44 = 3.98 hPa per index
-    # (Previously 22 indexes: 175 / 22 = 7.95 hPa per index)
-    constant = bar_range / 44
-
-    # Determine season and trend
+    # Season from the current month (summer = March - October)
     current_month = datetime.now().month
     is_summer = 2 < current_month < 11
 
-    if pressure_change <= PRESSURE_TREND_FALLING:
-        trend = -1
-    elif pressure_change >= PRESSURE_TREND_RISING:
-        trend = 1
-    else:
-        trend = 0
+    # Wind direction adjustment only for the Northern Hemisphere with wind
+    wind_sector = None
+    if hemisphere == "north" and wind_data[3] == 1:
+        wind_sector = _wind_sector(wind_data[1])
 
-    _LOGGER.debug(
-        f"Negretti: month={current_month}, is_summer={is_summer}, "
-        f"trend={'RISING' if trend == 1 else 'FALLING' if trend == -1 else 'STEADY'}"
-    )
-
-    # Adjusted pressure for Northern Hemisphere
-    z_hp = p0
-    direction = wind_data[1]
-    wind_speed_fak = wind_data[3]
-
-    _LOGGER.debug(f"Negretti: wind direction={direction}°, wind_speed_fak={wind_speed_fak}")
-    _LOGGER.debug(f"Negretti: Initial z_hp={z_hp:.1f} hPa (before wind adjustments)")
-
-    if hemisphere_numeric == 1 and wind_speed_fak == 1:
-        # Wind direction adjustments for Northern Hemisphere
-        if 11.25 < direction <= 33.75:  # NNE
-            z_hp = z_hp + 5 / 100 * bar_range
-        elif 33.75 < direction <= 56.25:  # NE
-            z_hp = z_hp + 4.6 / 100 * bar_range
-        elif 56.25 < direction <= 78.75:  # ENE
-            z_hp = z_hp + 2 / 100 * bar_range
-        elif 78.75 < direction <= 101.25:  # E
-            z_hp = z_hp - 0.5 / 100 * bar_range
-        elif 101.25 < direction <= 123.75:  # ESE
-            z_hp = z_hp - 5 / 100 * bar_range
-        elif 123.75 < direction <= 146.25:  # SE
-            z_hp = z_hp - 5 / 100 * bar_range
-        elif 146.25 < direction <= 168.75:  # SSE
-            z_hp = z_hp - 8.5 / 100 * bar_range
-        elif 168.75 < direction <= 191.25:  # S
-            z_hp = z_hp - 11.5 / 100 * bar_range
-        elif 191.25 < direction <= 213.75:  # SSW
-            z_hp = z_hp - 10 / 100 * bar_range
-        elif 213.75 < direction <= 236.25:  # SW
-            z_hp = z_hp - 6 / 100 * bar_range
-        elif 236.25 < direction <= 258.75:  # WSW
-            z_hp = z_hp - 4.5 / 100 * bar_range
-        elif 258.75 < direction <= 281.25:  # W
-            z_hp = z_hp - 3 / 100 * bar_range
-        elif 281.25 < direction <= 303.75:  # WNW
-            z_hp = z_hp - 0.5 / 100 * bar_range
-        elif 303.75 < direction <= 326.25:  # NW
-            z_hp = z_hp + 1.5 / 100 * bar_range
-        elif 326.25 < direction <= 348.75:  # NNW
-            z_hp = z_hp + 3 / 100 * bar_range
-        elif direction > 348.75 or direction <= 11.25:  # N
-            z_hp = z_hp + 6 / 100 * bar_range
-
-        _LOGGER.debug(f"Negretti: z_hp after wind direction adjustment={z_hp:.1f} hPa")
-    else:
-        _LOGGER.debug(f"Negretti: No wind direction adjustment applied (hemisphere={'north' if hemisphere_numeric == 1 else 'south'}, wind_speed_fak={wind_speed_fak})")
-
-    # Summer adjustment for rising/falling trends
-    # ✅ FIXED v3.1.10: Use original Negretti & Zambra absolute value (7 hPa)
-    # Original barometers (1890s) used 950-1050 hPa range, 7% = 7 hPa
-    # Our expanded range (910-1085 hPa) made 7% = 12.25 hPa (too aggressive!)
-    # Scientific correction: Summer effects are physical constants, not percentage-scaled
-    #
-    # Apply only for moderate pressure (975-1025 hPa) - same logic as Zambretti
-    # Very low pressure (<975 hPa) = storm conditions, no adjustment needed
-    # Very high pressure (>1025 hPa) = already optimal, no adjustment needed
-    SUMMER_ADJUSTMENT_HPA = 7.0  # Original Negretti & Zambra value
-
-    if is_summer and 975 <= p0 <= 1025:
-        if trend == 1:
-            z_hp = z_hp + SUMMER_ADJUSTMENT_HPA
-            _LOGGER.debug(f"Negretti: Summer RISING adjustment: +{SUMMER_ADJUSTMENT_HPA} hPa → z_hp={z_hp:.1f} hPa (p0={p0:.1f} hPa in moderate range)")
-        elif trend == -1:
-            z_hp = z_hp - SUMMER_ADJUSTMENT_HPA
-            _LOGGER.debug(f"Negretti: Summer FALLING adjustment: -{SUMMER_ADJUSTMENT_HPA} hPa → z_hp={z_hp:.1f} hPa (p0={p0:.1f} hPa in moderate range)")
-    elif is_summer and p0 < 975:
-        _LOGGER.debug(f"Negretti: Skipping summer adjustment for very low pressure ({p0:.1f} hPa < 975, storm conditions)")
-    elif is_summer and p0 > 1025:
-        _LOGGER.debug(f"Negretti: Skipping summer adjustment for high pressure ({p0:.1f} hPa > 1025, already optimal)")
-    elif not is_summer:
-        _LOGGER.debug(f"Negretti: No summer adjustment (winter month)")
-
-    # Ensure within bounds (use float comparison for consistency)
-    if z_hp >= float(bar_top):
-        _LOGGER.debug(f"Negretti: Pressure {z_hp:.1f} hPa exceeds bar_top {bar_top}, clamping to {bar_top - 1}")
-        z_hp = float(bar_top - 1)
-
-    if z_hp < float(bar_bottom):
-        _LOGGER.debug(f"Negretti: Pressure {z_hp:.1f} hPa below bar_bottom {bar_bottom}, clamping to {bar_bottom}")
-        z_hp = float(bar_bottom)
-
-    # Calculate option index (this will be float, needs clamping)
-    # The Negretti & Zambra algorithm uses an expanded scale from 910-1085 hPa
-    # divided into 44 index positions (0-43) for higher precision (3.98 hPa/index).
-    # This range covers global weather conditions including Mediterranean hurricanes,
-    # Australian cyclones, and European storms, plus all adjustments.
-    # Values outside this range indicate truly exceptional conditions.
-    z_option_raw = (z_hp - bar_bottom) / constant
-
-    _LOGGER.debug(f"Negretti: z_hp after adjustments={z_hp:.1f} hPa, z_option_raw={z_option_raw:.2f}")
-
-    # Check for exceptional weather and clamp BEFORE converting to int
-    is_exceptional = False
-    if z_option_raw < 0.0:
-        _LOGGER.debug(
-            f"Negretti: EXCEPTIONAL weather detected - z_option={z_option_raw:.2f} < 0, "
-            f"clamping to 0 (pressure={z_hp:.1f} hPa, very low pressure)"
-        )
-        z_option_raw = 0.0
-        is_exceptional = True
-    elif z_option_raw > 43.0:
-        _LOGGER.debug(
-            f"Negretti: EXCEPTIONAL weather detected - z_option={z_option_raw:.2f} > 43, "
-            f"clamping to 43 (pressure={z_hp:.1f} hPa, very high pressure)"
-        )
-        z_option_raw = 43.0
-        is_exceptional = True
-
-    # Convert to int after clamping (now guaranteed to be in range 0-43)
-    z_option = int(round(z_option_raw))
-
-    # Select forecast based on trend
-    if trend == 1:  # Rising
-        forecast_idx = rise_opt[z_option]
-        _LOGGER.debug(f"Negretti: Using RISING lookup table: z_option={z_option} → forecast_idx={forecast_idx}")
-    elif trend == -1:  # Falling
-        forecast_idx = fall_opt[z_option]
-        _LOGGER.debug(f"Negretti: Using FALLING lookup table: z_option={z_option} → forecast_idx={forecast_idx}")
-    else:  # Steady
-        forecast_idx = steady_opt[z_option]
-        _LOGGER.debug(f"Negretti: Using STEADY lookup table: z_option={z_option} → forecast_idx={forecast_idx}")
-
-    _LOGGER.debug(
-        f"Negretti: forecast_idx={forecast_idx}, is_exceptional={is_exceptional}, "
-        f"z_option={z_option}"
+    forecast_idx, is_exceptional = _negretti_core(
+        round(p0, _P0_RESOLUTION),
+        _pressure_trend(pressure_change),
+        wind_sector,
+        is_summer,
     )
 
     # Build forecast text using unified system
     # ✅ USE UNIFIED SYSTEM: Get text from forecast_mapping
     from .forecast_mapping import get_forecast_text
 
-    base_forecast_text = get_forecast_text(
+    forecast_text = get_forecast_text(
         forecast_num=forecast_idx,
         lang_index=lang_index
     )
 
     # Add exceptional weather prefix if needed
     if is_exceptional:
-        exceptional_text = [
-            "außergewöhnliches Wetter, ",
-            "Exceptional Weather, ",
-            "εξαιρετικός καιρός, ",
-            "Tempo eccezionale, ",
-            "Výnimočné počasie, "
-        ]
-        forecast_text = exceptional_text[lang_index] + base_forecast_text
-    else:
-        forecast_text = base_forecast_text
+        forecast_text = EXCEPTIONAL_TEXT[lang_index] + forecast_text
 
-    # Calculate letter code for display purposes
     # ⚠️ IMPORTANT: Negretti uses DIFFERENT letter codes than Zambretti!
-    # The Negretti & Zambra slide rule has its own proprietary letter system.
-    # However, for compatibility with unified forecast system, we use sequential letters
-    # based on forecast_idx (0-25), NOT Zambretti's letter mapping.
-    # 
-    # SCIENTIFIC RATIONALE:
-    # - Negretti letters are for display/reference only (not used for mapping)
-    # - forecast_idx (0-25) is the UNIVERSAL code used by all models
-    # - Using Zambretti letters for Negretti would be scientifically incorrect
-    # 
-    # Solution: Generate letter based on forecast severity (A=best, Z=worst)
+    # Letters are generated from forecast severity (A=best, Z=worst), see
+    # _generate_negretti_letter()
     letter_code = _generate_negretti_letter(forecast_idx)
 
     _LOGGER.debug(
-        f"Negretti: RESULT - forecast_code={forecast_idx}, "
-        f"letter={letter_code} (Negretti system), text='{forecast_text}'"
+        "Negretti: RESULT - p0=%.1f hPa, change=%.2f hPa, hemisphere=%s, "
+        "forecast_code=%s, letter=%s (Negretti system), text='%s'",
+        p0,
+        pressure_change,
+        hemisphere,
+        forecast_idx,
+        letter_code,
+        forecast_text
     )
 
     # Return [text, code, letter] - forecast_calculator expects 3 items
     return [forecast_text, forecast_idx, letter_code]
 
 
+def calculate_negretti_zambra_forecast_batch(
+    p0,
+    pressure_change,
+    wind_direction=None,
+    wind_speed=None,
+    month=None,
+    hemisphere: str = "north",
+    *,
+    use_numpy: bool = True,
+) -> BatchResult:
+    """Calculate Negretti & Zambra forecasts for many observations at once.
+
+    Every observation input can be a scalar, a sequence or a NumPy array;
+    scalars are broadcast.  Results match calculate_negretti_zambra_forecast()
+    element-wise.
+
+    Args:
+        p0: Sea level pressures in hPa
+        pressure_change: Pressure changes over 3 hours in hPa
+        wind_direction: Wind directions in degrees (optional)
+        wind_speed: Wind speeds in m/s (optional, no wind adjustment without)
+        month: Months (1-12) for the season adjustment (default: current month)
+        hemisphere: "north" or "south" (default: "north")
+        use_numpy: Use NumPy if installed
+
+    Returns:
+        (forecast numbers 0-25, letter codes) as NumPy arrays, or as
+        array("i") and list[str] without NumPy
+    """
+    if month is None:
+        month = datetime.now().month
+    if wind_direction is None or wind_speed is None:
+        wind_direction = wind_speed = 0.0
+    north = hemisphere == "north"
+
+    if numpy_enabled(use_numpy):
+        p0, pressure_change, wind_direction, wind_speed, month = broadcast_arrays(
+            p0, pressure_change, wind_direction, wind_speed, month
+        )
+        p0 = np.round(p0, _P0_RESOLUTION)
+        trend = np.where(
+            pressure_change <= PRESSURE_TREND_FALLING,
+            -1,
+            np.where(pressure_change >= PRESSURE_TREND_RISING, 1, 0),
+        )
+
+        # Wind direction adjustment (see _wind_sector and _negretti_core)
+        _, wind_speed_fak = wind_factors_array(wind_direction, wind_speed)
+        with np.errstate(invalid="ignore"):
+            sector = np.ceil((wind_direction - 11.25) / 22.5)
+        apply_wind = (wind_speed_fak == 1) & np.isfinite(sector) & north
+        sector = np.where((sector > 0) & (sector < 16), sector, 0).astype(int)
+        z_hp = p0 + np.where(apply_wind, _WIND_ADJUSTMENT_ARRAY[sector], 0.0)
+
+        is_summer = (month > 2) & (month < 11)
+        z_hp = z_hp + np.where(
+            is_summer & (p0 >= 975) & (p0 <= 1025), trend * SUMMER_ADJUSTMENT_HPA, 0.0
+        )
+        z_hp = np.where(
+            z_hp >= BAR_TOP,
+            float(BAR_TOP - 1),
+            np.where(z_hp < BAR_BOTTOM, float(BAR_BOTTOM), z_hp),
+        )
+
+        z_option = np.round(np.clip((z_hp - BAR_BOTTOM) / _OPTION_STEP, 0.0, 43.0)).astype(int)
+        numbers = _OPTIONS_ARRAY[trend + 1, z_option]
+        return numbers, _NEGRETTI_LETTER_ARRAY[numbers]
+
+    _, inputs = broadcast(p0, pressure_change, wind_direction, wind_speed, month)
+    numbers: list[int] = []
+    letters: list[str] = []
+    for pressure, change, direction, speed, current_month in zip(*inputs):
+        wind_sector = None
+        if north and wind_factors(direction, speed)[1] == 1:
+            wind_sector = _wind_sector(direction)
+        forecast_idx, _ = _negretti_core(
+            round(float(pressure), _P0_RESOLUTION),
+            _pressure_trend(change),
+            wind_sector,
+            2 < current_month < 11,
+        )
+        numbers.append(forecast_idx)
+        letters.append(_NEGRETTI_LETTERS[forecast_idx])
+    return to_result(numbers, letters)
+
+
 def _generate_negretti_letter(forecast_idx: int) -> str:
     """Generate Negretti letter code based on forecast severity.
     
@@ -351,42 +361,13 @@ def _generate_negretti_letter(forecast_idx: int) -> str:
     Returns:
         Letter code (A-Z) representing forecast severity
     """
-    # Map forecast_idx (0-25) to letter severity (A-Z, 26 letters)
-    # Group similar severities together for better representation
-    mapping = {
-        0: "A",   # Settled fine
-        1: "B",   # Fine weather
-        2: "C",   # Becoming fine
-        3: "D",   # Fine, becoming less settled
-        4: "E",   # Fine, possible showers
-        5: "F",   # Fairly fine, improving
-        6: "G",   # Fairly fine, possible showers early
-        7: "H",   # Fairly fine, showery later
-        8: "I",   # Showery early, improving
-        9: "J",   # Changeable, mending
-        10: "K",  # Fairly fine, showers likely
-        11: "L",  # Rather unsettled clearing later
-        12: "M",  # Unsettled, probably improving
-        13: "N",  # Showery, bright intervals
-        14: "O",  # Showery, becoming more unsettled
-        15: "P",  # Changeable, some rain
-        16: "Q",  # Unsettled, short fine intervals
-        17: "R",  # Unsettled, rain later (not X!)
-        18: "S",  # Unsettled, some rain
-        19: "T",  # Mostly very unsettled
-        20: "U",  # Occasional rain, worsening
-        21: "V",  # Rain at times, very unsettled
-        22: "W",  # Rain at frequent intervals
-        23: "X",  # Very unsettled, rain
-        24: "Y",  # Stormy, may improve
-        25: "Z",  # Stormy, much rain
-    }
-    
+    # Map forecast_idx (0-25) to letter severity (A-Z, 26 letters):
+    # 0 = A (settled fine), 13 = N (showery, bright intervals), 25 = Z (stormy, much rain)
     # Clamp to valid range
     forecast_idx = max(0, min(25, forecast_idx))
-    result = mapping.get(forecast_idx, "A")
+    result = _NEGRETTI_LETTERS[forecast_idx]
     
-    _LOGGER.debug(f"Negretti letter: forecast_idx={forecast_idx} → '{result}'")
+    _LOGGER.debug("Negretti letter: forecast_idx=%s → '%s'", forecast_idx, result)
     return result
 
 
@@ -406,10 +387,10 @@ def _map_zambretti_to_letter(z: int) -> str:
     """
     # Defensive clamping - should already be done by caller, but extra safety
     if z < 1:
-        _LOGGER.debug(f"Negretti: z={z} < 1, clamping to 1 for letter mapping")
+        _LOGGER.debug("Negretti: z=%s < 1, clamping to 1 for letter mapping", z)
         z = 1
     elif z > 33:
-        _LOGGER.debug(f"Negretti: z={z} > 33, clamping to 33 for letter mapping")
+        _LOGGER.debug("Negretti: z=%s > 33, clamping to 33 for letter mapping", z)
         z = 33
 
     mapping = {
@@ -444,8 +425,8 @@ def _map_zambretti_to_letter(z: int) -> str:
     }
     result = mapping.get(z, "A")
     if z not in mapping:
-        _LOGGER.debug(f"Negretti: Using default letter 'A' for z={z}")
+        _LOGGER.debug("Negretti: Using default letter 'A' for z=%s", z)
     else:
-        _LOGGER.debug(f"Negretti: Mapped z={z} → letter '{result}'")
+        _LOGGER.debug("Negretti: Mapped z=%s → letter '%s'", z, result)
     return result
 
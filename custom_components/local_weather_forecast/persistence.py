@@ -14,8 +14,14 @@ Theory:
 import logging
 from typing import Optional
 
+from .batch import BatchResult, broadcast, np, numpy_enabled, to_result
+
 _LOGGER = logging.getLogger(__name__)
 
+if np is not None:
+    # Letter codes A-H (one per 3 condition codes)
+    _LETTER_ARRAY = np.array(list("ABCDEFGH"))
+
 
 def calculate_persistence_forecast(
     current_condition_code: int,
@@ -53,6 +59,33 @@ def calculate_persistence_forecast(
     return [forecast_text, forecast_code, letter_code, confidence]
 
 
+def calculate_persistence_forecast_batch(
+    current_condition_code,
+    *,
+    use_numpy: bool = True,
+) -> BatchResult:
+    """Calculate Persistence forecasts for many observations at once.
+
+    Results match calculate_persistence_forecast() element-wise.
+
+    Args:
+        current_condition_code: Current unified condition codes (0-25),
+            a scalar, sequence or NumPy array
+        use_numpy: Use NumPy if installed
+
+    Returns:
+        (forecast numbers 0-25, letter codes) as NumPy arrays, or as
+        array("i") and list[str] without NumPy
+    """
+    if numpy_enabled(use_numpy):
+        codes = np.atleast_1d(np.asarray(current_condition_code)).astype(int)
+        return codes, _LETTER_ARRAY[np.minimum(codes // 3, 7)]
+
+    _, (codes,) = broadcast(current_condition_code)
+    numbers = [int(code) for code in codes]
+    return to_result(numbers, [chr(65 + min(code // 3, 7)) for code in numbers])
+
+
 def get_persistence_confidence(hours_ahead: int) -> float:
     """Calculate confidence for Persistence model based on forecast horizon.
     
@@ -0,0 +1,119 @@
+"""Startup readiness barrier of a config entry.
+
+At startup the entities run their first update once the entities they read
+are ready, instead of polling the state machine:
+
+- a source sensor is ready once it has a valid state (state change events);
+- an entity of this entry that takes part in the barrier (``async_expect``)
+  is ready once it has run its first update (``async_mark_ready``), so
+  dependent sensors (main -> detail -> enhanced / rain probability) start in
+  order instead of each working on the restored state of the others.
+
+All waits of an entry share one deadline of ``STARTUP_READY_TIMEOUT``
+seconds, started by the first wait; an entity whose upstream entities are
+not ready by then updates with whatever is available.  The time from the
+setup of the entry until every expected entity is ready is logged once.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+import logging
+import time
+from typing import Callable
+
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import STARTUP_READY_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ReadinessBarrier:
+    """Let entities wait for the entities they need at startup."""
+
+    def __init__(
+        self, hass: HomeAssistant, name: str, timeout: float = STARTUP_READY_TIMEOUT
+    ) -> None:
+        """Initialize the barrier (the startup timing starts now)."""
+        self.hass = hass
+        self._name = name
+        self._timeout = timeout
+        self._started = time.monotonic()
+        self._deadline: float | None = None
+        self._expected: set[str] = set()
+        self._ready: set[str] = set()
+        self._mark_listeners: set[Callable[[], None]] = set()
+        self.startup_duration: float | None = None  # Seconds until all expected entities were ready
+
+    @callback
+    def async_expect(self, entity_id: str | None) -> None:
+        """Take part in the barrier: the entity is ready after async_mark_ready."""
+        if entity_id and entity_id not in self._ready:
+            self._expected.add(entity_id)
+
+    @callback
+    def async_mark_ready(self, entity_id: str | None) -> None:
+        """Mark an entity of this entry as ready (first update done)."""
+        if not entity_id or entity_id in self._ready:
+            return
+        self._ready.add(entity_id)
+        for listener in list(self._mark_listeners):
+            listener()
+
+        if self.startup_duration is None and self._expected <= self._ready:
+            self.startup_duration = time.monotonic() - self._started
+            _LOGGER.info(
+                "%s: startup took %.2f s (%d entities ready)",
+                self._name, self.startup_duration, len(self._ready),
+            )
+
+    @callback
+    def is_ready(self, entity_id: str) -> bool:
+        """Return True if an entity is ready."""
+        if entity_id in self._expected:
+            return entity_id in self._ready
+        state = self.hass.states.get(entity_id)
+        return state is not None and state.state not in ("unknown", "unavailable")
+
+    async def async_wait(self, entity_ids: Iterable[str | None]) -> list[str]:
+        """Wait until all entities are ready or the shared deadline has passed.
+
+        Args:
+            entity_ids: Entities to wait for (None entries are ignored)
+
+        Returns:
+            Entities that were not ready by the deadline (empty if all are ready)
+        """
+        pending = [entity_id for entity_id in dict.fromkeys(entity_ids) if entity_id]
+        if all(self.is_ready(entity_id) for entity_id in pending):
+            return []
+
+        if self._deadline is None:
+            self._deadline = time.monotonic() + self._timeout
+        remaining = self._deadline - time.monotonic()
+        if remaining <= 0:
+            return [entity_id for entity_id in pending if not self.is_ready(entity_id)]
+
+        ready = asyncio.get_running_loop().create_future()
+
+        @callback
+        def _check(_event: Event | None = None) -> None:
+            if not ready.done() and all(self.is_ready(entity_id) for entity_id in pending):
+                ready.set_result(None)
+
+        sources = [entity_id for entity_id in pending if entity_id not in self._expected]
+        unsub = async_track_state_change_event(self.hass, sources, _check) if sources else None
+        self._mark_listeners.add(_check)
+        try:
+            async with asyncio.timeout(remaining):
+                await ready
+        except TimeoutError:
+            pass
+        finally:
+            self._mark_listeners.discard(_check)
+            if unsub is not None:
+                unsub()
+
+        return [entity_id for entity_id in pending if not self.is_ready(entity_id)]
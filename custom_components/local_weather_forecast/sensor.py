@@ -1,7 +1,6 @@
 """Sensor platform for Local Weather Forecast integration."""
 from __future__ import annotations
 
-import asyncio
 from datetime import datetime, timedelta, timezone
 import logging
 import math
@@ -14,16 +13,20 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
+    EntityCategory,
+    Platform,
     UnitOfPressure,
     UnitOfTemperature,
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+    async_track_time_interval,
+)
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.start import async_at_start
-from homeassistant.helpers import entity_registry as er
-from homeassistant.components.recorder import get_instance, history
 from homeassistant.util import dt as dt_util
 
 from .const import (
@@ -33,7 +36,9 @@ from .const import (
     CONF_PRESSURE_TYPE,
     CONF_PRESSURE_SENSOR,
     CONF_RAIN_RATE_SENSOR,
+    CONF_SENSOR_UPDATE_INTERVAL,
     CONF_SOLAR_RADIATION_SENSOR,
+    CONF_STAGE_TIMING,
     CONF_TEMPERATURE_SENSOR,
     CONF_WIND_DIRECTION_SENSOR,
     CONF_WIND_GUST_SENSOR,
@@ -41,7 +46,20 @@ from .const import (
     DEFAULT_ELEVATION,
     DEFAULT_HEMISPHERE,
     DEFAULT_PRESSURE_TYPE,
+    DEFAULT_SENSOR_UPDATE_INTERVAL,
+    DEFAULT_STAGE_TIMING,
     DOMAIN,
+    ENTITY_ENHANCED,
+    ENTITY_MAIN,
+    ENTITY_NEG_ZAM_DETAIL,
+    ENTITY_PRESSURE,
+    ENTITY_PRESSURE_CHANGE,
+    ENTITY_RAIN_PROBABILITY,
+    ENTITY_STAGE_TIMING,
+    ENTITY_TEMPERATURE,
+    ENTITY_TEMPERATURE_CHANGE,
+    ENTITY_WEATHER,
+    ENTITY_ZAMBRETTI_DETAIL,
     GRAVITY_CONSTANT,
     KELVIN_OFFSET,
     LAPSE_RATE,
@@ -54,7 +72,11 @@ from .const import (
     TEMPERATURE_QC_MIN,
     TEMPERATURE_QC_MAX,
     PRESSURE_TYPE_RELATIVE,
+    PRESSURE_CHANGE_MINUTES,
+    SENSOR_UPDATE_INTERVAL_MAX,
+    STAGE_TIMING_SENSOR_INTERVAL,
     PRESSURE_MIN_RECORDS,
+    TEMPERATURE_CHANGE_MINUTES,
     TEMPERATURE_MIN_RECORDS,
     TEMPERATURE_SPIKE_LIMIT,
     CONF_FORECAST_MODEL,
@@ -91,6 +113,26 @@ from .combined_model import (
     calculate_weather_aware_temperature,
     get_combined_forecast_text,
 )
+from .coordinator import (
+    DetailRefresh,
+    async_build_detail_refresh,
+    async_get_coordinator,
+    async_track_detail_refresh_time,
+)
+from .history_store import (
+    PRESSURE_CHANGE_HISTORY,
+    TEMPERATURE_CHANGE_HISTORY,
+    ChangeHistoryStore,
+)
+from .debug_trace import (
+    STAGE_MAIN_UPDATE,
+    STAGE_PRESSURE_CHANGE,
+    STAGE_TEMPERATURE_CHANGE,
+    StageTimings,
+    timed_stage,
+)
+from .last_known_good import LastKnownGoodCache
+from .sliding_window import SlidingWindow
 from .unit_conversion import UnitConverter
 
 _LOGGER = logging.getLogger(__name__)
@@ -115,10 +157,28 @@ async def async_setup_entry(
         LocalForecastEnhancedSensor(hass, config_entry),
         LocalForecastRainProbabilitySensor(hass, config_entry),
     ]
+    if config_entry.options.get(CONF_STAGE_TIMING, config.get(CONF_STAGE_TIMING, DEFAULT_STAGE_TIMING)):
+        entities.append(LocalForecastStageTimingSensor(hass, config_entry))
 
     async_add_entities(entities, False)
 
 
+def _detail_display(attributes: dict[str, Any]) -> tuple:
+    """Return what a detail sensor shows: the interval times and the icons.
+
+    Restored attributes hold lists instead of tuples, so values are
+    normalized before comparing.
+    """
+    def time_label(value):
+        return value[0] if isinstance(value, (list, tuple)) and value else value
+
+    return (
+        time_label(attributes.get("first_time")),
+        time_label(attributes.get("second_time")),
+        tuple(attributes.get("icons") or ()),
+    )
+
+
 class LocalWeatherForecastEntity(RestoreEntity, SensorEntity):
     """Base class for Local Weather Forecast entities."""
 
@@ -129,54 +189,232 @@ class LocalWeatherForecastEntity(RestoreEntity, SensorEntity):
         self._attr_has_entity_name = False  # Don't prefix with device name
         self._attr_should_poll = False
         self._last_update_time = None
-        self._update_throttle_seconds = 30  # Minimum seconds between updates
+        self._pending_update = None  # Latest update deferred to the end of the interval
+        self._trailing_update_unsub = None
+        self.updates_skipped = 0  # Inputs within the interval that did not run on their own
+        self.updates_coalesced = 0  # Trailing runs that caught up with skipped inputs
+        self.coordinator = async_get_coordinator(hass, config_entry)
+        self._own_last_known_good: LastKnownGoodCache | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Register the entity ID with the coordinator of this entry."""
+        await super().async_added_to_hass()
+        if self.coordinator is not None:
+            self.coordinator.async_register_entity(self.unique_id, self.entity_id)
+            self.async_on_remove(
+                self.coordinator.async_register_update_counters(
+                    self.entity_id, self._update_counters
+                )
+            )
+        self.async_on_remove(self._async_cancel_trailing_update)
+
+    def _update_counters(self) -> dict[str, int]:
+        """Return the update throttling counters (config entry diagnostics)."""
+        return {
+            "updates_skipped": self.updates_skipped,
+            "updates_coalesced": self.updates_coalesced,
+        }
+
+    @property
+    def _last_known_good(self) -> LastKnownGoodCache:
+        """Last known good values, shared by the entities of the entry."""
+        if self.coordinator is not None:
+            return self.coordinator.last_known_good
+        if self._own_last_known_good is None:
+            self._own_last_known_good = LastKnownGoodCache(self.hass)
+            self.async_on_remove(self._own_last_known_good.async_stop)
+        return self._own_last_known_good
+
+    @property
+    def stage_timings(self) -> StageTimings | None:
+        """Return the stage timings of the entry, or None if disabled."""
+        if self.coordinator is None:
+            return None
+        return self.coordinator.stage_timings
+
+    @property
+    def _update_throttle_seconds(self) -> float:
+        """Minimum seconds between updates (options flow, read on every update)."""
+        interval = self.config_entry.options.get(
+            CONF_SENSOR_UPDATE_INTERVAL,
+            self.config_entry.data.get(CONF_SENSOR_UPDATE_INTERVAL, DEFAULT_SENSOR_UPDATE_INTERVAL),
+        )
+        try:
+            return min(max(float(interval), 0.0), SENSOR_UPDATE_INTERVAL_MAX)
+        except (TypeError, ValueError):
+            return DEFAULT_SENSOR_UPDATE_INTERVAL
+
+    def _unique_id(self, key: str) -> str:
+        """Return the unique ID of an entity of this entry (see coordinator.unique_id)."""
+        if self.coordinator is None:
+            return key
+        return self.coordinator.unique_id(key)
+
+    def _internal_entity_id(self, key: str, domain: str = Platform.SENSOR) -> str | None:
+        """Return the entity ID of another entity of this entry."""
+        if self.coordinator is None:
+            return f"{domain}.{key}"
+        return self.coordinator.entity_id(key, domain)
 
     async def _throttled_update(self, update_coro, *, throttle: bool = True):
-        """Run an update coroutine with optional throttle, then write state."""
+        """Run an update coroutine with optional throttle, then write state.
+
+        The throttle runs the update at most once per interval without losing
+        inputs: an update requested within the interval is deferred to its
+        end, where a single run covers every request made meanwhile.
+        """
         if throttle:
             now = dt_util.now()
             if self._last_update_time is not None:
-                elapsed = (now - self._last_update_time).total_seconds()
-                if elapsed < self._update_throttle_seconds:
-                    _LOGGER.debug(
-                        "Skipping update for %s, only %.1fs since last update",
-                        self.entity_id, elapsed,
-                    )
+                remaining = self._update_throttle_seconds - (now - self._last_update_time).total_seconds()
+                if remaining > 0:
+                    self.updates_skipped += 1
+                    self._pending_update = update_coro
+                    if self._trailing_update_unsub is None:
+                        _LOGGER.debug(
+                            "Deferring update for %s by %.1fs", self.entity_id, remaining
+                        )
+                        self._trailing_update_unsub = async_call_later(
+                            self.hass, remaining, self._async_run_trailing_update
+                        )
                     return
             self._last_update_time = now
         await update_coro()
         self.async_write_ha_state()
 
-    def _get_main_sensor_id(self) -> str:
-        """Get the entity_id of the main sensor."""
-        # Try new format first (after migration)
-        new_id = "sensor.local_forecast"
-        if self.hass.states.get(new_id):
-            return new_id
-
-        # Fallback to old format (before migration)
-        # Entity registry generates: sensor.{domain}_{unique_id}
-        old_id = f"sensor.{DOMAIN}_{self.config_entry.entry_id}_main"
-        if self.hass.states.get(old_id):
-            return old_id
-
-        # Default to new format
-        return new_id
-
-    def _get_entity_id(self, suffix: str) -> str:
-        """Get entity_id for a given suffix."""
-        # Try new format first
-        new_id = f"sensor.local_forecast_{suffix}"
-        if self.hass.states.get(new_id):
-            return new_id
-
-        # Fallback to old format
-        old_id = f"sensor.{DOMAIN}_local_forecast_{suffix}"
-        if self.hass.states.get(old_id):
-            return old_id
-
-        # Default to new format
-        return new_id
+    async def _async_run_trailing_update(self, _now: datetime | None = None) -> None:
+        """Run the update deferred by _throttled_update with the latest inputs."""
+        self._trailing_update_unsub = None
+        update_coro, self._pending_update = self._pending_update, None
+        if update_coro is None:
+            return
+        self.updates_coalesced += 1
+        self._last_update_time = dt_util.now()
+        await update_coro()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_trailing_update(self) -> None:
+        """Cancel a deferred update."""
+        if self._trailing_update_unsub is not None:
+            self._trailing_update_unsub()
+            self._trailing_update_unsub = None
+        self._pending_update = None
+
+    def _async_track_detail_refresh(self) -> None:
+        """Call _periodic_update on the scheduled detail sensor refresh.
+
+        With a coordinator all detail sensors of the entry share its timer
+        and the inputs it reads per tick; otherwise the entity runs its own
+        timer on the same wall-clock boundaries.
+        """
+        if self.coordinator is not None:
+            self.async_on_remove(
+                self.coordinator.async_add_detail_refresh_listener(self._periodic_update)
+            )
+            return
+
+        @callback
+        def _handle_refresh_time(now: datetime) -> None:
+            self._periodic_update(
+                async_build_detail_refresh(self.hass, self._get_pressure_change_updated())
+            )
+
+        self.async_on_remove(async_track_detail_refresh_time(self.hass, _handle_refresh_time))
+
+    def _async_track_coordinator(
+        self, watched_fields: set[str], update_coro, *, throttle: bool = True
+    ) -> None:
+        """Run update_coro whenever one of the watched snapshot fields changes."""
+
+        @callback
+        def _handle_coordinator_update(changed_fields: frozenset[str]) -> None:
+            self.hass.async_create_task(
+                self._throttled_update(update_coro, throttle=throttle)
+            )
+
+        self.async_on_remove(
+            self.coordinator.async_add_listener(_handle_coordinator_update, watched_fields)
+        )
+
+    @staticmethod
+    def _parse_legacy_history(attributes) -> list[tuple[datetime, float]]:
+        """Parse history stored as [timestamp_iso, value] pairs in state attributes.
+
+        Versions before the history store kept the readings in the "history"
+        attribute; this is only used once to migrate them.
+        """
+        restored_history = []
+        for entry in attributes.get("history") or []:
+            try:
+                restored_history.append((datetime.fromisoformat(entry[0]), float(entry[1])))
+            except (ValueError, TypeError, IndexError):
+                continue
+        return restored_history
+
+    def _get_snapshot_value(self, name: str):
+        """Return a value from the coordinator snapshot, or None if unavailable."""
+        if self.coordinator is None:
+            return None
+        return getattr(self.coordinator.data, name)
+
+    def _get_internal_state(self, key: str, domain: str = Platform.SENSOR):
+        """Return the state of another entity of this entry, or None."""
+        entity_id = self._internal_entity_id(key, domain)
+        if entity_id is None:
+            return None
+        return self.hass.states.get(entity_id)
+
+    def _get_detail_forecast(self, snapshot_field: str, key: str) -> tuple[str, dict] | None:
+        """Return (state, attributes) of a detail sensor.
+
+        Prefers the coordinator snapshot and falls back to the state machine
+        when the detail sensor has not published a result yet.
+        """
+        detail = self._get_snapshot_value(snapshot_field)
+        if detail:
+            return detail.get("forecast_text", ""), detail
+
+        detail_sensor = self._get_internal_state(key)
+        if detail_sensor and detail_sensor.state not in ("unknown", "unavailable"):
+            return detail_sensor.state, detail_sensor.attributes
+        return None
+
+    def _get_main_forecast(self, snapshot_field: str, attribute: str):
+        """Return a main sensor forecast ([text, number, letter]) from snapshot or state."""
+        forecast = self._get_snapshot_value(snapshot_field)
+        if forecast is not None:
+            return forecast
+
+        main_sensor = self._get_internal_state(ENTITY_MAIN)
+        if not main_sensor or main_sensor.state in ("unknown", "unavailable"):
+            return None
+        return main_sensor.attributes.get(attribute)
+
+    def _get_pressure_change_updated(self) -> datetime | None:
+        """Return when the pressure change was last calculated."""
+        updated = self._get_snapshot_value("pressure_change_updated")
+        if updated is not None:
+            return updated
+
+        pressure_change_sensor = self._get_internal_state(ENTITY_PRESSURE_CHANGE)
+        if pressure_change_sensor and pressure_change_sensor.last_updated:
+            return pressure_change_sensor.last_updated
+        return None
+
+    def _get_float_state(self, snapshot_field: str, key: str) -> float | None:
+        """Return a numeric value from the snapshot or the state of an internal sensor."""
+        value = self._get_snapshot_value(snapshot_field)
+        if value is not None:
+            return value
+
+        state = self._get_internal_state(key)
+        if state and state.state not in ("unknown", "unavailable", None):
+            try:
+                return float(state.state)
+            except (ValueError, TypeError):
+                pass
+        return None
 
     @property
     def device_info(self):
@@ -189,38 +427,34 @@ class LocalWeatherForecastEntity(RestoreEntity, SensorEntity):
             "sw_version": "3.1.27",
         }
 
-    async def _wait_for_entity(
-        self,
-        entity_id: str,
-        timeout: int = 30,
-        retry_interval: float = 1.0
-    ) -> bool:
-        """
-        Wait for an entity to become available.
-
-        Args:
-            entity_id: Entity ID to wait for
-            timeout: Maximum seconds to wait
-            retry_interval: Seconds between checks
+    @callback
+    def _async_expect_ready(self) -> None:
+        """Take part in the startup barrier of the entry (see readiness.py)."""
+        if self.coordinator is not None:
+            self.coordinator.readiness.async_expect(self.entity_id)
 
-        Returns:
-            True if entity became available, False if timeout
-        """
-        if not entity_id:
-            return False
+    @callback
+    def _async_mark_ready(self) -> None:
+        """Tell entities waiting for this entity that its first update is done."""
+        if self.coordinator is not None:
+            self.coordinator.readiness.async_mark_ready(self.entity_id)
 
-        elapsed = 0
-        while elapsed < timeout:
-            state = self.hass.states.get(entity_id)
-            if state and state.state not in ("unknown", "unavailable"):
-                _LOGGER.debug(f"Entity {entity_id} is now available (waited {elapsed}s)")
-                return True
+    async def _async_wait_for_upstream(self, entity_ids: list[str | None]) -> None:
+        """Wait at startup until the entities this entity reads are ready.
 
-            await asyncio.sleep(retry_interval)
-            elapsed += retry_interval
+        All waits of the entry share one timeout; without a coordinator the
+        entity does not wait.
 
-        _LOGGER.debug(f"Entity {entity_id} did not become available after {timeout}s")
-        return False
+        Args:
+            entity_ids: Source sensors and entities of this entry to wait for
+        """
+        if self.coordinator is None:
+            return
+        missing = await self.coordinator.readiness.async_wait(entity_ids)
+        if missing:
+            _LOGGER.debug(
+                "%s: starting without %s (not ready in time)", self.entity_id, ", ".join(missing)
+            )
 
     async def _get_sensor_value(
         self,
@@ -243,6 +477,10 @@ class LocalWeatherForecastEntity(RestoreEntity, SensorEntity):
         if not sensor_id:
             return default
 
+        if use_history:
+            # Remember valid states from now on for the unavailable fallback
+            self._last_known_good.async_track(sensor_id)
+
         state = self.hass.states.get(sensor_id)
 
         if state is None or state.state in ("unknown", "unavailable"):
@@ -260,13 +498,7 @@ class LocalWeatherForecastEntity(RestoreEntity, SensorEntity):
             if sensor_type:
                 unit = state.attributes.get("unit_of_measurement")
                 if unit:
-                    converted_value = UnitConverter.convert_sensor_value(value, sensor_type, unit)
-                    if converted_value != value:
-                        _LOGGER.debug(
-                            f"Converted {sensor_id}: {value} {unit} → {converted_value:.2f} "
-                            f"{UnitConverter.REQUIRED_UNITS.get(sensor_type, '')}"
-                        )
-                    value = converted_value
+                    value = UnitConverter.convert_entity_value(sensor_id, value, sensor_type, unit)
 
             # QC validation: reject NaN/Inf and out-of-range values
             if math.isnan(value) or math.isinf(value):
@@ -300,50 +532,12 @@ class LocalWeatherForecastEntity(RestoreEntity, SensorEntity):
         sensor_id: str,
         default: float | None = 0.0
     ) -> float | None:
-        """Get last known good value from entity registry or return default."""
-        try:
-            # Try to get the entity from entity registry
-            entity_reg = er.async_get(self.hass)
-            entity_entry = entity_reg.async_get(sensor_id)
-
-            if entity_entry:
-                # Try to get last state from recorder
-                recorder = get_instance(self.hass)
-                if recorder:
-                    # Get last valid state from history (last 24 hours)
-                    end_time = datetime.now()
-                    start_time = end_time - timedelta(hours=24)
-
-                    states = await recorder.async_add_executor_job(
-                        history.state_changes_during_period,
-                        self.hass,
-                        start_time,
-                        end_time,
-                        sensor_id
-                    )
-
-                    if states and sensor_id in states:
-                        # Get the most recent valid state
-                        for state in reversed(states[sensor_id]):
-                            if state.state not in ("unknown", "unavailable", None):
-                                try:
-                                    value = float(str(state.state))
-                                    _LOGGER.debug(
-                                        f"Retrieved historical value {value} for {sensor_id}"
-                                    )
-                                    return value
-                                except (ValueError, TypeError):
-                                    continue
-
-            _LOGGER.debug(
-                f"No historical data found for {sensor_id}, using default {default}"
-            )
-        except Exception as e:
-            _LOGGER.error(
-                f"Error retrieving historical data for {sensor_id}: {e}"
-            )
-
-        return default
+        """Get last known good value (see last_known_good.py) or return default."""
+        value = await self._last_known_good.async_get(sensor_id)
+        if value is None:
+            _LOGGER.debug("No historical data found for %s, using default %s", sensor_id, default)
+            return default
+        return value
 
 
 class LocalForecastMainSensor(LocalWeatherForecastEntity):
@@ -352,7 +546,7 @@ class LocalForecastMainSensor(LocalWeatherForecastEntity):
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
         """Initialize the main sensor."""
         super().__init__(hass, config_entry)
-        self._attr_unique_id = "local_forecast"  # Match original YAML entity_id
+        self._attr_unique_id = self._unique_id(ENTITY_MAIN)
         self._attr_name = "Local forecast"
         self._attr_icon = "mdi:weather-cloudy"
         self._state = None
@@ -379,13 +573,20 @@ class LocalForecastMainSensor(LocalWeatherForecastEntity):
         # Filter out None values
         sensors_to_track = [s for s in sensors_to_track if s]
 
-        # Also track internal sensors - they update independently and feed into Zambretti
-        # and temperature forecast calculations
-        sensors_to_track += [
-            "sensor.local_forecast_pressurechange",
-            "sensor.local_forecast_temperaturechange",
-            "sensor.local_forecast_zambretti_detail",
-        ]
+        # Also follow internal sensors - they update independently and feed into Zambretti
+        # and temperature forecast calculations. With a coordinator their results are
+        # pushed directly instead of round-tripping through the state machine.
+        if self.coordinator is not None:
+            self._async_track_coordinator(
+                {"pressure_change", "temperature_change", "zambretti_detail"},
+                self.async_update,
+            )
+        else:
+            sensors_to_track += [
+                self._internal_entity_id(ENTITY_PRESSURE_CHANGE),
+                self._internal_entity_id(ENTITY_TEMPERATURE_CHANGE),
+                self._internal_entity_id(ENTITY_ZAMBRETTI_DETAIL),
+            ]
 
         self.async_on_remove(
             async_track_state_change_event(
@@ -393,10 +594,19 @@ class LocalForecastMainSensor(LocalWeatherForecastEntity):
             )
         )
 
-        # Schedule initial update after HA has finished starting up
+        # Initial update after HA has started and the source sensors are ready
+        self._async_expect_ready()
+
         async def _initial_update(_hass):
-            await self.async_update()
-            self.async_write_ha_state()
+            await self._async_wait_for_upstream([
+                self.config_entry.data.get(CONF_PRESSURE_SENSOR),
+                self.config_entry.data.get(CONF_TEMPERATURE_SENSOR),
+            ])
+            try:
+                await self.async_update()
+                self.async_write_ha_state()
+            finally:
+                self._async_mark_ready()
 
         self.async_on_remove(async_at_start(self.hass, _initial_update))
 
@@ -404,12 +614,13 @@ class LocalForecastMainSensor(LocalWeatherForecastEntity):
         """Handle source sensor state changes."""
         await self._throttled_update(self.async_update)
 
+    @timed_stage(STAGE_MAIN_UPDATE)
     async def async_update(self) -> None:
         """Update the sensor."""
         config = self.config_entry.data
 
         # Get language index from centralized helper
-        lang_index = get_language_index(self.hass)
+        lang_index = get_language_index(self.hass, self.config_entry)
 
         # Get sensor values with automatic unit conversion
         pressure = await self._get_sensor_value(
@@ -446,11 +657,13 @@ class LocalForecastMainSensor(LocalWeatherForecastEntity):
         wind_data = self._calculate_wind_data(wind_direction or 0.0, wind_speed or 0.0)
 
         # Get pressure change from statistics sensor
-        pressure_change = await self._get_sensor_value(
-            "sensor.local_forecast_pressurechange",  # Match original YAML entity_id
-            default=0.0,
-            use_history=False
-        )
+        pressure_change = self._get_snapshot_value("pressure_change")
+        if pressure_change is None:
+            pressure_change = await self._get_sensor_value(
+                self._internal_entity_id(ENTITY_PRESSURE_CHANGE) or "",
+                default=0.0,
+                use_history=False
+            )
 
         # Calculate current conditions based on pressure
         # This is kept in sensor for reference/debugging, but NOT used in weather.py priority chain
@@ -497,6 +710,17 @@ class LocalForecastMainSensor(LocalWeatherForecastEntity):
             "forecast_temp_short": temp_short,  # List: [predicted_temp, interval_index] or string if unavailable
         }
 
+        if self.coordinator is not None:
+            self.coordinator.async_set_updated_data(
+                p0=self._attributes["p0"],
+                temperature=self._attributes["temperature"],
+                wind_data=wind_data,
+                zambretti=zambretti_forecast,
+                negretti=neg_zam_forecast,
+                pressure_trend=pressure_trend,
+                lang_index=lang_index,
+            )
+
     async def _calculate_temp_short_forecast(self, current_temp: float) -> list | str:
         """Calculate short-term temperature forecast using advanced TemperatureModel.
 
@@ -509,29 +733,31 @@ class LocalForecastMainSensor(LocalWeatherForecastEntity):
 
         Returns: [predicted_temp, interval_index] where interval: 0=first_time, 1=second_time, -1=unavailable
         """
-        # Get temperature change sensor
-        temp_change_sensor = self.hass.states.get("sensor.local_forecast_temperaturechange")
-        if not temp_change_sensor or temp_change_sensor.state in ("unknown", "unavailable"):
-            _LOGGER.debug(
-                f"Temperature change sensor not available: {temp_change_sensor.state if temp_change_sensor else 'not found'}"
-            )
-            return ["unavailable", -1]
+        # Get temperature change (coordinator snapshot first, then sensor state)
+        temp_change = self._get_snapshot_value("temperature_change")
+        if temp_change is None:
+            temp_change_sensor = self._get_internal_state(ENTITY_TEMPERATURE_CHANGE)
+            if not temp_change_sensor or temp_change_sensor.state in ("unknown", "unavailable"):
+                _LOGGER.debug(
+                    f"Temperature change sensor not available: {temp_change_sensor.state if temp_change_sensor else 'not found'}"
+                )
+                return ["unavailable", -1]
 
-        try:
-            temp_change = float(temp_change_sensor.state)
-        except (ValueError, TypeError):
-            _LOGGER.debug(f"Could not convert temperature change to float: {temp_change_sensor.state}")
-            return ["unavailable", -1]
+            try:
+                temp_change = float(temp_change_sensor.state)
+            except (ValueError, TypeError):
+                _LOGGER.debug(f"Could not convert temperature change to float: {temp_change_sensor.state}")
+                return ["unavailable", -1]
 
-        # Get Zambretti detail sensor for timing information
-        zambretti_detail = self.hass.states.get("sensor.local_forecast_zambretti_detail")
-        if not zambretti_detail or zambretti_detail.state in ("unknown", "unavailable"):
-            _LOGGER.debug(
-                f"Zambretti detail sensor not available: {zambretti_detail.state if zambretti_detail else 'not found'}"
-            )
+        # Get Zambretti detail for timing information
+        zambretti_detail = self._get_detail_forecast(
+            "zambretti_detail", ENTITY_ZAMBRETTI_DETAIL
+        )
+        if zambretti_detail is None:
+            _LOGGER.debug("Zambretti detail sensor not available")
             return ["unavailable", -1]
 
-        attrs = zambretti_detail.attributes
+        attrs = zambretti_detail[1]
         _LOGGER.debug(f"Zambretti detail attributes: {attrs}")
 
         # Get optional sensors for enhanced temperature modeling
@@ -787,7 +1013,7 @@ class LocalForecastPressureSensor(LocalWeatherForecastEntity):
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(hass, config_entry)
-        self._attr_unique_id = "local_forecast_pressure"  # Match original YAML entity_id
+        self._attr_unique_id = self._unique_id(ENTITY_PRESSURE)
         self._attr_name = "Local forecast Pressure"
         self._attr_device_class = SensorDeviceClass.ATMOSPHERIC_PRESSURE
         self._attr_native_unit_of_measurement = UnitOfPressure.HPA
@@ -805,21 +1031,29 @@ class LocalForecastPressureSensor(LocalWeatherForecastEntity):
             except (ValueError, TypeError):
                 pass
 
-        # Track main sensor
-        self.async_on_remove(
-            async_track_state_change_event(
-                self.hass,
-                [self._get_main_sensor_id()],
-                self._handle_main_update,
+        # Follow main sensor results
+        if self.coordinator is not None:
+            self._async_track_coordinator({"p0"}, self._update_from_main)
+        else:
+            self.async_on_remove(
+                async_track_state_change_event(
+                    self.hass,
+                    [self._internal_entity_id(ENTITY_MAIN)],
+                    self._handle_main_update,
+                )
             )
-        )
 
         # Initial update
         await self._update_from_main()
 
     async def _update_from_main(self):
         """Update from main sensor."""
-        main_sensor = self.hass.states.get("sensor.local_forecast")
+        p0 = self._get_snapshot_value("p0")
+        if p0 is not None:
+            self._state = float(p0)
+            return
+
+        main_sensor = self._get_internal_state(ENTITY_MAIN)
         if main_sensor and main_sensor.state != "unknown":
             p0 = main_sensor.attributes.get("p0")
             if p0 is not None:
@@ -841,7 +1075,7 @@ class LocalForecastTemperatureSensor(LocalWeatherForecastEntity):
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(hass, config_entry)
-        self._attr_unique_id = "local_forecast_temperature"  # Match original YAML entity_id
+        self._attr_unique_id = self._unique_id(ENTITY_TEMPERATURE)
         self._attr_name = "Local forecast temperature"
         self._attr_device_class = SensorDeviceClass.TEMPERATURE
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
@@ -859,21 +1093,29 @@ class LocalForecastTemperatureSensor(LocalWeatherForecastEntity):
             except (ValueError, TypeError):
                 pass
 
-        # Track main sensor
-        self.async_on_remove(
-            async_track_state_change_event(
-                self.hass,
-                [self._get_main_sensor_id()],
-                self._handle_main_update,
+        # Follow main sensor results
+        if self.coordinator is not None:
+            self._async_track_coordinator({"temperature"}, self._update_from_main)
+        else:
+            self.async_on_remove(
+                async_track_state_change_event(
+                    self.hass,
+                    [self._internal_entity_id(ENTITY_MAIN)],
+                    self._handle_main_update,
+                )
             )
-        )
 
         # Initial update
         await self._update_from_main()
 
     async def _update_from_main(self):
         """Update from main sensor."""
-        main_sensor = self.hass.states.get("sensor.local_forecast")
+        temp = self._get_snapshot_value("temperature")
+        if temp is not None:
+            self._state = float(temp)
+            return
+
+        main_sensor = self._get_internal_state(ENTITY_MAIN)
         if main_sensor and main_sensor.state != "unknown":
             temp = main_sensor.attributes.get("temperature")
             if temp is not None:
@@ -895,7 +1137,7 @@ class LocalForecastPressureChangeSensor(LocalWeatherForecastEntity):
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(hass, config_entry)
-        self._attr_unique_id = "local_forecast_pressurechange"  # Match original YAML entity_id (no underscore!)
+        self._attr_unique_id = self._unique_id(ENTITY_PRESSURE_CHANGE)
         self._attr_name = "Local forecast PressureChange"
         self._attr_device_class = SensorDeviceClass.ATMOSPHERIC_PRESSURE
         self._attr_native_unit_of_measurement = UnitOfPressure.HPA
@@ -903,6 +1145,7 @@ class LocalForecastPressureChangeSensor(LocalWeatherForecastEntity):
         self._attr_icon = "mdi:trending-up"
         self._state = 0.0
         self._history = []
+        self._history_store: ChangeHistoryStore | None = None
 
         # Determine pressure source: track QFE (source sensor) when ABSOLUTE
         # to avoid temperature-dependent QNH conversion artifact at high elevations.
@@ -910,40 +1153,60 @@ class LocalForecastPressureChangeSensor(LocalWeatherForecastEntity):
         pressure_type = config_entry.data.get(CONF_PRESSURE_TYPE, DEFAULT_PRESSURE_TYPE)
         if pressure_type == PRESSURE_TYPE_RELATIVE:
             self._use_qfe = False
-            self._source_sensor_id = "sensor.local_forecast_pressure"
+            # The internal QNH sensor of this entry is resolved again once added.
+            self._source_sensor_id = f"{Platform.SENSOR}.{ENTITY_PRESSURE}"
         else:
             self._use_qfe = True
-            self._source_sensor_id = config_entry.data.get(CONF_PRESSURE_SENSOR, "sensor.local_forecast_pressure")
+            self._source_sensor_id = config_entry.data.get(
+                CONF_PRESSURE_SENSOR, f"{Platform.SENSOR}.{ENTITY_PRESSURE}"
+            )
+
+    @property
+    def _history(self) -> SlidingWindow:
+        """Return retained readings as (timestamp, value), oldest first."""
+        return self._window
+
+    @_history.setter
+    def _history(self, records) -> None:
+        """Replace retained readings (restore, or clear after a source change)."""
+        self._window = SlidingWindow(
+            timedelta(minutes=PRESSURE_CHANGE_MINUTES), PRESSURE_MIN_RECORDS, records
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Flush the history so a reload restores the latest readings."""
+        await super().async_will_remove_from_hass()
+        if self._history_store is not None:
+            await self._history_store.async_flush(lambda: list(self._history))
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
 
-        # Restore previous state AND history
+        # Restore previous state
         if (last_state := await self.async_get_last_state()) is not None:
             try:
                 self._state = float(last_state.state)
-
-                # Restore history from attributes
-                if last_state.attributes.get("history"):
-                    restored_history = []
-                    for entry in last_state.attributes["history"]:
-                        try:
-                            # entry format: [timestamp_iso, pressure_value]
-                            timestamp = datetime.fromisoformat(entry[0])
-                            pressure = float(entry[1])
-                            restored_history.append((timestamp, pressure))
-                        except (ValueError, TypeError, IndexError):
-                            continue
-
-                    if restored_history:
-                        self._history = restored_history
-                        _LOGGER.debug(
-                            f"PressureChange: Restored {len(self._history)} historical values from previous session"
-                        )
             except (ValueError, TypeError):
                 pass
 
+        # Restore history from storage (falls back to legacy state attribute once)
+        self._history_store = ChangeHistoryStore(
+            self.hass, self.config_entry.entry_id, PRESSURE_CHANGE_HISTORY
+        )
+        restored_history = await self._history_store.async_load()
+        if not restored_history and last_state is not None:
+            restored_history = self._parse_legacy_history(last_state.attributes)
+        if restored_history:
+            self._history = restored_history
+            _LOGGER.debug(
+                f"PressureChange: Restored {len(self._history)} historical values from previous session"
+            )
+
+        if not self._use_qfe:
+            # Internal QNH sensor of this entry (added before this sensor)
+            self._source_sensor_id = self._internal_entity_id(ENTITY_PRESSURE)
+
         # Upgrade guard: restored history may contain QNH values (~1021 hPa)
         # while sensor now tracks QFE (~897 hPa). The 124 hPa gap would trigger
         # spike rejection on every new reading, permanently blocking updates.
@@ -954,7 +1217,9 @@ class LocalForecastPressureChangeSensor(LocalWeatherForecastEntity):
                     current_qfe = float(source_state.state)
                     unit = source_state.attributes.get("unit_of_measurement")
                     if unit and unit != UnitOfPressure.HPA:
-                        current_qfe = UnitConverter.convert_pressure(current_qfe, unit)
+                        current_qfe = UnitConverter.convert_entity_value(
+                            self._source_sensor_id, current_qfe, "pressure", unit
+                        )
                     last_stored = self._history[-1][1]
                     if abs(current_qfe - last_stored) > PRESSURE_SPIKE_LIMIT:
                         _LOGGER.info(
@@ -986,16 +1251,31 @@ class LocalForecastPressureChangeSensor(LocalWeatherForecastEntity):
                     if self._use_qfe:
                         unit = pressure_sensor.attributes.get("unit_of_measurement")
                         if unit and unit != UnitOfPressure.HPA:
-                            pressure = UnitConverter.convert_pressure(pressure, unit)
+                            pressure = UnitConverter.convert_entity_value(
+                                self._source_sensor_id, pressure, "pressure", unit
+                            )
                     timestamp = datetime.now()
                     self._history.append((timestamp, pressure))
+                    self._history_store.async_schedule_save(lambda: list(self._history))
                     _LOGGER.debug(
                         f"Pressure change sensor initialized with {pressure} hPa at {timestamp}"
                     )
                 except (ValueError, TypeError):
                     pass
 
+        # Share the restored value; detail sensors time their forecast from the last update
+        self._publish_state(last_state.last_updated if last_state is not None else dt_util.utcnow())
+
     @callback
+    def _publish_state(self, updated: datetime) -> None:
+        """Publish the current pressure change to the coordinator."""
+        if self.coordinator is not None:
+            self.coordinator.async_set_updated_data(
+                pressure_change=self._state, pressure_change_updated=updated
+            )
+
+    @callback
+    @timed_stage(STAGE_PRESSURE_CHANGE)
     def _handle_pressure_update(self, event):
         """Handle pressure sensor updates."""
         new_state = event.data.get("new_state")
@@ -1007,7 +1287,9 @@ class LocalForecastPressureChangeSensor(LocalWeatherForecastEntity):
                 if self._use_qfe:
                     unit = new_state.attributes.get("unit_of_measurement")
                     if unit and unit != UnitOfPressure.HPA:
-                        pressure = UnitConverter.convert_pressure(pressure, unit)
+                        pressure = UnitConverter.convert_entity_value(
+                            self._source_sensor_id, pressure, "pressure", unit
+                        )
 
                 timestamp = datetime.now()
 
@@ -1033,52 +1315,37 @@ class LocalForecastPressureChangeSensor(LocalWeatherForecastEntity):
 
                 _LOGGER.debug(f"PressureChange: New pressure reading: {pressure} hPa at {timestamp}")
 
-                # Add to history
-                self._history.append((timestamp, pressure))
-
-                # Keep records using BOTH time-based AND count-based limits:
+                # Add to history - the sliding window keeps records using BOTH
+                # time-based AND count-based limits:
                 # 1. Keep all records within 180 minutes (time window)
                 # 2. ALWAYS keep at least PRESSURE_MIN_RECORDS newest records (even if older)
                 # This ensures we have enough data even if sensor updates irregularly
-                cutoff = timestamp - timedelta(minutes=180)
-                time_filtered = [
-                    (ts, p) for ts, p in self._history if ts > cutoff
-                ]
-
-                # If we don't have enough records after time filtering, keep more
-                if len(time_filtered) < PRESSURE_MIN_RECORDS:
-                    # Keep the last PRESSURE_MIN_RECORDS records regardless of age
-                    self._history = self._history[-PRESSURE_MIN_RECORDS:]
-                    _LOGGER.debug(
-                        f"PressureChange: Kept {len(self._history)} records (minimum required, "
-                        f"time filter would leave only {len(time_filtered)})"
-                    )
-                else:
-                    self._history = time_filtered
-                    _LOGGER.debug(f"PressureChange: Kept {len(self._history)} records within 180-minute window")
+                self._history.add(timestamp, pressure)
+                _LOGGER.debug(
+                    f"PressureChange: Kept {len(self._history)} records "
+                    f"({self._history.window_count} within 180-minute window)"
+                )
 
-                # Calculate pressure change using linear regression (least-squares)
-                # WMO standard: 3-hour pressure tendency (SYNOP group 5appp)
-                # Use ONLY data within 180-min window for meteorological accuracy
-                cutoff_for_calc = timestamp - timedelta(minutes=180)
-                calc_data = [(ts, p) for ts, p in self._history if ts > cutoff_for_calc]
+                if self._history_store is not None:
+                    self._history_store.async_schedule_save(lambda: list(self._history))
 
+                # WMO standard: 3-hour pressure tendency (SYNOP group 5appp)
+                # Uses ONLY data within 180-min window for meteorological accuracy
                 # Fallback: if less than 2 points in 3h window, use all available
-                if len(calc_data) < 2:
-                    calc_data = self._history
+                change = self._history.change()
 
-                if len(calc_data) >= 2:
+                if change is not None:
                     # WMO SYNOP group 5appp: P(now) - P(oldest in 3h window)
-                    oldest = calc_data[0][1]
-                    newest = calc_data[-1][1]
-                    self._state = round(newest - oldest, 2)
+                    self._state = round(change, 2)
 
+                    calc_data = self._history.calculation_readings()
                     time_span = (calc_data[-1][0] - calc_data[0][0]).total_seconds() / 60.0
                     _LOGGER.debug(
                         f"PressureChange: Calculated change = {self._state} hPa "
                         f"over {time_span:.1f} minutes ({len(calc_data)}/{len(self._history)} points, WMO simple diff)"
                     )
                     self.async_write_ha_state()
+                    self._publish_state(dt_util.utcnow())
                 else:
                     _LOGGER.debug(f"PressureChange: Not enough data for calculation (have {len(self._history)} records)")
 
@@ -1094,13 +1361,8 @@ class LocalForecastPressureChangeSensor(LocalWeatherForecastEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        # Save history in ISO format for persistence across restarts
-        history_data = [
-            [ts.isoformat(), pressure]
-            for ts, pressure in self._history
-        ]
+        # Only a summary - the readings themselves are kept in the history store
         return {
-            "history": history_data,
             "history_count": len(self._history),
             "oldest_reading": self._history[0][0].isoformat() if self._history else None,
             "newest_reading": self._history[-1][0].isoformat() if self._history else None,
@@ -1113,7 +1375,7 @@ class LocalForecastTemperatureChangeSensor(LocalWeatherForecastEntity):
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(hass, config_entry)
-        self._attr_unique_id = "local_forecast_temperaturechange"  # Match original YAML entity_id (no underscore!)
+        self._attr_unique_id = self._unique_id(ENTITY_TEMPERATURE_CHANGE)
         self._attr_name = "Local forecast TemperatureChange"
         self._attr_device_class = SensorDeviceClass.TEMPERATURE
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
@@ -1121,60 +1383,86 @@ class LocalForecastTemperatureChangeSensor(LocalWeatherForecastEntity):
         self._attr_icon = "mdi:thermometer-lines"
         self._state = 0.0
         self._history = []
+        self._history_store: ChangeHistoryStore | None = None
+
+    @property
+    def _history(self) -> SlidingWindow:
+        """Return retained readings as (timestamp, value), oldest first."""
+        return self._window
+
+    @_history.setter
+    def _history(self, records) -> None:
+        """Replace retained readings (restore, or clear after a source change)."""
+        self._window = SlidingWindow(
+            timedelta(minutes=TEMPERATURE_CHANGE_MINUTES), TEMPERATURE_MIN_RECORDS, records
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Flush the history so a reload restores the latest readings."""
+        await super().async_will_remove_from_hass()
+        if self._history_store is not None:
+            await self._history_store.async_flush(lambda: list(self._history))
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
 
-        # Restore previous state AND history
+        # Restore previous state
         if (last_state := await self.async_get_last_state()) is not None:
             try:
                 self._state = float(last_state.state)
-
-                # Restore history from attributes
-                if last_state.attributes.get("history"):
-                    restored_history = []
-                    for entry in last_state.attributes["history"]:
-                        try:
-                            # entry format: [timestamp_iso, temperature_value]
-                            timestamp = datetime.fromisoformat(entry[0])
-                            temperature = float(entry[1])
-                            restored_history.append((timestamp, temperature))
-                        except (ValueError, TypeError, IndexError):
-                            continue
-
-                    if restored_history:
-                        self._history = restored_history
-                        _LOGGER.debug(
-                            f"TemperatureChange: Restored {len(self._history)} historical values from previous session"
-                        )
             except (ValueError, TypeError):
                 pass
 
-        # Track temperature sensor
-        self.async_on_remove(
-            async_track_state_change_event(
-                self.hass,
-                ["sensor.local_forecast_temperature"],
-                self._handle_temperature_update,
-            )
+        # Restore history from storage (falls back to legacy state attribute once)
+        self._history_store = ChangeHistoryStore(
+            self.hass, self.config_entry.entry_id, TEMPERATURE_CHANGE_HISTORY
         )
+        restored_history = await self._history_store.async_load()
+        if not restored_history and last_state is not None:
+            restored_history = self._parse_legacy_history(last_state.attributes)
+        if restored_history:
+            self._history = restored_history
+            _LOGGER.debug(
+                f"TemperatureChange: Restored {len(self._history)} historical values from previous session"
+            )
+
+        # Track the internal temperature sensor of this entry
+        temperature_entity_id = self._internal_entity_id(ENTITY_TEMPERATURE)
+        if temperature_entity_id:
+            self.async_on_remove(
+                async_track_state_change_event(
+                    self.hass,
+                    [temperature_entity_id],
+                    self._handle_temperature_update,
+                )
+            )
 
         # Add initial temperature value to history (only if history is empty)
         if not self._history:
-            temp_sensor = self.hass.states.get("sensor.local_forecast_temperature")
+            temp_sensor = self._get_internal_state(ENTITY_TEMPERATURE)
             if temp_sensor and temp_sensor.state not in ("unknown", "unavailable"):
                 try:
                     temperature = float(temp_sensor.state)
                     timestamp = datetime.now()
                     self._history.append((timestamp, temperature))
+                    self._history_store.async_schedule_save(lambda: list(self._history))
                     _LOGGER.debug(
                         f"Temperature change sensor initialized with {temperature}°C at {timestamp}"
                     )
                 except (ValueError, TypeError):
                     pass
 
+        self._publish_state()
+
+    @callback
+    def _publish_state(self) -> None:
+        """Publish the current temperature change to the coordinator."""
+        if self.coordinator is not None:
+            self.coordinator.async_set_updated_data(temperature_change=self._state)
+
     @callback
+    @timed_stage(STAGE_TEMPERATURE_CHANGE)
     def _handle_temperature_update(self, event):
         """Handle temperature sensor updates."""
         new_state = event.data.get("new_state")
@@ -1202,64 +1490,38 @@ class LocalForecastTemperatureChangeSensor(LocalWeatherForecastEntity):
 
                 _LOGGER.debug(f"TemperatureChange: New temperature reading: {temperature}°C at {timestamp}")
 
-                # Add to history
-                self._history.append((timestamp, temperature))
-
-                # Keep records using BOTH time-based AND count-based limits:
+                # Add to history - the sliding window keeps records using BOTH
+                # time-based AND count-based limits:
                 # 1. Keep all records within 60 minutes (time window)
                 # 2. ALWAYS keep at least TEMPERATURE_MIN_RECORDS newest records (even if older)
                 # This ensures we have enough data even if sensor updates irregularly
-                cutoff = timestamp - timedelta(minutes=60)
-                time_filtered = [
-                    (ts, t) for ts, t in self._history if ts > cutoff
-                ]
-
-                # If we don't have enough records after time filtering, keep more
-                if len(time_filtered) < TEMPERATURE_MIN_RECORDS:
-                    # Keep the last TEMPERATURE_MIN_RECORDS records regardless of age
-                    self._history = self._history[-TEMPERATURE_MIN_RECORDS:]
-                    _LOGGER.debug(
-                        f"TemperatureChange: Kept {len(self._history)} records (minimum required, "
-                        f"time filter would leave only {len(time_filtered)})"
-                    )
-                else:
-                    self._history = time_filtered
-                    _LOGGER.debug(f"TemperatureChange: Kept {len(self._history)} records within 60-minute window")
+                self._history.add(timestamp, temperature)
+                _LOGGER.debug(
+                    f"TemperatureChange: Kept {len(self._history)} records "
+                    f"({self._history.window_count} within 60-minute window)"
+                )
 
-                # Calculate temperature change using linear regression
-                # Use ONLY data within 60-min window for nowcasting accuracy
-                cutoff_for_calc = timestamp - timedelta(minutes=60)
-                calc_data = [(ts, t) for ts, t in self._history if ts > cutoff_for_calc]
+                if self._history_store is not None:
+                    self._history_store.async_schedule_save(lambda: list(self._history))
 
+                # Calculate temperature change using linear regression (running sums)
+                # Uses ONLY data within 60-min window for nowcasting accuracy
                 # Fallback: if less than 2 points in 1h window, use all available
-                if len(calc_data) < 2:
-                    calc_data = self._history
-
-                if len(calc_data) >= 2:
-                    n = len(calc_data)
-                    t0 = calc_data[0][0]
-                    times = [(ts - t0).total_seconds() / 60.0 for ts, _ in calc_data]
-                    temps = [t for _, t in calc_data]
-
-                    t_mean = sum(times) / n
-                    temp_mean = sum(temps) / n
-
-                    numerator = sum((t - t_mean) * (v - temp_mean) for t, v in zip(times, temps))
-                    denominator = sum((t - t_mean) ** 2 for t in times)
-
-                    if denominator > 0:
-                        slope = numerator / denominator  # °C per minute
-                        # Extrapolate to 60-minute (1h) change
-                        self._state = round(slope * 60, 2)
-                    else:
-                        self._state = 0.0
+                fit = self._history.linear_fit()
 
-                    time_span = times[-1]
+                if fit is not None:
+                    slope = fit[0]  # °C per second
+                    # Extrapolate to 60-minute (1h) change
+                    self._state = round(slope * 3600, 2)
+
+                    calc_data = self._history.calculation_readings()
+                    time_span = (calc_data[-1][0] - calc_data[0][0]).total_seconds() / 60.0
                     _LOGGER.debug(
                         f"TemperatureChange: Calculated change = {self._state}°C "
-                        f"over {time_span:.1f} minutes ({n}/{len(self._history)} points, regression)"
+                        f"over {time_span:.1f} minutes ({len(calc_data)}/{len(self._history)} points, regression)"
                     )
                     self.async_write_ha_state()
+                    self._publish_state()
                 else:
                     _LOGGER.debug(f"TemperatureChange: Not enough data for calculation (have {len(self._history)} records)")
 
@@ -1275,13 +1537,8 @@ class LocalForecastTemperatureChangeSensor(LocalWeatherForecastEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        # Save history in ISO format for persistence across restarts
-        history_data = [
-            [ts.isoformat(), temperature]
-            for ts, temperature in self._history
-        ]
+        # Only a summary - the readings themselves are kept in the history store
         return {
-            "history": history_data,
             "history_count": len(self._history),
             "oldest_reading": self._history[0][0].isoformat() if self._history else None,
             "newest_reading": self._history[-1][0].isoformat() if self._history else None,
@@ -1294,7 +1551,7 @@ class LocalForecastZambrettiDetailSensor(LocalWeatherForecastEntity):
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(hass, config_entry)
-        self._attr_unique_id = "local_forecast_zambretti_detail"  # Match original YAML entity_id
+        self._attr_unique_id = self._unique_id(ENTITY_ZAMBRETTI_DETAIL)
         self._attr_name = "Local forecast zambretti detail"
         self._attr_icon = "mdi:weather-cloudy-arrow-right"
         self._state = None
@@ -1315,23 +1572,22 @@ class LocalForecastZambrettiDetailSensor(LocalWeatherForecastEntity):
                 self._last_update_time = dt_util.now()
 
         # Track main sensor
-        self.async_on_remove(
-            async_track_state_change_event(
-                self.hass,
-                [self._get_main_sensor_id()],
-                self._handle_main_update,
+        if self.coordinator is not None:
+            self._async_track_coordinator({"zambretti"}, self._update_from_main, throttle=False)
+        else:
+            self.async_on_remove(
+                async_track_state_change_event(
+                    self.hass,
+                    [self._internal_entity_id(ENTITY_MAIN)],
+                    self._handle_main_update,
+                )
             )
-        )
 
-        # Schedule periodic updates every 10 minutes to keep forecast times current
-        from homeassistant.helpers.event import async_track_time_interval
-        self.async_on_remove(
-            async_track_time_interval(
-                self.hass,
-                self._periodic_update,
-                timedelta(minutes=10),
-            )
-        )
+        # Refresh forecast times and icons on the shared wall-clock schedule
+        self._async_track_detail_refresh()
+
+        # Ready for the enhanced and rain probability sensors once published
+        self._async_expect_ready()
 
         # Initial update
         await self._update_from_main()
@@ -1339,31 +1595,28 @@ class LocalForecastZambrettiDetailSensor(LocalWeatherForecastEntity):
         self.async_write_ha_state()
 
     @callback
-    def _periodic_update(self, now: datetime) -> None:
+    def _periodic_update(self, refresh: DetailRefresh) -> None:
         """Periodic update to refresh forecast times."""
         if self._state and self._attributes:
-            # Recalculate forecast times with current time
-            current_time = dt_util.now()
+            # Recalculate forecast times with the time of the tick
+            current_time = refresh.now
+            displayed = _detail_display(self._attributes)
 
             # SYNC: Re-synchronize reference time from pressure change sensor
             # This ensures consistent timing even during periodic updates
-            pressure_change_sensor = self.hass.states.get("sensor.local_forecast_pressurechange")
-            if pressure_change_sensor and pressure_change_sensor.last_updated:
+            pressure_change_updated = refresh.pressure_change_updated
+            if pressure_change_updated:
                 # Only update if pressure sensor was updated more recently
-                if self._last_update_time is None or pressure_change_sensor.last_updated > self._last_update_time:
-                    self._last_update_time = pressure_change_sensor.last_updated
+                if self._last_update_time is None or pressure_change_updated > self._last_update_time:
+                    self._last_update_time = pressure_change_updated
                     _LOGGER.debug(f"Zambretti: Synced reference time to {self._last_update_time}")
 
-            # Check if sun is below horizon for icon selection
-            sun_state = self.hass.states.get("sun.sun")
-            is_night = sun_state and sun_state.state == "below_horizon"
-
             # Get forecast states
             forecast_states = self._attributes.get("forecast", [3, 3])
 
             # Update icons based on current time of day
-            icon_now = self._get_icon_for_forecast(forecast_states[0], is_night)
-            icon_later = self._get_icon_for_forecast(forecast_states[1], is_night)
+            icon_now = self._get_icon_for_forecast(forecast_states[0], refresh.is_night)
+            icon_later = self._get_icon_for_forecast(forecast_states[1], refresh.is_night)
 
             # Recalculate dynamic timing
             first_time_data = self._calculate_interval_time(3, current_time)
@@ -1374,7 +1627,11 @@ class LocalForecastZambrettiDetailSensor(LocalWeatherForecastEntity):
             self._attributes["second_time"] = second_time_data
             self._attributes["icons"] = (icon_now, icon_later)
 
-            # Write updated state
+            # Subscribers use the minutes to the intervals, the state only
+            # shows the times and icons - skip the write if those are unchanged
+            self._publish_detail()
+            if _detail_display(self._attributes) == displayed:
+                return
             self.async_write_ha_state()
 
             _LOGGER.debug(
@@ -1383,14 +1640,8 @@ class LocalForecastZambrettiDetailSensor(LocalWeatherForecastEntity):
 
     async def _update_from_main(self):
         """Update from main sensor."""
-        main_sensor = self.hass.states.get("sensor.local_forecast")
-        if not main_sensor or main_sensor.state in ("unknown", "unavailable"):
-            return
-
-        attrs = main_sensor.attributes
-
         # Parse Zambretti forecast - expect list format: [text, number, letter]
-        zambretti = attrs.get("forecast_zambretti")
+        zambretti = self._get_main_forecast("zambretti", "forecast_zambretti")
         if not zambretti:
             return
 
@@ -1423,11 +1674,7 @@ class LocalForecastZambrettiDetailSensor(LocalWeatherForecastEntity):
 
         # Try to get pressure change sensor's last update time as reference
         # This is when the forecast was actually calculated
-        pressure_change_sensor = self.hass.states.get("sensor.local_forecast_pressurechange")
-        if pressure_change_sensor and pressure_change_sensor.last_updated:
-            reference_time = pressure_change_sensor.last_updated
-        else:
-            reference_time = now
+        reference_time = self._get_pressure_change_updated() or now
 
         # Check if forecast actually changed (different number)
         forecast_changed = False
@@ -1471,6 +1718,14 @@ class LocalForecastZambrettiDetailSensor(LocalWeatherForecastEntity):
             "first_time": first_time_data,  # List format ["HH:MM", minutes]
             "second_time": second_time_data,  # List format ["HH:MM", minutes]
         }
+        self._publish_detail()
+
+    @callback
+    def _publish_detail(self) -> None:
+        """Publish the detail attributes to the coordinator."""
+        if self.coordinator is not None:
+            self.coordinator.async_set_updated_data(zambretti_detail=dict(self._attributes))
+        self._async_mark_ready()
 
     def _calculate_interval_time(self, base_hours: int, current_time: datetime) -> list:
         """Calculate time to forecast interval with correction for old forecasts."""
@@ -1619,7 +1874,7 @@ class LocalForecastNegZamDetailSensor(LocalWeatherForecastEntity):
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(hass, config_entry)
-        self._attr_unique_id = "local_forecast_neg_zam_detail"  # Match original YAML entity_id
+        self._attr_unique_id = self._unique_id(ENTITY_NEG_ZAM_DETAIL)
         self._attr_name = "Local forecast neg_zam detail"
         self._attr_icon = "mdi:weather-cloudy-clock"
         self._state = None
@@ -1640,23 +1895,22 @@ class LocalForecastNegZamDetailSensor(LocalWeatherForecastEntity):
                 self._last_update_time = dt_util.now()
 
         # Track main sensor
-        self.async_on_remove(
-            async_track_state_change_event(
-                self.hass,
-                [self._get_main_sensor_id()],
-                self._handle_main_update,
+        if self.coordinator is not None:
+            self._async_track_coordinator({"negretti"}, self._update_from_main, throttle=False)
+        else:
+            self.async_on_remove(
+                async_track_state_change_event(
+                    self.hass,
+                    [self._internal_entity_id(ENTITY_MAIN)],
+                    self._handle_main_update,
+                )
             )
-        )
 
-        # Schedule periodic updates every 10 minutes to keep forecast times current
-        from homeassistant.helpers.event import async_track_time_interval
-        self.async_on_remove(
-            async_track_time_interval(
-                self.hass,
-                self._periodic_update,
-                timedelta(minutes=10),
-            )
-        )
+        # Refresh forecast times and icons on the shared wall-clock schedule
+        self._async_track_detail_refresh()
+
+        # Ready for the enhanced and rain probability sensors once published
+        self._async_expect_ready()
 
         # Initial update - always update from main sensor
         await self._update_from_main()
@@ -1664,31 +1918,28 @@ class LocalForecastNegZamDetailSensor(LocalWeatherForecastEntity):
         self.async_write_ha_state()
 
     @callback
-    def _periodic_update(self, now: datetime) -> None:
+    def _periodic_update(self, refresh: DetailRefresh) -> None:
         """Periodic update to refresh forecast times."""
         if self._state and self._attributes:
-            # Recalculate forecast times with current time
-            current_time = dt_util.now()
+            # Recalculate forecast times with the time of the tick
+            current_time = refresh.now
+            displayed = _detail_display(self._attributes)
 
             # SYNC: Re-synchronize reference time from pressure change sensor
             # This ensures consistent timing even during periodic updates
-            pressure_change_sensor = self.hass.states.get("sensor.local_forecast_pressurechange")
-            if pressure_change_sensor and pressure_change_sensor.last_updated:
+            pressure_change_updated = refresh.pressure_change_updated
+            if pressure_change_updated:
                 # Only update if pressure sensor was updated more recently
-                if self._last_update_time is None or pressure_change_sensor.last_updated > self._last_update_time:
-                    self._last_update_time = pressure_change_sensor.last_updated
+                if self._last_update_time is None or pressure_change_updated > self._last_update_time:
+                    self._last_update_time = pressure_change_updated
                     _LOGGER.debug(f"Negretti: Synced reference time to {self._last_update_time}")
 
-            # Check if sun is below horizon for icon selection
-            sun_state = self.hass.states.get("sun.sun")
-            is_night = sun_state and sun_state.state == "below_horizon"
-
             # Get forecast states
             forecast_states = self._attributes.get("forecast", [3, 3])
 
             # Update icons based on current time of day
-            icon_now = self._get_icon_for_forecast(forecast_states[0], is_night)
-            icon_later = self._get_icon_for_forecast(forecast_states[1], is_night)
+            icon_now = self._get_icon_for_forecast(forecast_states[0], refresh.is_night)
+            icon_later = self._get_icon_for_forecast(forecast_states[1], refresh.is_night)
 
             # Recalculate dynamic timing
             first_time_data = self._calculate_interval_time(3, current_time)
@@ -1699,7 +1950,11 @@ class LocalForecastNegZamDetailSensor(LocalWeatherForecastEntity):
             self._attributes["second_time"] = second_time_data
             self._attributes["icons"] = (icon_now, icon_later)
 
-            # Write updated state
+            # Subscribers use the minutes to the intervals, the state only
+            # shows the times and icons - skip the write if those are unchanged
+            self._publish_detail()
+            if _detail_display(self._attributes) == displayed:
+                return
             self.async_write_ha_state()
 
             _LOGGER.debug(
@@ -1708,14 +1963,8 @@ class LocalForecastNegZamDetailSensor(LocalWeatherForecastEntity):
 
     async def _update_from_main(self):
         """Update from main sensor."""
-        main_sensor = self.hass.states.get("sensor.local_forecast")
-        if not main_sensor or main_sensor.state in ("unknown", "unavailable"):
-            return
-
-        attrs = main_sensor.attributes
-
         # Parse Negretti-Zambra forecast - expect list format: [text, number, letter]
-        neg_zam = attrs.get("forecast_neg_zam")
+        neg_zam = self._get_main_forecast("negretti", "forecast_neg_zam")
         if not neg_zam:
             return
 
@@ -1748,11 +1997,7 @@ class LocalForecastNegZamDetailSensor(LocalWeatherForecastEntity):
 
         # Try to get pressure change sensor's last update time as reference
         # This is when the forecast was actually calculated
-        pressure_change_sensor = self.hass.states.get("sensor.local_forecast_pressurechange")
-        if pressure_change_sensor and pressure_change_sensor.last_updated:
-            reference_time = pressure_change_sensor.last_updated
-        else:
-            reference_time = now
+        reference_time = self._get_pressure_change_updated() or now
 
         # Check if forecast actually changed (different number)
         forecast_changed = False
@@ -1796,6 +2041,14 @@ class LocalForecastNegZamDetailSensor(LocalWeatherForecastEntity):
             "first_time": first_time_data,  # List format ["HH:MM", minutes]
             "second_time": second_time_data,  # List format ["HH:MM", minutes]
         }
+        self._publish_detail()
+
+    @callback
+    def _publish_detail(self) -> None:
+        """Publish the detail attributes to the coordinator."""
+        if self.coordinator is not None:
+            self.coordinator.async_set_updated_data(negretti_detail=dict(self._attributes))
+        self._async_mark_ready()
 
     def _calculate_interval_time(self, base_hours: int, current_time: datetime) -> list:
         """Calculate time to forecast interval with correction for old forecasts."""
@@ -1952,7 +2205,7 @@ class LocalForecastEnhancedSensor(LocalWeatherForecastEntity):
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
         """Initialize the enhanced forecast sensor."""
         super().__init__(hass, config_entry)
-        self._attr_unique_id = "local_forecast_enhanced"
+        self._attr_unique_id = self._unique_id(ENTITY_ENHANCED)
         self._attr_name = "Local forecast Enhanced"
         self._attr_icon = "mdi:weather-partly-rainy"
         self._startup_retry_count = 0
@@ -1964,12 +2217,23 @@ class LocalForecastEnhancedSensor(LocalWeatherForecastEntity):
         await super().async_added_to_hass()
 
         # Track weather entity and main sensor changes for automatic updates
-        entities_to_track = [
-            "weather.local_weather_forecast_weather",  # Weather entity
-            "sensor.local_forecast",  # Main forecast sensor
-            "sensor.local_forecast_zambretti_detail",  # Detail sensor with 10-min timer
-            "sensor.local_forecast_neg_zam_detail",    # Detail sensor with 10-min timer
-        ]
+        # (the weather entity of this entry, if it is enabled and registered)
+        entities_to_track = []
+        weather_entity_id = self._internal_entity_id(ENTITY_WEATHER, Platform.WEATHER)
+        if weather_entity_id:
+            entities_to_track.append(weather_entity_id)
+        if self.coordinator is not None:
+            # Main and detail sensor results are pushed by the coordinator
+            self._async_track_coordinator(
+                {"p0", "pressure_change", "zambretti_detail", "negretti_detail"},
+                self.async_update,
+            )
+        else:
+            entities_to_track += [
+                self._internal_entity_id(ENTITY_MAIN),  # Main forecast sensor
+                self._internal_entity_id(ENTITY_ZAMBRETTI_DETAIL),  # Detail sensor with 10-min timer
+                self._internal_entity_id(ENTITY_NEG_ZAM_DETAIL),    # Detail sensor with 10-min timer
+            ]
 
         # Track ALL configured sensors for automatic updates
         # Only PRESSURE is truly required (in config.data)
@@ -2002,11 +2266,21 @@ class LocalForecastEnhancedSensor(LocalWeatherForecastEntity):
             )
         )
 
-        # Schedule initial update after HA has finished starting up
+        # Initial update after HA has started and the main and detail sensors are ready
+        self._async_expect_ready()
+
         async def _initial_update(_hass):
+            await self._async_wait_for_upstream([
+                self._internal_entity_id(ENTITY_MAIN),
+                self._internal_entity_id(ENTITY_ZAMBRETTI_DETAIL),
+                self._internal_entity_id(ENTITY_NEG_ZAM_DETAIL),
+            ])
             _LOGGER.debug("Enhanced: Running startup update")
-            await self.async_update()
-            self.async_write_ha_state()
+            try:
+                await self.async_update()
+                self.async_write_ha_state()
+            finally:
+                self._async_mark_ready()
 
         self.async_on_remove(async_at_start(self.hass, _initial_update))
 
@@ -2031,7 +2305,7 @@ class LocalForecastEnhancedSensor(LocalWeatherForecastEntity):
     def _get_beaufort_wind_type(self, wind_speed: float) -> str:
         """Get wind type description from Beaufort scale (multilingual)."""
         beaufort = get_beaufort_number(wind_speed)
-        return get_wind_type(self.hass, beaufort)
+        return get_wind_type(self.hass, beaufort, self.config_entry)
 
     def _get_atmosphere_stability(self, wind_speed: float, gust_ratio: float | None) -> str:
         """Determine atmospheric stability based on wind speed and gust ratio."""
@@ -2048,25 +2322,29 @@ class LocalForecastEnhancedSensor(LocalWeatherForecastEntity):
         _LOGGER.debug(f"Enhanced: Using forecast model: {forecast_model}")
 
         # Get base forecasts from detail sensors (they update independently)
-        zambretti_sensor = self.hass.states.get("sensor.local_forecast_zambretti_detail")
-        negretti_sensor = self.hass.states.get("sensor.local_forecast_neg_zam_detail")
+        zambretti_detail = self._get_detail_forecast(
+            "zambretti_detail", ENTITY_ZAMBRETTI_DETAIL
+        )
+        negretti_detail = self._get_detail_forecast(
+            "negretti_detail", ENTITY_NEG_ZAM_DETAIL
+        )
 
-        if zambretti_sensor and zambretti_sensor.state not in ("unknown", "unavailable"):
+        if zambretti_detail is not None:
             # ✅ SIMPLIFIED: Format is now [text, code]
             zambretti = [
-                zambretti_sensor.state,
-                zambretti_sensor.attributes.get("forecast_number", 0)
+                zambretti_detail[0],
+                zambretti_detail[1].get("forecast_number", 0)
             ]
             _LOGGER.debug(f"Enhanced: Zambretti from detail sensor - {zambretti[0]} (code={zambretti[1]})")
         else:
             _LOGGER.debug("Enhanced: Zambretti detail sensor unavailable, using defaults")
             zambretti = ["Unknown", 0]
 
-        if negretti_sensor and negretti_sensor.state not in ("unknown", "unavailable"):
+        if negretti_detail is not None:
             # ✅ SIMPLIFIED: Format is now [text, code]
             negretti = [
-                negretti_sensor.state,
-                negretti_sensor.attributes.get("forecast_number", 0)
+                negretti_detail[0],
+                negretti_detail[1].get("forecast_number", 0)
             ]
             _LOGGER.debug(f"Enhanced: Negretti from detail sensor - {negretti[0]} (code={negretti[1]})")
         else:
@@ -2079,7 +2357,7 @@ class LocalForecastEnhancedSensor(LocalWeatherForecastEntity):
         dewpoint = None
         humidity = None
 
-        weather_entity = self.hass.states.get("weather.local_weather_forecast_weather")
+        weather_entity = self._get_internal_state(ENTITY_WEATHER, Platform.WEATHER)
         if weather_entity and weather_entity.state not in ("unknown", "unavailable"):
             # Get temperature from weather entity
             temp_attr = weather_entity.attributes.get("temperature")
@@ -2177,23 +2455,23 @@ class LocalForecastEnhancedSensor(LocalWeatherForecastEntity):
         if humidity is not None:
             if humidity > 85:
                 adjustments.append("high_humidity")
-                adjustment_details.append(get_adjustment_text(self.hass, "high_humidity", f"{humidity:.1f}"))
+                adjustment_details.append(get_adjustment_text(self.hass, "high_humidity", f"{humidity:.1f}", self.config_entry))
             elif humidity < 40:
                 adjustments.append("low_humidity")
-                adjustment_details.append(get_adjustment_text(self.hass, "low_humidity", f"{humidity:.1f}"))
+                adjustment_details.append(get_adjustment_text(self.hass, "low_humidity", f"{humidity:.1f}", self.config_entry))
 
         # Dewpoint spread adjustment (fog/precipitation risk)
         # Use fog risk levels consistently with get_fog_risk() thresholds
         if dewpoint_spread is not None:
             if dewpoint_spread < 1.5:  # HIGH fog risk
                 adjustments.append("high_fog_risk")
-                adjustment_details.append(get_adjustment_text(self.hass, "high_fog_risk", f"{dewpoint_spread:.1f}"))
+                adjustment_details.append(get_adjustment_text(self.hass, "high_fog_risk", f"{dewpoint_spread:.1f}", self.config_entry))
             elif 1.5 <= dewpoint_spread < 2.5:  # MEDIUM fog risk
                 adjustments.append("medium_fog_risk")
-                adjustment_details.append(get_adjustment_text(self.hass, "medium_fog_risk", f"{dewpoint_spread:.1f}"))
+                adjustment_details.append(get_adjustment_text(self.hass, "medium_fog_risk", f"{dewpoint_spread:.1f}", self.config_entry))
             elif 2.5 <= dewpoint_spread < 4:  # LOW fog risk
                 adjustments.append("low_fog_risk")
-                adjustment_details.append(get_adjustment_text(self.hass, "low_fog_risk", f"{dewpoint_spread:.1f}"))
+                adjustment_details.append(get_adjustment_text(self.hass, "low_fog_risk", f"{dewpoint_spread:.1f}", self.config_entry))
 
         # Atmospheric stability (gust ratio)
         # Only evaluate for significant wind speeds (>3 m/s)
@@ -2202,10 +2480,10 @@ class LocalForecastEnhancedSensor(LocalWeatherForecastEntity):
         if gust_ratio is not None and wind_speed is not None and wind_speed > 3.0:
             if gust_ratio > 2.0:
                 adjustments.append("very_unstable")
-                adjustment_details.append(get_adjustment_text(self.hass, "very_unstable", f"{gust_ratio:.2f}"))
+                adjustment_details.append(get_adjustment_text(self.hass, "very_unstable", f"{gust_ratio:.2f}", self.config_entry))
             elif gust_ratio > 1.6:
                 adjustments.append("unstable")
-                adjustment_details.append(get_adjustment_text(self.hass, "unstable", f"{gust_ratio:.2f}"))
+                adjustment_details.append(get_adjustment_text(self.hass, "unstable", f"{gust_ratio:.2f}", self.config_entry))
         elif gust_ratio is not None and wind_speed <= 3.0:
             _LOGGER.debug(
                 f"Enhanced: Skipping gust ratio check for low wind speed "
@@ -2238,22 +2516,16 @@ class LocalForecastEnhancedSensor(LocalWeatherForecastEntity):
         else:
             # FORECAST_MODEL_ENHANCED - Use combined_model.py
             # Get current pressure for anticyclone detection
-            current_pressure = 1013.25  # Default
-            pressure_sensor = self.hass.states.get("sensor.local_forecast_pressure")
-            if pressure_sensor and pressure_sensor.state not in ("unknown", "unavailable", None):
-                try:
-                    current_pressure = float(pressure_sensor.state)
-                except (ValueError, TypeError):
-                    pass
+            current_pressure = self._get_float_state("p0", ENTITY_PRESSURE)
+            if current_pressure is None:
+                current_pressure = 1013.25  # Default
 
             # Get pressure change
-            pressure_change_sensor = self.hass.states.get("sensor.local_forecast_pressurechange")
-            pressure_change = 0.0
-            if pressure_change_sensor and pressure_change_sensor.state not in ("unknown", "unavailable", None):
-                try:
-                    pressure_change = float(pressure_change_sensor.state)
-                except (ValueError, TypeError):
-                    pass
+            pressure_change = self._get_float_state(
+                "pressure_change", ENTITY_PRESSURE_CHANGE
+            )
+            if pressure_change is None:
+                pressure_change = 0.0
 
             # ✅ USE COMBINED MODEL MODULE (✅ SIMPLIFIED - no letter!)
             (
@@ -2275,7 +2547,7 @@ class LocalForecastEnhancedSensor(LocalWeatherForecastEntity):
                 negretti_result=negretti,
                 forecast_number=export_forecast_num,
                 zambretti_weight=zambretti_weight,
-                lang_index=get_language_index(self.hass)
+                lang_index=get_language_index(self.hass, self.config_entry)
             )
 
         # Add adjustments to forecast text
@@ -2319,9 +2591,9 @@ class LocalForecastEnhancedSensor(LocalWeatherForecastEntity):
         snow_risk = "none"
         if temp is not None and temp <= 4 and dewpoint is not None and humidity is not None:
             # Get rain probability if available for better snow risk assessment
-            rain_prob_sensor = self.hass.states.get("sensor.local_forecast_rain_probability")
-            rain_prob = None
-            if rain_prob_sensor and rain_prob_sensor.state not in ("unknown", "unavailable", None):
+            rain_prob = self._get_snapshot_value("rain_probability")
+            rain_prob_sensor = self._get_internal_state(ENTITY_RAIN_PROBABILITY)
+            if rain_prob is None and rain_prob_sensor and rain_prob_sensor.state not in ("unknown", "unavailable", None):
                 try:
                     rain_prob = int(rain_prob_sensor.state.rstrip('%'))
                 except (ValueError, AttributeError):
@@ -2347,12 +2619,7 @@ class LocalForecastEnhancedSensor(LocalWeatherForecastEntity):
         current_pressure = None
         pressure_sensor_id = self.config_entry.options.get(CONF_PRESSURE_SENSOR) or self.config_entry.data.get(CONF_PRESSURE_SENSOR)
         if pressure_sensor_id:
-            pressure_sensor = self.hass.states.get("sensor.local_forecast_pressure")
-            if pressure_sensor and pressure_sensor.state not in ("unknown", "unavailable"):
-                try:
-                    current_pressure = float(pressure_sensor.state)
-                except (ValueError, TypeError):
-                    pass
+            current_pressure = self._get_float_state("p0", ENTITY_PRESSURE)
         if temp is not None and humidity is not None and current_pressure is not None:
             from datetime import datetime as _dt
             current_hour = _dt.now().hour
@@ -2361,7 +2628,7 @@ class LocalForecastEnhancedSensor(LocalWeatherForecastEntity):
                 risk_key = f"convective_risk_{convective_risk}"
                 dewpoint_str = f"{dewpoint:.1f}" if dewpoint is not None else "?"
                 adjustments.append(risk_key)
-                adjustment_details.append(get_adjustment_text(self.hass, risk_key, dewpoint_str))
+                adjustment_details.append(get_adjustment_text(self.hass, risk_key, dewpoint_str, self.config_entry))
                 _LOGGER.debug(f"Enhanced: Convective risk={convective_risk} (Td={dewpoint_str}°C)")
 
         self._state = enhanced_text
@@ -2389,18 +2656,20 @@ class LocalForecastEnhancedSensor(LocalWeatherForecastEntity):
             "frost_risk": frost_risk,  # "none", "low", "medium", "high", "critical"
             "convective_risk": convective_risk,  # "none", "low", "high"
             # Translated values for UI display
-            "fog_risk_text": get_fog_risk_text(self.hass, fog_risk),
-            "snow_risk_text": get_snow_risk_text(self.hass, snow_risk),
-            "frost_risk_text": get_frost_risk_text(self.hass, frost_risk),
-            "convective_risk_text": get_convective_risk_text(self.hass, convective_risk),
+            "fog_risk_text": get_fog_risk_text(self.hass, fog_risk, self.config_entry),
+            "snow_risk_text": get_snow_risk_text(self.hass, snow_risk, self.config_entry),
+            "frost_risk_text": get_frost_risk_text(self.hass, frost_risk, self.config_entry),
+            "convective_risk_text": get_convective_risk_text(self.hass, convective_risk, self.config_entry),
             "wind_speed": round(wind_speed, 2) if wind_speed is not None else None,
             "wind_gust": round(wind_gust, 2) if wind_gust is not None else None,
             "gust_ratio": round(gust_ratio, 2) if gust_ratio is not None else None,
             "wind_type": wind_type,
             "wind_beaufort_scale": wind_beaufort_number,
-            "atmosphere_stability": get_atmosphere_stability_text(self.hass, atmosphere_stability),  # Translated
+            "atmosphere_stability": get_atmosphere_stability_text(self.hass, atmosphere_stability, self.config_entry),  # Translated
             "accuracy_estimate": "~98%" if confidence in ["high", "very_high"] else "~94%",
         }
+        if self.coordinator is not None:
+            self.coordinator.async_set_updated_data(enhanced=dict(self._attributes))
         # Note: Home Assistant automatically writes state after async_update() completes
 
 
@@ -2413,7 +2682,7 @@ class LocalForecastRainProbabilitySensor(LocalWeatherForecastEntity):
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
         """Initialize the precipitation probability sensor."""
         super().__init__(hass, config_entry)
-        self._attr_unique_id = "local_forecast_rain_probability"
+        self._attr_unique_id = self._unique_id(ENTITY_RAIN_PROBABILITY)
         self._attr_name = "Local Forecast Precipitation Probability"
         # Icon will be dynamic based on temperature (snow vs rain)
         self._attr_icon = "mdi:weather-rainy"  # Default, updated in async_update
@@ -2427,10 +2696,16 @@ class LocalForecastRainProbabilitySensor(LocalWeatherForecastEntity):
         await super().async_added_to_hass()
 
         # Track detail sensors for updates
-        sensors_to_track = [
-            "sensor.local_forecast_zambretti_detail",
-            "sensor.local_forecast_neg_zam_detail",
-        ]
+        sensors_to_track = []
+        if self.coordinator is not None:
+            self._async_track_coordinator(
+                {"zambretti_detail", "negretti_detail"}, self.async_update
+            )
+        else:
+            sensors_to_track += [
+                self._internal_entity_id(ENTITY_ZAMBRETTI_DETAIL),
+                self._internal_entity_id(ENTITY_NEG_ZAM_DETAIL),
+            ]
 
         # Add optional sensors if configured
         humidity_sensor = self.config_entry.options.get(CONF_HUMIDITY_SENSOR) or self.config_entry.data.get(CONF_HUMIDITY_SENSOR)
@@ -2451,11 +2726,20 @@ class LocalForecastRainProbabilitySensor(LocalWeatherForecastEntity):
             )
         )
 
-        # Schedule initial update after HA has finished starting up
+        # Initial update after HA has started and the detail sensors are ready
+        self._async_expect_ready()
+
         async def _initial_update(_hass):
+            await self._async_wait_for_upstream([
+                self._internal_entity_id(ENTITY_ZAMBRETTI_DETAIL),
+                self._internal_entity_id(ENTITY_NEG_ZAM_DETAIL),
+            ])
             _LOGGER.debug("RainProb: Running startup update")
-            await self.async_update()
-            self.async_write_ha_state()
+            try:
+                await self.async_update()
+                self.async_write_ha_state()
+            finally:
+                self._async_mark_ready()
 
         self.async_on_remove(async_at_start(self.hass, _initial_update))
 
@@ -2489,8 +2773,12 @@ class LocalForecastRainProbabilitySensor(LocalWeatherForecastEntity):
         _LOGGER.debug(f"RainProb: Using forecast model: {forecast_model}")
 
         # Get detail sensors
-        zambretti_sensor = self.hass.states.get("sensor.local_forecast_zambretti_detail")
-        negretti_sensor = self.hass.states.get("sensor.local_forecast_neg_zam_detail")
+        zambretti_detail = self._get_detail_forecast(
+            "zambretti_detail", ENTITY_ZAMBRETTI_DETAIL
+        )
+        negretti_detail = self._get_detail_forecast(
+            "negretti_detail", ENTITY_NEG_ZAM_DETAIL
+        )
 
         # ✅ ALWAYS load BOTH probabilities (sensors run independently)
         # Only base_probability calculation respects model selection
@@ -2498,16 +2786,16 @@ class LocalForecastRainProbabilitySensor(LocalWeatherForecastEntity):
         negretti_prob = 0
 
         # Load Zambretti probability (always)
-        if zambretti_sensor and zambretti_sensor.state not in ("unknown", "unavailable"):
-            zambretti_rain = zambretti_sensor.attributes.get("rain_prob", [0, 0])
+        if zambretti_detail is not None:
+            zambretti_rain = zambretti_detail[1].get("rain_prob", [0, 0])
             zambretti_prob = sum(zambretti_rain) / len(zambretti_rain) if zambretti_rain else 0
             _LOGGER.debug(f"RainProb: Zambretti rain_prob={zambretti_rain} → avg={zambretti_prob}%")
         else:
             _LOGGER.debug("RainProb: Zambretti detail sensor unavailable")
 
         # Load Negretti probability (always)
-        if negretti_sensor and negretti_sensor.state not in ("unknown", "unavailable"):
-            negretti_rain = negretti_sensor.attributes.get("rain_prob", [0, 0])
+        if negretti_detail is not None:
+            negretti_rain = negretti_detail[1].get("rain_prob", [0, 0])
             negretti_prob = sum(negretti_rain) / len(negretti_rain) if negretti_rain else 0
             _LOGGER.debug(f"RainProb: Negretti rain_prob={negretti_rain} → avg={negretti_prob}%")
         else:
@@ -2539,26 +2827,20 @@ class LocalForecastRainProbabilitySensor(LocalWeatherForecastEntity):
             # Same logic as Enhanced sensor for consistency
 
             # Get current pressure
-            current_pressure = 1013.25  # Default
-            pressure_sensor = self.hass.states.get("sensor.local_forecast_pressure")
-            if pressure_sensor and pressure_sensor.state not in ("unknown", "unavailable", None):
-                try:
-                    current_pressure = float(pressure_sensor.state)
-                except (ValueError, TypeError):
-                    pass
+            current_pressure = self._get_float_state("p0", ENTITY_PRESSURE)
+            if current_pressure is None:
+                current_pressure = 1013.25  # Default
 
             # Get pressure change
-            pressure_change_sensor = self.hass.states.get("sensor.local_forecast_pressurechange")
-            pressure_change = 0.0
-            if pressure_change_sensor and pressure_change_sensor.state not in ("unknown", "unavailable", None):
-                try:
-                    pressure_change = float(pressure_change_sensor.state)
-                except (ValueError, TypeError):
-                    pass
+            pressure_change = self._get_float_state(
+                "pressure_change", ENTITY_PRESSURE_CHANGE
+            )
+            if pressure_change is None:
+                pressure_change = 0.0
 
             # Get dynamic weights (we don't need forecast_num, just weights)
-            zambretti_result = [zambretti_sensor.state if zambretti_sensor else "", 0, "A"]
-            negretti_result = [negretti_sensor.state if negretti_sensor else "", 0, "A"]
+            zambretti_result = [zambretti_detail[0] if zambretti_detail else "", 0, "A"]
+            negretti_result = [negretti_detail[0] if negretti_detail else "", 0, "A"]
 
             try:
                 (
@@ -2687,7 +2969,8 @@ class LocalForecastRainProbabilitySensor(LocalWeatherForecastEntity):
             temp_state = self.hass.states.get(temp_sensor_id)
             if temp_state and temp_state.state not in ("unknown", "unavailable", None):
                 try:
-                    temperature = UnitConverter.convert_sensor_value(
+                    temperature = UnitConverter.convert_entity_value(
+                        temp_sensor_id,
                         float(temp_state.state),
                         "temperature",
                         temp_state.attributes.get("unit_of_measurement", "°C")
@@ -2697,8 +2980,10 @@ class LocalForecastRainProbabilitySensor(LocalWeatherForecastEntity):
 
         # Get snow risk from enhanced sensor for consistent snow detection
         snow_risk = None
-        enhanced_sensor = self.hass.states.get("sensor.local_forecast_enhanced")
-        if enhanced_sensor and enhanced_sensor.state not in ("unknown", "unavailable", None):
+        enhanced_sensor = self._get_internal_state(ENTITY_ENHANCED)
+        if self._get_snapshot_value("enhanced"):
+            snow_risk = self.coordinator.data.enhanced.get("snow_risk")
+        elif enhanced_sensor and enhanced_sensor.state not in ("unknown", "unavailable", None):
             try:
                 enhanced_attrs = enhanced_sensor.attributes or {}
                 snow_risk = enhanced_attrs.get("snow_risk", None)
@@ -2777,6 +3062,11 @@ class LocalForecastRainProbabilitySensor(LocalWeatherForecastEntity):
             "zambretti_probability": round(zambretti_prob),
             "negretti_probability": round(negretti_prob),
         }
+        if self.coordinator is not None:
+            self.coordinator.async_set_updated_data(
+                rain_probability=self._state,
+                rain_probability_attributes=dict(self._attributes),
+            )
 
     def _get_factors_used(self, forecast_model, humidity, dewpoint_spread):
         """Get list of factors used in calculation based on selected model."""
@@ -2795,3 +3085,62 @@ class LocalForecastRainProbabilitySensor(LocalWeatherForecastEntity):
         if dewpoint_spread is not None:
             factors.append("Dewpoint spread")
         return factors
+
+
+class LocalForecastStageTimingSensor(LocalWeatherForecastEntity):
+    """Diagnostic sensor with the per-stage timings of the entry (stage_timing option)."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(hass, config_entry)
+        self._attr_unique_id = self._unique_id(ENTITY_STAGE_TIMING)
+        self._attr_name = "Local forecast stage timing"
+        self._attr_icon = "mdi:timer-outline"
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+        self._state: int | None = None
+        self._attributes: dict[str, Any] = {}
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass,
+                self._async_refresh,
+                timedelta(seconds=STAGE_TIMING_SENSOR_INTERVAL),
+            )
+        )
+        self._update_from_timings()
+
+    @callback
+    def _async_refresh(self, now: datetime) -> None:
+        """Publish the current timings."""
+        self._update_from_timings()
+        self.async_write_ha_state()
+
+    def _update_from_timings(self) -> None:
+        """Read the timings; the state is the number of timed calls."""
+        timings = self.stage_timings
+        stages = timings.as_dict() if timings is not None else {}
+        self._state = sum(stage["calls"] for stage in stages.values())
+        self._attributes = {
+            "stages": stages,
+            "update_counters": (
+                self.coordinator.update_counters() if self.coordinator is not None else {}
+            ),
+        }
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the state."""
+        return self._state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the state attributes."""
+        return self._attributes
@@ -0,0 +1,214 @@
+"""Time-based sliding window with incremental trend statistics.
+
+Used by the pressure and temperature change sensors.  Every reading is
+appended once and evicted once, so the cost per reading is amortized O(1)
+regardless of sensor update rate or window length:
+
+- Readings newer than ``newest - window`` are kept in the window deque.
+- Older readings are moved to a small "expired" deque that is only kept
+  while the total number of readings is below ``min_records`` (irregular
+  sensors still get enough data, same as the previous list-based filter).
+- Sums for least-squares regression (n, Σx, Σy, Σx², Σxy) are updated on
+  append/evict.  x is seconds relative to an origin that is periodically
+  moved to the oldest reading, which also clears accumulated rounding error.
+"""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta
+
+Reading = tuple[datetime, float]
+
+
+class SlidingWindow:
+    """Readings within a time window plus at least ``min_records`` newest readings."""
+
+    def __init__(
+        self,
+        window: timedelta,
+        min_records: int = 0,
+        records: Iterable[Reading] = (),
+    ) -> None:
+        """Initialize the window.
+
+        Args:
+            window: Length of the time window (e.g. 180 minutes)
+            min_records: Always retain at least this many newest readings
+            records: Initial readings ordered oldest first
+        """
+        self.window = window
+        self.min_records = min_records
+        self._window: deque[Reading] = deque()
+        self._expired: deque[Reading] = deque()
+        self._origin: datetime | None = None
+        self._sum_x = self._sum_y = self._sum_xx = self._sum_xy = 0.0
+        self.extend(records)
+
+    # Sequence protocol (readings ordered oldest first)
+
+    def __len__(self) -> int:
+        """Return the number of retained readings."""
+        return len(self._expired) + len(self._window)
+
+    def __iter__(self) -> Iterator[Reading]:
+        """Iterate over retained readings, oldest first."""
+        yield from self._expired
+        yield from self._window
+
+    def __getitem__(self, index: int) -> Reading:
+        """Return a retained reading (negative indexes count from newest)."""
+        expired_count = len(self._expired)
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("sliding window index out of range")
+        if index < expired_count:
+            return self._expired[index]
+        return self._window[index - expired_count]
+
+    def __eq__(self, other: object) -> bool:
+        """Compare retained readings with another sequence of readings."""
+        if isinstance(other, (SlidingWindow, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return a short description for debug logs."""
+        return f"SlidingWindow({len(self._window)} in window, {len(self._expired)} expired)"
+
+    # Updates
+
+    def append(self, reading: Reading) -> None:
+        """Add a reading (list compatible) and evict readings outside the window."""
+        self.add(reading[0], reading[1])
+
+    def add(self, timestamp: datetime, value: float) -> None:
+        """Add a reading and evict readings outside the window.
+
+        Readings must be added in chronological order.
+        """
+        self._window.append((timestamp, value))
+        self._add_to_sums(timestamp, value)
+
+        cutoff = timestamp - self.window
+        while self._window and self._window[0][0] <= cutoff:
+            old_ts, old_value = self._window.popleft()
+            self._remove_from_sums(old_ts, old_value)
+            self._expired.append((old_ts, old_value))
+
+        while self._expired and len(self) > self.min_records:
+            self._expired.popleft()
+
+        # Move the regression origin forward once it lags a full window behind
+        if self._window and self._window[0][0] - self._origin > self.window:
+            self._rebuild_sums()
+
+    def extend(self, records: Iterable[Reading]) -> None:
+        """Add several readings, oldest first."""
+        for timestamp, value in records:
+            self.add(timestamp, value)
+
+    def clear(self) -> None:
+        """Remove all readings."""
+        self._window.clear()
+        self._expired.clear()
+        self._rebuild_sums()
+
+    # Statistics
+
+    @property
+    def window_count(self) -> int:
+        """Return the number of readings inside the time window."""
+        return len(self._window)
+
+    @property
+    def oldest(self) -> Reading | None:
+        """Return the oldest retained reading."""
+        if self._expired:
+            return self._expired[0]
+        return self._window[0] if self._window else None
+
+    @property
+    def newest(self) -> Reading | None:
+        """Return the newest reading."""
+        return self._window[-1] if self._window else None
+
+    def calculation_readings(self) -> Iterable[Reading]:
+        """Return the readings trends are calculated from.
+
+        Readings inside the time window, or all retained readings when the
+        window holds fewer than two (sensor stopped updating for a while).
+        """
+        if len(self._window) >= 2:
+            return self._window
+        return self
+
+    def change(self) -> float | None:
+        """Return newest minus oldest value of the calculation readings.
+
+        This is the WMO SYNOP simple tendency (group 5appp for pressure).
+        """
+        if len(self) < 2:
+            return None
+        if len(self._window) >= 2:
+            return self._window[-1][1] - self._window[0][1]
+        return self._window[-1][1] - self.oldest[1]
+
+    def linear_fit(self) -> tuple[float, float] | None:
+        """Return the least-squares fit of the calculation readings.
+
+        Returns:
+            (slope in units per second, intercept = fitted value at the oldest
+            calculation reading), or None with fewer than two readings.
+            The slope is 0.0 if all readings have the same timestamp.
+        """
+        if len(self._window) >= 2:
+            n = len(self._window)
+            sum_x, sum_y, sum_xx, sum_xy = self._sum_x, self._sum_y, self._sum_xx, self._sum_xy
+            first_x = (self._window[0][0] - self._origin).total_seconds()
+        elif len(self) >= 2:
+            readings = list(self)
+            n = len(readings)
+            first_x = 0.0
+            xs = [(ts - readings[0][0]).total_seconds() for ts, _ in readings]
+            ys = [value for _, value in readings]
+            sum_x, sum_y = sum(xs), sum(ys)
+            sum_xx = sum(x * x for x in xs)
+            sum_xy = sum(x * y for x, y in zip(xs, ys))
+        else:
+            return None
+
+        denominator = n * sum_xx - sum_x * sum_x
+        if denominator <= 1e-9 * max(1.0, n * sum_xx):
+            return 0.0, sum_y / n
+
+        slope = (n * sum_xy - sum_x * sum_y) / denominator
+        intercept = (sum_y - slope * sum_x) / n
+        return slope, intercept + slope * first_x
+
+    # Internal helpers
+
+    def _add_to_sums(self, timestamp: datetime, value: float) -> None:
+        if self._origin is None:
+            self._origin = timestamp
+        x = (timestamp - self._origin).total_seconds()
+        self._sum_x += x
+        self._sum_y += value
+        self._sum_xx += x * x
+        self._sum_xy += x * value
+
+    def _remove_from_sums(self, timestamp: datetime, value: float) -> None:
+        x = (timestamp - self._origin).total_seconds()
+        self._sum_x -= x
+        self._sum_y -= value
+        self._sum_xx -= x * x
+        self._sum_xy -= x * value
+
+    def _rebuild_sums(self) -> None:
+        self._origin = self._window[0][0] if self._window else None
+        self._sum_x = self._sum_y = self._sum_xx = self._sum_xy = 0.0
+        for timestamp, value in self._window:
+            self._add_to_sums(timestamp, value)
@@ -0,0 +1,266 @@
+"""Cached solar ephemeris for day/night and sun angle queries.
+
+Forecast generation asks "is it night?" and "how high is the sun?" for every
+forecast hour.  Computing sunrise/sunset with astral for each hour is
+expensive, so the per-day values (declination, equation of time, sunrise,
+solar noon, sunset) are computed once per (date, latitude, longitude) with the
+NOAA solar position equations and cached.  Per-hour queries are then a few
+arithmetic operations on the cached day.
+
+All calculations are in UTC.  Naive datetimes are treated as UTC, same as the
+previous sun.sun/astral based code.  Pure Python - safe to call from an
+executor thread.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+import logging
+import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant, State
+
+_LOGGER = logging.getLogger(__name__)
+
+# Sun center 0.833° below horizon at sunrise/sunset (refraction + solar radius)
+SUNRISE_ELEVATION = -0.833
+
+
+def _fallback_is_night(check_time: datetime) -> bool:
+    """Fixed-hours night check used when no location is available."""
+    return check_time.hour >= 19 or check_time.hour < 7
+
+
+def _as_utc(when: datetime) -> datetime:
+    """Return when as an aware UTC datetime (naive = UTC)."""
+    if when.tzinfo is None:
+        return when.replace(tzinfo=timezone.utc)
+    return when.astimezone(timezone.utc)
+
+
+@dataclass(frozen=True)
+class DayEphemeris:
+    """Sun parameters for one solar day at one location.
+
+    sunrise/sunset are None during polar day or polar night.
+    """
+
+    day: date
+    latitude: float
+    longitude: float
+    declination: float  # radians
+    equation_of_time: float  # minutes
+    solar_noon: datetime
+    sunrise: datetime | None
+    sunset: datetime | None
+    polar_day: bool = False
+
+    def elevation(self, when: datetime) -> float:
+        """Return the sun elevation in degrees at the given time."""
+        when = _as_utc(when)
+        minutes = when.hour * 60 + when.minute + when.second / 60.0
+        true_solar_time = minutes + self.equation_of_time + 4.0 * self.longitude
+        hour_angle = math.radians(true_solar_time / 4.0 - 180.0)
+        lat = math.radians(self.latitude)
+        cos_zenith = (
+            math.sin(lat) * math.sin(self.declination)
+            + math.cos(lat) * math.cos(self.declination) * math.cos(hour_angle)
+        )
+        return 90.0 - math.degrees(math.acos(max(-1.0, min(1.0, cos_zenith))))
+
+    def is_night(self, when: datetime) -> bool:
+        """Return True if the sun is below the horizon."""
+        if self.sunrise is None:
+            return not self.polar_day
+        when = _as_utc(when)
+        return when < self.sunrise or when > self.sunset
+
+    def sun_angle_factor(self, when: datetime) -> float:
+        """Return 0.0 (night) to 1.0 (solar noon) for solar warming.
+
+        Half sine from sunrise to sunset, same shape the temperature model
+        used with sun.sun times.
+        """
+        if self.sunrise is None:
+            if not self.polar_day:
+                return 0.0
+            noon_elevation = self.elevation(self.solar_noon)
+            if noon_elevation <= 0:
+                return 0.0
+            return max(0.0, min(1.0, self.elevation(when) / noon_elevation))
+
+        when = _as_utc(when)
+        if when < self.sunrise or when >= self.sunset:
+            return 0.0
+        daylight = (self.sunset - self.sunrise).total_seconds()
+        phase = (when - self.sunrise).total_seconds() / daylight * math.pi
+        return max(0.0, min(1.0, math.sin(phase)))
+
+
+def _sun_parameters(julian_day: float) -> tuple[float, float]:
+    """Return (declination in radians, equation of time in minutes)."""
+    t = (julian_day - 2451545.0) / 36525.0
+    mean_long = math.radians((280.46646 + t * (36000.76983 + t * 0.0003032)) % 360.0)
+    mean_anomaly = math.radians(357.52911 + t * (35999.05029 - 0.0001537 * t))
+    eccentricity = 0.016708634 - t * (0.000042037 + 0.0000001267 * t)
+
+    center = (
+        math.sin(mean_anomaly) * (1.914602 - t * (0.004817 + 0.000014 * t))
+        + math.sin(2 * mean_anomaly) * (0.019993 - 0.000101 * t)
+        + math.sin(3 * mean_anomaly) * 0.000289
+    )
+    omega = math.radians(125.04 - 1934.136 * t)
+    apparent_long = math.radians(
+        math.degrees(mean_long) + center - 0.00569 - 0.00478 * math.sin(omega)
+    )
+    obliquity = math.radians(
+        23.0 + (26.0 + (21.448 - t * (46.815 + t * (0.00059 - t * 0.001813))) / 60.0) / 60.0
+        + 0.00256 * math.cos(omega)
+    )
+    declination = math.asin(math.sin(obliquity) * math.sin(apparent_long))
+
+    y = math.tan(obliquity / 2) ** 2
+    equation_of_time = 4.0 * math.degrees(
+        y * math.sin(2 * mean_long)
+        - 2 * eccentricity * math.sin(mean_anomaly)
+        + 4 * eccentricity * y * math.sin(mean_anomaly) * math.cos(2 * mean_long)
+        - 0.5 * y * y * math.sin(4 * mean_long)
+        - 1.25 * eccentricity * eccentricity * math.sin(2 * mean_anomaly)
+    )
+    return declination, equation_of_time
+
+
+@lru_cache(maxsize=64)
+def _compute_day(day: date, latitude: float, longitude: float) -> DayEphemeris:
+    """Compute (and cache) the ephemeris for one solar day."""
+    midnight = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+    # Julian day at local solar noon (approximately)
+    julian_day = day.toordinal() + 1721424.5 + 0.5 - longitude / 360.0
+    declination, equation_of_time = _sun_parameters(julian_day)
+
+    solar_noon = midnight + timedelta(minutes=720.0 - 4.0 * longitude - equation_of_time)
+
+    lat = math.radians(latitude)
+    cos_hour_angle = (
+        math.cos(math.radians(90.0 - SUNRISE_ELEVATION))
+        / (math.cos(lat) * math.cos(declination))
+        - math.tan(lat) * math.tan(declination)
+    ) if abs(latitude) < 90.0 else (1.0 if latitude * declination < 0 else -1.0)
+
+    if cos_hour_angle > 1.0:
+        # Sun never rises
+        return DayEphemeris(day, latitude, longitude, declination, equation_of_time, solar_noon, None, None)
+    if cos_hour_angle < -1.0:
+        # Sun never sets
+        return DayEphemeris(
+            day, latitude, longitude, declination, equation_of_time, solar_noon, None, None, polar_day=True
+        )
+
+    half_day = timedelta(minutes=4.0 * math.degrees(math.acos(cos_hour_angle)))
+    return DayEphemeris(
+        day,
+        latitude,
+        longitude,
+        declination,
+        equation_of_time,
+        solar_noon,
+        solar_noon - half_day,
+        solar_noon + half_day,
+    )
+
+
+def get_day_ephemeris(when: datetime | date, latitude: float, longitude: float) -> DayEphemeris:
+    """Return the cached ephemeris for the solar day containing when.
+
+    A datetime is mapped to its local solar date (UTC shifted by longitude),
+    so sunrise and sunset always belong to the same local day.
+
+    Args:
+        when: Time (or date) of interest
+        latitude: Latitude in degrees
+        longitude: Longitude in degrees (east positive)
+
+    Returns:
+        DayEphemeris for that day and location
+    """
+    latitude = round(float(latitude), 2)
+    longitude = round(float(longitude), 2)
+    if isinstance(when, datetime):
+        day = (_as_utc(when) + timedelta(hours=longitude / 15.0)).date()
+    else:
+        day = when
+    return _compute_day(day, latitude, longitude)
+
+
+def is_night(when: datetime, latitude: float, longitude: float) -> bool:
+    """Return True if the sun is below the horizon at the given time."""
+    return get_day_ephemeris(when, latitude, longitude).is_night(when)
+
+
+def solar_elevation(when: datetime, latitude: float, longitude: float) -> float:
+    """Return the sun elevation in degrees at the given time."""
+    return get_day_ephemeris(when, latitude, longitude).elevation(when)
+
+
+def sun_angle_factor(when: datetime, latitude: float, longitude: float) -> float:
+    """Return the sun angle factor (0.0 night - 1.0 solar noon) at the given time."""
+    return get_day_ephemeris(when, latitude, longitude).sun_angle_factor(when)
+
+
+def is_night_for_hass(hass: HomeAssistant | None, check_time: datetime) -> bool:
+    """Check if it's night at check_time for the Home Assistant location.
+
+    The current time uses the sun.sun state directly; other times use the
+    cached ephemeris for the configured location.  Falls back to fixed night
+    hours (19:00-07:00) without hass, sun.sun or a valid location.
+
+    Args:
+        hass: Home Assistant instance (optional)
+        check_time: Time to check
+
+    Returns:
+        True if sun is below horizon
+    """
+    if hass is None:
+        return _fallback_is_night(check_time)
+
+    return is_night_from_sun(
+        hass.states.get("sun.sun"), check_time, hass.config.latitude, hass.config.longitude
+    )
+
+
+def is_night_from_sun(
+    sun_state: State | None,
+    check_time: datetime,
+    latitude: float | None,
+    longitude: float | None,
+) -> bool:
+    """Check if it's night at check_time from a sun.sun state and a location.
+
+    Same rules as is_night_for_hass, but only uses the given values, so it
+    can run outside the event loop.
+
+    Args:
+        sun_state: State of sun.sun (None falls back to fixed night hours)
+        check_time: Time to check
+        latitude: Home Assistant latitude
+        longitude: Home Assistant longitude
+
+    Returns:
+        True if sun is below horizon
+    """
+    if not sun_state:
+        return _fallback_is_night(check_time)
+
+    # For current time (within 1 minute), just check state
+    if abs((_as_utc(check_time) - datetime.now(timezone.utc)).total_seconds()) < 60:
+        return sun_state.state == "below_horizon"
+
+    try:
+        return is_night(check_time, latitude, longitude)
+    except (TypeError, ValueError, AttributeError) as err:
+        _LOGGER.debug("Could not calculate sun times, using fallback: %s", err)
+        return _fallback_is_night(check_time)
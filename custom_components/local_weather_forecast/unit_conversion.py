@@ -1,6 +1,8 @@
 """Unit conversion utilities for Local Weather Forecast integration."""
 from __future__ import annotations
 
+from collections.abc import Callable
+import functools
 import logging
 
 from homeassistant.const import (
@@ -19,6 +21,95 @@ from homeassistant.util.unit_conversion import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Unit aliases → Home Assistant unit constants
+PRESSURE_UNIT_ALIASES = {
+    "hPa": UnitOfPressure.HPA,
+    "mbar": UnitOfPressure.MBAR,
+    "inHg": UnitOfPressure.INHG,
+    "mmHg": UnitOfPressure.MMHG,
+    "kPa": UnitOfPressure.KPA,
+    "Pa": UnitOfPressure.PA,
+    "psi": UnitOfPressure.PSI,
+}
+TEMPERATURE_UNIT_ALIASES = {
+    "C": UnitOfTemperature.CELSIUS,
+    "°C": UnitOfTemperature.CELSIUS,
+    "F": UnitOfTemperature.FAHRENHEIT,
+    "°F": UnitOfTemperature.FAHRENHEIT,
+    "K": UnitOfTemperature.KELVIN,
+}
+WIND_SPEED_UNIT_ALIASES = {
+    "m/s": UnitOfSpeed.METERS_PER_SECOND,
+    "km/h": UnitOfSpeed.KILOMETERS_PER_HOUR,
+    "kmh": UnitOfSpeed.KILOMETERS_PER_HOUR,
+    "mph": UnitOfSpeed.MILES_PER_HOUR,
+    "kn": UnitOfSpeed.KNOTS,
+    "kt": UnitOfSpeed.KNOTS,
+    "ft/s": UnitOfSpeed.FEET_PER_SECOND,
+    "fps": UnitOfSpeed.FEET_PER_SECOND,
+}
+PRECIPITATION_UNIT_ALIASES = {
+    "mm": UnitOfLength.MILLIMETERS,
+    "in": UnitOfLength.INCHES,
+}
+SOLAR_RADIATION_NATIVE_UNITS = ("W/m²", "W/m2", "watt/m²")
+SOLAR_RADIATION_LUX_UNITS = ("lx", "lux")
+LUX_TO_W_M2 = 0.0079  # Direct sunlight approximation (spectrum dependent)
+
+
+def _identity(value: float) -> float:
+    """Return the value unchanged (unit already correct or unknown)."""
+    return value
+
+
+def _lux_to_w_m2(value: float) -> float:
+    """Convert lux to W/m²."""
+    return value * LUX_TO_W_M2
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_converter(sensor_type: str, from_unit: str | None) -> Callable[[float], float]:
+    """Return the function converting a sensor type from a unit to the internal unit.
+
+    Uses the converter factories of Home Assistant (the same functions its
+    convert() calls), so results are identical to the convert_* methods.
+    Units a converter does not know are left unchanged, like in convert_*.
+
+    Args:
+        sensor_type: Type of sensor (pressure, temperature, wind_speed, ...)
+        from_unit: Source unit
+
+    Returns:
+        Converter taking and returning a float
+    """
+    if from_unit is None:
+        return _identity
+    try:
+        if sensor_type == "pressure":
+            return PressureConverter.converter_factory(
+                PRESSURE_UNIT_ALIASES.get(from_unit, from_unit), UnitOfPressure.HPA
+            )
+        if sensor_type == "temperature":
+            return TemperatureConverter.converter_factory(
+                TEMPERATURE_UNIT_ALIASES.get(from_unit, from_unit), UnitOfTemperature.CELSIUS
+            )
+        if sensor_type == "wind_speed":
+            return SpeedConverter.converter_factory(
+                WIND_SPEED_UNIT_ALIASES.get(from_unit, from_unit), UnitOfSpeed.METERS_PER_SECOND
+            )
+        if sensor_type == "precipitation":
+            base_unit = from_unit.replace("/h", "")
+            return DistanceConverter.converter_factory(
+                PRECIPITATION_UNIT_ALIASES.get(base_unit, base_unit), UnitOfLength.MILLIMETERS
+            )
+    except Exception as e:
+        _LOGGER.debug("No %s conversion from %s (%s), assuming internal unit", sensor_type, from_unit, e)
+        return _identity
+    if sensor_type == "solar_radiation" and from_unit in SOLAR_RADIATION_LUX_UNITS:
+        return _lux_to_w_m2
+    # Humidity is always in %, unknown solar units and sensor types are kept
+    return _identity
+
 
 class UnitConverter:
     """Handle unit conversions for weather sensors."""
@@ -33,6 +124,9 @@ class UnitConverter:
         "solar_radiation": "W/m²",  # W/m² for solar radiation
     }
 
+    # (entity_id, sensor_type) -> (unit the converter was resolved for, converter)
+    _entity_converters: dict[tuple[str, str], tuple[str | None, Callable[[float], float]]] = {}
+
     @staticmethod
     def convert_pressure(value: float, from_unit: str) -> float:
         """Convert pressure to hPa using Home Assistant's official converter.
@@ -45,24 +139,14 @@ class UnitConverter:
             Pressure in hPa
         """
         try:
-            # Normalize unit names for HA converter
-            unit_map = {
-                "hPa": UnitOfPressure.HPA,
-                "mbar": UnitOfPressure.MBAR,
-                "inHg": UnitOfPressure.INHG,
-                "mmHg": UnitOfPressure.MMHG,
-                "kPa": UnitOfPressure.KPA,
-                "Pa": UnitOfPressure.PA,
-                "psi": UnitOfPressure.PSI,
-            }
-            normalized_unit = unit_map.get(from_unit, from_unit)
+            normalized_unit = PRESSURE_UNIT_ALIASES.get(from_unit, from_unit)
             
             # Use Home Assistant's official PressureConverter for better precision
             result = PressureConverter.convert(value, normalized_unit, UnitOfPressure.HPA)
-            _LOGGER.debug(f"Pressure conversion: {value} {from_unit} → {result:.2f} hPa")
+            _LOGGER.debug("Pressure conversion: %s %s → %.2f hPa", value, from_unit, result)
             return result
         except Exception as e:
-            _LOGGER.debug(f"Pressure conversion error for {value} {from_unit}: {e}, assuming hPa")
+            _LOGGER.debug("Pressure conversion error for %s %s: %s, assuming hPa", value, from_unit, e)
             return value
 
     @staticmethod
@@ -77,22 +161,14 @@ class UnitConverter:
             Temperature in °C
         """
         try:
-            # Normalize unit names for HA converter
-            unit_map = {
-                "C": UnitOfTemperature.CELSIUS,
-                "°C": UnitOfTemperature.CELSIUS,
-                "F": UnitOfTemperature.FAHRENHEIT,
-                "°F": UnitOfTemperature.FAHRENHEIT,
-                "K": UnitOfTemperature.KELVIN,
-            }
-            normalized_unit = unit_map.get(from_unit, from_unit)
+            normalized_unit = TEMPERATURE_UNIT_ALIASES.get(from_unit, from_unit)
             
             # Use Home Assistant's official TemperatureConverter for consistency
             result = TemperatureConverter.convert(value, normalized_unit, UnitOfTemperature.CELSIUS)
-            _LOGGER.debug(f"Temperature conversion: {value} {from_unit} → {result:.2f} °C")
+            _LOGGER.debug("Temperature conversion: %s %s → %.2f °C", value, from_unit, result)
             return result
         except Exception as e:
-            _LOGGER.debug(f"Temperature conversion error for {value} {from_unit}: {e}, assuming °C")
+            _LOGGER.debug("Temperature conversion error for %s %s: %s, assuming °C", value, from_unit, e)
             return value
 
     @staticmethod
@@ -107,25 +183,14 @@ class UnitConverter:
             Wind speed in m/s
         """
         try:
-            # Normalize unit names for HA converter
-            unit_map = {
-                "m/s": UnitOfSpeed.METERS_PER_SECOND,
-                "km/h": UnitOfSpeed.KILOMETERS_PER_HOUR,
-                "kmh": UnitOfSpeed.KILOMETERS_PER_HOUR,
-                "mph": UnitOfSpeed.MILES_PER_HOUR,
-                "kn": UnitOfSpeed.KNOTS,
-                "kt": UnitOfSpeed.KNOTS,
-                "ft/s": UnitOfSpeed.FEET_PER_SECOND,
-                "fps": UnitOfSpeed.FEET_PER_SECOND,
-            }
-            normalized_unit = unit_map.get(from_unit, from_unit)
+            normalized_unit = WIND_SPEED_UNIT_ALIASES.get(from_unit, from_unit)
             
             # Use Home Assistant's official SpeedConverter for consistency
             result = SpeedConverter.convert(value, normalized_unit, UnitOfSpeed.METERS_PER_SECOND)
-            _LOGGER.debug(f"Wind speed conversion: {value} {from_unit} → {result:.2f} m/s")
+            _LOGGER.debug("Wind speed conversion: %s %s → %.2f m/s", value, from_unit, result)
             return result
         except Exception as e:
-            _LOGGER.debug(f"Wind speed conversion error for {value} {from_unit}: {e}, assuming m/s")
+            _LOGGER.debug("Wind speed conversion error for %s %s: %s, assuming m/s", value, from_unit, e)
             return value
 
     @staticmethod
@@ -145,22 +210,16 @@ class UnitConverter:
             is_rate = "/h" in from_unit
             base_unit = from_unit.replace("/h", "") if is_rate else from_unit
             
-            # Map common aliases to UnitOfLength constants
-            unit_map = {
-                "mm": UnitOfLength.MILLIMETERS,
-                "in": UnitOfLength.INCHES,
-            }
-            
-            normalized_unit = unit_map.get(base_unit, base_unit)
+            normalized_unit = PRECIPITATION_UNIT_ALIASES.get(base_unit, base_unit)
             
             # Use Home Assistant's official DistanceConverter
             result = DistanceConverter.convert(value, normalized_unit, UnitOfLength.MILLIMETERS)
             
             target_unit = "mm/h" if is_rate else "mm"
-            _LOGGER.debug(f"Precipitation conversion: {value} {from_unit} → {result:.2f} {target_unit}")
+            _LOGGER.debug("Precipitation conversion: %s %s → %.2f %s", value, from_unit, result, target_unit)
             return result
         except Exception as e:
-            _LOGGER.debug(f"Precipitation conversion error for {value} {from_unit}: {e}, assuming mm")
+            _LOGGER.debug("Precipitation conversion error for %s %s: %s, assuming mm", value, from_unit, e)
             return value
 
     @staticmethod
@@ -178,19 +237,19 @@ class UnitConverter:
         Returns:
             Solar radiation in W/m²
         """
-        if from_unit in ("W/m²", "W/m2", "watt/m²"):
-            _LOGGER.debug(f"Solar radiation conversion: {value} {from_unit} (no conversion needed)")
+        if from_unit in SOLAR_RADIATION_NATIVE_UNITS:
+            _LOGGER.debug("Solar radiation conversion: %s %s (no conversion needed)", value, from_unit)
             return value
 
         result = value
-        if from_unit in ("lx", "lux"):
+        if from_unit in SOLAR_RADIATION_LUX_UNITS:
             # Convert lux to W/m²
             # For direct sunlight: 1 lux ≈ 0.0079 W/m²
             # This is an approximation as the exact conversion depends on light spectrum
-            result = value * 0.0079
-            _LOGGER.debug(f"Solar radiation conversion: {value} {from_unit} → {result:.2f} W/m²")
+            result = _lux_to_w_m2(value)
+            _LOGGER.debug("Solar radiation conversion: %s %s → %.2f W/m²", value, from_unit, result)
         else:
-            _LOGGER.debug(f"Unknown solar radiation unit: {from_unit}, assuming W/m²")
+            _LOGGER.debug("Unknown solar radiation unit: %s, assuming W/m²", from_unit)
             return value
 
         return result
@@ -228,29 +287,52 @@ class UnitConverter:
         Returns:
             Converted value in required unit
         """
-        if from_unit is None:
-            _LOGGER.debug(f"Converting {sensor_type}: {value} (no unit specified, assuming correct unit)")
-            return value
+        return _resolve_converter(sensor_type, from_unit)(value)
 
-        _LOGGER.debug(f"Converting {sensor_type}: {value} {from_unit} to {cls.REQUIRED_UNITS.get(sensor_type)}")
+    @classmethod
+    def converter_for_entity(
+        cls,
+        entity_id: str,
+        sensor_type: str,
+        from_unit: str | None,
+    ) -> Callable[[float], float]:
+        """Return the converter of an entity, resolved again only when its unit changes.
 
-        if sensor_type == "pressure":
-            return cls.convert_pressure(value, from_unit)
-        elif sensor_type == "temperature":
-            return cls.convert_temperature(value, from_unit)
-        elif sensor_type == "wind_speed":
-            return cls.convert_wind_speed(value, from_unit)
-        elif sensor_type == "humidity":
-            # Humidity is always in %
-            _LOGGER.debug(f"Humidity: {value}% (no conversion needed)")
-            return value
-        elif sensor_type == "precipitation":
-            return cls.convert_precipitation(value, from_unit)
-        elif sensor_type == "solar_radiation":
-            return cls.convert_solar_radiation(value, from_unit)
-        else:
-            _LOGGER.debug(f"Unknown sensor type: {sensor_type}")
-            return value
+        Args:
+            entity_id: Entity ID of the sensor
+            sensor_type: Type of sensor
+            from_unit: Current unit_of_measurement of the entity
+
+        Returns:
+            Converter taking and returning a float
+        """
+        key = (entity_id, sensor_type)
+        cached = cls._entity_converters.get(key)
+        if cached is not None and cached[0] == from_unit:
+            return cached[1]
+
+        converter = _resolve_converter(sensor_type, from_unit)
+        cls._entity_converters[key] = (from_unit, converter)
+        _LOGGER.debug(
+            "Unit conversion for %s: %s %s → %s",
+            entity_id, sensor_type, from_unit, cls.REQUIRED_UNITS.get(sensor_type),
+        )
+        return converter
+
+    @classmethod
+    def convert_entity_value(
+        cls,
+        entity_id: str,
+        value: float,
+        sensor_type: str,
+        from_unit: str | None,
+    ) -> float:
+        """Convert a reading of an entity to the required internal unit.
+
+        Same result as convert_sensor_value, using the cached converter of
+        the entity (see converter_for_entity).
+        """
+        return cls.converter_for_entity(entity_id, sensor_type, from_unit)(value)
 
     @classmethod
     async def get_converted_value(
@@ -282,8 +364,13 @@ class UnitConverter:
             converted = cls.convert_sensor_value(value, sensor_type, unit)
 
             _LOGGER.debug(
-                f"Converted {entity_id}: {value} {unit} → {converted:.2f} "
-                f"{cls.REQUIRED_UNITS.get(sensor_type)}"
+                "Converted %s: %s %s → %.2f "
+                "%s",
+                entity_id,
+                value,
+                unit,
+                converted,
+                cls.REQUIRED_UNITS.get(sensor_type)
             )
 
             return (converted, unit)
@@ -352,7 +439,7 @@ class UnitConverter:
 
             return f"{converted_value:.{precision}f} {user_unit}"
         except Exception as e:
-            _LOGGER.debug(f"UI formatting error for {sensor_type} {value} → {user_unit}: {e}")
+            _LOGGER.debug("UI formatting error for %s %s → %s: %s", sensor_type, value, user_unit, e)
             return f"{value:.{precision}f} {user_unit}"
 
 
@@ -1,7 +1,11 @@
 """Weather entity for Local Weather Forecast integration."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
+import functools
 import logging
 from typing import Any
 
@@ -41,12 +45,19 @@ from homeassistant.components.weather import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
+    Platform,
     UnitOfPressure,
     UnitOfSpeed,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+    async_track_utc_time_change,
+)
 from homeassistant.helpers.entity import DeviceInfo
 
 from .calculations import (
@@ -68,6 +79,7 @@ from .const import (
     CONF_ELEVATION,
     CONF_ENABLE_WEATHER_ENTITY,
     CONF_FORECAST_MODEL,
+    CONF_FORECAST_TRACE,
     CONF_HEMISPHERE,
     CONF_HUMIDITY_SENSOR,
     CONF_LATITUDE,
@@ -80,15 +92,26 @@ from .const import (
     CONF_WIND_DIRECTION_SENSOR,
     CONF_WIND_GUST_SENSOR,
     CONF_WIND_SPEED_SENSOR,
+    CONF_WEATHER_UPDATE_DEBOUNCE,
     DEFAULT_ELEVATION,
     DEFAULT_ENABLE_WEATHER_ENTITY,
     DEFAULT_FORECAST_MODEL,
     DEFAULT_LATITUDE,
     DEFAULT_PRESSURE_TYPE,
+    DEFAULT_WEATHER_UPDATE_DEBOUNCE,
     DOMAIN,
+    ENTITY_ENHANCED,
+    ENTITY_MAIN,
+    ENTITY_PRESSURE,
+    ENTITY_PRESSURE_CHANGE,
+    ENTITY_RAIN_PROBABILITY,
+    ENTITY_TEMPERATURE_CHANGE,
+    ENTITY_WEATHER,
     FORECAST_MODEL_ENHANCED,
     FORECAST_MODEL_NEGRETTI,
     FORECAST_MODEL_ZAMBRETTI,
+    FORECAST_GENERATE_IN_EXECUTOR,
+    FORECAST_REFRESH_DELAY,
     GRAVITY_CONSTANT,
     KELVIN_OFFSET,
     LAPSE_RATE,
@@ -120,19 +143,81 @@ from .const import (
     PRESSURE_BOMB_CYCLONE_CHANGE,
     PRESSURE_EXTREME_HIGH_THRESHOLD,
     PRESSURE_HURRICANE_THRESHOLD,
+    WEATHER_UPDATE_DEBOUNCE_MAX,
+    WEATHER_UPDATE_DEBOUNCE_MIN,
+)
+from .coordinator import LocalForecastCoordinator, async_get_coordinator
+from .debug_trace import (
+    STAGE_DAILY_FORECAST,
+    STAGE_HOURLY_FORECAST,
+    STAGE_WEATHER_ATTRIBUTES,
+    STAGE_WEATHER_CONDITION,
+    ForecastTrace,
+    StageTimings,
+    timed_call,
+    timed_stage,
 )
+from .forecast_cache import ForecastCache, forecast_signature, quantize
 from .forecast_calculator import (
     DailyForecastGenerator,
+    ForecastEnvironment,
     HourlyForecastGenerator,
     PressureModel,
     TemperatureModel,
     ZambrettiForecaster,
 )
-from .language import get_wind_type, get_visibility_estimate
+from .language import get_language_index, get_wind_type, get_visibility_estimate
+from .solar_ephemeris import is_night_for_hass
 from .unit_conversion import UnitConverter
 
 _LOGGER = logging.getLogger(__name__)
 
+_FORECAST_STAGES = {"hourly": STAGE_HOURLY_FORECAST, "daily": STAGE_DAILY_FORECAST}
+
+
+def _snapshot_property(func: Callable[[Any], Any]) -> property:
+    """Property memoized in the sensor snapshot of the current state write.
+
+    Outside a snapshot (see LocalWeatherForecastWeather._sensor_snapshot) the
+    value is computed on every access, exactly like a plain property.
+    """
+    name = func.__name__
+
+    @functools.wraps(func)
+    def getter(self: LocalWeatherForecastWeather) -> Any:
+        snapshot = self._snapshot_values
+        if snapshot is None:
+            return func(self)
+        try:
+            return snapshot[name]
+        except KeyError:
+            value = snapshot[name] = func(self)
+            return value
+
+    return property(getter)
+
+
+def _is_precipitation_onset(old_state: str, new_state: str) -> bool:
+    """Return True if a rain rate changed from dry (or unknown) to raining.
+
+    Args:
+        old_state: Previous rain rate state
+        new_state: New rain rate state
+
+    Returns:
+        True if the new rate is above zero and the old one was not
+    """
+    try:
+        new_rate = float(new_state)
+    except (TypeError, ValueError):
+        return False
+    if new_rate <= 0:
+        return False
+    try:
+        return float(old_state) <= 0
+    except (TypeError, ValueError):
+        return True
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -168,7 +253,7 @@ class LocalWeatherForecastWeather(WeatherEntity):
     def __init__(self, entry: ConfigEntry) -> None:
         """Initialize the weather entity."""
         self._entry = entry
-        self._attr_unique_id = f"{entry.entry_id}_weather"
+        self._attr_unique_id = f"{entry.entry_id}_{ENTITY_WEATHER}"
         self._attr_name = "Weather"
         self._attr_device_info: DeviceInfo = DeviceInfo(
             identifiers={(DOMAIN, entry.entry_id)},
@@ -179,6 +264,19 @@ class LocalWeatherForecastWeather(WeatherEntity):
         )
         self._hail_conditions_present = False  # Track if atmospheric conditions favor hail (v3.1.10)
         self._theoretical_max_solar = None  # Cache calculated theoretical max (for solar_radiation_enhanced.yaml)
+        self._coordinator: LocalForecastCoordinator | None = None  # Set in async_added_to_hass
+        self._forecast_cache = ForecastCache()  # Hourly/daily forecast results
+        self._forecast_signatures: dict[str, tuple | None] = {}  # Last pushed forecast per type
+        self._forecast_refresh_unsub = None  # Pending background forecast refresh
+        self._forecast_in_flight: dict[tuple, asyncio.Future] = {}  # Executor jobs by (cache generation, key)
+        self._forecast_traces: dict[str, dict[str, Any]] = {}  # Last trace per forecast type (if enabled)
+        self._write_debouncer: Debouncer | None = None  # Coalesces sensor-driven state writes
+        # Sensor snapshot: every state read and derived property is computed
+        # once per state generation while a snapshot is active
+        self._state_generation = 0  # Bumped on every state write
+        self._snapshot_generation = -1  # Generation of _snapshot_memo
+        self._snapshot_memo: dict[str, Any] = {}
+        self._snapshot_values: dict[str, Any] | None = None  # Set while a snapshot is active
 
         # Log rain sensor configuration at startup
         rain_sensor_id = self._get_config(CONF_RAIN_RATE_SENSOR)
@@ -189,7 +287,16 @@ class LocalWeatherForecastWeather(WeatherEntity):
         """Run when entity is added to hass - set up sensor tracking."""
         await super().async_added_to_hass()
 
-        from homeassistant.helpers.event import async_track_state_change_event
+        # Bursts of sensor changes (one station update touches many sensors)
+        # result in a single state write at the end of the window
+        self._write_debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=self._get_write_debounce(),
+            immediate=False,
+            function=self.async_write_ha_state,
+        )
+        self.async_on_remove(self._write_debouncer.async_shutdown)
 
         # Collect ALL configured sensors from config_flow
         all_sensor_keys = [
@@ -231,10 +338,30 @@ class LocalWeatherForecastWeather(WeatherEntity):
         # 1. Sensors that didn't load during startup (will auto-refresh when they appear)
         # 2. Normal sensor updates during operation
         sensors_to_track = list(configured_sensors.values())
-        sensors_to_track += [
-            "sensor.local_forecast_pressurechange",
-            "sensor.local_forecast_temperaturechange",
-        ]
+
+        # Pressure/temperature trends are pushed by the coordinator when available
+        self._coordinator = async_get_coordinator(self.hass, self._entry)
+        if self._coordinator is not None:
+            self._coordinator.async_register_entity(self.unique_id, self.entity_id)
+            # Traces are reported by the config entry diagnostics
+            self._forecast_traces = self._coordinator.forecast_traces
+
+            @callback
+            def trends_updated(changed_fields: frozenset[str]) -> None:
+                """Handle new pressure/temperature trends - trigger weather entity update."""
+                self._async_schedule_forecast_refresh()
+                self._async_schedule_write()
+
+            self.async_on_remove(
+                self._coordinator.async_add_listener(
+                    trends_updated, {"pressure_change", "temperature_change"}
+                )
+            )
+        else:
+            sensors_to_track += [
+                self._internal_entity_id(ENTITY_PRESSURE_CHANGE),
+                self._internal_entity_id(ENTITY_TEMPERATURE_CHANGE),
+            ]
 
         if sensors_to_track:
             _LOGGER.debug(
@@ -257,50 +384,245 @@ class LocalWeatherForecastWeather(WeatherEntity):
                             f"({old_state.state} → {new_state.state}), triggering refresh"
                         )
 
-                    # Trigger weather entity state update
-                    self.async_write_ha_state()
+                    # Trigger weather entity state update. Cached forecasts stay valid:
+                    # the cache key only changes when a quantized input changes.
+                    self._async_schedule_forecast_refresh()
+                    if entity_id == self._get_config(CONF_RAIN_RATE_SENSOR) and _is_precipitation_onset(
+                        old_state.state, new_state.state
+                    ):
+                        # Rain starting must show up at once, not at the end of the window
+                        _LOGGER.debug(f"Weather: 🌧️ Precipitation started ({entity_id}), updating immediately")
+                        self._async_write_now()
+                    else:
+                        self._async_schedule_write()
 
             self.async_on_remove(
                 async_track_state_change_event(self.hass, sensors_to_track, sensor_state_changed)
             )
 
+        # Forecast hours move on every hour even without sensor changes
+        self.async_on_remove(
+            async_track_utc_time_change(
+                self.hass, self._async_refresh_forecasts, minute=0, second=5
+            )
+        )
+        self.async_on_remove(self._async_cancel_forecast_refresh)
+
+    def _get_write_debounce(self) -> float:
+        """Return the configured state write window in seconds, clamped to the allowed range."""
+        try:
+            cooldown = float(self._get_config(CONF_WEATHER_UPDATE_DEBOUNCE) or DEFAULT_WEATHER_UPDATE_DEBOUNCE)
+        except (TypeError, ValueError):
+            cooldown = DEFAULT_WEATHER_UPDATE_DEBOUNCE
+        return min(max(cooldown, WEATHER_UPDATE_DEBOUNCE_MIN), WEATHER_UPDATE_DEBOUNCE_MAX)
+
+    @callback
+    def _async_schedule_write(self) -> None:
+        """Request a state write, coalescing requests within the configured window."""
+        if self._write_debouncer is None:
+            self.async_write_ha_state()
+            return
+        # Options are stored without reloading the entry - pick up a changed window
+        self._write_debouncer.cooldown = self._get_write_debounce()
+        self._write_debouncer.async_schedule_call()
+
+    @callback
+    def _async_write_now(self) -> None:
+        """Write the state immediately, dropping a pending coalesced write."""
+        if self._write_debouncer is not None:
+            self._write_debouncer.async_cancel()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_schedule_forecast_refresh(self) -> None:
+        """Schedule a background forecast refresh, coalescing bursts of sensor changes."""
+        if self._forecast_refresh_unsub is None:
+            self._forecast_refresh_unsub = async_call_later(
+                self.hass, FORECAST_REFRESH_DELAY, self._async_refresh_forecasts
+            )
+
+    @callback
+    def _async_cancel_forecast_refresh(self) -> None:
+        """Cancel a pending forecast refresh."""
+        if self._forecast_refresh_unsub is not None:
+            self._forecast_refresh_unsub()
+            self._forecast_refresh_unsub = None
+
+    async def _async_refresh_forecasts(self, _now: datetime | None = None) -> None:
+        """Recompute forecasts and push them to subscribers if something visible changed.
+
+        Forecast types without subscribers are not computed. Results are
+        compared by forecast_signature(), so subscribers only get a websocket
+        update when a value or forecast hour actually changed.
+        """
+        self._async_cancel_forecast_refresh()
+
+        for forecast_type in ("hourly", "daily"):
+            if not self._forecast_listeners[forecast_type]:
+                # New subscribers get the current forecast from Home Assistant directly
+                self._forecast_signatures.pop(forecast_type, None)
+                continue
+
+            forecasts = await getattr(self, f"async_forecast_{forecast_type}")()
+            signature = forecast_signature(forecasts)
+            if forecast_type in self._forecast_signatures and signature == self._forecast_signatures[forecast_type]:
+                _LOGGER.debug(f"Weather: {forecast_type} forecast unchanged, not notifying subscribers")
+                continue
+
+            self._forecast_signatures[forecast_type] = signature
+            _LOGGER.debug(f"Weather: {forecast_type} forecast changed, notifying subscribers")
+            # Served from the forecast cache filled by the call above
+            await self.async_update_listeners([forecast_type])
+
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state, reading every sensor once for all properties."""
+        self._state_generation += 1
+        with self._sensor_snapshot():
+            super().async_write_ha_state()
+
+    @contextmanager
+    def _sensor_snapshot(self) -> Iterator[None]:
+        """Serve sensor states and derived properties from one snapshot.
+
+        The snapshot lives until the next state write, so forecast
+        generation following a write reuses the values the write computed.
+        Nested snapshots share the outer one.
+        """
+        if self._snapshot_values is not None:
+            yield
+            return
+        if self._snapshot_generation != self._state_generation:
+            self._snapshot_generation = self._state_generation
+            self._snapshot_memo = {}
+        self._snapshot_values = self._snapshot_memo
+        try:
+            yield
+        finally:
+            self._snapshot_values = None
+
+    def _get_state(self, entity_id: str) -> State | None:
+        """Get the state of an entity (memoized in the active sensor snapshot)."""
+        snapshot = self._snapshot_values
+        if snapshot is None:
+            return self.hass.states.get(entity_id)
+        key = f"state:{entity_id}"
+        try:
+            return snapshot[key]
+        except KeyError:
+            state = snapshot[key] = self.hass.states.get(entity_id)
+            return state
+
+    @_snapshot_property
+    def _solar_radiation(self) -> float | None:
+        """Return the solar radiation in W/m² (converted and QC checked), or None."""
+        solar_sensor_id = self._get_config(CONF_SOLAR_RADIATION_SENSOR)
+        if not solar_sensor_id:
+            return None
+        solar_state = self._get_state(solar_sensor_id)
+        if not solar_state or solar_state.state in ("unknown", "unavailable", None):
+            return None
+        try:
+            raw_value = float(solar_state.state)
+        except (ValueError, TypeError):
+            return None
+        unit = solar_state.attributes.get("unit_of_measurement", "W/m²")
+        # Convert to W/m² (from lux if needed)
+        converted = UnitConverter.convert_entity_value(
+            solar_sensor_id, raw_value, "solar_radiation", unit
+        )
+        return self._validate_sensor_value(converted, "solar_radiation", solar_sensor_id)
 
     def _get_config(self, key: str) -> Any:
         """Get configuration value from options or data."""
         return self._entry.options.get(key, self._entry.data.get(key))
 
     @property
+    def stage_timings(self) -> StageTimings | None:
+        """Return the stage timings of the entry, or None if disabled."""
+        if self._coordinator is None:
+            return None
+        return self._coordinator.stage_timings
+
+    def _internal_entity_id(self, key: str) -> str | None:
+        """Get the entity ID of an internal sensor of this entry."""
+        if self._coordinator is None:
+            return f"{Platform.SENSOR}.{key}"
+        return self._coordinator.entity_id(key)
+
+    def _get_internal_state(self, key: str):
+        """Get the state of an internal sensor of this entry, or None."""
+        entity_id = self._internal_entity_id(key)
+        if entity_id is None:
+            return None
+        return self._get_state(entity_id)
+
+    def _get_internal_value(self, snapshot_field: str, key: str) -> float | None:
+        """Get a numeric value computed by an internal sensor.
+
+        Prefers the coordinator snapshot and falls back to the sensor state.
+        """
+        if self._coordinator is not None:
+            value = getattr(self._coordinator.data, snapshot_field)
+            if value is not None:
+                return float(value)
+
+        state = self._get_internal_state(key)
+        if state and state.state not in ("unknown", "unavailable", None):
+            try:
+                return float(state.state)
+            except (ValueError, TypeError):
+                pass
+        return None
+
+    def _get_internal_attributes(self, snapshot_field: str, key: str) -> dict | None:
+        """Get the attributes published by an internal sensor.
+
+        Prefers the coordinator snapshot and falls back to the sensor state.
+        """
+        if self._coordinator is not None:
+            attributes = getattr(self._coordinator.data, snapshot_field)
+            if attributes:
+                return attributes
+
+        state = self._get_internal_state(key)
+        if state and state.state not in ("unknown", "unavailable", None):
+            return state.attributes or {}
+        return None
+
+    @_snapshot_property
     def native_temperature(self) -> float | None:
         """Return the temperature."""
         if not self.hass:
             return None
         temp_sensor = self._get_config(CONF_TEMPERATURE_SENSOR)
         if temp_sensor:
-            state = self.hass.states.get(temp_sensor)
+            state = self._get_state(temp_sensor)
             if state and state.state not in ("unknown", "unavailable"):
                 try:
                     value = float(state.state)
                     # Apply unit conversion
                     unit = state.attributes.get("unit_of_measurement")
                     if unit:
-                        return UnitConverter.convert_sensor_value(value, "temperature", unit)
+                        return UnitConverter.convert_entity_value(temp_sensor, value, "temperature", unit)
                     return value
                 except (ValueError, TypeError):
                     pass
         return None
 
-    @property
+    @_snapshot_property
     def native_pressure(self) -> float | None:
         """Return the pressure (sea-level / QNH).
 
-        Prefers the value from sensor.local_forecast_pressure (which already has
+        Prefers the value of the internal pressure sensor (which already has
         temp smoothing for QFE→QNH). Falls back to direct calculation if unavailable.
         """
         if not self.hass:
             return None
 
         # Prefer sensor entity (benefits from temp smoothing and input validation)
-        sensor_state = self.hass.states.get("sensor.local_forecast_pressure")
+        sensor_state = self._get_internal_state(ENTITY_PRESSURE)
         if sensor_state and sensor_state.state not in ("unknown", "unavailable"):
             try:
                 return float(sensor_state.state)
@@ -310,14 +632,14 @@ class LocalWeatherForecastWeather(WeatherEntity):
         # Fallback: calculate directly from source sensor
         pressure_sensor = self._get_config(CONF_PRESSURE_SENSOR)
         if pressure_sensor:
-            state = self.hass.states.get(pressure_sensor)
+            state = self._get_state(pressure_sensor)
             if state and state.state not in ("unknown", "unavailable"):
                 try:
                     value = float(state.state)
                     # Apply unit conversion
                     unit = state.attributes.get("unit_of_measurement")
                     if unit:
-                        value = UnitConverter.convert_sensor_value(value, "pressure", unit)
+                        value = UnitConverter.convert_entity_value(pressure_sensor, value, "pressure", unit)
 
                     # Convert station pressure (QFE) to sea-level pressure (QNH) if needed
                     pressure_type = self._get_config(CONF_PRESSURE_TYPE) or DEFAULT_PRESSURE_TYPE
@@ -355,14 +677,14 @@ class LocalWeatherForecastWeather(WeatherEntity):
                 return None
         return value
 
-    @property
+    @_snapshot_property
     def humidity(self) -> float | None:
         """Return the humidity."""
         if not self.hass:
             return None
         humidity_sensor = self._get_config(CONF_HUMIDITY_SENSOR)
         if humidity_sensor:
-            state = self.hass.states.get(humidity_sensor)
+            state = self._get_state(humidity_sensor)
             if state and state.state not in ("unknown", "unavailable"):
                 try:
                     value = float(state.state)
@@ -371,33 +693,33 @@ class LocalWeatherForecastWeather(WeatherEntity):
                     pass
         return None
 
-    @property
+    @_snapshot_property
     def native_wind_speed(self) -> float | None:
         """Return the wind speed."""
         if not self.hass:
             return None
         wind_speed_sensor = self._get_config(CONF_WIND_SPEED_SENSOR)
         if wind_speed_sensor:
-            state = self.hass.states.get(wind_speed_sensor)
+            state = self._get_state(wind_speed_sensor)
             if state and state.state not in ("unknown", "unavailable"):
                 try:
                     value = float(state.state)
                     unit = state.attributes.get("unit_of_measurement")
                     if unit:
-                        value = UnitConverter.convert_sensor_value(value, "wind_speed", unit)
+                        value = UnitConverter.convert_entity_value(wind_speed_sensor, value, "wind_speed", unit)
                     return self._validate_sensor_value(value, "wind_speed", wind_speed_sensor)
                 except (ValueError, TypeError):
                     pass
         return None
 
-    @property
+    @_snapshot_property
     def wind_bearing(self) -> float | str | None:
         """Return the wind bearing."""
         if not self.hass:
             return None
         wind_direction_sensor = self._get_config(CONF_WIND_DIRECTION_SENSOR)
         if wind_direction_sensor:
-            state = self.hass.states.get(wind_direction_sensor)
+            state = self._get_state(wind_direction_sensor)
             if state and state.state not in ("unknown", "unavailable"):
                 try:
                     value = float(state.state)
@@ -406,20 +728,20 @@ class LocalWeatherForecastWeather(WeatherEntity):
                     pass
         return None
 
-    @property
+    @_snapshot_property
     def native_wind_gust_speed(self) -> float | None:
         """Return the wind gust speed."""
         if not self.hass:
             return None
         wind_gust_sensor = self._get_config(CONF_WIND_GUST_SENSOR)
         if wind_gust_sensor:
-            state = self.hass.states.get(wind_gust_sensor)
+            state = self._get_state(wind_gust_sensor)
             if state and state.state not in ("unknown", "unavailable"):
                 try:
                     value = float(state.state)
                     unit = state.attributes.get("unit_of_measurement")
                     if unit:
-                        value = UnitConverter.convert_sensor_value(value, "wind_speed", unit)
+                        value = UnitConverter.convert_entity_value(wind_gust_sensor, value, "wind_speed", unit)
                         _LOGGER.debug(
                             f"Weather: Wind gust converted: {value} {unit} → {value:.2f} m/s"
                         )
@@ -428,7 +750,7 @@ class LocalWeatherForecastWeather(WeatherEntity):
                     pass
         return None
 
-    @property
+    @_snapshot_property
     def native_dew_point(self) -> float | None:
         """Return the dew point temperature."""
         if not self.hass:
@@ -442,7 +764,7 @@ class LocalWeatherForecastWeather(WeatherEntity):
 
         return None
 
-    @property
+    @_snapshot_property
     def feels_like(self) -> float | None:
         """Return the feels like temperature (alias for native_apparent_temperature).
 
@@ -466,7 +788,7 @@ class LocalWeatherForecastWeather(WeatherEntity):
         return 0.0
 
 
-    @property
+    @_snapshot_property
     def native_apparent_temperature(self) -> float | None:
         """Return the apparent temperature (feels like).
 
@@ -491,19 +813,7 @@ class LocalWeatherForecastWeather(WeatherEntity):
         wind_speed_kmh = (wind_speed * 3.6) if wind_speed else None
 
         # Get solar radiation (optional)
-        solar_radiation = None
-        solar_sensor_id = self._get_config(CONF_SOLAR_RADIATION_SENSOR)
-        if solar_sensor_id:
-            solar_state = self.hass.states.get(solar_sensor_id)
-            if solar_state and solar_state.state not in ("unknown", "unavailable"):
-                try:
-                    raw_value = float(solar_state.state)
-                    unit = solar_state.attributes.get("unit_of_measurement", "W/m²")
-                    # Convert to W/m² (from lux if needed)
-                    converted = UnitConverter.convert_solar_radiation(raw_value, unit)
-                    solar_radiation = self._validate_sensor_value(converted, "solar_radiation", solar_sensor_id)
-                except (ValueError, TypeError):
-                    pass
+        solar_radiation = self._solar_radiation
 
         # Calculate with all available sensors
         return calculate_apparent_temperature(
@@ -513,7 +823,7 @@ class LocalWeatherForecastWeather(WeatherEntity):
             solar_radiation
         )
 
-    @property
+    @_snapshot_property
     def cloud_coverage(self) -> int | None:
         """Return cloud coverage percentage (0-100) based on solar radiation.
         
@@ -527,18 +837,13 @@ class LocalWeatherForecastWeather(WeatherEntity):
         if not solar_sensor_id or not self.hass.states.is_state('sun.sun', 'above_horizon'):
             return None
 
-        solar_state = self.hass.states.get(solar_sensor_id)
-        sun_state = self.hass.states.get("sun.sun")
-        
-        if not solar_state or not sun_state or solar_state.state in ("unknown", "unavailable"):
+        sun_state = self._get_state("sun.sun")
+        if not sun_state:
             return None
 
         try:
             # Get measured solar radiation
-            raw_value = float(solar_state.state)
-            unit = solar_state.attributes.get("unit_of_measurement", "W/m²")
-            converted = UnitConverter.convert_solar_radiation(raw_value, unit)
-            solar_radiation = self._validate_sensor_value(converted, "solar_radiation", solar_sensor_id)
+            solar_radiation = self._solar_radiation
             if solar_radiation is None:
                 return None
             
@@ -563,7 +868,7 @@ class LocalWeatherForecastWeather(WeatherEntity):
 
         return None
 
-    @property
+    @_snapshot_property
     def native_visibility(self) -> float | None:
         """Return the visibility in km (native unit).
 
@@ -617,7 +922,7 @@ class LocalWeatherForecastWeather(WeatherEntity):
             return round(visibility_km, 1)
         return None
 
-    @property
+    @_snapshot_property
     def uv_index(self) -> float | None:
         """Return the UV index.
 
@@ -627,19 +932,8 @@ class LocalWeatherForecastWeather(WeatherEntity):
         if not self.hass:
             return None
 
-        solar_sensor_id = self._get_config(CONF_SOLAR_RADIATION_SENSOR)
-        if not solar_sensor_id:
-            return None
-
-        solar_state = self.hass.states.get(solar_sensor_id)
-        if not solar_state or solar_state.state in ("unknown", "unavailable"):
-            return None
-
         try:
-            raw_value = float(solar_state.state)
-            unit = solar_state.attributes.get("unit_of_measurement", "W/m²")
-            converted = UnitConverter.convert_solar_radiation(raw_value, unit)
-            solar_radiation = self._validate_sensor_value(converted, "solar_radiation", solar_sensor_id)
+            solar_radiation = self._solar_radiation
             if solar_radiation is None:
                 return None
 
@@ -667,14 +961,20 @@ class LocalWeatherForecastWeather(WeatherEntity):
         cache = {}
         
         # Read each sensor ONCE and cache for entire condition() execution
-        cache['pressure_change'] = self.hass.states.get("sensor.local_forecast_pressurechange")
-        cache['enhanced'] = self.hass.states.get("sensor.local_forecast_enhanced")
+        cache['pressure_change'] = self._get_internal_value(
+            "pressure_change", ENTITY_PRESSURE_CHANGE
+        )
+        cache['enhanced'] = self._get_internal_attributes(
+            "enhanced", ENTITY_ENHANCED
+        )
         rain_rate_sensor = self._get_config(CONF_RAIN_RATE_SENSOR)
-        cache['rain_rate'] = self.hass.states.get(rain_rate_sensor) if rain_rate_sensor else None
+        cache['rain_rate'] = self._get_state(rain_rate_sensor) if rain_rate_sensor else None
         solar_sensor = self._get_config(CONF_SOLAR_RADIATION_SENSOR)
-        cache['solar'] = self.hass.states.get(solar_sensor) if solar_sensor else None
-        cache['sun'] = self.hass.states.get("sun.sun")
-        cache['rain_prob'] = self.hass.states.get("sensor.local_forecast_rain_probability")
+        cache['solar'] = self._get_state(solar_sensor) if solar_sensor else None
+        cache['sun'] = self._get_state("sun.sun")
+        cache['rain_prob'] = self._get_internal_value(
+            "rain_probability", ENTITY_RAIN_PROBABILITY
+        )
         
         # Cache native values (from properties that don't call hass.states.get)
         cache['temp'] = self.native_temperature
@@ -702,13 +1002,7 @@ class LocalWeatherForecastWeather(WeatherEntity):
             return None
             
         # Get pressure change for bomb cyclone detection
-        pressure_change_sensor = cache['pressure_change']
-        pressure_change = 0.0
-        if pressure_change_sensor and pressure_change_sensor.state not in ("unknown", "unavailable", None):
-            try:
-                pressure_change = float(pressure_change_sensor.state)
-            except (ValueError, TypeError):
-                pass
+        pressure_change = cache['pressure_change'] or 0.0
 
         # EXCEPTIONAL: Extreme pressure (hurricane, bomb cyclone, extreme anticyclone)
         if pressure < PRESSURE_HURRICANE_THRESHOLD:
@@ -735,11 +1029,11 @@ class LocalWeatherForecastWeather(WeatherEntity):
         # HAIL: Check atmospheric conditions (actual detection in PRIORITY 1)
         temp = cache['temp']
         humidity = cache['humidity']
-        enhanced_sensor = cache['enhanced']
+        enhanced_attrs = cache['enhanced']
         
         gust_ratio = None
-        if enhanced_sensor and enhanced_sensor.state not in ("unknown", "unavailable"):
-            gust_ratio = enhanced_sensor.attributes.get("gust_ratio")
+        if enhanced_attrs is not None:
+            gust_ratio = enhanced_attrs.get("gust_ratio")
 
         # Wind gust from dedicated sensor (via cache)
         wind_gust = cache['wind_gust']
@@ -770,7 +1064,8 @@ class LocalWeatherForecastWeather(WeatherEntity):
             
         return None
 
-    @property
+    @_snapshot_property
+    @timed_stage(STAGE_WEATHER_CONDITION)
     def condition(self) -> str | None:
         """Return the current condition based on Zambretti forecast and current weather."""
         try:
@@ -1048,23 +1343,13 @@ class LocalWeatherForecastWeather(WeatherEntity):
                 current_hour = dt.now().hour
 
                 # Get rain/snow probability sensor value (used for multiple checks) - from cache
-                rain_prob_sensor = _cache['rain_prob']
-                rain_prob = 0
-                if rain_prob_sensor and rain_prob_sensor.state not in ("unknown", "unavailable", None):
-                    try:
-                        rain_prob = float(rain_prob_sensor.state)
-                    except (ValueError, TypeError):
-                        pass
+                rain_prob = _cache['rain_prob'] or 0
 
                 # Get snow risk sensor if available (v3.1.3+) - from cache
                 snow_risk = None
-                snow_risk_sensor = _cache['enhanced']
-                if snow_risk_sensor and snow_risk_sensor.state not in ("unknown", "unavailable", None):
-                    try:
-                        snow_risk_attrs = snow_risk_sensor.attributes or {}
-                        snow_risk = snow_risk_attrs.get("snow_risk", None)
-                    except (AttributeError, KeyError, TypeError):
-                        pass
+                snow_risk_attrs = _cache['enhanced']
+                if snow_risk_attrs is not None:
+                    snow_risk = snow_risk_attrs.get("snow_risk", None)
 
                 # Snow risk is prediction, not current observation - logged only
                 if snow_risk in ("high", "medium", "Vysoké riziko snehu", "Stredné riziko snehu"):
@@ -1139,10 +1424,7 @@ class LocalWeatherForecastWeather(WeatherEntity):
                 if solar_state and sun_state and solar_state.state not in ("unknown", "unavailable", None):
                     try:
                         # Get measured solar radiation
-                        raw_value = float(solar_state.state)
-                        unit = solar_state.attributes.get("unit_of_measurement", "W/m²")
-                        converted = UnitConverter.convert_solar_radiation(raw_value, unit)
-                        solar_radiation = self._validate_sensor_value(converted, "solar_radiation", solar_sensor_id)
+                        solar_radiation = self._solar_radiation
                         if solar_radiation is None:
                             raise ValueError("QC rejected")
                         
@@ -1708,7 +1990,7 @@ class LocalWeatherForecastWeather(WeatherEntity):
         import homeassistant.util.dt as dt_util
 
         # Get sun entity state
-        sun_entity = self.hass.states.get("sun.sun")
+        sun_entity = self._get_state("sun.sun")
 
         if check_time is None:
             # Check current time
@@ -1724,48 +2006,11 @@ class LocalWeatherForecastWeather(WeatherEntity):
                 _LOGGER.debug(f"Weather: Night check from time: {is_night} (hour={current_hour})")
                 return is_night
         else:
-            # For future times, compare with sunrise/sunset
-            if sun_entity:
-                next_sunrise = sun_entity.attributes.get("next_rising")
-                next_sunset = sun_entity.attributes.get("next_setting")
-
-                if next_sunrise and next_sunset:
-                    try:
-                        # Parse ISO format datetime strings with proper timezone handling
-                        sunrise_dt = dt_util.parse_datetime(next_sunrise)
-                        sunset_dt = dt_util.parse_datetime(next_sunset)
-
-                        if sunrise_dt is None or sunset_dt is None:
-                            # Fallback parsing
-                            sunrise_dt = datetime.fromisoformat(next_sunrise.replace('Z', '+00:00'))
-                            sunset_dt = datetime.fromisoformat(next_sunset.replace('Z', '+00:00'))
-
-                        # Make check_time timezone aware using HA's timezone
-                        if check_time.tzinfo is None:
-                            check_time = dt_util.as_local(check_time)
-
-                        # Convert all to same timezone for comparison
-                        sunrise_dt = dt_util.as_local(sunrise_dt)
-                        sunset_dt = dt_util.as_local(sunset_dt)
-                        check_time = dt_util.as_local(check_time)
-
-                        # If check time is before next sunrise, it's night
-                        # If check time is after next sunset, it's night
-                        # Otherwise it's day
-                        if sunrise_dt < sunset_dt:
-                            # Normal day: night is before sunrise or after sunset
-                            return check_time < sunrise_dt or check_time > sunset_dt
-                        else:
-                            # Crossing midnight
-                            return sunset_dt < check_time < sunrise_dt
-                    except (ValueError, AttributeError, TypeError) as e:
-                        _LOGGER.debug(f"Error parsing sun times: {e}")
-                        pass
-
-            # Fallback to simple time check
-            return check_time.hour >= 19 or check_time.hour < 7
+            # For future times, use the cached solar ephemeris (any day, not only the next sunrise/sunset)
+            return is_night_for_hass(self.hass, check_time)
 
     @property
+    @timed_stage(STAGE_WEATHER_ATTRIBUTES)
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
         if not self.hass:
@@ -1774,7 +2019,7 @@ class LocalWeatherForecastWeather(WeatherEntity):
         attrs = {}
 
         # Add forecast short term from main sensor
-        main_sensor = self.hass.states.get("sensor.local_forecast")
+        main_sensor = self._get_internal_state(ENTITY_MAIN)
         if main_sensor and main_sensor.state not in ("unknown", "unavailable"):
             main_attrs = main_sensor.attributes
             attrs["forecast_short_term"] = main_attrs.get("forecast_short_term", "Unknown")
@@ -1848,13 +2093,9 @@ class LocalWeatherForecastWeather(WeatherEntity):
             spread = temp - dewpoint
 
             # Get rain probability for snow risk calculation
-            rain_prob = 0
-            rain_prob_sensor = self.hass.states.get("sensor.local_forecast_rain_probability")
-            if rain_prob_sensor and rain_prob_sensor.state not in ("unknown", "unavailable", None):
-                try:
-                    rain_prob = float(rain_prob_sensor.state)
-                except (ValueError, TypeError):
-                    pass
+            rain_prob = self._get_internal_value(
+                "rain_probability", ENTITY_RAIN_PROBABILITY
+            ) or 0
 
             # Calculate snow risk (pass dewpoint, not spread - function calculates spread internally)
             snow_risk = get_snow_risk(temp, humidity, dewpoint, int(rain_prob) if rain_prob else None)
@@ -1894,13 +2135,17 @@ class LocalWeatherForecastWeather(WeatherEntity):
         # Add wind gust and gust ratio if available
         wind_gust_sensor_id = self._get_config(CONF_WIND_GUST_SENSOR)
         if wind_gust_sensor_id and wind_speed and wind_speed > 0.1:
-            wind_gust_state = self.hass.states.get(wind_gust_sensor_id)
+            wind_gust_state = self._get_state(wind_gust_sensor_id)
             if wind_gust_state and wind_gust_state.state not in ("unknown", "unavailable"):
                 try:
                     value = float(wind_gust_state.state)
                     # Apply unit conversion
                     unit = wind_gust_state.attributes.get("unit_of_measurement")
-                    wind_gust = UnitConverter.convert_sensor_value(value, "wind_speed", unit) if unit else value
+                    wind_gust = (
+                        UnitConverter.convert_entity_value(wind_gust_sensor_id, value, "wind_speed", unit)
+                        if unit
+                        else value
+                    )
                     attrs["wind_gust"] = round(wind_gust, 2)
                     if wind_speed and wind_speed > 0:
                         gust_ratio = wind_gust / wind_speed
@@ -1918,10 +2163,8 @@ class LocalWeatherForecastWeather(WeatherEntity):
                     pass
 
         # Add enhanced forecast details from Enhanced sensor
-        enhanced_sensor = self.hass.states.get("sensor.local_forecast_enhanced")
-        if enhanced_sensor and enhanced_sensor.state not in ("unknown", "unavailable"):
-            enhanced_attrs = enhanced_sensor.attributes or {}
-
+        enhanced_attrs = self._get_internal_attributes("enhanced", ENTITY_ENHANCED)
+        if enhanced_attrs is not None:
             # Add confidence and adjustments
             if "confidence" in enhanced_attrs:
                 attrs["forecast_confidence"] = enhanced_attrs["confidence"]
@@ -1931,15 +2174,16 @@ class LocalWeatherForecastWeather(WeatherEntity):
                 attrs["forecast_adjustment_details"] = enhanced_attrs["adjustment_details"]
 
         # Add rain probability if available
-        rain_prob_sensor = self.hass.states.get("sensor.local_forecast_rain_probability")
-        if rain_prob_sensor and rain_prob_sensor.state not in ("unknown", "unavailable"):
-            try:
-                attrs["rain_probability"] = int(float(rain_prob_sensor.state))
-                rain_attrs = rain_prob_sensor.attributes or {}
-                if "confidence" in rain_attrs:
-                    attrs["rain_confidence"] = rain_attrs["confidence"]
-            except (ValueError, TypeError):
-                pass
+        rain_prob = self._get_internal_value(
+            "rain_probability", ENTITY_RAIN_PROBABILITY
+        )
+        if rain_prob is not None:
+            attrs["rain_probability"] = int(rain_prob)
+            rain_attrs = self._get_internal_attributes(
+                "rain_probability_attributes", ENTITY_RAIN_PROBABILITY
+            ) or {}
+            if "confidence" in rain_attrs:
+                attrs["rain_confidence"] = rain_attrs["confidence"]
 
         # Add humidity if available
         humidity = self.humidity
@@ -1949,7 +2193,7 @@ class LocalWeatherForecastWeather(WeatherEntity):
         # Add visibility estimate based on fog risk
         if "fog_risk" in attrs:
             fog_risk = attrs["fog_risk"]
-            attrs["visibility_estimate"] = get_visibility_estimate(self.hass, fog_risk)
+            attrs["visibility_estimate"] = get_visibility_estimate(self.hass, fog_risk, self._entry)
 
         # Export theoretical_max_solar for use in solar_radiation_enhanced.yaml
         # This ensures EXACT synchronization (Python math.sin/exp vs Jinja2 approximations)
@@ -1967,7 +2211,7 @@ class LocalWeatherForecastWeather(WeatherEntity):
     def _get_beaufort_wind_type(self, wind_speed: float) -> str:
         """Get wind type description from Beaufort scale in current HA language."""
         beaufort = get_beaufort_number(wind_speed)
-        return get_wind_type(self.hass, beaufort)
+        return get_wind_type(self.hass, beaufort, self._entry)
 
     def _get_atmosphere_stability(self, wind_speed: float, gust_ratio: float | None) -> str:
         """Determine atmospheric stability based on wind speed and gust ratio."""
@@ -1977,7 +2221,9 @@ class LocalWeatherForecastWeather(WeatherEntity):
         """Return the daily forecast using advanced models."""
         _LOGGER.debug("async_forecast_daily called - generating with advanced models")
 
-        result = self._generate_advanced_daily_forecast(3)
+        with self._sensor_snapshot():
+            prepared = self._prepare_advanced_daily_forecast(3)
+        result = await self._async_generate_forecast("daily", prepared)
         _LOGGER.debug(f"async_forecast_daily returning {len(result) if result else 0} days")
         return result
 
@@ -1985,18 +2231,153 @@ class LocalWeatherForecastWeather(WeatherEntity):
         """Return the hourly forecast using advanced models."""
         _LOGGER.debug("async_forecast_hourly called - generating with advanced models")
 
-        result = self._generate_advanced_hourly_forecast(24)
+        with self._sensor_snapshot():
+            prepared = self._prepare_advanced_hourly_forecast(24)
+        result = await self._async_generate_forecast("hourly", prepared)
         _LOGGER.debug(f"async_forecast_hourly returning {len(result) if result else 0} hours")
         return result
 
-    def _generate_advanced_daily_forecast(self, days: int = 3) -> list[Forecast] | None:
-        """Generate daily forecast using advanced models.
+    async def _async_generate_forecast(
+        self,
+        kind: str,
+        prepared: tuple[tuple, Callable[[], tuple[list[Forecast], dict[str, Any] | None]]] | None,
+    ) -> list[Forecast] | None:
+        """Return cached forecasts or run the prepared generator.
+
+        With FORECAST_GENERATE_IN_EXECUTOR the generator runs in the executor,
+        and concurrent requests for the same input snapshot (same cache key)
+        await one shared job instead of starting their own.
+
+        Results and forecast traces are stored on the event loop.
+
+        Args:
+            kind: "daily" or "hourly"
+            prepared: Result of _prepare_advanced_*_forecast
+
+        Returns:
+            List of Forecast objects, or None on missing inputs or error
+        """
+        if prepared is None:
+            return None
+
+        cache_key, generate = prepared
+        cached = self._forecast_cache.get(cache_key)
+        if cached is not None:
+            return cached  # type: ignore[return-value]
+        generate = timed_call(self.stage_timings, _FORECAST_STAGES[kind], generate)
+
+        try:
+            if not FORECAST_GENERATE_IN_EXECUTOR:
+                forecasts, trace = generate()
+                self._store_forecast_result(kind, cache_key, forecasts, trace)
+                return forecasts
+
+            # Jobs started before the last invalidation are not joined
+            generation = self._forecast_cache.generation
+            future = self._forecast_in_flight.get((generation, cache_key))
+            if future is None:
+                future = self.hass.async_add_executor_job(generate)
+                self._forecast_in_flight[(generation, cache_key)] = future
+                future.add_done_callback(
+                    lambda done: self._on_forecast_job_done(kind, cache_key, generation, done)
+                )
+            else:
+                _LOGGER.debug(f"Joining in-flight {kind} forecast calculation")
+
+            # Shield so a cancelled caller does not cancel the job for the others
+            forecasts, _trace = await asyncio.shield(future)
+        except Exception as e:
+            _LOGGER.error(f"❌ Error generating advanced {kind} forecast: {e}", exc_info=True)
+            return None
+
+        # Callers share the job result - hand out copies
+        return [dict(forecast) for forecast in forecasts]  # type: ignore[misc]
+
+    @callback
+    def _on_forecast_job_done(
+        self, kind: str, cache_key: tuple, generation: int, future: asyncio.Future
+    ) -> None:
+        """Store a finished executor job and forget it.
+
+        The cache drops the result if it was invalidated while the job ran.
+        """
+        self._forecast_in_flight.pop((generation, cache_key), None)
+        if not future.cancelled() and future.exception() is None:
+            forecasts, trace = future.result()
+            self._store_forecast_result(kind, cache_key, forecasts, trace, generation)
+
+    @callback
+    def _store_forecast_result(
+        self,
+        kind: str,
+        cache_key: tuple,
+        forecasts: list[Forecast],
+        trace: dict[str, Any] | None,
+        generation: int | None = None,
+    ) -> None:
+        """Cache generated forecasts and keep their trace (event loop only)."""
+        self._forecast_cache.put(cache_key, forecasts, generation)
+        if trace is not None:
+            self._forecast_traces[kind] = trace
+
+    def _get_forecast_cache_key(
+        self,
+        kind: str,
+        count: int,
+        pressure: float,
+        pressure_change: float,
+        temperature: float,
+        temp_change: float,
+        humidity: float | None,
+        wind_dir: float,
+        wind_speed: float,
+        rain_rate: float,
+        solar_radiation: float | None,
+        cloud_cover: float | None,
+        current_condition: str | None,
+    ) -> tuple:
+        """Build the forecast cache key from quantized inputs.
+
+        Inputs are rounded to the resolution that can change the forecast, so
+        sensor noise does not defeat the cache. The current hour is part of
+        the key because diurnal temperature and day/night conditions depend on it.
+        """
+        return (
+            kind,
+            count,
+            quantize(pressure, 0.1),
+            quantize(pressure_change, 0.1),
+            quantize(temperature, 0.1),
+            quantize(temp_change, 0.1),
+            quantize(humidity, 1.0),
+            quantize(wind_dir, 10.0),
+            quantize(wind_speed, 0.5),
+            quantize(rain_rate, 0.1),
+            quantize(solar_radiation, 10.0),
+            quantize(cloud_cover, 5.0),
+            current_condition,
+            self._get_config(CONF_FORECAST_MODEL) or DEFAULT_FORECAST_MODEL,
+            get_language_index(self.hass, self._entry),
+            self._get_config(CONF_ELEVATION),
+            self._get_config(CONF_LATITUDE),
+            self._get_config(CONF_HEMISPHERE),
+            datetime.now().replace(minute=0, second=0, microsecond=0),
+        )
+
+    def _prepare_advanced_daily_forecast(
+        self, days: int = 3
+    ) -> tuple[tuple, Callable[[], tuple[list[Forecast], dict[str, Any] | None]]] | None:
+        """Snapshot inputs for the daily forecast.
+
+        Sensor states and config are read here, on the event loop. The returned
+        generate() callable only uses the snapshot and can run in an executor;
+        it returns the forecasts and the forecast trace (None if disabled).
 
         Args:
             days: Number of days to forecast
 
         Returns:
-            List of daily Forecast objects
+            (cache key, generate callable), or None if inputs are missing
         """
         try:
             # Get current sensor data
@@ -2016,22 +2397,12 @@ class LocalWeatherForecastWeather(WeatherEntity):
                 return None
 
             # Get pressure and temperature changes
-            pressure_change_sensor = self.hass.states.get("sensor.local_forecast_pressurechange")
-            temp_change_sensor = self.hass.states.get("sensor.local_forecast_temperaturechange")
-
-            pressure_change_3h = 0.0
-            if pressure_change_sensor and pressure_change_sensor.state not in ("unknown", "unavailable"):
-                try:
-                    pressure_change_3h = float(pressure_change_sensor.state)
-                except (ValueError, TypeError):
-                    pass
-
-            temp_change_1h = 0.0
-            if temp_change_sensor and temp_change_sensor.state not in ("unknown", "unavailable"):
-                try:
-                    temp_change_1h = float(temp_change_sensor.state)
-                except (ValueError, TypeError):
-                    pass
+            pressure_change_3h = self._get_internal_value(
+                "pressure_change", ENTITY_PRESSURE_CHANGE
+            ) or 0.0
+            temp_change_1h = self._get_internal_value(
+                "temperature_change", ENTITY_TEMPERATURE_CHANGE
+            ) or 0.0
 
             _LOGGER.debug(
                 f"📈 Trends: ΔP={pressure_change_3h}hPa/3h, "
@@ -2043,7 +2414,7 @@ class LocalWeatherForecastWeather(WeatherEntity):
             rain_rate_sensor_id = self._get_config(CONF_RAIN_RATE_SENSOR)
             _LOGGER.debug(f"🌧️ Rain rate sensor config: {rain_rate_sensor_id}")
             if rain_rate_sensor_id:
-                rain_sensor = self.hass.states.get(rain_rate_sensor_id)
+                rain_sensor = self._get_state(rain_rate_sensor_id)
                 _LOGGER.debug(
                     f"🌧️ Rain rate sensor state: {rain_sensor.state if rain_sensor else 'NOT_FOUND'} "
                     f"(entity: {rain_rate_sensor_id})"
@@ -2060,20 +2431,9 @@ class LocalWeatherForecastWeather(WeatherEntity):
                 _LOGGER.debug("🌧️ No rain rate sensor configured")
 
             # Get solar radiation for temperature model (optional)
-            solar_radiation = None
-            solar_sensor_id = self._get_config(CONF_SOLAR_RADIATION_SENSOR)
-            if solar_sensor_id:
-                solar_state = self.hass.states.get(solar_sensor_id)
-                if solar_state and solar_state.state not in ("unknown", "unavailable"):
-                    try:
-                        raw_value = float(solar_state.state)
-                        unit = solar_state.attributes.get("unit_of_measurement", "W/m²")
-                        # Convert to W/m² (from lux if needed)
-                        converted = UnitConverter.convert_solar_radiation(raw_value, unit)
-                        solar_radiation = self._validate_sensor_value(converted, "solar_radiation", solar_sensor_id)
-                        _LOGGER.debug(f"☀️ Solar radiation: {solar_radiation} W/m²")
-                    except (ValueError, TypeError):
-                        pass
+            solar_radiation = self._solar_radiation
+            if self._get_config(CONF_SOLAR_RADIATION_SENSOR):
+                _LOGGER.debug(f"☀️ Solar radiation: {solar_radiation} W/m²")
             else:
                 _LOGGER.debug("☀️ No solar radiation sensor configured")
 
@@ -2102,25 +2462,18 @@ class LocalWeatherForecastWeather(WeatherEntity):
             if hemisphere is None:
                 hemisphere = "north"  # Default
 
-            # Create models
-            pressure_model = PressureModel(pressure, pressure_change_3h)
-            temp_model = TemperatureModel(
-                temperature,
-                temp_change_1h,
-                solar_radiation=solar_radiation,
-                cloud_cover=cloud_cover,
-                humidity=humidity,
-                hass=self.hass,
-                latitude=latitude,
-                longitude=longitude,
-                hemisphere=hemisphere
+            # Cache key doubles as the snapshot identity for coalescing
+            current_condition = self.condition
+            cache_key = self._get_forecast_cache_key(
+                "daily", days, pressure, pressure_change_3h, temperature, temp_change_1h,
+                humidity, wind_dir, wind_speed, current_rain_rate, solar_radiation, cloud_cover,
+                current_condition,
             )
 
             # Get user's selected forecast model
             forecast_model = self._get_config(CONF_FORECAST_MODEL) or DEFAULT_FORECAST_MODEL
             _LOGGER.debug(f"📊 Using forecast model for daily forecast: {forecast_model}")
 
-
             # Get elevation from config, fall back to Home Assistant's elevation, then to default
             elevation = self._get_config(CONF_ELEVATION)
             if elevation is None:
@@ -2129,74 +2482,107 @@ class LocalWeatherForecastWeather(WeatherEntity):
             else:
                 _LOGGER.debug(f"📍 Using elevation from config: {elevation}m")
 
-            # Determine which algorithm to use based on selected model
-            if forecast_model == FORECAST_MODEL_ENHANCED:
-                # Enhanced: Use weighted combination of both algorithms
-                # Generate forecasts from both and combine them
-                zambretti = ZambrettiForecaster(
-                    hass=self.hass,
-                    latitude=latitude,
-                    solar_radiation=solar_radiation
-                )
-                _LOGGER.debug("📊 Enhanced mode: Using combined Zambretti + Negretti algorithms")
-            elif forecast_model == FORECAST_MODEL_NEGRETTI:
-                # Negretti-Zambra: Conservative slide-rule method
-                # Note: We still use Zambretti class but with Negretti-optimized parameters
-                zambretti = ZambrettiForecaster(
-                    hass=self.hass,
+            trace_enabled = bool(self._get_config(CONF_FORECAST_TRACE))
+            # State machine, language and config reads stay on the event loop
+            environment = ForecastEnvironment.from_hass(self.hass, self._entry)
+
+            def generate() -> tuple[list[Forecast], dict[str, Any] | None]:
+                """Build models and generate forecasts (safe to run in an executor)."""
+                trace = ForecastTrace("daily") if trace_enabled else None
+
+                # Create models
+                pressure_model = PressureModel(pressure, pressure_change_3h)
+                temp_model = TemperatureModel(
+                    temperature,
+                    temp_change_1h,
+                    solar_radiation=solar_radiation,
+                    cloud_cover=cloud_cover,
+                    humidity=humidity,
                     latitude=latitude,
-                    solar_radiation=solar_radiation
+                    longitude=longitude,
+                    hemisphere=hemisphere,
+                    environment=environment,
                 )
-                _LOGGER.debug("📊 Negretti-Zambra mode: Using conservative algorithm")
-            else:  # FORECAST_MODEL_ZAMBRETTI
-                # Classic Zambretti: Optimized for rising/falling pressure
-                zambretti = ZambrettiForecaster(
-                    hass=self.hass,
+
+                # Determine which algorithm to use based on selected model
+                if forecast_model == FORECAST_MODEL_ENHANCED:
+                    # Enhanced: Use weighted combination of both algorithms
+                    # Generate forecasts from both and combine them
+                    zambretti = ZambrettiForecaster(
+                        latitude=latitude,
+                        solar_radiation=solar_radiation,
+                        environment=environment,
+                    )
+                    _LOGGER.debug("📊 Enhanced mode: Using combined Zambretti + Negretti algorithms")
+                elif forecast_model == FORECAST_MODEL_NEGRETTI:
+                    # Negretti-Zambra: Conservative slide-rule method
+                    # Note: We still use Zambretti class but with Negretti-optimized parameters
+                    zambretti = ZambrettiForecaster(
+                        latitude=latitude,
+                        solar_radiation=solar_radiation,
+                        environment=environment,
+                    )
+                    _LOGGER.debug("📊 Negretti-Zambra mode: Using conservative algorithm")
+                else:  # FORECAST_MODEL_ZAMBRETTI
+                    # Classic Zambretti: Optimized for rising/falling pressure
+                    zambretti = ZambrettiForecaster(
+                        latitude=latitude,
+                        solar_radiation=solar_radiation,
+                        environment=environment,
+                    )
+                    _LOGGER.debug("📊 Zambretti mode: Using classic algorithm")
+
+                # Create generators with rain rate and selected model
+                hourly_gen = HourlyForecastGenerator(
+                    None,
+                    pressure_model,
+                    temp_model,
+                    zambretti,
+                    wind_direction=int(wind_dir),
+                    wind_speed=float(wind_speed),
                     latitude=latitude,
-                    solar_radiation=solar_radiation
+                    elevation=elevation,
+                    current_rain_rate=current_rain_rate,
+                    forecast_model=forecast_model,
+                    current_condition=current_condition,
+                    longitude=longitude,
+                    trace=trace,
+                    environment=environment,
                 )
-                _LOGGER.debug("📊 Zambretti mode: Using classic algorithm")
-
-            # Create generators with rain rate and selected model
-            hourly_gen = HourlyForecastGenerator(
-                self.hass,
-                pressure_model,
-                temp_model,
-                zambretti,
-                wind_direction=int(wind_dir),
-                wind_speed=float(wind_speed),
-                latitude=latitude,
-                elevation=elevation,
-                current_rain_rate=current_rain_rate,
-                forecast_model=forecast_model,
-                current_condition=self.condition,
-                longitude=longitude,
-            )
 
-            daily_gen = DailyForecastGenerator(hourly_gen)
+                daily_gen = DailyForecastGenerator(hourly_gen)
 
-            # Generate forecast
-            forecasts = daily_gen.generate(days)
+                # Generate forecast
+                forecasts = daily_gen.generate(days)
 
-            _LOGGER.debug(
-                f"✅ Generated {len(forecasts)} daily forecasts "
-                f"(P={pressure}hPa, T={temperature}°C)"
-            )
+                _LOGGER.debug(
+                    f"✅ Generated {len(forecasts)} daily forecasts "
+                    f"(P={pressure}hPa, T={temperature}°C)"
+                )
+
+                # The trace is stored on the event loop (see _async_generate_forecast)
+                return forecasts, trace.as_dict() if trace is not None else None  # type: ignore[return-value]
 
-            return forecasts  # type: ignore[return-value]
+            return cache_key, generate
 
         except Exception as e:
             _LOGGER.error(f"❌ Error generating advanced daily forecast: {e}", exc_info=True)
             return None
 
-    def _generate_advanced_hourly_forecast(self, hours: int = 24) -> list[Forecast] | None:
-        """Generate hourly forecast using advanced models.
+    def _prepare_advanced_hourly_forecast(
+        self, hours: int = 24
+    ) -> tuple[tuple, Callable[[], tuple[list[Forecast], dict[str, Any] | None]]] | None:
+        """Snapshot inputs for the hourly forecast.
+
+        Sensor states and config are read here, on the event loop. The returned
+        generate() callable only uses the snapshot and can run in an executor;
+        it returns the forecasts and the forecast trace (None if disabled).
 
         Args:
             hours: Number of hours to forecast
 
         Returns:
-            List of hourly Forecast objects
+            (cache key, generate callable), or None if inputs are missing
         """
         try:
             # Get current sensor data
@@ -2210,29 +2596,19 @@ class LocalWeatherForecastWeather(WeatherEntity):
                 return None
 
             # Get pressure and temperature changes
-            pressure_change_sensor = self.hass.states.get("sensor.local_forecast_pressurechange")
-            temp_change_sensor = self.hass.states.get("sensor.local_forecast_temperaturechange")
-
-            pressure_change_3h = 0.0
-            if pressure_change_sensor and pressure_change_sensor.state not in ("unknown", "unavailable"):
-                try:
-                    pressure_change_3h = float(pressure_change_sensor.state)
-                except (ValueError, TypeError):
-                    pass
-
-            temp_change_1h = 0.0
-            if temp_change_sensor and temp_change_sensor.state not in ("unknown", "unavailable"):
-                try:
-                    temp_change_1h = float(temp_change_sensor.state)
-                except (ValueError, TypeError):
-                    pass
+            pressure_change_3h = self._get_internal_value(
+                "pressure_change", ENTITY_PRESSURE_CHANGE
+            ) or 0.0
+            temp_change_1h = self._get_internal_value(
+                "temperature_change", ENTITY_TEMPERATURE_CHANGE
+            ) or 0.0
 
             # Get current rain rate for real-time override
             current_rain_rate = 0.0
             rain_rate_sensor_id = self._get_config(CONF_RAIN_RATE_SENSOR)
             _LOGGER.debug(f"Current rain rate sensor config: {rain_rate_sensor_id}")
             if rain_rate_sensor_id:
-                rain_sensor = self.hass.states.get(rain_rate_sensor_id)
+                rain_sensor = self._get_state(rain_rate_sensor_id)
                 _LOGGER.debug(
                     f"Rain rate sensor state: {rain_sensor.state if rain_sensor else 'NOT_FOUND'} "
                     f"(entity: {rain_rate_sensor_id})"
@@ -2249,20 +2625,9 @@ class LocalWeatherForecastWeather(WeatherEntity):
                 _LOGGER.debug("No rain rate sensor configured")
 
             # Get solar radiation for temperature model (optional)
-            solar_radiation = None
-            solar_sensor_id = self._get_config(CONF_SOLAR_RADIATION_SENSOR)
-            if solar_sensor_id:
-                solar_state = self.hass.states.get(solar_sensor_id)
-                if solar_state and solar_state.state not in ("unknown", "unavailable"):
-                    try:
-                        raw_value = float(solar_state.state)
-                        unit = solar_state.attributes.get("unit_of_measurement", "W/m²")
-                        # Convert to W/m² (from lux if needed)
-                        converted = UnitConverter.convert_solar_radiation(raw_value, unit)
-                        solar_radiation = self._validate_sensor_value(converted, "solar_radiation", solar_sensor_id)
-                        _LOGGER.debug(f"Solar radiation for daily forecast: {solar_radiation} W/m²")
-                    except (ValueError, TypeError):
-                        pass
+            solar_radiation = self._solar_radiation
+            if solar_radiation is not None:
+                _LOGGER.debug(f"Solar radiation for daily forecast: {solar_radiation} W/m²")
 
 
             # Get cloud coverage for temperature model (optional)
@@ -2288,25 +2653,18 @@ class LocalWeatherForecastWeather(WeatherEntity):
             if hemisphere is None:
                 hemisphere = "north"  # Default
 
-            # Create models
-            pressure_model = PressureModel(pressure, pressure_change_3h)
-            temp_model = TemperatureModel(
-                temperature,
-                temp_change_1h,
-                solar_radiation=solar_radiation,
-                cloud_cover=cloud_cover,
-                humidity=humidity,
-                hass=self.hass,
-                latitude=latitude,
-                longitude=longitude,
-                hemisphere=hemisphere
+            # Cache key doubles as the snapshot identity for coalescing
+            current_condition = self.condition
+            cache_key = self._get_forecast_cache_key(
+                "hourly", hours, pressure, pressure_change_3h, temperature, temp_change_1h,
+                humidity, wind_dir, wind_speed, current_rain_rate, solar_radiation, cloud_cover,
+                current_condition,
             )
 
             # Get user's selected forecast model
             forecast_model = self._get_config(CONF_FORECAST_MODEL) or DEFAULT_FORECAST_MODEL
             _LOGGER.debug(f"📊 Using forecast model for hourly forecast: {forecast_model}")
 
-
             # Get elevation from config, fall back to Home Assistant's elevation, then to default
             elevation = self._get_config(CONF_ELEVATION)
             if elevation is None:
@@ -2315,60 +2673,87 @@ class LocalWeatherForecastWeather(WeatherEntity):
             else:
                 _LOGGER.debug(f"📍 Using elevation from config: {elevation}m")
 
-            # Determine which algorithm to use based on selected model
-            if forecast_model == FORECAST_MODEL_ENHANCED:
-                # Enhanced: Use weighted combination of both algorithms
-                zambretti = ZambrettiForecaster(
-                    hass=self.hass,
+            trace_enabled = bool(self._get_config(CONF_FORECAST_TRACE))
+            # State machine, language and config reads stay on the event loop
+            environment = ForecastEnvironment.from_hass(self.hass, self._entry)
+
+            def generate() -> tuple[list[Forecast], dict[str, Any] | None]:
+                """Build models and generate forecasts (safe to run in an executor)."""
+                trace = ForecastTrace("hourly") if trace_enabled else None
+
+                # Create models
+                pressure_model = PressureModel(pressure, pressure_change_3h)
+                temp_model = TemperatureModel(
+                    temperature,
+                    temp_change_1h,
+                    solar_radiation=solar_radiation,
+                    cloud_cover=cloud_cover,
+                    humidity=humidity,
                     latitude=latitude,
-                    solar_radiation=solar_radiation
+                    longitude=longitude,
+                    hemisphere=hemisphere,
+                    environment=environment,
                 )
-                _LOGGER.debug("📊 Enhanced mode: Using combined Zambretti + Negretti algorithms")
-            elif forecast_model == FORECAST_MODEL_NEGRETTI:
-                # Negretti-Zambra: Conservative slide-rule method
-                zambretti = ZambrettiForecaster(
-                    hass=self.hass,
+
+                # Determine which algorithm to use based on selected model
+                if forecast_model == FORECAST_MODEL_ENHANCED:
+                    # Enhanced: Use weighted combination of both algorithms
+                    zambretti = ZambrettiForecaster(
+                        latitude=latitude,
+                        solar_radiation=solar_radiation,
+                        environment=environment,
+                    )
+                    _LOGGER.debug("📊 Enhanced mode: Using combined Zambretti + Negretti algorithms")
+                elif forecast_model == FORECAST_MODEL_NEGRETTI:
+                    # Negretti-Zambra: Conservative slide-rule method
+                    zambretti = ZambrettiForecaster(
+                        latitude=latitude,
+                        solar_radiation=solar_radiation,
+                        environment=environment,
+                    )
+                    _LOGGER.debug("📊 Negretti-Zambra mode: Using conservative algorithm")
+                else:  # FORECAST_MODEL_ZAMBRETTI
+                    # Classic Zambretti: Optimized for rising/falling pressure
+                    zambretti = ZambrettiForecaster(
+                        latitude=latitude,
+                        solar_radiation=solar_radiation,
+                        environment=environment,
+                    )
+                    _LOGGER.debug("📊 Zambretti mode: Using classic algorithm")
+
+                # Create generator with rain rate and selected model
+                hourly_gen = HourlyForecastGenerator(
+                    None,
+                    pressure_model,
+                    temp_model,
+                    zambretti,
+                    wind_direction=int(wind_dir),
+                    wind_speed=float(wind_speed),
                     latitude=latitude,
-                    solar_radiation=solar_radiation
+                    elevation=elevation,
+                    current_rain_rate=current_rain_rate,
+                    forecast_model=forecast_model,
+                    current_condition=current_condition,
+                    longitude=longitude,
+                    trace=trace,
+                    environment=environment,
                 )
-                _LOGGER.debug("📊 Negretti-Zambra mode: Using conservative algorithm")
-            else:  # FORECAST_MODEL_ZAMBRETTI
-                # Classic Zambretti: Optimized for rising/falling pressure
-                zambretti = ZambrettiForecaster(
-                    hass=self.hass,
-                    latitude=latitude,
-                    solar_radiation=solar_radiation
+
+                # Generate forecast (1-hour intervals)
+                forecasts = hourly_gen.generate(
+                    hours_count=hours,
+                    interval_hours=1
                 )
-                _LOGGER.debug("📊 Zambretti mode: Using classic algorithm")
-
-            # Create generator with rain rate and selected model
-            hourly_gen = HourlyForecastGenerator(
-                self.hass,
-                pressure_model,
-                temp_model,
-                zambretti,
-                wind_direction=int(wind_dir),
-                wind_speed=float(wind_speed),
-                latitude=latitude,
-                elevation=elevation,
-                current_rain_rate=current_rain_rate,
-                forecast_model=forecast_model,
-                current_condition=self.condition,
-                longitude=longitude,
-            )
 
-            # Generate forecast (1-hour intervals)
-            forecasts = hourly_gen.generate(
-                hours_count=hours,
-                interval_hours=1
-            )
+                _LOGGER.debug(
+                    f"Generated {len(forecasts)} hourly forecasts: "
+                    f"P={pressure}hPa, T={temperature}°C, ΔP={pressure_change_3h}hPa"
+                )
 
-            _LOGGER.debug(
-                f"Generated {len(forecasts)} hourly forecasts: "
-                f"P={pressure}hPa, T={temperature}°C, ΔP={pressure_change_3h}hPa"
-            )
+                # The trace is stored on the event loop (see _async_generate_forecast)
+                return forecasts, trace.as_dict() if trace is not None else None  # type: ignore[return-value]
 
-            return forecasts  # type: ignore[return-value]
+            return cache_key, generate
 
         except Exception as e:
             _LOGGER.error(f"Error generating advanced hourly forecast: {e}", exc_info=True)
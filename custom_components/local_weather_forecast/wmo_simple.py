@@ -23,10 +23,15 @@ Version: 3.1.27
 import logging
 from typing import Optional
 
+from .batch import BatchResult, broadcast, broadcast_arrays, np, numpy_enabled, to_result
 from .const import PRESSURE_TREND_FALLING, PRESSURE_TREND_RISING
 
 _LOGGER = logging.getLogger(__name__)
 
+if np is not None:
+    # Letter codes A-H (one per 3 condition codes)
+    _LETTER_ARRAY = np.array(list("ABCDEFGH"))
+
 
 def calculate_wmo_simple_forecast(
     current_condition_code: int,
@@ -73,6 +78,49 @@ def calculate_wmo_simple_forecast(
     return [forecast_text, forecast_code, letter_code, confidence]
 
 
+def calculate_wmo_simple_forecast_batch(
+    current_condition_code,
+    pressure_change_3h,
+    *,
+    use_numpy: bool = True,
+) -> BatchResult:
+    """Calculate WMO Simple forecasts for many observations at once.
+
+    Inputs can be scalars, sequences or NumPy arrays; scalars are broadcast.
+    Results match calculate_wmo_simple_forecast() element-wise.
+
+    Args:
+        current_condition_code: Current unified condition codes (0-25)
+        pressure_change_3h: Pressure changes over 3 hours (hPa)
+        use_numpy: Use NumPy if installed
+
+    Returns:
+        (forecast numbers 0-25, letter codes) as NumPy arrays, or as
+        array("i") and list[str] without NumPy
+    """
+    if numpy_enabled(use_numpy):
+        codes, changes = broadcast_arrays(current_condition_code, pressure_change_3h)
+        adjustment = np.select(
+            [
+                changes >= 3.0,
+                changes >= PRESSURE_TREND_RISING,
+                changes > PRESSURE_TREND_FALLING,
+                changes > -3.0,
+            ],
+            [-3, -2, 0, 2],
+            default=3,
+        )
+        forecast_codes = np.clip(codes.astype(int) + adjustment * 3, 0, 25)
+        return forecast_codes, _LETTER_ARRAY[np.minimum(forecast_codes // 3, 7)]
+
+    _, inputs = broadcast(current_condition_code, pressure_change_3h)
+    numbers = [
+        _apply_trend_adjustment(int(code), _calculate_wmo_trend_adjustment(change))
+        for code, change in zip(*inputs)
+    ]
+    return to_result(numbers, [chr(65 + min(code // 3, 7)) for code in numbers])
+
+
 def _calculate_wmo_trend_adjustment(pressure_change_3h: float) -> int:
     """Calculate condition adjustment based on WMO pressure trend.
     
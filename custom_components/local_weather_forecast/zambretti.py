@@ -4,16 +4,129 @@
 - Uses forecast_mapping.get_forecast_text() for text retrieval
 - Internal codes (0-25) are universal for all models
 - No duplicate text storage needed
+
+Decision tables are module-level tuples built once per process.  The pure
+core maps quantized inputs (pressure, trend, season, wind correction) to
+the forecast number and letter and is memoized; the localized text is only
+looked up for the final result.
 """
+from __future__ import annotations
+
 from datetime import datetime
+from functools import lru_cache
 import logging
 
+from .batch import (
+    BatchResult,
+    broadcast,
+    broadcast_arrays,
+    np,
+    numpy_enabled,
+    to_result,
+    wind_factors,
+    wind_factors_array,
+)
 from .const import PRESSURE_TREND_FALLING, PRESSURE_TREND_RISING
 
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Zambretti formula per trend (falling, steady, rising): z = a - b * p0
+_Z_FORMULA: tuple[tuple[int, float], ...] = ((127, 0.12), (138, 0.13), (185, 0.16))
+
+# Forecast index (0-25) for Zambretti numbers 1-33 (index = z - 1)
+_Z_FORECAST: tuple[int, ...] = (
+    0, 1, 3, 7, 14, 17, 20, 21,  # 1-8: falling
+    5, 0, 1, 4, 10, 13, 15, 18, 22, 23,  # 9-18: steady
+    1, 0, 1, 5, 5, 6, 8, 9, 11, 12, 16, 19, 24, 25, 25,  # 19-33: rising
+)
+
+# Letter code for Zambretti numbers 1-33 (index = z - 1)
+_Z_LETTER: tuple[str, ...] = (
+    "A", "B", "D", "H", "O", "R", "U", "V",  # 1-8: falling
+    "F", "A", "B", "E", "K", "N", "P", "S", "W", "X",  # 9-18: steady
+    "B", "A", "B", "F", "F", "G", "I", "J", "L", "M", "Q", "T", "Y", "Z", "Z",  # 19-33: rising
+)
+
+if np is not None:
+    _Z_FORMULA_ARRAY = np.array(_Z_FORMULA, dtype=float)
+    _Z_FORECAST_ARRAY = np.array(_Z_FORECAST, dtype=int)
+    _Z_LETTER_ARRAY = np.array(_Z_LETTER)
+
+# Pressure resolution of the memoized core (hPa)
+_P0_RESOLUTION = 2  # decimal places
+
+
+def _pressure_trend(pressure_change: float) -> int:
+    """Return -1 (falling), 0 (steady) or 1 (rising)."""
+    if pressure_change <= PRESSURE_TREND_FALLING:
+        return -1
+    if pressure_change >= PRESSURE_TREND_RISING:
+        return 1
+    return 0
+
+
+@lru_cache(maxsize=2048)
+def _zambretti_core(
+    p0: float, trend: int, is_summer: bool, wind_correction: float
+) -> tuple[int, int, str, str | None]:
+    """Map quantized inputs to a Zambretti result (pure, memoized).
+
+    Args:
+        p0: Sea level pressure in hPa (quantized by caller)
+        trend: -1 falling, 0 steady, 1 rising
+        is_summer: True for March - October
+        wind_correction: wind_fak * wind_speed_fak
+
+    Returns:
+        (z-number 1-33, forecast index 0-25, letter code, extreme condition or None)
+    """
+    base, factor = _Z_FORMULA[trend + 1]
+    z_before_wind = round(base - factor * p0)
+
+    if trend == 0:
+        # Very low steady pressure = stormy conditions, clamp to unsettled forecast
+        if p0 < 970 and z_before_wind > 12:
+            z_before_wind = 12
+        # Winter adjustment only for moderate pressure (975-1025 hPa)
+        if not is_summer and 975 <= p0 <= 1025:
+            z_before_wind -= 1
+    elif trend == 1:
+        # Summer adjustment only for moderate pressure (975-1025 hPa)
+        if is_summer and 975 <= p0 <= 1025:
+            z_before_wind += 1
+
+    z = z_before_wind + wind_correction
+
+    # Handle extreme z-numbers: clamp BEFORE mapping
+    extreme_condition = None
+    if z < 1.0:
+        # Very high pressure falling rapidly (anticyclone breakdown)
+        # → "Fine, Becoming Less Settled"
+        extreme_condition = "high_pressure_falling"
+        z = 3
+    elif z > 33.0:
+        # Very low pressure rising rapidly (storm recovery) → "Stormy, Much Rain"
+        extreme_condition = "low_pressure_rising"
+        z = 33
+    z = int(round(z))
+
+    _LOGGER.debug(
+        "Zambretti: p0=%.2f hPa, trend=%s, is_summer=%s, z_before_wind=%s, "
+        "wind_correction=%s → z=%s%s",
+        p0,
+        'FALLING' if trend == -1 else 'RISING' if trend == 1 else 'STEADY',
+        is_summer,
+        z_before_wind,
+        wind_correction,
+        z,
+        f" (EXTREME: {extreme_condition})" if extreme_condition else ""
+    )
+
+    return z, _Z_FORECAST[z - 1], _Z_LETTER[z - 1], extreme_condition
+
+
 def calculate_zambretti_forecast(
     p0: float,
     pressure_change: float,
@@ -32,155 +145,110 @@ def calculate_zambretti_forecast(
     Returns:
         [forecast_text, forecast_number, letter_code]
     """
-    _LOGGER.debug(
-        f"Zambretti: Input - p0={p0:.1f} hPa, pressure_change={pressure_change:.2f} hPa, "
-        f"wind_data={wind_data}, lang_index={lang_index}"
-    )
-
-    # Determine pressure trend
-    if pressure_change <= PRESSURE_TREND_FALLING:
-        trend = -1  # Falling
-    elif pressure_change >= PRESSURE_TREND_RISING:
-        trend = 1  # Rising
-    else:
-        trend = 0  # Steady
-
-    _LOGGER.debug(
-        f"Zambretti: Pressure trend={'FALLING' if trend == -1 else 'RISING' if trend == 1 else 'STEADY'} "
-        f"(change={pressure_change:.2f} hPa)"
-    )
-
-    # Get current month for season adjustment
+    # Season from the current month (summer = March - October)
     current_month = datetime.now().month
     is_summer = 2 < current_month < 11
 
-    _LOGGER.debug(f"Zambretti: Month={current_month}, is_summer={is_summer}")
-
-    # Calculate Zambretti number based on trend
-    z_before_wind = 0
-    if trend == -1:  # Falling pressure
-        z_before_wind = round(127 - 0.12 * p0)
-        _LOGGER.debug(f"Zambretti: FALLING formula: z = round(127 - 0.12 * {p0:.1f}) = {z_before_wind}")
-    elif trend == 0:  # Steady pressure
-        # ✅ FIXED: Correct scientific formula is 138, not 144!
-        # Original Zambretti algorithm: Z = 138 - 0.13 * P (for steady pressure)
-        # Previous incorrect value (144) caused overly optimistic forecasts
-        z_before_wind = round(138 - 0.13 * p0)
-        _LOGGER.debug(f"Zambretti: STEADY formula: z = round(138 - 0.13 * {p0:.1f}) = {z_before_wind}")
-
-        # Special handling for very low pressure (<970 hPa) with steady trend
-        # Very low steady pressure = stormy conditions, should not give high z-numbers
-        # Clamp to maximum z=12 to ensure unsettled forecast
-        if p0 < 970 and z_before_wind > 12:
-            _LOGGER.debug(
-                f"Zambretti: Very low pressure ({p0:.1f} hPa < 970) with steady trend, "
-                f"clamping z from {z_before_wind} to 12 (stormy conditions)"
-            )
-            z_before_wind = 12
+    z, forecast_type, letter_code, extreme_condition = _zambretti_core(
+        round(p0, _P0_RESOLUTION),
+        _pressure_trend(pressure_change),
+        is_summer,
+        wind_data[0] * wind_data[3],
+    )
 
-        # Season adjustment
-        # Winter adjustment only for moderate pressure (975-1025 hPa)
-        # High stable pressure (>1025) in winter = fine weather, not unsettled
-        # Very low pressure (<975) = stormy even in winter, no adjustment needed
-        if not is_summer and 975 <= p0 <= 1025:
-            z_before_wind = z_before_wind - 1  # Winter
-            _LOGGER.debug(f"Zambretti: Winter adjustment: z = {z_before_wind} (steady winter -1)")
-        elif not is_summer and p0 > 1025:
-            _LOGGER.debug(f"Zambretti: Skipping winter adjustment for high pressure ({p0:.1f} hPa > 1025)")
-        elif not is_summer and p0 < 975:
-            _LOGGER.debug(f"Zambretti: Skipping winter adjustment for very low pressure ({p0:.1f} hPa < 975, stormy conditions)")
-    else:  # Rising pressure (trend == 1)
-        z_before_wind = round(185 - 0.16 * p0)
-        _LOGGER.debug(f"Zambretti: RISING formula: z = round(185 - 0.16 * {p0:.1f}) = {z_before_wind}")
-        # Season adjustment
-        # Summer adjustment only for moderate pressure (975-1025 hPa)
-        # Very low pressure (<975) = storm recovery, no adjustment needed
-        # Very high pressure (>1025) = already optimistic, no adjustment needed
-        if is_summer and 975 <= p0 <= 1025:
-            z_before_wind = z_before_wind + 1  # Summer
-            _LOGGER.debug(f"Zambretti: Summer adjustment: z = {z_before_wind} (rising summer +1)")
-        elif is_summer and p0 < 975:
-            _LOGGER.debug(f"Zambretti: Skipping summer adjustment for very low pressure ({p0:.1f} hPa < 975, storm recovery)")
-        elif is_summer and p0 > 1025:
-            _LOGGER.debug(f"Zambretti: Skipping summer adjustment for high pressure ({p0:.1f} hPa > 1025)")
-
-    # Apply wind correction
-    wind_fak = wind_data[0]
-    wind_speed_fak = wind_data[3]
-    wind_correction = wind_fak * wind_speed_fak
-    z = z_before_wind + wind_correction
+    # ✅ USE UNIFIED SYSTEM: Get text from forecast_mapping
+    from .forecast_mapping import get_forecast_text
+    forecast_text = get_forecast_text(
+        forecast_num=forecast_type,
+        lang_index=lang_index
+    )
 
     _LOGGER.debug(
-        f"Zambretti: Wind correction: wind_fak={wind_fak}, speed_fak={wind_speed_fak}, "
-        f"correction={wind_correction} → z_final={z}"
+        "Zambretti: RESULT%s - p0=%.1f hPa, change=%.2f hPa, z=%s, "
+        "forecast_code=%s, letter=%s (display only), text='%s'",
+        " (EXTREME)" if extreme_condition else "",
+        p0,
+        pressure_change,
+        z,
+        forecast_type,
+        letter_code,
+        forecast_text
     )
 
-    # Handle extreme z-numbers with intelligent mapping
-    # IMPORTANT: Clamp z BEFORE calling mapping functions to avoid "Unmapped" warnings
-    z_original = z
-    extreme_condition = None
-
-    if z < 1.0:
-        # Extreme high pressure with falling trend
-        # This indicates breakdown of anticyclone → weather deteriorating
-        _LOGGER.debug(
-            f"Zambretti: EXTREME condition - Very high pressure falling rapidly "
-            f"(z={z:.1f}, pressure={p0:.1f} hPa, change={pressure_change:.2f} hPa)"
-        )
-        extreme_condition = "high_pressure_falling"
-        # Map to "Fine, Becoming Less Settled" (forecast_type=3, letter=D)
-        z = 3
-        _LOGGER.debug(f"Zambretti: Mapping extreme case z={z_original:.1f} → z=3 (Fine, Becoming Less Settled)")
+    # Return [text, code, letter] - forecast_calculator expects 3 items
+    return [forecast_text, forecast_type, letter_code]
 
-    elif z > 33.0:
-        # Extreme low pressure with rising trend
-        # This indicates recovery from storm → weather improving
-        _LOGGER.debug(
-            f"Zambretti: EXTREME condition - Very low pressure rising rapidly "
-            f"(z={z:.1f}, pressure={p0:.1f} hPa, change={pressure_change:.2f} hPa)"
-        )
-        extreme_condition = "low_pressure_rising"
-        # Keep at z=33 (Stormy, Much Rain) - still dangerous
-        z = 33
-        _LOGGER.debug(f"Zambretti: Clamping extreme case z={z_original:.1f} → z=33 (Stormy, Much Rain)")
 
-    # Convert to int for mapping (now guaranteed to be in range 1-33)
-    z = int(round(z))
+def calculate_zambretti_forecast_batch(
+    p0,
+    pressure_change,
+    wind_direction=None,
+    wind_speed=None,
+    month=None,
+    *,
+    use_numpy: bool = True,
+) -> BatchResult:
+    """Calculate Zambretti forecasts for many observations at once.
 
-    # Now z is guaranteed to be in range 1-33, safe to map
-    forecast_type = _map_zambretti_to_forecast(z)
+    Every input can be a scalar, a sequence or a NumPy array; scalars are
+    broadcast.  Results match calculate_zambretti_forecast() element-wise.
 
-    # Calculate letter code for display purposes
-    letter_code = _map_zambretti_to_letter(z)
+    Args:
+        p0: Sea level pressures in hPa
+        pressure_change: Pressure changes over 3 hours in hPa
+        wind_direction: Wind directions in degrees (optional)
+        wind_speed: Wind speeds in m/s (optional, no wind correction without)
+        month: Months (1-12) for the season adjustment (default: current month)
+        use_numpy: Use NumPy if installed
 
-    if forecast_type is not None:
-        # ✅ USE UNIFIED SYSTEM: Get text from forecast_mapping
-        from .forecast_mapping import get_forecast_text
-        forecast_text = get_forecast_text(
-            forecast_num=forecast_type,
-            lang_index=lang_index
+    Returns:
+        (forecast numbers 0-25, letter codes) as NumPy arrays, or as
+        array("i") and list[str] without NumPy
+    """
+    if month is None:
+        month = datetime.now().month
+    if wind_direction is None or wind_speed is None:
+        wind_direction = wind_speed = 0.0
+
+    if numpy_enabled(use_numpy):
+        p0, pressure_change, wind_direction, wind_speed, month = broadcast_arrays(
+            p0, pressure_change, wind_direction, wind_speed, month
         )
-
-        # Add note for extreme conditions
-        if extreme_condition:
-            _LOGGER.debug(
-                f"Zambretti: RESULT (EXTREME) - z={z} (original={z_original:.1f}), "
-                f"condition={extreme_condition}, forecast_code={forecast_type}, "
-                f"letter={letter_code} (display only), text='{forecast_text}'"
-            )
-        else:
-            _LOGGER.debug(
-                f"Zambretti: RESULT - z={z}, forecast_code={forecast_type}, "
-                f"letter={letter_code} (display only), text='{forecast_text}'"
-            )
-    else:
-        forecast_text = "Unknown"
-        forecast_type = 0
-        letter_code = "A"
-        _LOGGER.debug(f"Zambretti: Failed to map z={z} to forecast, using Unknown")
-
-    # Return [text, code, letter] - forecast_calculator expects 3 items
-    return [forecast_text, forecast_type, letter_code]
+        p0 = np.round(p0, _P0_RESOLUTION)
+        trend = np.where(
+            pressure_change <= PRESSURE_TREND_FALLING,
+            -1,
+            np.where(pressure_change >= PRESSURE_TREND_RISING, 1, 0),
+        )
+        formula = _Z_FORMULA_ARRAY[trend + 1]
+        z = np.round(formula[:, 0] - formula[:, 1] * p0)
+
+        # Season adjustments (see _zambretti_core)
+        is_summer = (month > 2) & (month < 11)
+        moderate = (p0 >= 975) & (p0 <= 1025)
+        z = np.where((trend == 0) & (p0 < 970) & (z > 12), 12, z)
+        z = np.where((trend == 0) & ~is_summer & moderate, z - 1, z)
+        z = np.where((trend == 1) & is_summer & moderate, z + 1, z)
+
+        wind_fak, wind_speed_fak = wind_factors_array(wind_direction, wind_speed)
+        z = z + wind_fak * wind_speed_fak
+        z = np.round(np.where(z < 1.0, 3, np.where(z > 33.0, 33, z))).astype(int)
+        return _Z_FORECAST_ARRAY[z - 1], _Z_LETTER_ARRAY[z - 1]
+
+    _, inputs = broadcast(p0, pressure_change, wind_direction, wind_speed, month)
+    numbers: list[int] = []
+    letters: list[str] = []
+    for pressure, change, direction, speed, current_month in zip(*inputs):
+        wind_fak, wind_speed_fak = wind_factors(direction, speed)
+        _, forecast_type, letter_code, _ = _zambretti_core(
+            round(float(pressure), _P0_RESOLUTION),
+            _pressure_trend(change),
+            2 < current_month < 11,
+            wind_fak * wind_speed_fak,
+        )
+        numbers.append(forecast_type)
+        letters.append(letter_code)
+    return to_result(numbers, letters)
 
 
 def _map_zambretti_to_forecast(z: int) -> int | None:
@@ -194,54 +262,18 @@ def _map_zambretti_to_forecast(z: int) -> int | None:
     """
     # Defensive clamping - should already be done by caller, but extra safety
     if z < 1:
-        _LOGGER.debug(f"Zambretti: z={z} < 1, clamping to 1")
+        _LOGGER.debug("Zambretti: z=%s < 1, clamping to 1", z)
         z = 1
     elif z > 33:
-        _LOGGER.debug(f"Zambretti: z={z} > 33, clamping to 33")
+        _LOGGER.debug("Zambretti: z=%s > 33, clamping to 33", z)
         z = 33
 
-    _LOGGER.debug(f"Zambretti: Mapping z-number={z}")
-    mapping = {
-        1: 0, 10: 0, 20: 0,  # Settled fine
-        2: 1, 11: 1, 21: 1,  # Fine weather
-        3: 3,  # Fine, becoming less settled
-        4: 7,  # Fairly fine, showery later
-        5: 14,  # Showery, becoming more unsettled
-        6: 17,  # Unsettled, rain later
-        7: 20,  # Rain at times, worse later
-        8: 21,  # Rain at times, becoming very unsettled
-        9: 5,   # Fairly fine, improving (high pressure steady)
-        12: 4,  # Fine, possible showers
-        13: 10,  # Fairly fine, showers likely
-        14: 13,  # Showery, bright intervals
-        15: 15,  # Changeable, some rain
-        16: 18,  # Unsettled, rain at times
-        17: 22,  # Rain at frequent intervals
-        18: 23,  # Very unsettled, rain
-        19: 1,   # Fine weather (high pressure rising)
-        22: 5,   # Settling fair
-        23: 5,   # Fairly fine
-        24: 6,   # Fairly fine, possible showers early
-        25: 8,   # Showery early, improving
-        26: 9,   # Changeable, mending
-        27: 11,  # Rather unsettled, clearing later
-        28: 12,  # Unsettled, probably improving
-        29: 16,  # Unsettled, short fine intervals
-        30: 19,  # Very unsettled, finer at times
-        31: 24,  # Stormy, possibly improving
-        32: 25, 33: 25,  # Stormy, much rain (extreme recovery)
-    }
-    result = mapping.get(z)
-    if result is None:
-        # This should never happen after clamping with valid input
-        _LOGGER.error(
-            f"Zambretti: UNMAPPED z-number {z} - invalid input! "
-            f"Valid range is 1-31."
-        )
-        return None  # Return None for invalid input
+    if not isinstance(z, int):
+        # This should never happen with valid input
+        _LOGGER.error("Zambretti: UNMAPPED z-number %s - invalid input! Valid range is 1-33.", z)
+        return None
 
-    _LOGGER.debug(f"Zambretti: Mapped z={z} → forecast_index={result}")
-    return result
+    return _Z_FORECAST[z - 1]
 
 
 def _map_zambretti_to_letter(z: int) -> str:
@@ -255,46 +287,14 @@ def _map_zambretti_to_letter(z: int) -> str:
     """
     # Defensive clamping - should already be done by caller, but extra safety
     if z < 1:
-        _LOGGER.debug(f"Zambretti: z={z} < 1, clamping to 1 for letter mapping")
+        _LOGGER.debug("Zambretti: z=%s < 1, clamping to 1 for letter mapping", z)
         z = 1
     elif z > 33:
-        _LOGGER.debug(f"Zambretti: z={z} > 33, clamping to 33 for letter mapping")
+        _LOGGER.debug("Zambretti: z=%s > 33, clamping to 33 for letter mapping", z)
         z = 33
 
-    mapping = {
-        1: "A", 10: "A", 20: "A",  # Settled fine
-        2: "B", 11: "B", 21: "B",  # Fine weather
-        3: "D",  # Fine, becoming less settled
-        4: "H",  # Fairly fine, showery later
-        5: "O",  # Showery, becoming more unsettled
-        6: "R",  # Unsettled, rain later
-        7: "U",  # Rain at times, worse later
-        8: "V",  # Rain at times, becoming very unsettled
-        9: "F",   # Fairly fine, improving (high pressure steady)
-        12: "E",  # Fine, possible showers
-        13: "K",  # Fairly fine, showers likely
-        14: "N",  # Showery, bright intervals
-        15: "P",  # Changeable, some rain
-        16: "S",  # Unsettled, rain at times
-        17: "W",  # Rain at frequent intervals
-        18: "X",  # Very unsettled, rain
-        19: "B",  # Fine weather (high pressure rising)
-        22: "F",  # Settling fair
-        23: "F",  # Fairly fine
-        24: "G",  # Fairly fine, possible showers early
-        25: "I",  # Showery early, improving
-        26: "J",  # Changeable, mending
-        27: "L",  # Rather unsettled, clearing later
-        28: "M",  # Unsettled, probably improving
-        29: "Q",  # Unsettled, short fine intervals
-        30: "T",  # Very unsettled, finer at times
-        31: "Y",  # Stormy, possibly improving
-        32: "Z", 33: "Z",  # Stormy, much rain (extreme recovery)
-    }
-    result = mapping.get(z, "A")
-    if z not in mapping:
-        # This should never happen after clamping
-        _LOGGER.debug(f"Zambretti: Using default letter 'A' for z={z}")
-    else:
-        _LOGGER.debug(f"Zambretti: Mapped z={z} → letter '{result}'")
-    return result
+    if not isinstance(z, int):
+        _LOGGER.debug("Zambretti: Using default letter 'A' for z=%s", z)
+        return "A"
+
+    return _Z_LETTER[z - 1]
@@ -0,0 +1 @@
+"""Offline replay and verification of the forecast models over recorded history."""
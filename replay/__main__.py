@@ -0,0 +1,128 @@
+"""Replay recorded sensor history and verify the hourly forecasts.
+
+Usage (from the repository root)::
+
+    python -m replay home-assistant_v2.db --pressure sensor.outdoor_pressure \\
+        --temperature sensor.outdoor_temperature --latitude 48.72 --longitude 21.25 \\
+        --elevation 314 --predictions predictions.csv
+
+The input is a recorder SQLite database, a CSV export (``.csv``) or a Parquet
+file (``.parquet``, requires pyarrow).  The verification report is printed as
+JSON (or written to ``--output``).
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+from pathlib import Path
+import sys
+
+from .engine import ALL_MODELS, ReplayConfig, ReplayEngine
+from .sources import DEFAULT_CHUNK_SIZE, open_source, parse_timestamp
+
+
+def _parse_units(values: list[str]) -> dict[str, str]:
+    """Parse repeated ENTITY=UNIT options."""
+    units = {}
+    for value in values:
+        entity_id, separator, unit = value.partition("=")
+        if not separator or not entity_id or not unit:
+            raise argparse.ArgumentTypeError(f"expected ENTITY=UNIT, got {value!r}")
+        units[entity_id] = unit
+    return units
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run a replay from the command line."""
+    parser = argparse.ArgumentParser(prog="python -m replay", description=__doc__.splitlines()[0])
+    parser.add_argument("source", type=Path, help="recorder database, CSV or Parquet file")
+    parser.add_argument("--pressure", required=True, help="pressure sensor entity ID")
+    parser.add_argument("--temperature", help="temperature sensor entity ID")
+    parser.add_argument("--humidity", help="humidity sensor entity ID")
+    parser.add_argument("--wind-speed", help="wind speed sensor entity ID")
+    parser.add_argument("--wind-direction", help="wind direction sensor entity ID")
+    parser.add_argument("--rain-rate", help="rain rate sensor entity ID (precipitation scores)")
+    parser.add_argument("--latitude", type=float, required=True)
+    parser.add_argument("--longitude", type=float, required=True)
+    parser.add_argument("--elevation", type=float, default=0.0, help="meters (default %(default)s)")
+    parser.add_argument(
+        "--pressure-type", choices=("absolute", "relative"), default="absolute",
+        help="absolute = station pressure (QFE), relative = sea level (QNH)",
+    )
+    parser.add_argument("--hemisphere", choices=("north", "south"))
+    parser.add_argument("--language", default="en")
+    parser.add_argument(
+        "--models", default=",".join(ALL_MODELS),
+        help="comma separated models to verify (default %(default)s)",
+    )
+    parser.add_argument("--horizon", type=int, default=24, help="forecast hours (default %(default)s)")
+    parser.add_argument("--warmup", type=float, default=3.0, help="hours before the first forecast")
+    parser.add_argument("--rain-threshold", type=float, default=0.1, help="mm/h counted as rain")
+    parser.add_argument("--start", help="first reading time (ISO, UTC if no offset)")
+    parser.add_argument("--end", help="end time, exclusive (ISO, UTC if no offset)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="rows per fetch")
+    parser.add_argument(
+        "--unit", action="append", default=[], metavar="ENTITY=UNIT",
+        help="unit of an entity whose readings carry none (repeatable)",
+    )
+    parser.add_argument("--predictions", type=Path, help="write verified forecast hours to CSV")
+    parser.add_argument("--output", type=Path, help="write the report to this JSON file")
+    args = parser.parse_args(argv)
+
+    # Debug logging of the integration would dominate the run time
+    logging.getLogger("custom_components.local_weather_forecast").setLevel(logging.WARNING)
+
+    try:
+        units = _parse_units(args.unit)
+    except argparse.ArgumentTypeError as err:
+        parser.error(str(err))
+
+    config = ReplayConfig(
+        pressure_sensor=args.pressure,
+        latitude=args.latitude,
+        longitude=args.longitude,
+        elevation=args.elevation,
+        pressure_type=args.pressure_type,
+        temperature_sensor=args.temperature,
+        humidity_sensor=args.humidity,
+        wind_speed_sensor=args.wind_speed,
+        wind_direction_sensor=args.wind_direction,
+        rain_rate_sensor=args.rain_rate,
+        hemisphere=args.hemisphere,
+        language=args.language,
+        models=tuple(model.strip() for model in args.models.split(",") if model.strip()),
+        horizon=args.horizon,
+        warmup_hours=args.warmup,
+        rain_threshold=args.rain_threshold,
+        units=units,
+    )
+    readings = open_source(
+        args.source,
+        config.entity_ids(),
+        start=parse_timestamp(args.start) if args.start else None,
+        end=parse_timestamp(args.end) if args.end else None,
+        chunk_size=args.chunk_size,
+    )
+
+    predictions = open(args.predictions, "w", newline="", encoding="utf-8") if args.predictions else None
+    try:
+        engine = ReplayEngine(config, predictions)
+        report = asyncio.run(engine.async_run(readings))
+    except (ValueError, ImportError) as err:
+        print(f"Error: {err}", file=sys.stderr)
+        return 2
+    finally:
+        if predictions is not None:
+            predictions.close()
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
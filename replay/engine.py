@@ -0,0 +1,694 @@
+"""Replay recorded sensor history through the forecast pipeline.
+
+The engine feeds readings, in chronological order, into the same entity code
+Home Assistant runs:
+
+- ``LocalForecastPressureChangeSensor._handle_pressure_update`` and
+  ``LocalForecastTemperatureChangeSensor._handle_temperature_update`` receive
+  every state change of their source entity
+- ``LocalForecastMainSensor.async_update`` runs when one of its source
+  entities changes, with the same 30 s throttle
+- ``HourlyForecastGenerator.generate`` runs at every full hour for each
+  selected model, with inputs built like the weather entity builds them
+
+A minimal in-memory state machine (``ReplayHass``) replaces Home Assistant.
+Time is replay time: while the engine runs, ``datetime.now()`` in the
+forecast modules returns the time of the reading being processed, and
+``sun.sun`` is derived from the solar ephemeris.
+
+Forecasts are verified when their target hour is reached, so only the
+forecasts still waiting for verification are kept (horizon x models hours of
+forecasts), independent of the length of the history.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+import csv
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+import math
+import time
+from types import SimpleNamespace
+from typing import IO, Any
+
+from homeassistant.core import State
+
+from custom_components.local_weather_forecast import (
+    combined_model,
+    forecast_calculator,
+    negretti_zambra,
+    sensor as sensor_module,
+    zambretti,
+)
+from custom_components.local_weather_forecast.const import (
+    CONF_ELEVATION,
+    CONF_HEMISPHERE,
+    CONF_HUMIDITY_SENSOR,
+    CONF_LANGUAGE,
+    CONF_PRESSURE_SENSOR,
+    CONF_PRESSURE_TYPE,
+    CONF_RAIN_RATE_SENSOR,
+    CONF_TEMPERATURE_SENSOR,
+    CONF_WIND_DIRECTION_SENSOR,
+    CONF_WIND_SPEED_SENSOR,
+    DEFAULT_PRESSURE_TYPE,
+    DOMAIN,
+    FORECAST_MODEL_ENHANCED,
+    FORECAST_MODEL_NEGRETTI,
+    FORECAST_MODEL_ZAMBRETTI,
+    HISTORY_FALLBACK_HOURS,
+)
+from custom_components.local_weather_forecast.forecast_calculator import (
+    HourlyForecastGenerator,
+    PressureModel,
+    TemperatureModel,
+    ZambrettiForecaster,
+)
+from custom_components.local_weather_forecast.sensor import (
+    LocalForecastMainSensor,
+    LocalForecastPressureChangeSensor,
+    LocalForecastTemperatureChangeSensor,
+)
+from custom_components.local_weather_forecast.solar_ephemeris import get_day_ephemeris
+
+from .metrics import ModelMetrics
+from .sources import Reading
+
+# Modules whose datetime.now() follows the replay clock
+CLOCK_MODULES = (sensor_module, forecast_calculator, combined_model, zambretti, negretti_zambra)
+
+# Internal entities (same entity IDs the integration creates)
+MAIN_ENTITY = "sensor.local_forecast"
+PRESSURE_ENTITY = "sensor.local_forecast_pressure"
+TEMPERATURE_ENTITY = "sensor.local_forecast_temperature"
+PRESSURE_CHANGE_ENTITY = "sensor.local_forecast_pressurechange"
+TEMPERATURE_CHANGE_ENTITY = "sensor.local_forecast_temperaturechange"
+ZAMBRETTI_DETAIL_ENTITY = "sensor.local_forecast_zambretti_detail"
+
+ALL_MODELS = (FORECAST_MODEL_ZAMBRETTI, FORECAST_MODEL_NEGRETTI, FORECAST_MODEL_ENHANCED)
+
+# Last good value of an unavailable sensor is used for this long (like the
+# last known good cache of the sensors)
+HISTORY_FALLBACK_SECONDS = HISTORY_FALLBACK_HOURS * 3600
+
+HOUR = 3600
+
+PREDICTION_COLUMNS = (
+    "issued",
+    "target",
+    "model",
+    "lead_hours",
+    "condition",
+    "temperature",
+    "pressure",
+    "precipitation_probability",
+    "observed_temperature",
+    "observed_pressure",
+    "observed_precipitation",
+)
+
+
+@dataclass
+class ReplayConfig:
+    """Station setup of a replay (the config entry of the integration).
+
+    Attributes:
+        pressure_sensor: Entity ID of the pressure sensor
+        latitude: Station latitude
+        longitude: Station longitude
+        elevation: Station elevation in meters
+        pressure_type: "absolute" (QFE) or "relative" (QNH)
+        temperature_sensor: Entity ID of the temperature sensor (optional)
+        humidity_sensor: Entity ID of the humidity sensor (optional)
+        wind_speed_sensor: Entity ID of the wind speed sensor (optional)
+        wind_direction_sensor: Entity ID of the wind direction sensor (optional)
+        rain_rate_sensor: Entity ID of the rain rate sensor, needed for the
+            precipitation scores (optional)
+        hemisphere: "north" or "south" (default: from latitude)
+        language: Forecast text language
+        models: Forecast models to verify
+        horizon: Forecast hours verified per run
+        warmup_hours: Hours of history fed before the first forecast
+        max_gap_hours: Longer gaps in the data restart the warmup
+        rain_threshold: Rain rate in mm/h counted as precipitation
+        units: Unit per entity ID for sources without units (e.g. CSV)
+    """
+
+    pressure_sensor: str
+    latitude: float
+    longitude: float
+    elevation: float = 0.0
+    pressure_type: str = DEFAULT_PRESSURE_TYPE
+    temperature_sensor: str | None = None
+    humidity_sensor: str | None = None
+    wind_speed_sensor: str | None = None
+    wind_direction_sensor: str | None = None
+    rain_rate_sensor: str | None = None
+    hemisphere: str | None = None
+    language: str = "en"
+    models: tuple[str, ...] = ALL_MODELS
+    horizon: int = 24
+    warmup_hours: float = 3.0
+    max_gap_hours: float = 3.0
+    rain_threshold: float = 0.1
+    units: dict[str, str] = field(default_factory=dict)
+
+    def entity_ids(self) -> list[str]:
+        """Return the source entities to read from the history."""
+        return [
+            entity_id
+            for entity_id in (
+                self.pressure_sensor,
+                self.temperature_sensor,
+                self.humidity_sensor,
+                self.wind_speed_sensor,
+                self.wind_direction_sensor,
+                self.rain_rate_sensor,
+            )
+            if entity_id
+        ]
+
+    def entry_data(self) -> dict[str, Any]:
+        """Return the config entry data the sensors read."""
+        return {
+            CONF_PRESSURE_SENSOR: self.pressure_sensor,
+            CONF_TEMPERATURE_SENSOR: self.temperature_sensor,
+            CONF_HUMIDITY_SENSOR: self.humidity_sensor,
+            CONF_WIND_SPEED_SENSOR: self.wind_speed_sensor,
+            CONF_WIND_DIRECTION_SENSOR: self.wind_direction_sensor,
+            CONF_RAIN_RATE_SENSOR: self.rain_rate_sensor,
+            CONF_ELEVATION: self.elevation,
+            CONF_PRESSURE_TYPE: self.pressure_type,
+            CONF_HEMISPHERE: self.hemisphere or ("north" if self.latitude >= 0 else "south"),
+            CONF_LANGUAGE: self.language,
+        }
+
+
+class ReplayClock:
+    """Replay time, installed as ``datetime`` in the forecast modules."""
+
+    def __init__(self) -> None:
+        """Initialize the clock at the epoch."""
+        self.timestamp = 0.0
+        self.utc = datetime.fromtimestamp(0, timezone.utc)
+        self._saved: list[tuple[Any, type[datetime]]] = []
+
+    def set(self, timestamp: float) -> None:
+        """Move the clock to a UTC epoch time."""
+        if timestamp != self.timestamp:
+            self.timestamp = timestamp
+            self.utc = datetime.fromtimestamp(timestamp, timezone.utc)
+
+    def _datetime_class(self) -> type[datetime]:
+        """Return a datetime subclass whose now() reads this clock."""
+        clock = self
+
+        class ReplayDatetime(datetime):
+            """datetime with now() returning replay time."""
+
+            @classmethod
+            def now(cls, tz=None):
+                if tz is None:
+                    # Naive local time, like datetime.now()
+                    return clock.utc.astimezone().replace(tzinfo=None)
+                return clock.utc.astimezone(tz)
+
+        return ReplayDatetime
+
+    def __enter__(self) -> ReplayClock:
+        """Install the clock in the forecast modules."""
+        replay_datetime = self._datetime_class()
+        self._saved = [(module, module.datetime) for module in CLOCK_MODULES]
+        for module in CLOCK_MODULES:
+            module.datetime = replay_datetime
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Restore the real clock."""
+        for module, original in self._saved:
+            module.datetime = original
+        self._saved = []
+
+
+class _StateChangedEvent:
+    """state_changed event as passed to state change listeners."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self.data = data
+
+
+class ReplayStates:
+    """In-memory state machine with synchronous state change listeners."""
+
+    def __init__(self, clock: ReplayClock) -> None:
+        """Initialize an empty state machine."""
+        self._clock = clock
+        self._states: dict[str, State] = {}
+        self._listeners: dict[str, list] = {}
+        self._last_good: dict[str, tuple[float, float]] = {}
+
+    def get(self, entity_id: str) -> State | None:
+        """Return the current state of an entity."""
+        return self._states.get(entity_id)
+
+    def is_state(self, entity_id: str, state: str) -> bool:
+        """Return True if the entity has the given state."""
+        current = self._states.get(entity_id)
+        return current is not None and current.state == state
+
+    def async_set(self, entity_id: str, new_state: str, attributes: dict | None = None) -> None:
+        """Set a state and call the listeners of the entity."""
+        now = self._clock.utc
+        old_state = self._states.get(entity_id)
+        state = State(entity_id, new_state, attributes, now, now, None, False)
+        self._states[entity_id] = state
+        try:
+            self._last_good[entity_id] = (self._clock.timestamp, float(new_state))
+        except ValueError:
+            pass
+
+        listeners = self._listeners.get(entity_id)
+        if listeners:
+            event = _StateChangedEvent(
+                {"entity_id": entity_id, "old_state": old_state, "new_state": state}
+            )
+            for listener in listeners:
+                listener(event)
+
+    def async_track(self, entity_ids: Iterable[str], listener) -> None:
+        """Call listener(event) on every state change of the entities."""
+        for entity_id in dict.fromkeys(entity_ids):
+            self._listeners.setdefault(entity_id, []).append(listener)
+
+    def last_good_value(self, entity_id: str, max_age: float) -> float | None:
+        """Return the last numeric state of an entity if not older than max_age."""
+        last = self._last_good.get(entity_id)
+        if last is None or self._clock.timestamp - last[0] > max_age:
+            return None
+        return last[1]
+
+
+class ReplayLastKnownGood:
+    """Last known good values of the sensors, from replayed states."""
+
+    def __init__(self, states: ReplayStates) -> None:
+        """Initialize with the replay state machine (it tracks every state)."""
+        self._states = states
+
+    def async_track(self, entity_id: str) -> None:
+        """Nothing to subscribe to, ReplayStates remembers every entity."""
+
+    def async_stop(self) -> None:
+        """Nothing to unsubscribe."""
+
+    async def async_get(self, entity_id: str) -> float | None:
+        """Return the last good value of an unavailable sensor."""
+        return self._states.last_good_value(entity_id, HISTORY_FALLBACK_SECONDS)
+
+
+@dataclass
+class ReplayConfigEntry:
+    """The parts of a config entry the sensors use."""
+
+    data: dict[str, Any]
+    options: dict[str, Any] = field(default_factory=dict)
+    entry_id: str = "replay"
+    domain: str = DOMAIN
+    title: str = "Replay"
+
+
+class ReplayHass:
+    """Just enough of HomeAssistant to run the forecast entities."""
+
+    def __init__(self, clock: ReplayClock, entry: ReplayConfigEntry, config: ReplayConfig) -> None:
+        """Initialize with the station location and the single config entry."""
+        self.states = ReplayStates(clock)
+        self.config = SimpleNamespace(
+            latitude=config.latitude,
+            longitude=config.longitude,
+            elevation=config.elevation,
+            language=config.language,
+        )
+        self.data: dict[str, Any] = {}
+        self.config_entries = SimpleNamespace(async_entries=lambda domain=None: [entry])
+
+
+@dataclass
+class ReplayStats:
+    """Counters of one replay."""
+
+    readings: int = 0
+    out_of_order: int = 0
+    main_updates: int = 0
+    forecast_runs: int = 0
+    verified: int = 0
+    unverified: int = 0
+    gaps: int = 0
+    first: float | None = None
+    last: float | None = None
+    elapsed: float = 0.0
+
+
+def _hour_floor(timestamp: float) -> float:
+    """Return the start of the UTC hour containing timestamp."""
+    return math.floor(timestamp / HOUR) * HOUR
+
+
+def _isoformat(timestamp: float | None) -> str | None:
+    """Return UTC ISO time of an epoch time."""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+class ReplayEngine:
+    """Replays a stream of readings and verifies the hourly forecasts."""
+
+    def __init__(self, config: ReplayConfig, predictions: IO[str] | None = None) -> None:
+        """Initialize the engine.
+
+        Args:
+            config: Station setup
+            predictions: Text file receiving one CSV row per verified
+                forecast hour (optional)
+        """
+        unknown = set(config.models) - set(ALL_MODELS)
+        if unknown:
+            raise ValueError(f"Unknown forecast model(s): {', '.join(sorted(unknown))}")
+
+        self.config = config
+        self.clock = ReplayClock()
+        self.entry = ReplayConfigEntry(config.entry_data())
+        self.hass = ReplayHass(self.clock, self.entry, config)
+        self.stats = ReplayStats()
+        self.metrics = {model: ModelMetrics() for model in config.models}
+
+        self._writer = csv.writer(predictions) if predictions is not None else None
+        if self._writer is not None:
+            self._writer.writerow(PREDICTION_COLUMNS)
+
+        # target hour -> [(model, lead, forecast)]
+        self._pending: dict[float, list[tuple[str, int, dict[str, Any]]]] = {}
+        self._attributes: dict[tuple[str, str | None], dict[str, str]] = {}
+        self._next_hour: float | None = None
+        self._ready_after = 0.0
+        self._last_main_update: float | None = None
+        self._main_pending = False
+        self._rain_in_hour = False
+
+        states = self.hass.states
+        last_known_good = ReplayLastKnownGood(states)
+        self.main = LocalForecastMainSensor(self.hass, self.entry)
+        self.pressure_change = LocalForecastPressureChangeSensor(self.hass, self.entry)
+        self.temperature_change = LocalForecastTemperatureChangeSensor(self.hass, self.entry)
+        for entity, entity_id in (
+            (self.main, MAIN_ENTITY),
+            (self.pressure_change, PRESSURE_CHANGE_ENTITY),
+            (self.temperature_change, TEMPERATURE_CHANGE_ENTITY),
+        ):
+            entity.entity_id = entity_id
+            entity._own_last_known_good = last_known_good
+        self.main.async_write_ha_state = self._write_main
+        self.pressure_change.async_write_ha_state = lambda: states.async_set(
+            PRESSURE_CHANGE_ENTITY, str(self.pressure_change.native_value)
+        )
+        self.temperature_change.async_write_ha_state = lambda: states.async_set(
+            TEMPERATURE_CHANGE_ENTITY, str(self.temperature_change.native_value)
+        )
+
+        # Same subscriptions as async_added_to_hass without a coordinator
+        states.async_track(
+            [self.pressure_change._source_sensor_id], self.pressure_change._handle_pressure_update
+        )
+        states.async_track(
+            [TEMPERATURE_ENTITY], self.temperature_change._handle_temperature_update
+        )
+        states.async_track(
+            [
+                entity_id
+                for entity_id in (
+                    config.pressure_sensor,
+                    config.temperature_sensor,
+                    config.wind_direction_sensor,
+                    config.wind_speed_sensor,
+                    PRESSURE_CHANGE_ENTITY,
+                    TEMPERATURE_CHANGE_ENTITY,
+                    ZAMBRETTI_DETAIL_ENTITY,
+                )
+                if entity_id
+            ],
+            self._schedule_main_update,
+        )
+
+    def _schedule_main_update(self, event) -> None:
+        """Mark the main sensor for an update after the current reading."""
+        self._main_pending = True
+
+    async def _update_main(self) -> None:
+        """Update the main sensor, throttled like _throttled_update (in replay time).
+
+        A throttled update stays pending and runs at the end of the interval
+        (see _run_due_main_update), like the trailing update of the sensor.
+        """
+        now = self.clock.timestamp
+        if (
+            self._last_main_update is not None
+            and now - self._last_main_update < self.main._update_throttle_seconds
+        ):
+            return
+        self._main_pending = False
+        self._last_main_update = now
+        await self.main.async_update()
+        self.stats.main_updates += 1
+        self.main.async_write_ha_state()
+
+    async def _run_due_main_update(self, until: float) -> None:
+        """Run a pending main sensor update whose interval ended by until."""
+        if not self._main_pending or self._last_main_update is None:
+            return
+        due = self._last_main_update + self.main._update_throttle_seconds
+        if due <= until:
+            self.clock.set(due)
+            await self._update_main()
+
+    def _write_main(self) -> None:
+        """Publish the main sensor and the entities following it."""
+        states = self.hass.states
+        attributes = self.main.extra_state_attributes
+        states.async_set(MAIN_ENTITY, str(self.main.native_value), attributes)
+        if attributes.get("p0") is not None:
+            states.async_set(PRESSURE_ENTITY, str(attributes["p0"]), {"unit_of_measurement": "hPa"})
+        if attributes.get("temperature") is not None:
+            states.async_set(
+                TEMPERATURE_ENTITY, str(attributes["temperature"]), {"unit_of_measurement": "°C"}
+            )
+
+    def _reading_attributes(self, entity_id: str, unit: str | None) -> dict[str, str]:
+        """Return (shared) state attributes for a reading."""
+        key = (entity_id, unit)
+        attributes = self._attributes.get(key)
+        if attributes is None:
+            unit = unit or self.config.units.get(entity_id)
+            attributes = {"unit_of_measurement": unit} if unit else {}
+            self._attributes[key] = attributes
+        return attributes
+
+    async def _sensor_value(self, entity_id: str | None, sensor_type: str) -> float | None:
+        """Return a converted source sensor value (None if unavailable)."""
+        if not entity_id:
+            return None
+        return await self.main._get_sensor_value(
+            entity_id, None, use_history=False, sensor_type=sensor_type
+        )
+
+    async def process(self, reading: Reading) -> None:
+        """Replay one reading."""
+        stats = self.stats
+        timestamp = reading.timestamp
+        if stats.last is not None and timestamp < stats.last:
+            stats.out_of_order += 1
+            timestamp = stats.last
+        if stats.first is None:
+            stats.first = timestamp
+            self._next_hour = _hour_floor(timestamp) + HOUR
+            self._ready_after = timestamp + self.config.warmup_hours * HOUR
+        if timestamp >= self._next_hour:
+            await self._advance(timestamp)
+        await self._run_due_main_update(timestamp)
+
+        stats.readings += 1
+        stats.last = timestamp
+        self.clock.set(timestamp)
+        self.hass.states.async_set(
+            reading.entity_id, reading.state, self._reading_attributes(reading.entity_id, reading.unit)
+        )
+
+        if reading.entity_id == self.config.rain_rate_sensor:
+            rain_rate = await self._sensor_value(reading.entity_id, "precipitation")
+            if rain_rate is not None and rain_rate >= self.config.rain_threshold:
+                self._rain_in_hour = True
+
+        if self._main_pending:
+            await self._update_main()
+
+    async def _advance(self, timestamp: float) -> None:
+        """Run the hourly work for every full hour up to timestamp."""
+        hour = self._next_hour
+        last_hour = _hour_floor(timestamp)
+        if last_hour - hour >= self.config.max_gap_hours * HOUR:
+            # Data gap: forecasts waiting for the gap cannot be verified and
+            # the change sensors need fresh history again
+            self.stats.gaps += 1
+            self.stats.unverified += sum(len(pending) for pending in self._pending.values())
+            self._pending.clear()
+            self._ready_after = timestamp + self.config.warmup_hours * HOUR
+            self._rain_in_hour = False
+            self._next_hour = last_hour + HOUR
+            return
+
+        while hour <= timestamp:
+            await self._run_due_main_update(hour)
+            self.clock.set(hour)
+            await self._on_hour(hour)
+            hour += HOUR
+        self._next_hour = hour
+
+    def _update_sun(self, when: datetime) -> None:
+        """Set sun.sun for the replay time from the solar ephemeris."""
+        latitude, longitude = self.config.latitude, self.config.longitude
+        today = get_day_ephemeris(when, latitude, longitude)
+        tomorrow = get_day_ephemeris(when + timedelta(days=1), latitude, longitude)
+        attributes = {}
+        for name, event in (("next_rising", "sunrise"), ("next_setting", "sunset")):
+            for ephemeris in (today, tomorrow):
+                moment = getattr(ephemeris, event)
+                if moment is not None and moment > when:
+                    attributes[name] = moment.isoformat()
+                    break
+        state = "below_horizon" if today.is_night(when) else "above_horizon"
+        self.hass.states.async_set("sun.sun", state, attributes)
+
+    async def _on_hour(self, hour: float) -> None:
+        """Verify forecasts for this hour and issue new ones."""
+        config = self.config
+        main_attributes = self.main.extra_state_attributes
+
+        # Observation at the full hour
+        observed_temperature = await self._sensor_value(config.temperature_sensor, "temperature")
+        observed_pressure = main_attributes.get("p0")
+        observed_rain = None
+        if config.rain_rate_sensor:
+            rain_rate = await self._sensor_value(config.rain_rate_sensor, "precipitation")
+            observed_rain = self._rain_in_hour or (
+                rain_rate is not None and rain_rate >= config.rain_threshold
+            )
+        self._rain_in_hour = False
+
+        for model, lead, forecast in self._pending.pop(hour, ()):
+            self.metrics[model].add(
+                lead, forecast, observed_temperature, observed_pressure, observed_rain
+            )
+            self.stats.verified += 1
+            if self._writer is not None:
+                self._writer.writerow((
+                    _isoformat(hour - lead * HOUR),
+                    _isoformat(hour),
+                    model,
+                    lead,
+                    forecast.get("condition"),
+                    forecast.get("native_temperature"),
+                    forecast.get("native_pressure"),
+                    forecast.get("precipitation_probability"),
+                    observed_temperature,
+                    observed_pressure,
+                    observed_rain,
+                ))
+
+        if hour < self._ready_after or not main_attributes:
+            return
+
+        self._update_sun(self.clock.utc)
+        for model in config.models:
+            for lead, forecast in await self._generate(model, hour):
+                self._pending.setdefault(hour + lead * HOUR, []).append((model, lead, forecast))
+        self.stats.forecast_runs += 1
+
+    async def _generate(self, model: str, hour: float) -> list[tuple[int, dict[str, Any]]]:
+        """Run HourlyForecastGenerator like the weather entity does.
+
+        Returns:
+            (lead hours, forecast) for lead 1..horizon
+        """
+        config = self.config
+        hass = self.hass
+        attributes = self.main.extra_state_attributes
+        wind_direction = attributes.get("wind_direction") or [0, 0.0]
+        hemisphere = self.entry.data[CONF_HEMISPHERE]
+
+        humidity = await self._sensor_value(config.humidity_sensor, "humidity")
+        wind_speed = await self._sensor_value(config.wind_speed_sensor, "wind_speed")
+        rain_rate = await self._sensor_value(config.rain_rate_sensor, "precipitation")
+
+        generator = HourlyForecastGenerator(
+            hass,
+            PressureModel(attributes["p0"], self.pressure_change.native_value or 0.0),
+            TemperatureModel(
+                attributes.get("temperature") or 15.0,
+                self.temperature_change.native_value or 0.0,
+                humidity=humidity,
+                hass=hass,
+                latitude=config.latitude,
+                longitude=config.longitude,
+                hemisphere=hemisphere,
+            ),
+            ZambrettiForecaster(hass=hass, latitude=config.latitude, config_entry=self.entry),
+            wind_direction=int(wind_direction[1] or 0),
+            wind_speed=float(wind_speed or 0.0),
+            latitude=config.latitude,
+            elevation=config.elevation,
+            current_rain_rate=rain_rate or 0.0,
+            forecast_model=model,
+            longitude=config.longitude,
+            config_entry=self.entry,
+        )
+        # Enhanced forecasts hours 0..n-1, the legacy path 0..n
+        forecasts = generator.generate(hours_count=config.horizon + 1, interval_hours=1)
+
+        result = []
+        for forecast in forecasts:
+            target = datetime.fromisoformat(forecast["datetime"]).timestamp()
+            lead = round((target - hour) / HOUR)
+            if 1 <= lead <= config.horizon:
+                result.append((lead, forecast))
+        return result
+
+    def report(self) -> dict[str, Any]:
+        """Return counters and scores as a JSON serializable dict."""
+        stats = self.stats
+        return {
+            "readings": stats.readings,
+            "first_reading": _isoformat(stats.first),
+            "last_reading": _isoformat(stats.last),
+            "elapsed_seconds": round(stats.elapsed, 3),
+            "readings_per_second": round(stats.readings / stats.elapsed) if stats.elapsed else None,
+            "out_of_order": stats.out_of_order,
+            "gaps": stats.gaps,
+            "main_updates": stats.main_updates,
+            "forecast_runs": stats.forecast_runs,
+            "verified": stats.verified,
+            "unverified": stats.unverified,
+            "models": {model: metrics.as_dict() for model, metrics in self.metrics.items()},
+        }
+
+    async def async_run(self, readings: Iterable[Reading]) -> dict[str, Any]:
+        """Replay all readings and return the report."""
+        started = time.perf_counter()
+        with self.clock:
+            for reading in readings:
+                await self.process(reading)
+        self.stats.unverified += sum(len(pending) for pending in self._pending.values())
+        self._pending.clear()
+        self.stats.elapsed += time.perf_counter() - started
+        return self.report()
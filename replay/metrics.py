@@ -0,0 +1,177 @@
+"""Verification metrics for replayed forecasts.
+
+All metrics are running sums, so memory does not grow with the length of the
+replay.  Scores follow the usual forecast verification definitions:
+
+- MAE / bias / RMSE of temperature and pressure per lead time
+- Brier score of the precipitation probability (0 = perfect, 1 = worst)
+- 2x2 contingency table of "precipitation condition" forecasts (rainy,
+  pouring, snowy, ...) with POD, FAR and CSI
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+from typing import Any
+
+# Forecast conditions counted as "precipitation forecast"
+PRECIPITATION_CONDITIONS = frozenset(
+    ("rainy", "pouring", "lightning-rainy", "snowy", "snowy-rainy", "hail")
+)
+
+
+def _ratio(numerator: float, denominator: float) -> float | None:
+    """Return numerator / denominator rounded, or None if undefined."""
+    if not denominator:
+        return None
+    return round(numerator / denominator, 4)
+
+
+@dataclass
+class ErrorStats:
+    """Running error statistics of a continuous variable."""
+
+    count: int = 0
+    sum_error: float = 0.0
+    sum_abs_error: float = 0.0
+    sum_squared_error: float = 0.0
+
+    def add(self, forecast: float, observed: float) -> None:
+        """Add one forecast/observation pair."""
+        error = forecast - observed
+        self.count += 1
+        self.sum_error += error
+        self.sum_abs_error += abs(error)
+        self.sum_squared_error += error * error
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return count, MAE, bias and RMSE."""
+        if not self.count:
+            return {"count": 0, "mae": None, "bias": None, "rmse": None}
+        return {
+            "count": self.count,
+            "mae": round(self.sum_abs_error / self.count, 3),
+            "bias": round(self.sum_error / self.count, 3),
+            "rmse": round(math.sqrt(self.sum_squared_error / self.count), 3),
+        }
+
+
+@dataclass
+class ContingencyTable:
+    """2x2 contingency table of a yes/no forecast."""
+
+    hits: int = 0
+    misses: int = 0
+    false_alarms: int = 0
+    correct_negatives: int = 0
+
+    def add(self, forecast: bool, observed: bool) -> None:
+        """Add one forecast/observation pair."""
+        if forecast and observed:
+            self.hits += 1
+        elif observed:
+            self.misses += 1
+        elif forecast:
+            self.false_alarms += 1
+        else:
+            self.correct_negatives += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the table with probability of detection, false alarm ratio and CSI."""
+        total = self.hits + self.misses + self.false_alarms + self.correct_negatives
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "false_alarms": self.false_alarms,
+            "correct_negatives": self.correct_negatives,
+            "pod": _ratio(self.hits, self.hits + self.misses),
+            "far": _ratio(self.false_alarms, self.hits + self.false_alarms),
+            "csi": _ratio(self.hits, self.hits + self.misses + self.false_alarms),
+            "accuracy": _ratio(self.hits + self.correct_negatives, total),
+        }
+
+
+@dataclass
+class BrierScore:
+    """Running Brier score of a probability forecast."""
+
+    count: int = 0
+    total: float = 0.0
+
+    def add(self, probability: float, observed: bool) -> None:
+        """Add one forecast probability (0-1) and the observed outcome."""
+        self.count += 1
+        self.total += (probability - (1.0 if observed else 0.0)) ** 2
+
+    @property
+    def score(self) -> float | None:
+        """Return the mean squared probability error, or None without data."""
+        return round(self.total / self.count, 4) if self.count else None
+
+
+@dataclass
+class ModelMetrics:
+    """Verification of one forecast model, broken down by lead time."""
+
+    temperature: dict[int, ErrorStats] = field(default_factory=dict)
+    pressure: dict[int, ErrorStats] = field(default_factory=dict)
+    precipitation: ContingencyTable = field(default_factory=ContingencyTable)
+    brier: BrierScore = field(default_factory=BrierScore)
+    verified: int = 0
+
+    def add(
+        self,
+        lead: int,
+        forecast: dict[str, Any],
+        temperature: float | None,
+        pressure: float | None,
+        rain: bool | None,
+    ) -> None:
+        """Verify one forecast hour against the observation.
+
+        Args:
+            lead: Lead time in hours
+            forecast: Forecast dict from HourlyForecastGenerator
+            temperature: Observed temperature in °C (None if not observed)
+            pressure: Observed sea level pressure in hPa (None if not observed)
+            rain: Whether precipitation was observed (None without rain sensor)
+        """
+        self.verified += 1
+        forecast_temperature = forecast.get("native_temperature")
+        if forecast_temperature is not None and temperature is not None:
+            self.temperature.setdefault(lead, ErrorStats()).add(forecast_temperature, temperature)
+        forecast_pressure = forecast.get("native_pressure")
+        if forecast_pressure is not None and pressure is not None:
+            self.pressure.setdefault(lead, ErrorStats()).add(forecast_pressure, pressure)
+        if rain is not None:
+            self.precipitation.add(forecast.get("condition") in PRECIPITATION_CONDITIONS, rain)
+            probability = forecast.get("precipitation_probability")
+            if probability is not None:
+                self.brier.add(probability / 100.0, rain)
+
+    @staticmethod
+    def _overall(by_lead: dict[int, ErrorStats]) -> dict[str, Any]:
+        """Combine the statistics of all lead times."""
+        total = ErrorStats()
+        for stats in by_lead.values():
+            total.count += stats.count
+            total.sum_error += stats.sum_error
+            total.sum_abs_error += stats.sum_abs_error
+            total.sum_squared_error += stats.sum_squared_error
+        return total.as_dict()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all scores as a JSON serializable dict."""
+        return {
+            "verified": self.verified,
+            "temperature": self._overall(self.temperature),
+            "pressure": self._overall(self.pressure),
+            "temperature_by_lead": {
+                str(lead): self.temperature[lead].as_dict() for lead in sorted(self.temperature)
+            },
+            "pressure_by_lead": {
+                str(lead): self.pressure[lead].as_dict() for lead in sorted(self.pressure)
+            },
+            "precipitation": self.precipitation.as_dict(),
+            "brier_score": self.brier.score,
+        }
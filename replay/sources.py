@@ -0,0 +1,336 @@
+"""Streaming readers for recorded sensor history.
+
+Every reader yields ``Reading`` tuples in chronological order and keeps only
+one chunk per entity in memory, so histories with millions of rows can be
+replayed on a small machine.  Readers merge one ordered stream per entity
+with ``heapq.merge``; for the recorder database each stream is an index scan
+on ``(metadata_id, last_updated_ts)``, so no sort of the whole table is needed.
+
+Supported inputs:
+
+- Home Assistant recorder SQLite database (``home-assistant_v2.db``, schema 32+
+  with ``states_meta`` and ``last_updated_ts``)
+- CSV export with the columns ``entity_id``, ``state`` and ``last_changed``
+  (or ``last_updated``), e.g. the history panel download; an optional
+  ``unit_of_measurement`` column is used when present
+- Parquet file with the same columns (requires ``pyarrow``)
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import csv
+from datetime import datetime, timezone
+import heapq
+import json
+from operator import attrgetter
+from pathlib import Path
+import sqlite3
+from typing import Any, NamedTuple
+
+# Rows fetched per entity and round trip
+DEFAULT_CHUNK_SIZE = 10_000
+
+# Column names accepted for the reading time (first match wins)
+TIME_COLUMNS = ("last_updated", "last_changed", "last_updated_ts", "time", "timestamp")
+
+UNIT_COLUMN = "unit_of_measurement"
+
+
+class Reading(NamedTuple):
+    """One recorded state.
+
+    Attributes:
+        timestamp: UTC seconds since the epoch
+        entity_id: Entity ID of the sensor
+        state: Recorded state string (may be "unknown"/"unavailable")
+        unit: Unit of measurement, or None if not recorded
+    """
+
+    timestamp: float
+    entity_id: str
+    state: str
+    unit: str | None
+
+
+def parse_timestamp(value: Any) -> float:
+    """Return UTC epoch seconds for an epoch number, datetime or ISO string.
+
+    Naive datetimes and ISO strings without offset are taken as UTC (the
+    recorder and the history export store UTC).
+
+    Raises:
+        ValueError: If the value cannot be parsed
+    """
+    if isinstance(value, datetime):
+        when = value
+    elif isinstance(value, (int, float)):
+        return float(value)
+    else:
+        text = str(value).strip()
+        try:
+            return float(text)
+        except ValueError:
+            pass
+        when = datetime.fromisoformat(text)
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return when.timestamp()
+
+
+def merge_streams(streams: Iterable[Iterator[Reading]]) -> Iterator[Reading]:
+    """Merge per-entity streams, each in chronological order, into one."""
+    return heapq.merge(*streams, key=attrgetter("timestamp"))
+
+
+def _in_range(timestamp: float, start: float | None, end: float | None) -> bool:
+    """Return True if the timestamp is within [start, end)."""
+    return (start is None or timestamp >= start) and (end is None or timestamp < end)
+
+
+# ---------------------------------------------------------------------------
+# Recorder database
+# ---------------------------------------------------------------------------
+
+
+def _connect_read_only(path: str | Path) -> sqlite3.Connection:
+    """Open a SQLite database read-only (safe on a live recorder file)."""
+    return sqlite3.connect(f"{Path(path).resolve().as_uri()}?mode=ro", uri=True)
+
+
+def _recorder_unit(connection: sqlite3.Connection, metadata_id: int) -> str | None:
+    """Return the unit of the latest recorded attributes of an entity."""
+    row = connection.execute(
+        "SELECT a.shared_attrs FROM states s "
+        "JOIN state_attributes a ON s.attributes_id = a.attributes_id "
+        "WHERE s.metadata_id = ? ORDER BY s.last_updated_ts DESC LIMIT 1",
+        (metadata_id,),
+    ).fetchone()
+    if not row or not row[0]:
+        return None
+    try:
+        return json.loads(row[0]).get(UNIT_COLUMN)
+    except (ValueError, AttributeError):
+        return None
+
+
+def _recorder_stream(
+    connection: sqlite3.Connection,
+    entity_id: str,
+    metadata_id: int,
+    unit: str | None,
+    start: float | None,
+    end: float | None,
+    chunk_size: int,
+) -> Iterator[Reading]:
+    """Yield the states of one entity in chronological order."""
+    cursor = connection.execute(
+        "SELECT last_updated_ts, state FROM states "
+        "WHERE metadata_id = ? AND last_updated_ts >= ? AND last_updated_ts < ? "
+        "ORDER BY last_updated_ts",
+        (
+            metadata_id,
+            start if start is not None else float("-inf"),
+            end if end is not None else float("inf"),
+        ),
+    )
+    try:
+        while rows := cursor.fetchmany(chunk_size):
+            for timestamp, state in rows:
+                if timestamp is not None and state is not None:
+                    yield Reading(timestamp, entity_id, state, unit)
+    finally:
+        cursor.close()
+
+
+def read_recorder(
+    path: str | Path,
+    entity_ids: Iterable[str],
+    *,
+    start: float | None = None,
+    end: float | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Reading]:
+    """Stream states of the given entities from a recorder database.
+
+    Args:
+        path: Path to the recorder SQLite file
+        entity_ids: Entities to read
+        start: Only readings at or after this UTC epoch time (optional)
+        end: Only readings before this UTC epoch time (optional)
+        chunk_size: Rows fetched per entity and round trip
+
+    Raises:
+        ValueError: If the database does not use the current recorder schema
+    """
+    connection = _connect_read_only(path)
+    try:
+        tables = {row[0] for row in connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+        )}
+        if "states_meta" not in tables or "states" not in tables:
+            raise ValueError(
+                f"{path} is not a recorder database with the current schema "
+                "(table states_meta missing, Home Assistant 2023.4 or newer is required)"
+            )
+
+        streams = []
+        for entity_id in dict.fromkeys(entity_ids):
+            row = connection.execute(
+                "SELECT metadata_id FROM states_meta WHERE entity_id = ?", (entity_id,)
+            ).fetchone()
+            if row is None:
+                continue
+            unit = _recorder_unit(connection, row[0])
+            streams.append(
+                _recorder_stream(connection, entity_id, row[0], unit, start, end, chunk_size)
+            )
+
+        yield from merge_streams(streams)
+    finally:
+        connection.close()
+
+
+# ---------------------------------------------------------------------------
+# CSV export
+# ---------------------------------------------------------------------------
+
+
+def _csv_time_column(fieldnames: list[str] | None, path: str | Path) -> str:
+    """Return the name of the time column of a CSV export."""
+    for column in TIME_COLUMNS:
+        if fieldnames and column in fieldnames:
+            return column
+    raise ValueError(f"{path} has no time column (expected one of {', '.join(TIME_COLUMNS)})")
+
+
+def _csv_stream(
+    path: str | Path,
+    entity_id: str,
+    start: float | None,
+    end: float | None,
+) -> Iterator[Reading]:
+    """Yield the rows of one entity from a CSV export."""
+    with open(path, newline="", encoding="utf-8") as file:
+        reader = csv.DictReader(file)
+        time_column = _csv_time_column(reader.fieldnames, path)
+        has_unit = UNIT_COLUMN in (reader.fieldnames or ())
+        for row in reader:
+            if row.get("entity_id") != entity_id:
+                continue
+            try:
+                timestamp = parse_timestamp(row[time_column])
+            except (ValueError, TypeError):
+                continue
+            if _in_range(timestamp, start, end):
+                unit = (row.get(UNIT_COLUMN) or None) if has_unit else None
+                yield Reading(timestamp, entity_id, row.get("state") or "unknown", unit)
+
+
+def read_csv(
+    path: str | Path,
+    entity_ids: Iterable[str],
+    *,
+    start: float | None = None,
+    end: float | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Reading]:
+    """Stream states of the given entities from a CSV export.
+
+    The file is read once per entity (no row is kept after it was merged), so
+    rows of each entity must be in chronological order, which is how Home
+    Assistant exports history.  ``chunk_size`` is accepted for a uniform
+    interface; the csv module already reads the file buffered.
+    """
+    yield from merge_streams(
+        _csv_stream(path, entity_id, start, end) for entity_id in dict.fromkeys(entity_ids)
+    )
+
+
+# ---------------------------------------------------------------------------
+# Parquet export
+# ---------------------------------------------------------------------------
+
+
+def _parquet_stream(
+    path: str | Path,
+    entity_id: str,
+    start: float | None,
+    end: float | None,
+    chunk_size: int,
+) -> Iterator[Reading]:
+    """Yield the rows of one entity from a Parquet file, batch by batch."""
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    parquet = pq.ParquetFile(path)
+    names = parquet.schema_arrow.names
+    time_column = _csv_time_column(names, path)
+    columns = ["entity_id", "state", time_column]
+    if UNIT_COLUMN in names:
+        columns.append(UNIT_COLUMN)
+
+    for batch in parquet.iter_batches(batch_size=chunk_size, columns=columns):
+        batch = batch.filter(pc.equal(batch.column("entity_id"), entity_id))
+        if not batch.num_rows:
+            continue
+        states = batch.column("state").to_pylist()
+        times = batch.column(time_column).to_pylist()
+        units = (
+            batch.column(UNIT_COLUMN).to_pylist()
+            if UNIT_COLUMN in columns
+            else [None] * batch.num_rows
+        )
+        for state, when, unit in zip(states, times, units):
+            try:
+                timestamp = parse_timestamp(when)
+            except (ValueError, TypeError):
+                continue
+            if _in_range(timestamp, start, end):
+                yield Reading(timestamp, entity_id, state if state is not None else "unknown", unit)
+
+
+def read_parquet(
+    path: str | Path,
+    entity_ids: Iterable[str],
+    *,
+    start: float | None = None,
+    end: float | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Reading]:
+    """Stream states of the given entities from a Parquet file.
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as err:
+        raise ImportError("Reading Parquet files requires pyarrow (pip install pyarrow)") from err
+
+    yield from merge_streams(
+        _parquet_stream(path, entity_id, start, end, chunk_size)
+        for entity_id in dict.fromkeys(entity_ids)
+    )
+
+
+def open_source(
+    path: str | Path,
+    entity_ids: Iterable[str],
+    *,
+    start: float | None = None,
+    end: float | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Reading]:
+    """Return a reading stream for a file, chosen by its extension.
+
+    ``.csv`` files are read as CSV exports, ``.parquet``/``.pq`` as Parquet,
+    everything else as a recorder database.
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv":
+        reader = read_csv
+    elif suffix in (".parquet", ".pq"):
+        reader = read_parquet
+    else:
+        reader = read_recorder
+    return reader(path, list(entity_ids), start=start, end=end, chunk_size=chunk_size)
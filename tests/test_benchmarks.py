@@ -0,0 +1,35 @@
+"""Smoke tests for the benchmark suite (benchmarks/)."""
+import pytest
+
+from benchmarks.cases import CASES
+from benchmarks.run import BenchmarkResult, compare, run_case
+
+
+@pytest.mark.parametrize("case", CASES, ids=lambda case: case.name)
+def test_case_runs(case):
+    """Test every benchmark case runs against the current code."""
+    result = run_case(case, scale=0.001, rounds=1, min_time=0.0)
+
+    assert result.ops_per_sec > 0
+    assert result.peak_kib >= 0
+
+
+def test_compare_detects_regressions():
+    """Test slower or more allocating results are reported."""
+    baseline = {
+        "fast": {"ops_per_sec": 1000.0, "peak_kib": 100.0},
+        "slow": {"ops_per_sec": 1000.0, "peak_kib": 100.0},
+        "alloc": {"ops_per_sec": 1000.0, "peak_kib": 100.0},
+    }
+    results = {
+        "fast": BenchmarkResult(900.0, 110.0, 0.0, 1, 1),
+        "slow": BenchmarkResult(500.0, 100.0, 0.0, 1, 1),
+        "alloc": BenchmarkResult(1000.0, 400.0, 0.0, 1, 1),
+        "new": BenchmarkResult(1.0, 1.0, 0.0, 1, 1),
+    }
+
+    regressions = compare(results, baseline, tolerance=0.3)
+
+    assert len(regressions) == 2
+    assert regressions[0].startswith("slow:")
+    assert regressions[1].startswith("alloc:")
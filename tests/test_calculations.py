@@ -10,6 +10,10 @@ from custom_components.local_weather_forecast.calculations import (
     calculate_heat_index,
     calculate_wind_chill,
     calculate_apparent_temperature,
+    calculate_apparent_temperature_batch,
+    calculate_dewpoint_batch,
+    calculate_future_humidity,
+    calculate_future_humidity_batch,
     get_comfort_level,
     get_fog_risk,
     calculate_rain_probability_enhanced,
@@ -146,6 +150,68 @@ class TestCalculateApparentTemperature:
         assert result is not None
 
 
+
+HORIZON_TEMPERATURES = [-25.0, -8.3, 0.0, 4.45, 12.7, 18.0, 23.15, 31.6, 38.9]
+HORIZON_PRESSURE_CHANGES = [0.0, 0.5, -1.8, 2.4, -6.0, 1.59, -1.61, 12.0, 0.0]
+
+
+class TestHorizonBatch:
+    """Tests for the array-in/array-out versions of the derived quantities."""
+
+    @pytest.fixture(params=[False, True], ids=["loop", "numpy"])
+    def use_numpy(self, request):
+        """Run every test with and without NumPy."""
+        if request.param:
+            pytest.importorskip("numpy")
+        return request.param
+
+    @pytest.mark.parametrize("current_humidity", [0.0, 5.0, 45.0, 88.0, 100.0])
+    def test_future_humidity_matches_scalar(self, current_humidity, use_numpy):
+        """Test future humidity matches calculate_future_humidity element-wise."""
+        result = calculate_future_humidity_batch(
+            15.0, current_humidity, HORIZON_TEMPERATURES, HORIZON_PRESSURE_CHANGES,
+            use_numpy=use_numpy,
+        )
+
+        assert result == [
+            calculate_future_humidity(15.0, current_humidity, temperature, change)
+            for temperature, change in zip(HORIZON_TEMPERATURES, HORIZON_PRESSURE_CHANGES)
+        ]
+
+    @pytest.mark.parametrize("humidity", [-1.0, 0.0, 0.5, 33.3, 71.0, 100.0, 101.0])
+    def test_dewpoint_matches_scalar(self, humidity, use_numpy):
+        """Test dew points match calculate_dewpoint element-wise."""
+        result = calculate_dewpoint_batch(HORIZON_TEMPERATURES, humidity, use_numpy=use_numpy)
+
+        assert result == [
+            calculate_dewpoint(temperature, humidity) for temperature in HORIZON_TEMPERATURES
+        ]
+
+    @pytest.mark.parametrize(
+        ("humidity", "wind_speed", "solar_radiation"),
+        [(None, None, None), (64.0, None, None), (80.0, 3.2, None), (None, 0.0, 650.0), (55.0, 12.0, 0.0)],
+    )
+    def test_apparent_temperature_matches_scalar(self, humidity, wind_speed, solar_radiation, use_numpy):
+        """Test apparent temperatures match calculate_apparent_temperature element-wise."""
+        humidities = None if humidity is None else [humidity + i for i in range(len(HORIZON_TEMPERATURES))]
+
+        result = calculate_apparent_temperature_batch(
+            HORIZON_TEMPERATURES, humidities, wind_speed, solar_radiation, use_numpy=use_numpy
+        )
+
+        assert result == [
+            calculate_apparent_temperature(
+                temperature, None if humidities is None else humidities[i], wind_speed, solar_radiation
+            )
+            for i, temperature in enumerate(HORIZON_TEMPERATURES)
+        ]
+
+    def test_length_mismatch(self):
+        """Test sequences of different length are rejected."""
+        with pytest.raises(ValueError):
+            calculate_dewpoint_batch([10.0, 12.0], [50.0], use_numpy=False)
+
+
 class TestGetComfortLevel:
     """Tests for get_comfort_level function."""
 
@@ -0,0 +1,375 @@
+"""Tests for the per-entry forecast coordinator."""
+import pytest
+from unittest.mock import Mock, patch
+
+from homeassistant.const import Platform
+
+from custom_components.local_weather_forecast.const import (
+    DOMAIN,
+    ENTITY_MAIN,
+    ENTITY_PRESSURE,
+    ENTITY_PRESSURE_CHANGE,
+    ENTITY_WEATHER,
+)
+from custom_components.local_weather_forecast.coordinator import (
+    ForecastSnapshot,
+    LocalForecastCoordinator,
+    async_get_coordinator,
+    async_unique_id_prefix,
+)
+from custom_components.local_weather_forecast.sensor import (
+    LocalForecastPressureChangeSensor,
+    LocalForecastPressureSensor,
+    LocalForecastTemperatureChangeSensor,
+)
+
+REGISTRY = "custom_components.local_weather_forecast.coordinator.er.async_get"
+
+
+def _registry(entity_ids=None, owners=None):
+    """Create a mock entity registry.
+
+    Args:
+        entity_ids: unique_id -> entity_id of registered entities
+        owners: entity_id -> config entry ID
+    """
+    entity_ids = entity_ids or {}
+    owners = owners or {}
+    registry = Mock()
+    registry.async_get_entity_id = Mock(
+        side_effect=lambda domain, platform, unique_id: entity_ids.get(unique_id)
+    )
+    registry.async_get = Mock(
+        side_effect=lambda entity_id: (
+            Mock(config_entry_id=owners[entity_id]) if entity_id in owners else None
+        )
+    )
+    return registry
+
+
+@pytest.fixture
+def mock_config_entry():
+    """Create a mock config entry."""
+    entry = Mock()
+    entry.data = {
+        "pressure_sensor": "sensor.test_pressure",
+        "pressure_type": "relative",
+        "elevation": 314.0,
+    }
+    entry.options = {}
+    entry.entry_id = "test_entry_id"
+    return entry
+
+
+@pytest.fixture
+def mock_hass(mock_config_entry):
+    """Create a mock Home Assistant instance with a registered coordinator."""
+    hass = Mock()
+    hass.states = Mock()
+    hass.states.get = Mock(return_value=None)
+    hass.data = {}
+    hass.data[DOMAIN] = {
+        mock_config_entry.entry_id: LocalForecastCoordinator(hass, mock_config_entry)
+    }
+    return hass
+
+
+@pytest.fixture
+def coordinator(mock_hass, mock_config_entry):
+    """Return the coordinator registered for the mock entry."""
+    return mock_hass.data[DOMAIN][mock_config_entry.entry_id]
+
+
+class TestLocalForecastCoordinator:
+    """Test LocalForecastCoordinator."""
+
+    def test_initial_snapshot_empty(self, coordinator, mock_config_entry):
+        """Test coordinator starts with an empty snapshot."""
+        assert coordinator.data == ForecastSnapshot()
+        assert coordinator.last_update is None
+        assert coordinator.config_data == mock_config_entry.data
+        assert coordinator.config_data is not mock_config_entry.data
+
+    def test_set_updated_data_returns_changed_fields(self, coordinator):
+        """Test only changed fields are reported."""
+        changed = coordinator.async_set_updated_data(p0=1013.2, pressure_change=-1.5)
+
+        assert changed == frozenset({"p0", "pressure_change"})
+        assert coordinator.data.p0 == 1013.2
+        assert coordinator.data.pressure_change == -1.5
+        assert coordinator.last_update is not None
+
+        # Same p0, new pressure change
+        changed = coordinator.async_set_updated_data(p0=1013.2, pressure_change=-2.0)
+        assert changed == frozenset({"pressure_change"})
+
+    def test_unchanged_data_does_not_notify(self, coordinator):
+        """Test re-publishing the same values does not wake listeners."""
+        listener = Mock()
+        coordinator.async_set_updated_data(zambretti=["Fine", 2, "B"])
+        coordinator.async_add_listener(listener)
+
+        assert coordinator.async_set_updated_data(zambretti=["Fine", 2, "B"]) == frozenset()
+        listener.assert_not_called()
+
+    def test_listener_field_filter(self, coordinator):
+        """Test listeners only fire for watched fields."""
+        pressure_listener = Mock()
+        all_listener = Mock()
+        coordinator.async_add_listener(pressure_listener, {"pressure_change"})
+        coordinator.async_add_listener(all_listener)
+
+        coordinator.async_set_updated_data(temperature_change=0.4)
+        pressure_listener.assert_not_called()
+        all_listener.assert_called_once_with(frozenset({"temperature_change"}))
+
+        coordinator.async_set_updated_data(pressure_change=1.1)
+        pressure_listener.assert_called_once_with(frozenset({"pressure_change"}))
+
+    def test_remove_listener(self, coordinator):
+        """Test removed listeners are not called."""
+        listener = Mock()
+        remove = coordinator.async_add_listener(listener)
+        remove()
+
+        coordinator.async_set_updated_data(p0=1000.0)
+        listener.assert_not_called()
+
+    def test_unknown_field_rejected(self, coordinator):
+        """Test typos in field names raise instead of silently dropping data."""
+        with pytest.raises(ValueError):
+            coordinator.async_set_updated_data(pressure=1013.0)
+        assert coordinator.data == ForecastSnapshot()
+
+
+class TestAsyncGetCoordinator:
+    """Test coordinator lookup."""
+
+    def test_returns_registered_coordinator(self, mock_hass, mock_config_entry, coordinator):
+        """Test lookup of a set up entry."""
+        assert async_get_coordinator(mock_hass, mock_config_entry) is coordinator
+
+    def test_mock_hass_without_data(self, mock_config_entry):
+        """Test lookup is safe when hass.data is not a dict."""
+        assert async_get_coordinator(Mock(), mock_config_entry) is None
+        assert async_get_coordinator(None, mock_config_entry) is None
+
+    def test_unknown_entry(self, mock_hass):
+        """Test lookup of an entry that is not set up."""
+        entry = Mock()
+        entry.entry_id = "other_entry"
+        assert async_get_coordinator(mock_hass, entry) is None
+
+
+class TestSensorsWithCoordinator:
+    """Test sensors exchange values through the coordinator."""
+
+    def test_sensor_picks_up_coordinator(self, mock_hass, mock_config_entry, coordinator):
+        """Test entities resolve the coordinator of their entry."""
+        sensor = LocalForecastPressureSensor(mock_hass, mock_config_entry)
+        assert sensor.coordinator is coordinator
+
+    @pytest.mark.asyncio
+    async def test_pressure_sensor_reads_snapshot(self, mock_hass, mock_config_entry, coordinator):
+        """Test pressure sensor uses p0 from the snapshot without reading states."""
+        coordinator.async_set_updated_data(p0=1008.4)
+        sensor = LocalForecastPressureSensor(mock_hass, mock_config_entry)
+
+        await sensor._update_from_main()
+
+        assert sensor.native_value == 1008.4
+        mock_hass.states.get.assert_not_called()
+
+    def test_temperature_change_published(self, mock_hass, mock_config_entry, coordinator):
+        """Test temperature change sensor publishes its result."""
+        sensor = LocalForecastTemperatureChangeSensor(mock_hass, mock_config_entry)
+        sensor._state = 0.75
+
+        sensor._publish_state()
+
+        assert coordinator.data.temperature_change == 0.75
+
+
+class TestEntityResolution:
+    """Test per-entry unique IDs and entity IDs."""
+
+    def test_first_station_keeps_legacy_unique_ids(self, coordinator):
+        """Test the first station uses the original YAML unique IDs."""
+        assert coordinator.unique_id(ENTITY_MAIN) == "local_forecast"
+        assert coordinator.unique_id(ENTITY_WEATHER, Platform.WEATHER) == "test_entry_id_weather"
+
+    def test_further_station_is_prefixed(self, coordinator):
+        """Test further stations prefix sensor unique IDs with the entry ID."""
+        coordinator.unique_id_prefix = "test_entry_id_"
+
+        assert coordinator.unique_id(ENTITY_PRESSURE) == "test_entry_id_local_forecast_pressure"
+        assert coordinator.unique_id(ENTITY_WEATHER, Platform.WEATHER) == "test_entry_id_weather"
+
+    def test_registered_entity_id_wins(self, coordinator):
+        """Test entities registered when added are resolved without the registry."""
+        coordinator.async_register_entity("local_forecast", "sensor.local_forecast_2")
+
+        with patch(REGISTRY) as async_get:
+            assert coordinator.entity_id(ENTITY_MAIN) == "sensor.local_forecast_2"
+        async_get.assert_not_called()
+
+    def test_registry_lookup_is_cached(self, coordinator):
+        """Test entities not added yet are looked up in the registry once."""
+        registry = _registry({"local_forecast_pressure": "sensor.garden_pressure"})
+
+        with patch(REGISTRY, return_value=registry):
+            assert coordinator.entity_id(ENTITY_PRESSURE) == "sensor.garden_pressure"
+            assert coordinator.entity_id(ENTITY_PRESSURE) == "sensor.garden_pressure"
+        assert registry.async_get_entity_id.call_count == 1
+
+    def test_unregistered_fallback(self, coordinator):
+        """Test only the first station falls back to the legacy entity IDs."""
+        with patch(REGISTRY, return_value=_registry()):
+            assert coordinator.entity_id(ENTITY_MAIN) == "sensor.local_forecast"
+            assert coordinator.entity_id(ENTITY_WEATHER, Platform.WEATHER) == (
+                "weather.local_weather_forecast_weather"
+            )
+
+            coordinator.unique_id_prefix = "test_entry_id_"
+            assert coordinator.entity_id(ENTITY_MAIN) is None
+            assert coordinator.entity_id(ENTITY_WEATHER, Platform.WEATHER) is None
+
+
+class TestUniqueIdPrefix:
+    """Test which entry owns the legacy unique IDs."""
+
+    def test_clean_install(self, mock_hass, mock_config_entry):
+        """Test the first entry set up on a clean install keeps the legacy IDs."""
+        mock_hass.data[DOMAIN] = {}
+
+        with patch(REGISTRY, return_value=_registry()):
+            assert async_unique_id_prefix(mock_hass, mock_config_entry) == ""
+
+    def test_owner_of_legacy_entity(self, mock_hass, mock_config_entry):
+        """Test the entry owning sensor.local_forecast keeps the legacy IDs."""
+        registry = _registry(
+            {"local_forecast": "sensor.local_forecast"},
+            {"sensor.local_forecast": "test_entry_id"},
+        )
+
+        with patch(REGISTRY, return_value=registry):
+            assert async_unique_id_prefix(mock_hass, mock_config_entry) == ""
+
+    def test_legacy_entity_owned_by_other_entry(self, mock_hass, mock_config_entry):
+        """Test a second station gets prefixed unique IDs."""
+        registry = _registry(
+            {"local_forecast": "sensor.local_forecast"},
+            {"sensor.local_forecast": "first_entry_id"},
+        )
+
+        with patch(REGISTRY, return_value=registry):
+            assert async_unique_id_prefix(mock_hass, mock_config_entry) == "test_entry_id_"
+
+    def test_legacy_ids_taken_by_loaded_entry(self, mock_hass):
+        """Test two entries set up together do not both take the legacy IDs."""
+        second = Mock(entry_id="second_entry_id", data={}, options={})
+
+        with patch(REGISTRY, return_value=_registry()):
+            assert async_unique_id_prefix(mock_hass, second) == "second_entry_id_"
+
+
+class TestMultipleStations:
+    """Test two config entries run isolated pipelines."""
+
+    def test_stations_do_not_share_entities(self, mock_hass, mock_config_entry, coordinator):
+        """Test sensors of each station use their own unique IDs and snapshot."""
+        second_entry = Mock(entry_id="second_entry_id", options={})
+        second_entry.data = dict(mock_config_entry.data, pressure_sensor="sensor.garden_pressure")
+        second = LocalForecastCoordinator(mock_hass, second_entry)
+        second.unique_id_prefix = "second_entry_id_"
+        mock_hass.data[DOMAIN][second_entry.entry_id] = second
+
+        first_sensor = LocalForecastPressureChangeSensor(mock_hass, mock_config_entry)
+        second_sensor = LocalForecastPressureChangeSensor(mock_hass, second_entry)
+        assert first_sensor.unique_id == "local_forecast_pressurechange"
+        assert second_sensor.unique_id == "second_entry_id_local_forecast_pressurechange"
+
+        second.async_register_entity(
+            second.unique_id(ENTITY_PRESSURE), "sensor.local_forecast_pressure_2"
+        )
+        assert second_sensor._internal_entity_id(ENTITY_PRESSURE) == "sensor.local_forecast_pressure_2"
+
+        second_sensor._state = -1.2
+        second_sensor._publish_state(None)
+        assert second.data.pressure_change == -1.2
+        assert coordinator.data.pressure_change is None
+        assert second.unique_id(ENTITY_PRESSURE_CHANGE) == second_sensor.unique_id
+
+
+class TestDetailRefresh:
+    """Test the shared, wall-clock aligned detail sensor refresh."""
+
+    TRACK = "custom_components.local_weather_forecast.coordinator.async_track_utc_time_change"
+
+    def test_one_timer_for_all_listeners(self, coordinator):
+        """Test the timer starts with the first listener and stops with the last."""
+        unsub_timer = Mock()
+        with patch(self.TRACK, return_value=unsub_timer) as track:
+            remove_first = coordinator.async_add_detail_refresh_listener(Mock())
+            remove_second = coordinator.async_add_detail_refresh_listener(Mock())
+
+        track.assert_called_once()
+        assert track.call_args.kwargs == {"minute": "/10", "second": 0}
+
+        remove_first()
+        unsub_timer.assert_not_called()
+        remove_second()
+        unsub_timer.assert_called_once()
+
+    def test_inputs_read_once_per_tick(self, mock_hass, coordinator):
+        """Test sun and reference time are read once and shared by all listeners."""
+        from datetime import datetime, timezone
+
+        updated = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        coordinator.async_set_updated_data(pressure_change_updated=updated)
+        mock_hass.states.get = Mock(return_value=Mock(state="below_horizon"))
+        listeners = [Mock(), Mock()]
+        with patch(self.TRACK, return_value=Mock()):
+            for listener in listeners:
+                coordinator.async_add_detail_refresh_listener(listener)
+
+        coordinator._async_refresh_details()
+
+        mock_hass.states.get.assert_called_once_with("sun.sun")
+        refresh = listeners[0].call_args.args[0]
+        assert listeners[1].call_args.args[0] is refresh
+        assert refresh.is_night is True
+        assert refresh.pressure_change_updated == updated
+
+    def test_detail_sensor_writes_only_visible_changes(self, mock_hass, mock_config_entry, coordinator):
+        """Test a tick only changing the minutes to the intervals does not write state."""
+        from datetime import datetime, timedelta, timezone
+
+        from custom_components.local_weather_forecast.coordinator import DetailRefresh
+        from custom_components.local_weather_forecast.sensor import LocalForecastZambrettiDetailSensor
+
+        now = datetime(2025, 1, 1, 12, 0, 30, tzinfo=timezone.utc)
+        sensor = LocalForecastZambrettiDetailSensor(mock_hass, mock_config_entry)
+        sensor.async_write_ha_state = Mock()
+        sensor._state = "Fine weather"
+        sensor._last_update_time = now
+        sensor._attributes = {
+            "forecast": [1, 1],
+            "icons": ["mdi:weather-partly-cloudy", "mdi:weather-partly-cloudy"],
+            "first_time": ["15:00", 180.0],
+            "second_time": ["21:00", 540.0],
+        }
+
+        sensor._periodic_update(DetailRefresh(now + timedelta(minutes=10), False, None))
+
+        sensor.async_write_ha_state.assert_not_called()
+        assert sensor._attributes["first_time"][1] == 170.0
+        assert coordinator.data.zambretti_detail["first_time"][1] == 170.0
+
+        # Sunset changes the icons
+        sensor._periodic_update(DetailRefresh(now + timedelta(minutes=20), True, None))
+
+        sensor.async_write_ha_state.assert_called_once()
+        assert sensor._attributes["icons"] == (
+            "mdi:weather-night-partly-cloudy", "mdi:weather-night-partly-cloudy"
+        )
@@ -0,0 +1,148 @@
+"""Tests for debug logging helpers and forecast traces."""
+import json
+import logging
+
+from custom_components.local_weather_forecast.debug_trace import (
+    ForecastTrace,
+    StageTimings,
+    debug_enabled,
+    timed_call,
+    timed_stage,
+)
+
+
+class _Timed:
+    """Object with timed methods."""
+
+    def __init__(self, stage_timings=None):
+        self.stage_timings = stage_timings
+
+    @timed_stage("sync")
+    def sync(self, value):
+        return value * 2
+
+    @timed_stage("async")
+    async def run(self, value):
+        return value + 1
+
+    @timed_stage("failing")
+    def failing(self):
+        raise ValueError("boom")
+
+
+class TestDebugEnabled:
+    """Test debug level guard."""
+
+    def test_follows_logger_level(self):
+        """Test guard reflects the effective logger level."""
+        logger = logging.getLogger("custom_components.local_weather_forecast.test_debug")
+
+        logger.setLevel(logging.INFO)
+        assert debug_enabled(logger) is False
+
+        logger.setLevel(logging.DEBUG)
+        assert debug_enabled(logger) is True
+
+        logger.setLevel(logging.NOTSET)
+
+
+class TestForecastTrace:
+    """Test ForecastTrace class."""
+
+    def test_record(self):
+        """Test records are kept in order."""
+        trace = ForecastTrace("hourly")
+
+        trace.record(hour=0, pressure=1013.2, condition="sunny")
+        trace.record(hour=1, pressure=1012.8, condition="cloudy")
+
+        assert [r["hour"] for r in trace.records] == [0, 1]
+        assert trace.records[1]["condition"] == "cloudy"
+        assert trace.dropped == 0
+
+    def test_max_records(self):
+        """Test records beyond the limit are counted, not kept."""
+        trace = ForecastTrace("daily", max_records=3)
+
+        for hour in range(5):
+            trace.record(hour=hour)
+
+        assert len(trace.records) == 3
+        assert trace.dropped == 2
+
+    def test_as_dict_is_json_serializable(self):
+        """Test trace can be exported for diagnostics."""
+        trace = ForecastTrace("hourly")
+        trace.record(hour=0, code=3, is_night=False)
+
+        data = trace.as_dict()
+
+        assert data["kind"] == "hourly"
+        assert data["records"] == [{"hour": 0, "code": 3, "is_night": False}]
+        json.dumps(data)
+
+
+class TestStageTimings:
+    """Test the rolling per-stage timings."""
+
+    def test_percentiles_over_window(self):
+        """Test p50/p95/max use the window while calls count every record."""
+        timings = StageTimings(window=100)
+        for ms in range(1, 121):
+            timings.record("stage", ms / 1000)
+
+        stage = timings.as_dict()["stage"]
+
+        # Window holds 21..120 ms
+        assert stage == {"calls": 120, "p50_ms": 70.0, "p95_ms": 115.0, "max_ms": 120.0}
+        json.dumps(timings.as_dict())
+
+    def test_single_record(self):
+        """Test every percentile of one call is its duration."""
+        timings = StageTimings()
+        timings.record("stage", 0.004)
+
+        assert timings.as_dict() == {
+            "stage": {"calls": 1, "p50_ms": 4.0, "p95_ms": 4.0, "max_ms": 4.0}
+        }
+
+    async def test_timed_stage_records_sync_and_async(self):
+        """Test the decorator times plain and coroutine methods."""
+        timed = _Timed(StageTimings())
+
+        assert timed.sync(2) == 4
+        assert await timed.run(2) == 3
+        assert timed.sync.__name__ == "sync"
+
+        stages = timed.stage_timings.as_dict()
+        assert stages["sync"]["calls"] == 1
+        assert stages["async"]["calls"] == 1
+
+    def test_timed_stage_records_failures(self):
+        """Test a call raising an exception is still recorded."""
+        timed = _Timed(StageTimings())
+
+        try:
+            timed.failing()
+        except ValueError:
+            pass
+
+        assert timed.stage_timings.as_dict()["failing"]["calls"] == 1
+
+    async def test_disabled_timings(self):
+        """Test methods run unchanged without timings."""
+        timed = _Timed()
+
+        assert timed.sync(3) == 6
+        assert await timed.run(3) == 4
+
+    def test_timed_call(self):
+        """Test wrapping a callable records a stage only with timings."""
+        def generate():
+            return [1, 2]
+
+        assert timed_call(None, "hourly_forecast", generate) is generate
+
+        timings = StageTimings()
+        assert timed_call(timings, "hourly_forecast", generate)() == [1, 2]
+        assert timings.as_dict()["hourly_forecast"]["calls"] == 1
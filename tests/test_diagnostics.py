@@ -0,0 +1,125 @@
+"""Tests for the config entry diagnostics."""
+import json
+from unittest.mock import Mock
+
+from custom_components.local_weather_forecast.const import DOMAIN
+from custom_components.local_weather_forecast.coordinator import LocalForecastCoordinator
+from custom_components.local_weather_forecast.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.local_weather_forecast.sensor import (
+    LocalForecastMainSensor,
+    LocalForecastStageTimingSensor,
+)
+
+
+def _entry(stage_timing=False):
+    entry = Mock()
+    entry.data = {
+        "pressure_sensor": "sensor.test_pressure",
+        "latitude": 48.15,
+        "stage_timing": stage_timing,
+    }
+    entry.options = {}
+    entry.entry_id = "test_entry_id"
+    return entry
+
+
+def _hass(entry):
+    hass = Mock()
+    hass.states.get = Mock(return_value=None)
+    hass.data = {DOMAIN: {entry.entry_id: LocalForecastCoordinator(hass, entry)}}
+    return hass
+
+
+class TestDiagnostics:
+    """Test diagnostics of a config entry."""
+
+    async def test_timings_disabled(self):
+        """Test diagnostics without the stage_timing option."""
+        entry = _entry()
+        hass = _hass(entry)
+        hass.data[DOMAIN][entry.entry_id].async_set_updated_data(p0=1013.2)
+
+        diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+        assert diagnostics["entry"]["data"]["latitude"] == "**REDACTED**"
+        assert diagnostics["coordinator"]["snapshot"]["p0"] == 1013.2
+        assert diagnostics["coordinator"]["history_fallback_queries"] == 0
+        assert diagnostics["coordinator"]["update_counters"] == {}
+        assert diagnostics["stage_timings"] is None
+        json.dumps(diagnostics, default=str)
+
+    async def test_timings_enabled(self):
+        """Test diagnostics report the recorded stages."""
+        entry = _entry(stage_timing=True)
+        hass = _hass(entry)
+        coordinator = hass.data[DOMAIN][entry.entry_id]
+        coordinator.stage_timings.record("main_update", 0.002)
+        coordinator.forecast_traces["hourly"] = {"kind": "hourly", "records": []}
+
+        diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+        assert diagnostics["stage_timings"]["main_update"]["calls"] == 1
+        assert diagnostics["forecast_traces"] == {"hourly": {"kind": "hourly", "records": []}}
+
+    async def test_update_counters(self):
+        """Test the throttling counters of registered sensors are reported without timings."""
+        entry = _entry()
+        hass = _hass(entry)
+        coordinator = hass.data[DOMAIN][entry.entry_id]
+        main = LocalForecastMainSensor(hass, entry)
+        main.entity_id = "sensor.local_forecast"
+        main.updates_skipped = 4
+        main.updates_coalesced = 1
+        remove = coordinator.async_register_update_counters(main.entity_id, main._update_counters)
+
+        diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+        assert diagnostics["coordinator"]["update_counters"] == {
+            "sensor.local_forecast": {"updates_skipped": 4, "updates_coalesced": 1}
+        }
+        remove()
+        assert coordinator.update_counters() == {}
+
+    async def test_unknown_entry(self):
+        """Test diagnostics of an entry that is not set up."""
+        entry = _entry()
+        hass = Mock()
+        hass.data = {DOMAIN: {}}
+
+        diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+        assert diagnostics["coordinator"] is None
+
+
+class TestStageTimingSensor:
+    """Test the optional stage timing sensor."""
+
+    def test_reports_stages_and_throttling(self):
+        """Test the sensor state counts timed calls and reports throttling."""
+        entry = _entry(stage_timing=True)
+        hass = _hass(entry)
+        coordinator = hass.data[DOMAIN][entry.entry_id]
+        main = LocalForecastMainSensor(hass, entry)
+        main.entity_id = "sensor.local_forecast"
+        main.updates_skipped = 3
+        coordinator.async_register_update_counters(main.entity_id, main._update_counters)
+        sensor = LocalForecastStageTimingSensor(hass, entry)
+
+        coordinator.stage_timings.record("main_update", 0.001)
+        coordinator.stage_timings.record("weather_condition", 0.003)
+        sensor._update_from_timings()
+
+        assert sensor.native_value == 2
+        assert set(sensor.extra_state_attributes["stages"]) == {"main_update", "weather_condition"}
+        assert sensor.extra_state_attributes["update_counters"] == {
+            "sensor.local_forecast": {"updates_skipped": 3, "updates_coalesced": 0}
+        }
+
+    def test_disabled_entry_has_no_timings(self):
+        """Test sensors of an entry without the option see no timings."""
+        entry = _entry()
+        hass = _hass(entry)
+
+        assert LocalForecastMainSensor(hass, entry).stage_timings is None
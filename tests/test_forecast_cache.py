@@ -0,0 +1,136 @@
+"""Tests for the weather entity forecast cache."""
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.local_weather_forecast.forecast_cache import (
+    ForecastCache,
+    forecast_signature,
+    quantize,
+)
+
+
+class TestQuantize:
+    """Test input quantization."""
+
+    @pytest.mark.parametrize(
+        "value,step,expected",
+        [
+            (1013.26, 0.1, 1013.3),
+            (1013.24, 0.1, 1013.2),
+            (-1.55, 0.1, -1.6),
+            (67.4, 1.0, 67.0),
+            (184.0, 10.0, 180.0),
+            (None, 0.1, None),
+        ],
+    )
+    def test_quantize(self, value, step, expected):
+        """Test values are rounded to the step."""
+        assert quantize(value, step) == expected
+
+
+class TestForecastCache:
+    """Test ForecastCache."""
+
+    def test_miss_then_hit(self):
+        """Test counters for a miss followed by a hit."""
+        cache = ForecastCache()
+        assert cache.get("key") is None
+
+        cache.put("key", [{"temperature": 12.0}])
+
+        assert cache.get("key") == [{"temperature": 12.0}]
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.stats["hit_rate"] == 0.5
+
+    def test_returns_copies(self):
+        """Test callers cannot modify cached forecasts."""
+        cache = ForecastCache()
+        forecasts = [{"temperature": 12.0}]
+        cache.put("key", forecasts)
+        forecasts[0]["temperature"] = 99.0
+
+        result = cache.get("key")
+        result[0]["temperature"] = 50.0
+
+        assert cache.get("key") == [{"temperature": 12.0}]
+
+    def test_lru_eviction(self):
+        """Test least recently used entry is evicted."""
+        cache = ForecastCache(max_size=2)
+        cache.put("a", [])
+        cache.put("b", [])
+        cache.get("a")  # a is now most recently used
+        cache.put("c", [])
+
+        assert cache.get("b") is None
+        assert cache.get("a") == []
+        assert cache.get("c") == []
+
+    def test_ttl_expiry(self):
+        """Test entries expire after the TTL."""
+        cache = ForecastCache(ttl=300)
+        with patch(
+            "custom_components.local_weather_forecast.forecast_cache.time.monotonic",
+            return_value=1000.0,
+        ):
+            cache.put("key", [{"temperature": 12.0}])
+
+        with patch(
+            "custom_components.local_weather_forecast.forecast_cache.time.monotonic",
+            return_value=1299.0,
+        ):
+            assert cache.get("key") is not None
+
+        with patch(
+            "custom_components.local_weather_forecast.forecast_cache.time.monotonic",
+            return_value=1300.0,
+        ):
+            assert cache.get("key") is None
+        assert cache.stats["size"] == 0
+
+    def test_invalidate(self):
+        """Test explicit invalidation clears all entries."""
+        cache = ForecastCache()
+        cache.put("hourly", [])
+        cache.put("daily", [])
+
+        cache.invalidate()
+        cache.invalidate()  # Nothing cached - not counted
+
+        assert cache.get("hourly") is None
+        assert cache.stats["invalidations"] == 1
+
+    def test_stale_generation_not_stored(self):
+        """Test a result calculated before an invalidation is dropped."""
+        cache = ForecastCache()
+        generation = cache.generation
+
+        cache.invalidate()  # Nothing cached yet, still a new generation
+        cache.put("hourly", [{"temperature": 10.0}], generation)
+        assert cache.get("hourly") is None
+
+        cache.put("hourly", [{"temperature": 11.0}], cache.generation)
+        assert cache.get("hourly") == [{"temperature": 11.0}]
+
+
+class TestForecastSignature:
+    """Test forecast change detection."""
+
+    def test_same_hour_same_values_equal(self):
+        """Test recalculation within the same hour compares equal."""
+        first = [{"datetime": "2025-01-01T12:00:05+00:00", "temperature": 12.0}]
+        second = [{"datetime": "2025-01-01T12:40:00+00:00", "temperature": 12.0}]
+
+        assert forecast_signature(first) == forecast_signature(second)
+
+    def test_changed_value_or_hour_differs(self):
+        """Test value or hour changes are detected."""
+        base = [{"datetime": "2025-01-01T12:00:00+00:00", "temperature": 12.0}]
+        warmer = [{"datetime": "2025-01-01T12:00:00+00:00", "temperature": 12.5}]
+        next_hour = [{"datetime": "2025-01-01T13:00:00+00:00", "temperature": 12.0}]
+
+        assert forecast_signature(base) != forecast_signature(warmer)
+        assert forecast_signature(base) != forecast_signature(next_hour)
+        assert forecast_signature(None) is None
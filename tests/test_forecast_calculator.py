@@ -7,6 +7,7 @@ import pytest
 from custom_components.local_weather_forecast.forecast_calculator import (
     DailyForecastGenerator,
     ForecastCalculator,
+    ForecastEnvironment,
     HourlyForecastGenerator,
     PressureModel,
     RainProbabilityCalculator,
@@ -119,6 +120,38 @@ class TestPressureModel:
         assert change_6h > change_3h  # Still increasing
         assert change_6h <= (change_3h * 2.0)  # Limited by max_change cap
 
+    @pytest.mark.parametrize(
+        "change_3h,damping",
+        [(-4.5, 0.95), (2.1, 0.8), (9.0, 0.95), (-30.0, 0.99), (3.0, 1.0), (0.5, 0.95)],
+    )
+    def test_closed_form_matches_loop(self, change_3h, damping):
+        """Test geometric-series prediction equals the damped hourly sum."""
+        model = PressureModel(1005.0, change_3h, damping_factor=damping)
+
+        for hours in range(0, 73):
+            total, rate = 0.0, model.change_rate_1h
+            for _ in range(hours):
+                total += rate
+                rate *= damping
+            max_change = 20.0 * (hours / 24.0)
+            expected = max(910.0, min(1085.0, 1005.0 + max(-max_change, min(max_change, total))))
+
+            assert model.predict(hours) == pytest.approx(expected, abs=1e-9)
+
+    def test_predict_many(self):
+        """Test horizon prediction matches predict/get_trend per hour."""
+        model = PressureModel(current_pressure=1012.0, pressure_change_3h=-3.0)
+        hours = range(0, 25, 3)
+
+        pressures, trends = model.predict_many(hours)
+        as_array, _ = model.predict_many(hours, as_array=True)
+
+        assert pressures == [model.predict(h) for h in hours]
+        assert trends == [model.get_trend(h) for h in hours]
+        assert as_array.typecode == "d"
+        assert list(as_array) == pressures
+        assert model.predict_many([]) == ([], [])
+
 
 class TestTemperatureModel:
     """Test TemperatureModel class."""
@@ -442,6 +475,77 @@ class TestHourlyForecastGenerator:
             assert "temperature" in forecast
             assert "precipitation_probability" in forecast
 
+    def test_environment_matches_hass(self):
+        """Test models built from a ForecastEnvironment forecast like models reading hass."""
+        from datetime import timedelta
+
+        from homeassistant.core import State
+
+        now = datetime.now(timezone.utc)
+        mock_hass = create_mock_hass()
+        mock_hass.config.language = "de"
+        mock_hass.states.get.return_value = State(
+            "sun.sun",
+            "above_horizon",
+            {
+                "next_rising": (now + timedelta(hours=12)).isoformat(),
+                "next_setting": (now + timedelta(hours=6)).isoformat(),
+            },
+        )
+        entry = Mock(data={"hemisphere": "south"}, options={})
+
+        def run(hass, environment):
+            temp_model = TemperatureModel(
+                15.0, 0.5, hass=hass, latitude=48.0, longitude=21.0, environment=environment
+            )
+            zambretti = ZambrettiForecaster(
+                hass=hass, latitude=48.0, config_entry=entry if hass else None, environment=environment
+            )
+            generator = HourlyForecastGenerator(
+                hass,
+                PressureModel(1008.0, -1.5),
+                temp_model,
+                zambretti,
+                wind_direction=200,
+                wind_speed=4.0,
+                latitude=48.0,
+                config_entry=entry if hass else None,
+                environment=environment,
+            )
+            return [
+                {key: value for key, value in forecast.items() if key != "datetime"}
+                for forecast in generator.generate(hours_count=12)
+            ]
+
+        environment = ForecastEnvironment.from_hass(mock_hass, entry)
+        assert environment.hemisphere == "south"
+
+        expected = run(mock_hass, None)
+        mock_hass.states.get.side_effect = AssertionError("state machine read")
+        assert run(None, environment) == expected
+
+    def test_generate_with_trace(self):
+        """Test one trace record is collected per forecast hour."""
+        from custom_components.local_weather_forecast.debug_trace import ForecastTrace
+
+        mock_hass = create_mock_hass()
+        mock_hass.states.get.return_value = None
+        trace = ForecastTrace("hourly")
+
+        generator = HourlyForecastGenerator(
+            mock_hass,
+            PressureModel(1008.0, -2.0),
+            TemperatureModel(15.0, 0.0, diurnal_amplitude=0.0),
+            ZambrettiForecaster(),
+            trace=trace,
+        )
+
+        forecasts = generator.generate(hours_count=6, interval_hours=1)
+
+        assert len(trace.records) == len(forecasts)
+        assert [r["hour"] for r in trace.records] == list(range(6))
+        assert trace.records[0]["condition"] == forecasts[0]["condition"]
+
     def test_generate_with_current_rain(self):
         """Test forecast generation with current rain - forecasts use model, NOT rain override."""
         from datetime import datetime, timezone, timedelta
@@ -1,7 +1,10 @@
 """Test forecast code to condition mapping."""
 import pytest
+from custom_components.local_weather_forecast import forecast_mapping
+from custom_components.local_weather_forecast.forecast_data import FORECAST_TEXTS
 from custom_components.local_weather_forecast.forecast_mapping import (
-    forecast_code_to_condition
+    forecast_code_to_condition,
+    forecast_text_to_code,
 )
 
 
@@ -72,5 +75,62 @@ class TestForecastCodeToCondition:
         assert forecast_code_to_condition(20, False, 15.0, is_current_state=False) == "rainy"
 
 
+class TestForecastTextToCode:
+    """Test multilingual text → code mapping."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Stormy, much rain", 25),
+            ("Búrlivé, veľa dažďa", 25),
+            ("Rain at frequent intervals", 22),
+            ("Zamračené", 13),
+            ("Partly cloudy", 3),
+            ("Showery, rain", 15),
+            ("Possibly a shower", 3),  # no keyword class → ultimate fallback
+            ("Wechselhaft", 3),
+            ("Settled fine", 0),
+            ("Fine, becoming less settled", 3),
+        ],
+    )
+    def test_keyword_priority(self, text, expected):
+        """Test keyword classes are applied in priority order."""
+        assert forecast_text_to_code(text) == expected
+
+    def test_forecast_num_rules(self):
+        """Test heavy rain zone, caveat and fallback rules of forecast_num."""
+        assert forecast_text_to_code("Settled fine", 21) == 21
+        assert forecast_text_to_code("Fine, becoming less settled", 0) == 0
+        assert forecast_text_to_code("Fine, becoming less settled", 5) == 3
+        assert forecast_text_to_code("???", 30) == 25
+        assert forecast_text_to_code("???", 7) == 7
+
+    def test_overlapping_keywords(self):
+        """Test keywords sharing a prefix are all detected in one pass."""
+        # "schönwetter" (fine) starts with "schön" (fine), "fairly" (partly) with "fair" (fine)
+        assert forecast_text_to_code("schönwetter") == 0
+        assert forecast_text_to_code("fairly cloudy") == 3
+        assert forecast_text_to_code("bel tempo, possibili") == 3
+        # "heavy rain" also contains the rain keyword "rain"
+        assert forecast_text_to_code("heavy rain") == 22
+        # "piogge frequenti" (heavy rain) starts with "piogge" (rain)
+        assert forecast_text_to_code("piogge frequenti") == 22
+
+    def test_known_texts_precomputed(self):
+        """Test every forecast text of every language is in the lookup table."""
+        texts = {text.lower() for texts in FORECAST_TEXTS for text in texts}
+        assert texts <= set(forecast_mapping._KNOWN_TEXT_CLASSES)
+
+    def test_unknown_texts_memoized(self):
+        """Test unknown texts are classified once."""
+        forecast_mapping._classify_unknown_text.cache_clear()
+
+        forecast_text_to_code("Some custom rain text")
+        forecast_text_to_code("Some custom rain text")
+
+        info = forecast_mapping._classify_unknown_text.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
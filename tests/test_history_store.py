@@ -0,0 +1,207 @@
+"""Tests for the change sensor history store."""
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock, patch
+
+from homeassistant.helpers.restore_state import RestoreEntity
+
+from custom_components.local_weather_forecast.const import (
+    PRESSURE_CHANGE_MINUTES,
+    PRESSURE_HISTORY_MAX_RECORDS,
+)
+from custom_components.local_weather_forecast.history_store import (
+    PRESSURE_CHANGE_HISTORY,
+    ChangeHistoryStore,
+    async_remove_histories,
+    decode_history,
+    downsample_history,
+    encode_history,
+    get_storage_key,
+)
+from custom_components.local_weather_forecast.sensor import (
+    LocalForecastPressureChangeSensor,
+    LocalWeatherForecastEntity,
+)
+
+
+def _make_history(count: int, start_value: float = 1010.0) -> list:
+    """Create readings 5 minutes apart (whole seconds, like stored data)."""
+    start = datetime.now().replace(microsecond=0) - timedelta(minutes=5 * count)
+    return [
+        (start + timedelta(minutes=5 * i), round(start_value + i * 0.1, 1))
+        for i in range(count)
+    ]
+
+
+class _MemoryStore:
+    """In-memory stand-in for Store with a delayed save that never fires."""
+
+    def __init__(self, files: dict, key: str) -> None:
+        self._files = files
+        self.key = key
+        self.pending = None
+
+    async def async_load(self):
+        return self._files.get(self.key)
+
+    def async_delay_save(self, data_func, delay=0):
+        self.pending = data_func
+
+    async def async_save(self, data):
+        self.pending = None
+        self._files[self.key] = data
+
+    async def async_remove(self):
+        self.pending = None
+        self._files.pop(self.key, None)
+
+
+def _make_change_sensor(files: dict) -> LocalForecastPressureChangeSensor:
+    """Create a pressure change sensor whose history store lives in files."""
+    entry = Mock()
+    entry.data = {"pressure_sensor": "sensor.test_pressure", "pressure_type": "absolute"}
+    entry.options = {}
+    entry.entry_id = "test_entry_id"
+    sensor = LocalForecastPressureChangeSensor(Mock(), entry)
+    sensor._history_store = ChangeHistoryStore(
+        sensor.hass, entry.entry_id, PRESSURE_CHANGE_HISTORY
+    )
+    return sensor
+
+
+class TestHistoryEncoding:
+    """Test columnar encoding of history."""
+
+    def test_round_trip(self):
+        """Test encode/decode preserves timestamps and values."""
+        history = _make_history(10)
+
+        data = encode_history(history)
+
+        assert data["dt"][0] == 0
+        assert data["dt"][-1] == 9 * 300
+        assert decode_history(data) == history
+
+    def test_ring_buffer_keeps_newest(self):
+        """Test only the newest max_records readings are stored."""
+        history = _make_history(10)
+
+        decoded = decode_history(encode_history(history, max_records=4))
+
+        assert decoded == history[-4:]
+
+    def test_downsample_keeps_newest_per_interval(self):
+        """Test readings closer than the sample interval are dropped, newest kept."""
+        start = datetime(2025, 1, 1, 12, 0, 0)
+        history = [(start + timedelta(seconds=i), 1010.0 + i) for i in range(25)]
+
+        kept = downsample_history(history, 10)
+
+        assert [ts.second for ts, _ in kept] == [4, 14, 24]
+        assert downsample_history(history, 0) == history
+
+    def test_high_frequency_sensor_keeps_full_window(self):
+        """Test a 1 Hz barometer restores the whole 3 h pressure window."""
+        end = datetime.now().replace(microsecond=0)
+        history = [
+            (end - timedelta(seconds=seconds), 1010.0)
+            for seconds in range(PRESSURE_CHANGE_MINUTES * 60, -1, -1)
+        ]
+
+        decoded = decode_history(encode_history(history))
+
+        assert len(decoded) <= PRESSURE_HISTORY_MAX_RECORDS
+        assert decoded[-1][0] == end
+        assert decoded[0][0] <= end - timedelta(minutes=PRESSURE_CHANGE_MINUTES) + timedelta(seconds=10)
+
+    def test_empty_history(self):
+        """Test empty history encodes and decodes."""
+        data = encode_history([])
+
+        assert data == {"t0": None, "dt": [], "v": []}
+        assert decode_history(data) == []
+        assert decode_history(None) == []
+
+    def test_malformed_data_ignored(self):
+        """Test malformed stored data returns empty history."""
+        assert decode_history({"t0": "abc", "dt": [0], "v": [1.0]}) == []
+        assert decode_history({"t0": 1700000000.0}) == []
+
+    def test_storage_key_per_entry(self):
+        """Test storage key contains the entry id and history name."""
+        key = get_storage_key("abc123", PRESSURE_CHANGE_HISTORY)
+
+        assert key == "local_weather_forecast.abc123_pressure_change_history"
+
+
+class TestLegacyHistoryMigration:
+    """Test parsing of history stored in state attributes by older versions."""
+
+    def test_parse_legacy_history(self):
+        """Test ISO pairs from the old "history" attribute are parsed."""
+        now = datetime.now()
+        attributes = {
+            "history": [
+                [now.isoformat(), 1012.5],
+                ["not a date", 1012.0],
+                [(now + timedelta(minutes=5)).isoformat(), "1012.7"],
+            ]
+        }
+
+        history = LocalWeatherForecastEntity._parse_legacy_history(attributes)
+
+        assert history == [(now, 1012.5), (now + timedelta(minutes=5), 1012.7)]
+
+    def test_parse_legacy_history_missing(self):
+        """Test missing attribute returns empty history."""
+        assert LocalWeatherForecastEntity._parse_legacy_history({}) == []
+        assert LocalWeatherForecastEntity._parse_legacy_history(Mock(get=Mock(return_value=None))) == []
+
+
+class TestChangeSensorHistoryFlush:
+    """Test the history is written when a change sensor is removed."""
+
+    @staticmethod
+    def _patch_store(files: dict):
+        return patch(
+            "custom_components.local_weather_forecast.history_store.Store",
+            side_effect=lambda hass, version, key: _MemoryStore(files, key),
+        )
+
+    async def test_reload_restores_latest_readings(self):
+        """Test remove + re-add restores readings whose delayed save never ran."""
+        files: dict = {}
+        history = _make_history(10)
+        with self._patch_store(files), patch.object(
+            RestoreEntity, "async_will_remove_from_hass", AsyncMock()
+        ):
+            sensor = _make_change_sensor(files)
+            sensor._history = history[:5]
+            sensor._history_store.async_schedule_save(lambda: list(sensor._history))
+            sensor._history = history
+            sensor._history_store.async_schedule_save(lambda: list(sensor._history))
+            assert files == {}
+
+            await sensor.async_will_remove_from_hass()
+
+            assert sensor._history_store._store.pending is None
+            reloaded = _make_change_sensor(files)
+            restored = await reloaded._history_store.async_load()
+
+        assert restored == history
+        assert restored[-1] == history[-1]
+
+    async def test_entry_removal_leaves_no_file(self):
+        """Test no pending write recreates the file after the entry is deleted."""
+        files: dict = {}
+        with self._patch_store(files), patch.object(
+            RestoreEntity, "async_will_remove_from_hass", AsyncMock()
+        ):
+            sensor = _make_change_sensor(files)
+            sensor._history = _make_history(3)
+            sensor._history_store.async_schedule_save(lambda: list(sensor._history))
+
+            await sensor.async_will_remove_from_hass()
+            await async_remove_histories(sensor.hass, "test_entry_id")
+
+            assert sensor._history_store._store.pending is None
+        assert files == {}
@@ -1,6 +1,7 @@
 """Tests for language.py module."""
 from types import SimpleNamespace
 
+from custom_components.local_weather_forecast.forecast_data import WIND_TYPES
 from custom_components.local_weather_forecast.language import (
     get_language_index,
     get_wind_type,
@@ -73,6 +74,42 @@ def test_get_language_index_no_hass():
     assert get_language_index(None) == DEFAULT_LANGUAGE_INDEX
 
 
+def test_get_language_index_uses_given_entry():
+    """Test each station uses the language of its own config entry."""
+    first = SimpleNamespace(data={"language": "de"}, options={})
+    second = SimpleNamespace(data={"language": "en"}, options={"language": "sk"})
+    hass = MockHass("en")
+    hass.config_entries = SimpleNamespace(async_entries=lambda domain: [first, second])
+
+    assert get_language_index(hass) == 0
+    assert get_language_index(hass, second) == 4
+    assert get_wind_type(hass, 99, second) == WIND_TYPES[0][4]
+
+
+def test_get_language_index_cached_per_entry():
+    """Test the index is resolved once per entry until invalidated."""
+    from custom_components.local_weather_forecast.const import DOMAIN
+    from custom_components.local_weather_forecast.coordinator import LocalForecastCoordinator
+
+    entry = SimpleNamespace(entry_id="station", data={}, options={})
+    hass = MockHass("de")
+    hass.data = {}
+    coordinator = LocalForecastCoordinator(hass, entry)
+    hass.data[DOMAIN] = {entry.entry_id: coordinator}
+
+    assert get_language_index(hass, entry) == 0
+
+    # Not resolved again while cached
+    hass.config.language = "it"
+    entry.options["language"] = "sk"
+    assert get_language_index(hass, entry) == 0
+    assert get_fog_risk_text(hass, "none", entry) == get_fog_risk_text(MockHass("de"), "none")
+
+    # Options or core config changed
+    coordinator.async_invalidate_language()
+    assert get_language_index(hass, entry) == 4
+
+
 # Test get_wind_type
 def test_get_wind_type_calm():
     """Test wind type for calm conditions."""
@@ -0,0 +1,147 @@
+"""Tests for the last known good cache of source sensors."""
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from homeassistant.core import State
+from homeassistant.util import dt as dt_util
+
+from custom_components.local_weather_forecast.const import HISTORY_FALLBACK_NEGATIVE_TTL
+from custom_components.local_weather_forecast.last_known_good import LastKnownGoodCache
+
+MODULE = "custom_components.local_weather_forecast.last_known_good"
+SENSOR = "sensor.outdoor_pressure"
+
+
+def _state(value: str, age: timedelta = timedelta(0)) -> State:
+    """Create a state of the test sensor updated age ago."""
+    updated = dt_util.utcnow() - age
+    return State(SENSOR, value, last_updated=updated, last_changed=updated)
+
+
+class _Harness:
+    """Cache with a fake state machine, event tracking and recorder."""
+
+    def __init__(self, current: State | None = None, recorded: list[State] | None = None):
+        self.states = {SENSOR: current} if current is not None else {}
+        self.listeners = []
+        self.recorded = recorded or []
+        self.query_started = asyncio.Event()
+        self.release_query = asyncio.Event()
+        self.release_query.set()
+
+        hass = Mock()
+        hass.states.get = self.states.get
+        self.cache = LastKnownGoodCache(hass)
+
+        recorder = Mock()
+        recorder.async_add_executor_job = AsyncMock(side_effect=self._query)
+        self.recorder = recorder
+
+    async def _query(self, func, hass, number_of_states, entity_id):
+        self.query_started.set()
+        await self.release_query.wait()
+        return {entity_id: list(self.recorded)}
+
+    def _track(self, hass, entity_ids, action):
+        self.listeners.append(action)
+        return Mock()
+
+    def set_state(self, state: State) -> None:
+        """Change the sensor state and send the state change event."""
+        self.states[SENSOR] = state
+        event = Mock(data={"entity_id": SENSOR, "new_state": state})
+        for listener in self.listeners:
+            listener(event)
+
+    def patches(self):
+        return (
+            patch(f"{MODULE}.async_track_state_change_event", side_effect=self._track),
+            patch(f"{MODULE}.get_instance", return_value=self.recorder),
+        )
+
+
+@pytest.fixture
+def harness_factory():
+    """Create harnesses with the tracking and recorder patches applied."""
+    started = []
+
+    def factory(**kwargs):
+        harness = _Harness(**kwargs)
+        for active in harness.patches():
+            active.start()
+            started.append(active)
+        return harness
+
+    yield factory
+    for active in started:
+        active.stop()
+
+
+class TestLastKnownGoodCache:
+    """Test the unavailable sensor fallback."""
+
+    async def test_live_states_need_no_query(self, harness_factory):
+        """Test a value seen in live states is used without the recorder."""
+        harness = harness_factory(current=_state("1012.5"))
+        harness.cache.async_track(SENSOR)
+        harness.set_state(_state("1011.0"))
+        harness.set_state(_state("unavailable"))
+
+        assert await harness.cache.async_get(SENSOR) == 1011.0
+        assert harness.cache.queries == 0
+
+    async def test_one_bounded_query_per_outage(self, harness_factory):
+        """Test concurrent lookups share one query and its result is kept."""
+        harness = harness_factory(
+            current=_state("unavailable"),
+            recorded=[_state("1009.0", timedelta(hours=2)), _state("1010.4", timedelta(hours=1)),
+                      _state("unavailable", timedelta(minutes=30))],
+        )
+        harness.release_query.clear()
+
+        lookups = [asyncio.ensure_future(harness.cache.async_get(SENSOR)) for _ in range(3)]
+        await harness.query_started.wait()
+        harness.release_query.set()
+
+        assert await asyncio.gather(*lookups) == [1010.4] * 3
+        assert await harness.cache.async_get(SENSOR) == 1010.4
+        assert harness.cache.queries == 1
+        assert harness.recorder.async_add_executor_job.call_args.args[2] > 0
+
+    async def test_negative_cache(self, harness_factory):
+        """Test an empty result is not queried again until the TTL expires."""
+        harness = harness_factory(current=_state("unavailable"))
+
+        with patch(f"{MODULE}.time.monotonic", return_value=1000.0):
+            assert await harness.cache.async_get(SENSOR) is None
+            assert await harness.cache.async_get(SENSOR) is None
+        assert harness.cache.queries == 1
+
+        with patch(f"{MODULE}.time.monotonic", return_value=1001.0 + HISTORY_FALLBACK_NEGATIVE_TTL):
+            assert await harness.cache.async_get(SENSOR) is None
+        assert harness.cache.queries == 2
+
+    async def test_live_state_ends_negative_cache(self, harness_factory):
+        """Test a valid live state replaces a failed lookup."""
+        harness = harness_factory(current=_state("unavailable"))
+        assert await harness.cache.async_get(SENSOR) is None
+
+        harness.set_state(_state("1015.2"))
+        harness.set_state(_state("unknown"))
+
+        assert await harness.cache.async_get(SENSOR) == 1015.2
+        assert harness.cache.queries == 1
+
+    async def test_old_values_are_not_used(self, harness_factory):
+        """Test values older than the fallback window are ignored."""
+        harness = harness_factory(
+            current=_state("unavailable"),
+            recorded=[_state("1008.0", timedelta(hours=30))],
+        )
+        assert await harness.cache.async_get(SENSOR) is None
+
+        harness.set_state(_state("1013.0", timedelta(hours=25)))
+        assert await harness.cache.async_get(SENSOR) is None
@@ -2,8 +2,16 @@
 from unittest.mock import patch
 from datetime import datetime
 
+import pytest
+
 from custom_components.local_weather_forecast.negretti_zambra import (
+    _FALL_OPT,
+    _RISE_OPT,
+    _STEADY_OPT,
+    _negretti_core,
+    _wind_sector,
     calculate_negretti_zambra_forecast,
+    calculate_negretti_zambra_forecast_batch,
     _map_zambretti_to_letter,
 )
 
@@ -591,3 +599,66 @@ def test_summer_adjustment_high_pressure_falling(mock_datetime):
     assert 0 <= num <= 25
     assert len(text) > 0
 
+
+
+def test_lookup_tables():
+    """Test the precompiled lookup tables cover all 44 options."""
+    for table in (_FALL_OPT, _STEADY_OPT, _RISE_OPT):
+        assert isinstance(table, tuple)
+        assert len(table) == 44
+        assert all(0 <= idx <= 25 for idx in table)
+
+
+def test_wind_sector_boundaries():
+    """Test wind sectors use the same boundaries as the 16 compass points."""
+    assert _wind_sector(0.0) == 0  # N
+    assert _wind_sector(11.25) == 0  # N (upper bound inclusive)
+    assert _wind_sector(11.26) == 1  # NNE
+    assert _wind_sector(180.0) == 8  # S
+    assert _wind_sector(348.75) == 15  # NNW
+    assert _wind_sector(348.76) == 0  # N
+    assert _wind_sector(-5.0) == 0
+    assert _wind_sector(float("nan")) is None
+
+
+@patch('custom_components.local_weather_forecast.negretti_zambra.datetime')
+def test_core_is_memoized(mock_datetime):
+    """Test repeated inputs reuse the memoized core."""
+    mock_datetime.now.return_value = datetime(2025, 7, 15, 12, 0)
+    _negretti_core.cache_clear()
+
+    first = calculate_negretti_zambra_forecast(1012.4, -1.8, [1, 225, "SW", 1], 1, 300.0)
+    second = calculate_negretti_zambra_forecast(1012.4, -1.8, [1, 225, "SW", 1], 4, 300.0)
+
+    assert first[1:] == second[1:]
+    assert first[0] != second[0]  # Text is looked up per language
+    assert _negretti_core.cache_info().hits == 1
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+@pytest.mark.parametrize("hemisphere", ["north", "south"])
+def test_batch_matches_scalar(hemisphere, use_numpy):
+    """Test batch results match calculate_negretti_zambra_forecast element-wise."""
+    if use_numpy:
+        pytest.importorskip("numpy")
+    pressures = [905.0, 950.0, 980.0, 1000.0, 1012.4, 1025.0, 1060.0, 1084.5]
+    changes = [-5.0, 0.0, 2.0, -1.6, 0.4, 1.6, -3.0, 4.0]
+    directions = [180.0, 11.25, 90.0, 225.0, 350.0, 33.75, 135.0, float("nan")]
+    speeds = [3.0, 2.0, 1.0, 5.0, 0.5, 2.0, 8.0, 1.5]
+    months = [1, 7, 7, 1, 7, 3, 11, 6]
+
+    numbers, letters = calculate_negretti_zambra_forecast_batch(
+        pressures, changes, directions, speeds, months, hemisphere, use_numpy=use_numpy
+    )
+
+    expected = []
+    with patch('custom_components.local_weather_forecast.negretti_zambra.datetime') as mock_datetime:
+        for p0, change, direction, speed, month in zip(pressures, changes, directions, speeds, months):
+            mock_datetime.now.return_value = datetime(2025, month, 15, 12, 0)
+            wind_data = [0, direction, "", 1 if speed >= 1 else 0]
+            expected.append(
+                calculate_negretti_zambra_forecast(p0, change, wind_data, 1, 0.0, hemisphere)
+            )
+
+    assert list(numbers) == [result[1] for result in expected]
+    assert list(letters) == [result[2] for result in expected]
@@ -3,6 +3,7 @@
 import pytest
 from custom_components.local_weather_forecast.persistence import (
     calculate_persistence_forecast,
+    calculate_persistence_forecast_batch,
     get_persistence_confidence,
     get_current_condition_code,
 )
@@ -252,3 +253,20 @@ class TestGetCurrentConditionCode:
         )
         
         assert 0 <= code <= 25  # Valid code returned
+
+
+class TestCalculatePersistenceForecastBatch:
+    """Test calculate_persistence_forecast_batch() function."""
+
+    @pytest.mark.parametrize("use_numpy", [False, True])
+    def test_matches_scalar(self, use_numpy):
+        """Test batch results match the scalar function element-wise."""
+        if use_numpy:
+            pytest.importorskip("numpy")
+        codes = list(range(26))
+
+        numbers, letters = calculate_persistence_forecast_batch(codes, use_numpy=use_numpy)
+
+        expected = [calculate_persistence_forecast(code) for code in codes]
+        assert list(numbers) == codes
+        assert list(letters) == [result[2] for result in expected]
@@ -0,0 +1,124 @@
+"""Tests for the startup readiness barrier."""
+import asyncio
+import logging
+from unittest.mock import Mock, patch
+
+import pytest
+
+from homeassistant.core import State
+
+from custom_components.local_weather_forecast.readiness import ReadinessBarrier
+
+TRACK = "custom_components.local_weather_forecast.readiness.async_track_state_change_event"
+SOURCE = "sensor.outdoor_pressure"
+MAIN = "sensor.local_forecast"
+DETAIL = "sensor.local_forecast_zambretti_detail"
+
+
+class _States:
+    """Minimal state machine sending state change events to tracked listeners."""
+
+    def __init__(self):
+        self._states = {}
+        self.listeners = {}
+
+    def get(self, entity_id):
+        return self._states.get(entity_id)
+
+    def set(self, entity_id, value):
+        self._states[entity_id] = State(entity_id, value)
+        for listener in list(self.listeners.get(entity_id, [])):
+            listener(Mock(data={"entity_id": entity_id}))
+
+    def track(self, hass, entity_ids, action):
+        for entity_id in entity_ids:
+            self.listeners.setdefault(entity_id, []).append(action)
+
+        def unsub():
+            for entity_id in entity_ids:
+                self.listeners[entity_id].remove(action)
+
+        return unsub
+
+
+@pytest.fixture
+def states():
+    """Patch state change tracking with the minimal state machine."""
+    machine = _States()
+    with patch(TRACK, side_effect=machine.track):
+        yield machine
+
+
+def _barrier(states, timeout=5.0):
+    hass = Mock()
+    hass.states = states
+    return ReadinessBarrier(hass, "Coordinator test", timeout=timeout)
+
+
+class TestReadinessBarrier:
+    """Test waiting for upstream entities at startup."""
+
+    async def test_ready_sources_do_not_wait(self, states):
+        """Test sources with a valid state are ready without subscribing."""
+        states.set(SOURCE, "1012.0")
+        barrier = _barrier(states)
+
+        assert await barrier.async_wait([SOURCE, None]) == []
+        assert states.listeners == {}
+
+    async def test_waits_for_source_state(self, states):
+        """Test a wait ends with the first valid state of a source."""
+        states.set(SOURCE, "unavailable")
+        barrier = _barrier(states)
+
+        wait = asyncio.ensure_future(barrier.async_wait([SOURCE]))
+        await asyncio.sleep(0)
+        states.set(SOURCE, "unknown")
+        await asyncio.sleep(0)
+        assert not wait.done()
+
+        states.set(SOURCE, "1011.5")
+        assert await wait == []
+        assert states.listeners[SOURCE] == []
+
+    async def test_waits_for_first_update_of_entry_entities(self, states):
+        """Test entities of the entry are ready after their first update, not their restored state."""
+        states.set(MAIN, "restored")
+        barrier = _barrier(states)
+        barrier.async_expect(MAIN)
+        barrier.async_expect(DETAIL)
+
+        wait = asyncio.ensure_future(barrier.async_wait([MAIN, DETAIL]))
+        await asyncio.sleep(0)
+        barrier.async_mark_ready(MAIN)
+        await asyncio.sleep(0)
+        assert not wait.done()
+
+        barrier.async_mark_ready(DETAIL)
+        assert await wait == []
+
+    async def test_shared_timeout(self, states):
+        """Test all waits share one deadline."""
+        barrier = _barrier(states, timeout=0.05)
+        barrier.async_expect(MAIN)
+
+        assert await barrier.async_wait([MAIN, SOURCE]) == [MAIN, SOURCE]
+        # The deadline has passed: later waits return at once
+        assert await asyncio.wait_for(barrier.async_wait([SOURCE]), 0.01) == [SOURCE]
+
+    async def test_startup_timing_logged_once(self, states, caplog):
+        """Test the startup time is logged when every expected entity is ready."""
+        barrier = _barrier(states)
+        barrier.async_expect(MAIN)
+        barrier.async_expect(DETAIL)
+
+        with caplog.at_level(logging.INFO):
+            barrier.async_mark_ready(MAIN)
+            assert barrier.startup_duration is None
+            barrier.async_mark_ready(DETAIL)
+            barrier.async_mark_ready(DETAIL)
+
+        assert barrier.startup_duration is not None
+        assert [record.getMessage() for record in caplog.records if "startup took" in record.getMessage()] == [
+            f"Coordinator test: startup took {barrier.startup_duration:.2f} s (2 entities ready)"
+        ]
@@ -0,0 +1,282 @@
+"""Tests for the offline replay engine (replay/)."""
+import csv
+import io
+import json
+import math
+import sqlite3
+import sys
+from datetime import datetime, timezone
+
+import pytest
+
+from custom_components.local_weather_forecast import zambretti
+from replay.engine import ReplayClock, ReplayConfig, ReplayEngine
+from replay.metrics import BrierScore, ContingencyTable, ErrorStats, ModelMetrics
+from replay.sources import Reading, open_source, read_csv, read_parquet, read_recorder
+
+# 2024-07-01 00:00 UTC
+START = 1719792000.0
+
+UNITS = {"sensor.station_pressure": "hPa", "sensor.outdoor_temp": "°C", "sensor.rain_rate": "mm/h"}
+
+
+def _station_values(step: int, count: int):
+    """Yield (timestamp, entity_id, state) of a falling-then-rising pressure day."""
+    for index in range(count):
+        timestamp = START + index * step
+        hours = index * step / 3600
+        pressure = 977.0 - 0.4 * hours if hours < 12 else 972.2 + 0.3 * (hours - 12)
+        temperature = 15.0 + 6.0 * math.sin((hours - 9) / 24 * 2 * math.pi)
+        yield timestamp, "sensor.station_pressure", f"{pressure:.2f}"
+        yield timestamp + 1, "sensor.outdoor_temp", f"{temperature:.1f}"
+        yield timestamp + 2, "sensor.rain_rate", "1.5" if 10 <= hours < 14 else "0.0"
+
+
+def _create_recorder(path, rows):
+    """Create a recorder database (current schema subset) with the given rows."""
+    connection = sqlite3.connect(path)
+    connection.executescript(
+        """
+        CREATE TABLE states_meta (metadata_id INTEGER PRIMARY KEY, entity_id TEXT);
+        CREATE TABLE state_attributes (attributes_id INTEGER PRIMARY KEY, hash INTEGER, shared_attrs TEXT);
+        CREATE TABLE states (
+            state_id INTEGER PRIMARY KEY, state TEXT, attributes_id INTEGER,
+            last_updated_ts FLOAT, metadata_id INTEGER
+        );
+        CREATE INDEX ix_states_metadata_id_last_updated_ts ON states (metadata_id, last_updated_ts);
+        """
+    )
+    ids = {}
+    for metadata_id, (entity_id, unit) in enumerate(UNITS.items(), start=1):
+        ids[entity_id] = metadata_id
+        connection.execute("INSERT INTO states_meta VALUES (?, ?)", (metadata_id, entity_id))
+        connection.execute(
+            "INSERT INTO state_attributes VALUES (?, 0, ?)",
+            (metadata_id, json.dumps({"unit_of_measurement": unit})),
+        )
+    connection.executemany(
+        "INSERT INTO states (state, attributes_id, last_updated_ts, metadata_id) VALUES (?, ?, ?, ?)",
+        [(state, ids[entity_id], timestamp, ids[entity_id]) for timestamp, entity_id, state in rows],
+    )
+    connection.commit()
+    connection.close()
+
+
+@pytest.fixture
+def recorder_db(tmp_path):
+    """One day of readings every 10 minutes."""
+    path = tmp_path / "home-assistant_v2.db"
+    _create_recorder(path, list(_station_values(600, 144)))
+    return path
+
+
+@pytest.fixture
+def config():
+    """Replay setup for the test station (Košice)."""
+    return ReplayConfig(
+        pressure_sensor="sensor.station_pressure",
+        temperature_sensor="sensor.outdoor_temp",
+        rain_rate_sensor="sensor.rain_rate",
+        latitude=48.72,
+        longitude=21.25,
+        elevation=314.0,
+        horizon=6,
+    )
+
+
+class TestSources:
+    """Test the history readers."""
+
+    def test_recorder_streams_in_order(self, recorder_db):
+        """Test entities are merged chronologically across small chunks."""
+        readings = list(read_recorder(
+            recorder_db, ["sensor.station_pressure", "sensor.outdoor_temp"], chunk_size=7
+        ))
+
+        assert len(readings) == 288
+        assert [r.timestamp for r in readings] == sorted(r.timestamp for r in readings)
+        assert readings[0] == Reading(START, "sensor.station_pressure", "977.00", "hPa")
+        assert readings[1].unit == "°C"
+
+    def test_recorder_time_range(self, recorder_db):
+        """Test start is inclusive and end exclusive."""
+        readings = list(read_recorder(
+            recorder_db, ["sensor.station_pressure"], start=START + 600, end=START + 3000
+        ))
+
+        assert [r.timestamp for r in readings] == [START + 600, START + 1200, START + 1800, START + 2400]
+
+    def test_recorder_unknown_entity_is_skipped(self, recorder_db):
+        """Test entities missing from states_meta yield nothing."""
+        assert list(read_recorder(recorder_db, ["sensor.missing"])) == []
+
+    def test_recorder_legacy_schema(self, tmp_path):
+        """Test databases without states_meta are rejected."""
+        path = tmp_path / "old.db"
+        connection = sqlite3.connect(path)
+        connection.execute("CREATE TABLE states (state_id INTEGER, entity_id TEXT, state TEXT)")
+        connection.close()
+
+        with pytest.raises(ValueError, match="states_meta"):
+            list(read_recorder(path, ["sensor.station_pressure"]))
+
+    def test_csv_export(self, tmp_path):
+        """Test a history export grouped by entity is merged chronologically."""
+        path = tmp_path / "history.csv"
+        path.write_text(
+            "entity_id,state,last_changed\n"
+            "sensor.outdoor_temp,14.0,2024-07-01T00:00:30.000Z\n"
+            "sensor.outdoor_temp,14.5,2024-07-01T00:10:30.000Z\n"
+            "sensor.station_pressure,977.0,2024-07-01T00:00:00.000Z\n"
+            "sensor.station_pressure,976.8,2024-07-01T00:10:00.000Z\n"
+            "sensor.other,1,2024-07-01T00:05:00.000Z\n",
+            encoding="utf-8",
+        )
+
+        readings = list(read_csv(path, ["sensor.station_pressure", "sensor.outdoor_temp"]))
+
+        assert [(r.entity_id, r.state) for r in readings] == [
+            ("sensor.station_pressure", "977.0"),
+            ("sensor.outdoor_temp", "14.0"),
+            ("sensor.station_pressure", "976.8"),
+            ("sensor.outdoor_temp", "14.5"),
+        ]
+        assert readings[0].timestamp == START
+        assert readings[0].unit is None
+
+    def test_open_source_by_extension(self, tmp_path, recorder_db):
+        """Test CSV files are read as CSV and other files as recorder databases."""
+        path = tmp_path / "history.csv"
+        path.write_text("entity_id,state,last_updated\nsensor.a,1,1719792000\n", encoding="utf-8")
+
+        assert list(open_source(path, ["sensor.a"])) == [Reading(START, "sensor.a", "1", None)]
+        assert len(list(open_source(recorder_db, ["sensor.rain_rate"]))) == 144
+
+    def test_parquet_requires_pyarrow(self, tmp_path, monkeypatch):
+        """Test a clear error without pyarrow."""
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        monkeypatch.setitem(sys.modules, "pyarrow.parquet", None)
+
+        with pytest.raises(ImportError, match="pyarrow"):
+            list(read_parquet(tmp_path / "history.parquet", ["sensor.a"]))
+
+
+class TestMetrics:
+    """Test the verification scores."""
+
+    def test_error_stats(self):
+        """Test MAE, bias and RMSE."""
+        stats = ErrorStats()
+        stats.add(12.0, 10.0)
+        stats.add(9.0, 10.0)
+
+        assert stats.as_dict() == {"count": 2, "mae": 1.5, "bias": 0.5, "rmse": 1.581}
+        assert ErrorStats().as_dict()["mae"] is None
+
+    def test_contingency_table(self):
+        """Test POD, FAR and CSI."""
+        table = ContingencyTable()
+        for forecast, observed in ((True, True), (True, False), (False, True), (False, False), (True, True)):
+            table.add(forecast, observed)
+
+        scores = table.as_dict()
+        assert (scores["hits"], scores["misses"], scores["false_alarms"]) == (2, 1, 1)
+        assert scores["pod"] == pytest.approx(2 / 3, abs=1e-4)
+        assert scores["far"] == pytest.approx(1 / 3, abs=1e-4)
+        assert scores["csi"] == 0.5
+
+    def test_brier_score(self):
+        """Test mean squared probability error."""
+        brier = BrierScore()
+        brier.add(1.0, True)
+        brier.add(0.5, False)
+
+        assert brier.score == 0.125
+        assert BrierScore().score is None
+
+    def test_model_metrics_by_lead(self):
+        """Test forecasts are scored per lead time and overall."""
+        metrics = ModelMetrics()
+        forecast = {
+            "native_temperature": 11.0, "native_pressure": 1010.0,
+            "precipitation_probability": 80, "condition": "rainy",
+        }
+        metrics.add(1, forecast, 10.0, 1012.0, True)
+        metrics.add(2, forecast, 14.0, None, None)
+
+        result = metrics.as_dict()
+        assert result["verified"] == 2
+        assert result["temperature"]["mae"] == 2.0
+        assert result["temperature_by_lead"]["2"]["bias"] == -3.0
+        assert result["pressure"]["count"] == 1
+        assert result["precipitation"]["hits"] == 1
+        assert result["brier_score"] == 0.04
+
+
+class TestReplayEngine:
+    """Test replaying history through the sensors and forecast generators."""
+
+    def test_clock_replaces_now(self):
+        """Test datetime.now() follows the replay clock and is restored."""
+        clock = ReplayClock()
+        clock.set(START)
+
+        with clock:
+            assert zambretti.datetime.now(timezone.utc) == datetime(2024, 7, 1, tzinfo=timezone.utc)
+            assert zambretti.datetime.now().month == clock.utc.astimezone().month
+
+        assert zambretti.datetime is datetime
+
+    def test_unknown_model(self, config):
+        """Test unknown models are rejected."""
+        config.models = ("zambretti", "ecmwf")
+
+        with pytest.raises(ValueError, match="ecmwf"):
+            ReplayEngine(config)
+
+    async def test_replay_recorder(self, recorder_db, config):
+        """Test a day of history produces verified forecasts for every model."""
+        predictions = io.StringIO()
+        engine = ReplayEngine(config, predictions)
+
+        report = await engine.async_run(open_source(recorder_db, config.entity_ids(), chunk_size=50))
+
+        assert report["readings"] == 432
+        assert report["out_of_order"] == 0
+        assert report["main_updates"] > 0
+        # Forecasts start after the 3 h warmup, one run per full hour
+        assert report["forecast_runs"] == 21
+        for model in ("zambretti", "negretti", "enhanced"):
+            scores = report["models"][model]
+            assert scores["verified"] > 0
+            assert set(scores["temperature_by_lead"]) == {"1", "2", "3", "4", "5", "6"}
+            assert scores["pressure"]["mae"] is not None
+            assert scores["precipitation"]["hits"] + scores["precipitation"]["misses"] > 0
+            assert scores["brier_score"] is not None
+        assert report["verified"] + report["unverified"] == 21 * 6 * 3
+
+        # Sensors were driven by the replayed readings
+        assert engine.pressure_change.native_value != 0.0
+        assert engine.hass.states.get("sensor.local_forecast").attributes["p0"] > 1000
+        assert zambretti.datetime is datetime
+
+        rows = list(csv.DictReader(io.StringIO(predictions.getvalue())))
+        assert len(rows) == report["verified"]
+        assert rows[0]["issued"] == "2024-07-01T03:00:00+00:00"
+        assert rows[0]["target"] == "2024-07-01T04:00:00+00:00"
+
+    async def test_gap_restarts_warmup(self, tmp_path, config):
+        """Test forecasts across a data gap are dropped instead of verified."""
+        rows = [
+            row for row in _station_values(600, 144)
+            if not START + 5 * 3600 <= row[0] < START + 15 * 3600
+        ]
+        path = tmp_path / "gap.db"
+        _create_recorder(path, rows)
+
+        report = await ReplayEngine(config).async_run(open_source(path, config.entity_ids()))
+
+        assert report["gaps"] == 1
+        assert report["unverified"] > 0
+        # Runs at 03:00 and 04:00, then after the new warmup from 18:00 to 23:00
+        assert report["forecast_runs"] == 2 + 6
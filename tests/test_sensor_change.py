@@ -138,7 +138,7 @@ class TestPressureChangeSensor:
 
         attrs = sensor.extra_state_attributes
 
-        assert "history" in attrs
+        assert "history" not in attrs  # Readings live in the history store
         assert "history_count" in attrs
         assert attrs["history_count"] == 2
         assert "oldest_reading" in attrs
@@ -248,3 +248,83 @@ class TestTemperatureChangeSensor:
         assert attrs["oldest_reading"] is None
         assert attrs["newest_reading"] is None
 
+
+
+class TestThrottledUpdate:
+    """Test the trailing-edge update throttle of the base entity."""
+
+    @pytest.fixture
+    def sensor(self, mock_hass, mock_config_entry, monkeypatch):
+        """Create a sensor with a controllable clock and timer."""
+        from custom_components.local_weather_forecast import sensor as sensor_module
+
+        sensor = LocalForecastTemperatureChangeSensor(mock_hass, mock_config_entry)
+        sensor.async_write_ha_state = Mock()
+        sensor.clock = datetime(2025, 1, 1, 12, 0, 0)
+        sensor.timers = []
+        monkeypatch.setattr(sensor_module.dt_util, "now", lambda: sensor.clock)
+
+        def call_later(hass, delay, action):
+            sensor.timers.append((delay, action))
+            return Mock()
+
+        monkeypatch.setattr(sensor_module, "async_call_later", call_later)
+        return sensor
+
+    async def test_burst_runs_latest_input_at_end_of_interval(self, sensor):
+        """Test updates within the interval are deferred, not dropped."""
+        runs = []
+
+        async def update():
+            runs.append(sensor.clock)
+
+        await sensor._throttled_update(update)
+        for seconds in (5, 10, 20):
+            sensor.clock = datetime(2025, 1, 1, 12, 0, seconds)
+            await sensor._throttled_update(update)
+
+        assert len(runs) == 1
+        assert sensor.updates_skipped == 3
+        assert len(sensor.timers) == 1
+        assert sensor.timers[0][0] == pytest.approx(25.0)
+
+        sensor.clock = datetime(2025, 1, 1, 12, 0, 30)
+        await sensor.timers[0][1](None)
+
+        assert runs == [datetime(2025, 1, 1, 12, 0, 0), datetime(2025, 1, 1, 12, 0, 30)]
+        assert sensor.updates_coalesced == 1
+        assert sensor.async_write_ha_state.call_count == 2
+
+        # The trailing run starts a new interval
+        sensor.clock = datetime(2025, 1, 1, 12, 0, 40)
+        await sensor._throttled_update(update)
+        assert len(runs) == 2
+        assert len(sensor.timers) == 2
+
+    async def test_interval_from_options(self, sensor, mock_config_entry):
+        """Test the interval comes from the options and 0 disables the throttle."""
+        runs = []
+
+        async def update():
+            runs.append(1)
+
+        assert sensor._update_throttle_seconds == 30
+        mock_config_entry.options = {"sensor_update_interval": 0}
+
+        await sensor._throttled_update(update)
+        await sensor._throttled_update(update)
+
+        assert len(runs) == 2
+        assert sensor.updates_skipped == 0
+
+    def test_cancel_drops_pending_update(self, sensor):
+        """Test removing the entity cancels a deferred update."""
+        unsub = Mock()
+        sensor._trailing_update_unsub = unsub
+        sensor._pending_update = Mock()
+
+        sensor._async_cancel_trailing_update()
+
+        unsub.assert_called_once()
+        assert sensor._pending_update is None
+        assert sensor._trailing_update_unsub is None
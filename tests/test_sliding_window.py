@@ -0,0 +1,134 @@
+"""Tests for the sliding window used by the change sensors."""
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from custom_components.local_weather_forecast.sliding_window import SlidingWindow
+
+
+def _reference_retained(history, window, min_records):
+    """Previous list-based retention: window filter or last min_records."""
+    cutoff = history[-1][0] - window
+    time_filtered = [(ts, v) for ts, v in history if ts > cutoff]
+    if len(time_filtered) < min_records:
+        return history[-min_records:]
+    return time_filtered
+
+
+def _reference_slope(readings):
+    """Centered least-squares slope in units per second."""
+    t0 = readings[0][0]
+    xs = [(ts - t0).total_seconds() for ts, _ in readings]
+    ys = [v for _, v in readings]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    denominator = sum((x - x_mean) ** 2 for x in xs)
+    if denominator == 0:
+        return 0.0
+    return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / denominator
+
+
+class TestSlidingWindow:
+    """Test SlidingWindow."""
+
+    def test_empty(self):
+        """Test empty window."""
+        window = SlidingWindow(timedelta(minutes=60), 12)
+
+        assert len(window) == 0
+        assert window == []
+        assert window.oldest is None
+        assert window.newest is None
+        assert window.change() is None
+        assert window.linear_fit() is None
+
+    def test_time_window_eviction(self):
+        """Test readings older than the window are evicted once enough remain."""
+        now = datetime(2025, 1, 1, 12, 0)
+        window = SlidingWindow(timedelta(minutes=180), min_records=2)
+
+        for minutes in (200, 150, 100, 50, 0):
+            window.add(now - timedelta(minutes=minutes), 1010.0 + minutes / 100)
+
+        assert len(window) == 4
+        assert window.window_count == 4
+        assert window.oldest == (now - timedelta(minutes=150), 1011.5)
+        assert window.newest == (now, 1010.0)
+
+    def test_minimum_records_kept(self):
+        """Test old readings are kept while below min_records."""
+        now = datetime(2025, 1, 1, 12, 0)
+        window = SlidingWindow(timedelta(minutes=60), min_records=5)
+
+        for hours in (10, 8, 6, 4, 2, 0):
+            window.add(now - timedelta(hours=hours), float(hours))
+
+        assert len(window) == 5
+        assert window.window_count == 1
+        assert window[0] == (now - timedelta(hours=8), 8.0)
+        # Fewer than two readings in the window: use all retained readings
+        assert window.change() == pytest.approx(-8.0)
+
+    def test_matches_list_implementation(self):
+        """Test retention and statistics match the previous list-based code."""
+        rng = random.Random(42)
+        window_length = timedelta(minutes=60)
+        window = SlidingWindow(window_length, min_records=12)
+        history = []
+        timestamp = datetime(2025, 7, 15, 6, 0)
+
+        for _ in range(2000):
+            # Irregular updates with occasional multi-hour gaps
+            gap = rng.choice([1, 5, 30, 120, 600, 4 * 3600]) if rng.random() < 0.05 else rng.randint(1, 90)
+            timestamp += timedelta(seconds=gap)
+            value = 15.0 + rng.uniform(-0.5, 0.5) + (timestamp.hour - 12) * 0.3
+
+            history.append((timestamp, value))
+            history = _reference_retained(history, window_length, 12)
+            window.add(timestamp, value)
+
+            assert list(window) == history
+
+        cutoff = timestamp - window_length
+        calc = [(ts, v) for ts, v in history if ts > cutoff]
+        if len(calc) < 2:
+            calc = history
+
+        slope, intercept = window.linear_fit()
+        assert slope == pytest.approx(_reference_slope(calc), abs=1e-9)
+        assert window.change() == pytest.approx(calc[-1][1] - calc[0][1])
+
+    def test_linear_fit_exact_line(self):
+        """Test slope and intercept of a perfect line."""
+        start = datetime(2025, 1, 1, 0, 0)
+        window = SlidingWindow(timedelta(hours=3))
+        for minute in range(0, 180, 10):
+            window.add(start + timedelta(minutes=minute), 900.0 - minute / 60)
+
+        slope, intercept = window.linear_fit()
+
+        assert slope * 3600 == pytest.approx(-1.0)
+        assert intercept == pytest.approx(900.0)
+
+    def test_linear_fit_same_timestamp(self):
+        """Test identical timestamps give zero slope instead of dividing by zero."""
+        now = datetime(2025, 1, 1, 0, 0)
+        window = SlidingWindow(timedelta(hours=1), records=[(now, 10.0), (now, 12.0)])
+
+        assert window.linear_fit() == (0.0, 11.0)
+
+    def test_list_compatibility(self):
+        """Test list-style append, indexing and comparison."""
+        now = datetime(2025, 1, 1, 0, 0)
+        window = SlidingWindow(timedelta(hours=1))
+        window.append((now, 1.0))
+        window.append((now + timedelta(minutes=1), 2.0))
+
+        assert window[-1] == (now + timedelta(minutes=1), 2.0)
+        assert window == [(now, 1.0), (now + timedelta(minutes=1), 2.0)]
+        with pytest.raises(IndexError):
+            window[2]
+
+        window.clear()
+        assert window == []
@@ -0,0 +1,107 @@
+"""Tests for the cached solar ephemeris."""
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from custom_components.local_weather_forecast.solar_ephemeris import (
+    _compute_day,
+    get_day_ephemeris,
+    is_night,
+    is_night_for_hass,
+    solar_elevation,
+    sun_angle_factor,
+)
+
+KOSICE = (48.72, 21.25)
+
+
+class TestDayEphemeris:
+    """Test sunrise/sunset and sun position."""
+
+    def test_summer_solstice_kosice(self):
+        """Test sunrise/sunset match astral within a minute."""
+        ephemeris = get_day_ephemeris(date(2025, 6, 21), *KOSICE)
+
+        # astral: sunrise 02:32:22 UTC, sunset 18:41:20 UTC
+        assert abs(ephemeris.sunrise - datetime(2025, 6, 21, 2, 32, 22, tzinfo=timezone.utc)) < timedelta(minutes=1)
+        assert abs(ephemeris.sunset - datetime(2025, 6, 21, 18, 41, 20, tzinfo=timezone.utc)) < timedelta(minutes=1)
+        assert ephemeris.sunrise < ephemeris.solar_noon < ephemeris.sunset
+
+    def test_elevation(self):
+        """Test sun elevation against astral."""
+        when = datetime(2025, 6, 21, 10, 30, tzinfo=timezone.utc)
+
+        assert solar_elevation(when, *KOSICE) == pytest.approx(64.69, abs=0.1)
+
+    def test_solar_day_for_far_east_longitude(self):
+        """Test sunrise and sunset belong to the same local day (Sydney)."""
+        # 20:00 UTC on Feb 28 is early morning Mar 1 in Sydney
+        ephemeris = get_day_ephemeris(datetime(2025, 2, 28, 20, 0, tzinfo=timezone.utc), -33.87, 151.2)
+
+        assert ephemeris.day == date(2025, 3, 1)
+        assert ephemeris.sunrise < datetime(2025, 2, 28, 20, 0, tzinfo=timezone.utc) < ephemeris.sunset
+
+    def test_polar_day_and_night(self):
+        """Test polar day and polar night have no sunrise/sunset."""
+        summer = get_day_ephemeris(date(2025, 6, 21), 78.2, 15.6)
+        winter = get_day_ephemeris(date(2025, 12, 21), 78.2, 15.6)
+
+        assert summer.sunrise is None and summer.polar_day
+        assert not is_night(datetime(2025, 6, 21, 0, 0), 78.2, 15.6)
+        assert winter.sunrise is None and not winter.polar_day
+        assert is_night(datetime(2025, 12, 21, 12, 0), 78.2, 15.6)
+        assert sun_angle_factor(datetime(2025, 12, 21, 12, 0), 78.2, 15.6) == 0.0
+
+    def test_sun_angle_factor(self):
+        """Test factor is zero at night and peaks around solar noon."""
+        ephemeris = get_day_ephemeris(date(2025, 6, 21), *KOSICE)
+
+        assert sun_angle_factor(datetime(2025, 6, 21, 0, 0), *KOSICE) == 0.0
+        assert sun_angle_factor(ephemeris.solar_noon, *KOSICE) == pytest.approx(1.0, abs=0.01)
+        assert 0.0 < sun_angle_factor(datetime(2025, 6, 21, 5, 0), *KOSICE) < 0.6
+
+    def test_day_is_cached(self):
+        """Test hourly queries for one day reuse one computation."""
+        _compute_day.cache_clear()
+
+        for hour in range(24):
+            is_night(datetime(2025, 3, 10, hour, 0), *KOSICE)
+
+        info = _compute_day.cache_info()
+        assert info.misses <= 2  # UTC hours can span two local solar days
+        assert info.hits >= 22
+
+
+class TestIsNightForHass:
+    """Test the Home Assistant aware night check."""
+
+    def test_no_hass_uses_fixed_hours(self):
+        """Test fallback without hass."""
+        assert is_night_for_hass(None, datetime(2025, 6, 21, 22, 0)) is True
+        assert is_night_for_hass(None, datetime(2025, 6, 21, 12, 0)) is False
+
+    def test_current_time_uses_sun_entity(self):
+        """Test sun.sun state is used for the current time."""
+        hass = Mock()
+        hass.states.get.return_value = Mock(state="below_horizon")
+
+        assert is_night_for_hass(hass, datetime.now(timezone.utc)) is True
+
+    def test_future_time_uses_location(self):
+        """Test future times use the configured location."""
+        hass = Mock()
+        hass.states.get.return_value = Mock(state="above_horizon")
+        hass.config.latitude, hass.config.longitude = KOSICE
+
+        # 20:00 UTC in June is after sunset in Košice, 08:00 UTC is daytime
+        assert is_night_for_hass(hass, datetime(2030, 6, 21, 20, 0, tzinfo=timezone.utc)) is True
+        assert is_night_for_hass(hass, datetime(2030, 6, 21, 8, 0, tzinfo=timezone.utc)) is False
+
+    def test_invalid_location_falls_back(self):
+        """Test Mock location falls back to fixed hours."""
+        hass = Mock()
+        hass.states.get.return_value = Mock(state="above_horizon")
+
+        assert is_night_for_hass(hass, datetime(2030, 6, 21, 20, 0)) is True
+        assert is_night_for_hass(hass, datetime(2030, 6, 21, 10, 0)) is False
@@ -362,6 +362,58 @@ class TestConversionAccuracy:
         assert calm == 0.0
 
 
+
+class TestEntityConverterCache:
+    """Test converters resolved once per entity."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        """Start every test with an empty entity cache."""
+        UnitConverter._entity_converters.clear()
+        yield
+        UnitConverter._entity_converters.clear()
+
+    @pytest.mark.parametrize(
+        ("sensor_type", "unit", "convert"),
+        [
+            ("pressure", "inHg", UnitConverter.convert_pressure),
+            ("pressure", "mmHg", UnitConverter.convert_pressure),
+            ("pressure", "hPa", UnitConverter.convert_pressure),
+            ("temperature", "°F", UnitConverter.convert_temperature),
+            ("temperature", "K", UnitConverter.convert_temperature),
+            ("wind_speed", "km/h", UnitConverter.convert_wind_speed),
+            ("wind_speed", "kt", UnitConverter.convert_wind_speed),
+            ("precipitation", "in/h", UnitConverter.convert_precipitation),
+            ("solar_radiation", "lx", UnitConverter.convert_solar_radiation),
+            ("solar_radiation", "W/m²", UnitConverter.convert_solar_radiation),
+        ],
+    )
+    def test_matches_direct_conversion(self, sensor_type, unit, convert):
+        """Test cached converters give exactly the convert_* results."""
+        for value in (0.0, 1.5, 29.92, 68.0, 1013.25, 50000.0):
+            assert UnitConverter.convert_entity_value(
+                "sensor.test", value, sensor_type, unit
+            ) == convert(value, unit)
+
+    def test_unknown_unit_keeps_value(self):
+        """Test units without a converter are left unchanged."""
+        assert UnitConverter.convert_entity_value("sensor.test", 12.5, "pressure", "bogus") == 12.5
+        assert UnitConverter.convert_entity_value("sensor.test", 12.5, "humidity", "%") == 12.5
+
+    def test_resolved_once_per_entity(self):
+        """Test the converter is reused while the unit stays the same."""
+        first = UnitConverter.converter_for_entity("sensor.pressure", "pressure", "inHg")
+        second = UnitConverter.converter_for_entity("sensor.pressure", "pressure", "inHg")
+
+        assert first is second
+
+    def test_unit_change_invalidates(self):
+        """Test a new unit_of_measurement resolves a new converter."""
+        assert UnitConverter.convert_entity_value("sensor.temp", 68.0, "temperature", "°F") == pytest.approx(20.0)
+        assert UnitConverter.convert_entity_value("sensor.temp", 20.0, "temperature", "°C") == 20.0
+        assert UnitConverter._entity_converters[("sensor.temp", "temperature")][0] == "°C"
+
+
 # Integration test
 class TestUnitConversionIntegration:
     """Integration tests for unit conversion."""
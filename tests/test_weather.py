@@ -1,6 +1,8 @@
 """Tests for weather.py module - standalone helper function tests."""
 from unittest.mock import Mock
 
+import pytest
+
 # Import the functions we want to test
 # We'll test the standalone helper functions without needing full entity initialization
 
@@ -567,3 +569,285 @@ class TestSeaLevelPressureConversion:
         # At elevation 0, the function returns the same value
         assert self._calculate_sea_level_pressure(pressure, 15.0, 0) == pressure
 
+
+
+class TestForecastExecutorCoalescing:
+    """Test forecast generation in the executor."""
+
+    async def test_concurrent_requests_share_one_job(self):
+        """Test concurrent requests for the same snapshot run the generator once."""
+        import asyncio
+
+        from custom_components.local_weather_forecast.weather import LocalWeatherForecastWeather
+
+        loop = asyncio.get_running_loop()
+        entry = Mock(entry_id="test", data={}, options={})
+        weather = LocalWeatherForecastWeather(entry)
+        weather.hass = Mock()
+        weather.hass.async_add_executor_job = lambda job: loop.run_in_executor(None, job)
+
+        calls = []
+
+        def generate():
+            calls.append(1)
+            return [{"datetime": "2025-01-01T12:00:00", "temperature": 12.0}], {"kind": "hourly", "records": []}
+
+        results = await asyncio.gather(
+            *(weather._async_generate_forecast("hourly", (("key",), generate)) for _ in range(3))
+        )
+
+        assert len(calls) == 1
+        assert all(result == [{"datetime": "2025-01-01T12:00:00", "temperature": 12.0}] for result in results)
+        assert weather._forecast_in_flight == {}
+        # The trace returned by the job is stored on the event loop
+        assert weather._forecast_traces == {"hourly": {"kind": "hourly", "records": []}}
+
+        # Finished job is cached, so a later request doesn't run it again
+        assert await weather._async_generate_forecast("hourly", (("key",), generate)) == results[0]
+        assert len(calls) == 1
+
+    async def test_invalidation_during_job_drops_result(self):
+        """Test a job running across an invalidation does not fill the cache."""
+        import asyncio
+        import threading
+
+        from custom_components.local_weather_forecast.weather import LocalWeatherForecastWeather
+
+        loop = asyncio.get_running_loop()
+        weather = LocalWeatherForecastWeather(Mock(entry_id="test", data={}, options={}))
+        weather.hass = Mock()
+        weather.hass.async_add_executor_job = lambda job: loop.run_in_executor(None, job)
+        release = threading.Event()
+        calls = []
+
+        def generate():
+            calls.append(1)
+            number = len(calls)
+            release.wait(5)
+            return [{"datetime": "2025-01-01T12:00:00", "temperature": number}], None
+
+        first = asyncio.ensure_future(weather._async_generate_forecast("hourly", (("key",), generate)))
+        await asyncio.sleep(0.01)
+        weather._forecast_cache.invalidate()
+        # A request after the invalidation does not join the stale job
+        second = asyncio.ensure_future(weather._async_generate_forecast("hourly", (("key",), generate)))
+        await asyncio.sleep(0.01)
+        release.set()
+
+        assert (await first)[0]["temperature"] == 1
+        assert (await second)[0]["temperature"] == 2
+        assert weather._forecast_in_flight == {}
+        # Only the job of the current generation was cached
+        assert weather._forecast_cache.get(("key",))[0]["temperature"] == 2
+
+    async def test_generator_error_returns_none(self):
+        """Test generator errors are logged and return None."""
+        import asyncio
+
+        from custom_components.local_weather_forecast.weather import LocalWeatherForecastWeather
+
+        loop = asyncio.get_running_loop()
+        weather = LocalWeatherForecastWeather(Mock(entry_id="test", data={}, options={}))
+        weather.hass = Mock()
+        weather.hass.async_add_executor_job = lambda job: loop.run_in_executor(None, job)
+
+        def generate():
+            raise ValueError("boom")
+
+        assert await weather._async_generate_forecast("daily", (("key",), generate)) is None
+        assert await weather._async_generate_forecast("daily", None) is None
+
+
+class TestSensorSnapshot:
+    """Test sensor reads are memoized per state write."""
+
+    @staticmethod
+    def _create_weather(states):
+        """Create a weather entity reading the given {entity_id: (state, unit)}."""
+        from homeassistant.core import State
+
+        from custom_components.local_weather_forecast.weather import LocalWeatherForecastWeather
+
+        entry = Mock(entry_id="test", options={})
+        entry.data = {
+            "temperature_sensor": "sensor.temp",
+            "humidity_sensor": "sensor.humidity",
+            "wind_speed_sensor": "sensor.wind",
+            "solar_radiation_sensor": "sensor.solar",
+        }
+        weather = LocalWeatherForecastWeather(entry)
+        weather.hass = Mock()
+        reads = []
+
+        def get_state(entity_id):
+            reads.append(entity_id)
+            if entity_id not in states:
+                return None
+            value, unit = states[entity_id]
+            return State(entity_id, value, {"unit_of_measurement": unit} if unit else {})
+
+        weather.hass.states.get = Mock(side_effect=get_state)
+        return weather, reads
+
+    def test_each_sensor_read_once_per_snapshot(self):
+        """Test all properties share one read and conversion of every sensor."""
+        from unittest.mock import patch
+
+        from custom_components.local_weather_forecast.unit_conversion import UnitConverter
+
+        weather, reads = self._create_weather({
+            "sensor.temp": ("68.0", "°F"),
+            "sensor.humidity": ("80", "%"),
+            "sensor.wind": ("3.0", "m/s"),
+            "sensor.solar": ("450", "W/m²"),
+        })
+
+        with patch.object(
+            UnitConverter, "convert_entity_value", wraps=UnitConverter.convert_entity_value
+        ) as convert_value, weather._sensor_snapshot():
+            temperature = weather.native_temperature
+            for _ in range(2):
+                weather.native_dew_point
+                weather.feels_like
+                weather.native_apparent_temperature
+                weather.native_visibility
+                weather.uv_index
+
+        assert temperature == 20.0
+        assert reads.count("sensor.temp") == 1
+        assert reads.count("sensor.humidity") == 1
+        assert reads.count("sensor.solar") == 1
+        converted = [call.args[0] for call in convert_value.call_args_list]
+        assert converted.count("sensor.solar") == 1
+
+    def test_properties_are_live_outside_snapshot(self):
+        """Test properties read current states when no write is in progress."""
+        states = {"sensor.temp": ("12.0", "°C")}
+        weather, reads = self._create_weather(states)
+
+        assert weather.native_temperature == 12.0
+        states["sensor.temp"] = ("13.5", "°C")
+        assert weather.native_temperature == 13.5
+        assert weather._snapshot_values is None
+
+    def test_new_write_takes_new_snapshot(self):
+        """Test each state write reads sensors again, forecasts reuse the last write."""
+        from unittest.mock import patch
+
+        states = {"sensor.temp": ("12.0", "°C")}
+        weather, reads = self._create_weather(states)
+        written = []
+
+        def write_state(entity):
+            written.append((entity.native_temperature, entity.native_temperature))
+
+        with patch("homeassistant.helpers.entity.Entity.async_write_ha_state", write_state):
+            weather.async_write_ha_state()
+            states["sensor.temp"] = ("14.0", "°C")
+
+            # Forecast preparation after the write is served from its snapshot
+            with weather._sensor_snapshot():
+                assert weather.native_temperature == 12.0
+
+            weather.async_write_ha_state()
+
+        assert written == [(12.0, 12.0), (14.0, 14.0)]
+        assert reads.count("sensor.temp") == 2
+
+
+class TestCoalescedStateWrites:
+    """Test sensor-driven state writes are coalesced."""
+
+    @staticmethod
+    def _create_weather(options):
+        """Create a weather entity with a real debouncer writing into a list."""
+        import asyncio
+
+        from homeassistant.core import callback
+        from homeassistant.helpers.debounce import Debouncer
+
+        from custom_components.local_weather_forecast.weather import LocalWeatherForecastWeather
+
+        loop = asyncio.get_running_loop()
+        weather = LocalWeatherForecastWeather(Mock(entry_id="test", data={}, options=options))
+        weather.hass = Mock()
+        weather.hass.loop = loop
+        weather.hass.async_run_hass_job = lambda job: job.target()
+        weather.hass.async_create_task = lambda coro, name=None, eager_start=False: loop.create_task(coro)
+        writes = []
+
+        @callback
+        def write_state():
+            writes.append(1)
+
+        weather.async_write_ha_state = write_state
+        weather._write_debouncer = Debouncer(
+            weather.hass, Mock(), cooldown=weather._get_write_debounce(), immediate=False, function=write_state
+        )
+        return weather, writes
+
+    async def test_burst_results_in_one_write(self):
+        """Test a station publishing all sensors at once causes a single write."""
+        import asyncio
+
+        weather, writes = self._create_weather({"weather_update_debounce": 0.25})
+
+        for _ in range(11):
+            weather._async_schedule_write()
+        assert writes == []
+
+        await asyncio.sleep(0.35)
+        assert len(writes) == 1
+
+    async def test_precipitation_onset_writes_immediately(self):
+        """Test an immediate write replaces the pending coalesced one."""
+        import asyncio
+
+        weather, writes = self._create_weather({"weather_update_debounce": 0.25})
+
+        weather._async_schedule_write()
+        weather._async_write_now()
+        assert len(writes) == 1
+
+        await asyncio.sleep(0.35)
+        assert len(writes) == 1
+
+    async def test_changed_window_applies_without_reload(self):
+        """Test the window option is re-read on every request."""
+        weather, _ = self._create_weather({"weather_update_debounce": 0.25})
+
+        weather._entry.options["weather_update_debounce"] = 2.0
+        weather._async_schedule_write()
+
+        assert weather._write_debouncer.cooldown == 2.0
+        weather._write_debouncer.async_shutdown()
+
+    def test_write_window_is_clamped(self):
+        """Test out of range and invalid windows fall back into 0.25-5 s."""
+        from custom_components.local_weather_forecast.weather import LocalWeatherForecastWeather
+
+        def window(value):
+            options = {} if value is None else {"weather_update_debounce": value}
+            return LocalWeatherForecastWeather(Mock(entry_id="test", data={}, options=options))._get_write_debounce()
+
+        assert window(None) == 1.0
+        assert window(0.0) == 1.0
+        assert window(0.1) == 0.25
+        assert window(30) == 5.0
+        assert window("abc") == 1.0
+
+    @pytest.mark.parametrize(
+        ("old_state", "new_state", "expected"),
+        [
+            ("0.0", "0.4", True),
+            ("unavailable", "1.2", True),
+            ("0.4", "1.2", False),
+            ("0.4", "0.0", False),
+            ("0.0", "unknown", False),
+        ],
+    )
+    def test_precipitation_onset(self, old_state, new_state, expected):
+        """Test rain onset detection from rain rate states."""
+        from custom_components.local_weather_forecast.weather import _is_precipitation_onset
+
+        assert _is_precipitation_onset(old_state, new_state) is expected
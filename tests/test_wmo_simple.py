@@ -3,6 +3,7 @@
 import pytest
 from custom_components.local_weather_forecast.wmo_simple import (
     calculate_wmo_simple_forecast,
+    calculate_wmo_simple_forecast_batch,
     get_wmo_confidence,
     _calculate_wmo_trend_adjustment,
     _apply_trend_adjustment,
@@ -241,3 +242,30 @@ class TestWMOSimpleIntegration:
         # Should maintain similar conditions
         assert abs(result[1] - current_code) <= 3
         assert result[3] >= 0.90  # Good confidence
+
+
+class TestCalculateWMOSimpleForecastBatch:
+    """Test calculate_wmo_simple_forecast_batch() function."""
+
+    CODES = [0, 5, 12, 20, 25, 3, 14]
+    CHANGES = [4.0, 1.6, 0.0, -1.6, -4.0, -2.0, 3.0]
+
+    @pytest.mark.parametrize("use_numpy", [False, True])
+    def test_matches_scalar(self, use_numpy):
+        """Test batch results match the scalar function element-wise."""
+        if use_numpy:
+            pytest.importorskip("numpy")
+
+        numbers, letters = calculate_wmo_simple_forecast_batch(
+            self.CODES, self.CHANGES, use_numpy=use_numpy
+        )
+
+        expected = [calculate_wmo_simple_forecast(c, p) for c, p in zip(self.CODES, self.CHANGES)]
+        assert list(numbers) == [result[1] for result in expected]
+        assert list(letters) == [result[2] for result in expected]
+
+    def test_scalar_is_broadcast(self):
+        """Test a scalar pressure change applies to every code."""
+        numbers, _ = calculate_wmo_simple_forecast_batch([10, 20], -4.0, use_numpy=False)
+
+        assert list(numbers) == [19, 25]
@@ -2,8 +2,12 @@
 from unittest.mock import patch
 from datetime import datetime
 
+import pytest
+
 from custom_components.local_weather_forecast.zambretti import (
+    _zambretti_core,
     calculate_zambretti_forecast,
+    calculate_zambretti_forecast_batch,
     _map_zambretti_to_forecast,
     _map_zambretti_to_letter,
 )
@@ -865,3 +869,70 @@ def test_summer_adjustment_moderate_pressure_rising(mock_datetime):
     assert isinstance(num, int)
     assert 0 <= num <= 25
     assert len(text) > 0
+
+
+@patch('custom_components.local_weather_forecast.zambretti.datetime')
+def test_core_is_memoized(mock_datetime):
+    """Test repeated inputs reuse the memoized core, text is looked up per call."""
+    mock_datetime.now.return_value = datetime(2025, 7, 18, 12, 0)
+    _zambretti_core.cache_clear()
+
+    english = calculate_zambretti_forecast(1012.4, -1.8, [1, 225, "SW", 1], 1)
+    slovak = calculate_zambretti_forecast(1012.4, -1.8, [1, 225, "SW", 1], 4)
+
+    assert english[1:] == slovak[1:]
+    assert english[0] != slovak[0]
+    assert _zambretti_core.cache_info().hits == 1
+
+
+@patch('custom_components.local_weather_forecast.zambretti.datetime')
+def test_season_is_part_of_core_key(mock_datetime):
+    """Test memoized results are not shared between summer and winter."""
+    mock_datetime.now.return_value = datetime(2025, 1, 15, 12, 0)
+    winter = calculate_zambretti_forecast(1000.0, 0.0, [0, 0, 'N', 0], 1)
+
+    mock_datetime.now.return_value = datetime(2025, 7, 15, 12, 0)
+    summer = calculate_zambretti_forecast(1000.0, 0.0, [0, 0, 'N', 0], 1)
+
+    # Steady: z = round(138 - 0.13 * 1000) = 8, winter adjustment -1 → z = 7
+    assert winter[2] == "U"
+    assert summer[2] == "V"
+
+
+BATCH_PRESSURES = [950.0, 968.5, 980.0, 1000.0, 1012.4, 1025.0, 1040.0, 1060.0]
+BATCH_CHANGES = [-5.0, 0.0, 2.0, -1.6, 0.4, 1.6, -3.0, 4.0]
+BATCH_DIRECTIONS = [180.0, 0.0, 90.0, 225.0, 350.0, 45.0, 135.0, 270.0]
+BATCH_SPEEDS = [3.0, 0.0, 1.0, 5.0, 0.5, 2.0, 8.0, 1.5]
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+@pytest.mark.parametrize("month", [1, 7])
+def test_batch_matches_scalar(month, use_numpy):
+    """Test batch results match calculate_zambretti_forecast element-wise."""
+    if use_numpy:
+        pytest.importorskip("numpy")
+    from custom_components.local_weather_forecast.batch import wind_factors
+
+    numbers, letters = calculate_zambretti_forecast_batch(
+        BATCH_PRESSURES, BATCH_CHANGES, BATCH_DIRECTIONS, BATCH_SPEEDS, month, use_numpy=use_numpy
+    )
+
+    with patch('custom_components.local_weather_forecast.zambretti.datetime') as mock_datetime:
+        mock_datetime.now.return_value = datetime(2025, month, 15, 12, 0)
+        expected = []
+        for p0, change, direction, speed in zip(
+            BATCH_PRESSURES, BATCH_CHANGES, BATCH_DIRECTIONS, BATCH_SPEEDS
+        ):
+            wind_fak, wind_speed_fak = wind_factors(direction, speed)
+            expected.append(
+                calculate_zambretti_forecast(p0, change, [wind_fak, direction, "", wind_speed_fak], 1)
+            )
+
+    assert list(numbers) == [result[1] for result in expected]
+    assert list(letters) == [result[2] for result in expected]
+
+
+def test_batch_length_mismatch():
+    """Test sequences of different length are rejected."""
+    with pytest.raises(ValueError):
+        calculate_zambretti_forecast_batch([1000.0, 1010.0], [0.0], use_numpy=False)